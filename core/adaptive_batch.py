@@ -0,0 +1,283 @@
+"""
+Adaptive batch sizing for distributed record claiming.
+
+A fixed batch size is a trade-off nobody tunes well per flow: small batches
+spend most of their time on claim round trips, large batches create long tails
+and leave many records leased to an instance that may die. AdaptiveBatchSizer
+observes each processed batch (records claimed, claim latency, processing time
+and failures) and moves the batch size toward the number of records that fills
+a target batch duration, within configured bounds.
+
+The learned size and the smoothed observations are persisted per flow_name and
+instance class (see migration V014), so a new container of the same size starts
+from what earlier containers learned instead of from default_batch_size.
+"""
+
+import time
+from typing import Any, Optional
+
+from core.process_pool import get_cpu_limit
+
+# Defaults when the distributed configuration has no adaptive batch settings
+DEFAULT_TARGET_BATCH_SECONDS = 30
+DEFAULT_MIN_BATCH_SIZE = 1
+DEFAULT_MAX_BATCH_SIZE = 1000
+
+# Weight of the newest batch in the smoothed observations
+SMOOTHING_FACTOR = 0.3
+
+# Largest change of the batch size after one batch, to avoid oscillation
+MAX_GROWTH_FACTOR = 2.0
+MAX_SHRINK_FACTOR = 0.5
+
+# Share of the target duration kept for processing when claims are slow
+MIN_PROCESSING_SHARE = 0.5
+
+# Smallest scale applied to the batch size for failing records
+MIN_FAILURE_SCALE = 0.25
+
+# Learned state is written when the batch size changes, or at least this often
+PERSIST_INTERVAL_SECONDS = 60
+
+
+def get_instance_class(configured: Optional[str] = None) -> str:
+    """
+    Get the instance class the learned batch size is stored under.
+
+    Args:
+        configured: Configured instance class (e.g. 'worker-large')
+
+    Returns:
+        The configured class, or one derived from the container CPU quota
+        (e.g. '4cpu')
+    """
+    if configured:
+        return configured
+    return f"{get_cpu_limit()}cpu"
+
+
+def _smooth(previous: Optional[float], value: float) -> float:
+    """Exponentially weighted moving average; the first value is taken as is."""
+    if previous is None:
+        return value
+    return previous + SMOOTHING_FACTOR * (value - previous)
+
+
+class AdaptiveBatchSizer:
+    """
+    Batch size controller for one flow on one instance class.
+
+    Call batch_size before claiming and record_batch() after a batch has been
+    processed. Not thread-safe: share one sizer per flow between batches, not
+    between concurrent claims.
+    """
+
+    def __init__(
+        self,
+        processor: Any,
+        flow_name: str,
+        initial_batch_size: int,
+        min_batch_size: int = DEFAULT_MIN_BATCH_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        target_batch_seconds: float = DEFAULT_TARGET_BATCH_SECONDS,
+        instance_class: Optional[str] = None,
+    ):
+        """
+        Initialize the sizer and restore the learned state of the flow.
+
+        Args:
+            processor: DistributedProcessor used to load and save the learned state
+            flow_name: Flow whose batches are sized
+            initial_batch_size: Batch size when nothing has been learned yet
+            min_batch_size: Smallest batch size
+            max_batch_size: Largest batch size
+            target_batch_seconds: Batch duration to aim for
+            instance_class: Instance class the state is stored under
+                (derived from the CPU quota if None)
+
+        Raises:
+            ValueError: If flow_name is empty or the bounds or target are invalid
+        """
+        if not flow_name or not isinstance(flow_name, str):
+            raise ValueError("flow_name must be a non-empty string")
+
+        if min_batch_size <= 0 or max_batch_size < min_batch_size:
+            raise ValueError(
+                f"Batch size bounds must satisfy 0 < min <= max, "
+                f"got: {min_batch_size}..{max_batch_size}"
+            )
+
+        if target_batch_seconds <= 0:
+            raise ValueError("target_batch_seconds must be positive")
+
+        self.processor = processor
+        self.flow_name = flow_name
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.target_batch_seconds = float(target_batch_seconds)
+        self.instance_class = get_instance_class(instance_class)
+        self.logger = processor.logger
+
+        self.per_record_seconds: Optional[float] = None
+        self.claim_seconds: Optional[float] = None
+        self.failure_rate: Optional[float] = None
+        self.batches_observed = 0
+        self._batch_size = self._clamp(initial_batch_size)
+
+        self._saved_batch_size: Optional[int] = None
+        self._last_saved_at = 0.0
+
+        self._restore()
+
+    @property
+    def batch_size(self) -> int:
+        """Number of records to claim for the next batch."""
+        return self._batch_size
+
+    def record_batch(
+        self,
+        records_claimed: int,
+        claim_seconds: float,
+        processing_seconds: float,
+        records_failed: int = 0,
+    ) -> int:
+        """
+        Record a processed batch and compute the size of the next one.
+
+        Args:
+            records_claimed: Records in the batch
+            claim_seconds: Time the claim query took
+            processing_seconds: Time from the start of processing until every
+                record of the batch was acknowledged
+            records_failed: Records of the batch that failed
+
+        Returns:
+            Batch size for the next batch
+        """
+        # Empty claims say nothing about processing time
+        if records_claimed <= 0:
+            return self._batch_size
+
+        self.per_record_seconds = _smooth(
+            self.per_record_seconds, max(processing_seconds, 0.0) / records_claimed
+        )
+        self.claim_seconds = _smooth(self.claim_seconds, max(claim_seconds, 0.0))
+        self.failure_rate = _smooth(
+            self.failure_rate,
+            min(max(records_failed, 0), records_claimed) / records_claimed,
+        )
+        self.batches_observed += 1
+
+        previous_size = self._batch_size
+        self._batch_size = self._next_batch_size()
+
+        if self._batch_size != previous_size:
+            self.logger.info(
+                f"Adaptive batch size for flow '{self.flow_name}' "
+                f"({self.instance_class}): {previous_size} -> {self._batch_size} "
+                f"(per record: {self.per_record_seconds:.3f}s, "
+                f"claim: {self.claim_seconds:.3f}s, "
+                f"failure rate: {self.failure_rate:.1%})"
+            )
+
+        if (
+            self._batch_size != self._saved_batch_size
+            or time.monotonic() - self._last_saved_at >= PERSIST_INTERVAL_SECONDS
+        ):
+            self.save()
+
+        return self._batch_size
+
+    def _next_batch_size(self) -> int:
+        """Batch size that fills the target duration, limited per step and bounds."""
+        if not self.per_record_seconds:
+            # Records complete faster than the clock resolution; grow the batch
+            ideal = self._batch_size * MAX_GROWTH_FACTOR
+        else:
+            processing_budget = max(
+                self.target_batch_seconds - self.claim_seconds,
+                self.target_batch_seconds * MIN_PROCESSING_SHARE,
+            )
+            ideal = processing_budget / self.per_record_seconds
+
+        # Failing records are retried, so smaller batches limit wasted leases
+        ideal *= max(1.0 - self.failure_rate, MIN_FAILURE_SCALE)
+
+        ideal = min(
+            max(ideal, self._batch_size * MAX_SHRINK_FACTOR),
+            self._batch_size * MAX_GROWTH_FACTOR,
+        )
+        return self._clamp(round(ideal))
+
+    def _clamp(self, batch_size: int) -> int:
+        """Limit a batch size to the configured bounds."""
+        return max(self.min_batch_size, min(self.max_batch_size, int(batch_size)))
+
+    def state(self) -> dict[str, Any]:
+        """Learned state as stored for the flow and instance class."""
+        return {
+            "batch_size": self._batch_size,
+            "per_record_seconds": self.per_record_seconds,
+            "claim_seconds": self.claim_seconds,
+            "failure_rate": self.failure_rate,
+            "batches_observed": self.batches_observed,
+        }
+
+    def save(self) -> bool:
+        """
+        Persist the learned state.
+
+        Failures are logged and do not interrupt processing.
+
+        Returns:
+            True if the state was saved
+        """
+        try:
+            self.processor.save_batch_size_state(
+                self.flow_name, self.instance_class, self.state()
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to save adaptive batch size for flow '{self.flow_name}': {e}"
+            )
+            return False
+
+        self._saved_batch_size = self._batch_size
+        self._last_saved_at = time.monotonic()
+        return True
+
+    def _restore(self) -> None:
+        """Load the learned state, keeping the initial size if there is none."""
+        try:
+            state = self.processor.load_batch_size_state(
+                self.flow_name, self.instance_class
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to load adaptive batch size for flow '{self.flow_name}', "
+                f"starting from {self._batch_size}: {e}"
+            )
+            return
+
+        if not state:
+            return
+
+        self._batch_size = self._clamp(state["batch_size"])
+        self.per_record_seconds = state.get("per_record_seconds")
+        self.claim_seconds = state.get("claim_seconds")
+        self.failure_rate = state.get("failure_rate")
+        self.batches_observed = state.get("batches_observed") or 0
+        self._saved_batch_size = self._batch_size
+        self._last_saved_at = time.monotonic()
+
+        self.logger.info(
+            f"Restored adaptive batch size {self._batch_size} for flow "
+            f"'{self.flow_name}' ({self.instance_class}, "
+            f"{self.batches_observed} batches observed)"
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveBatchSizer(flow_name='{self.flow_name}', "
+            f"instance_class='{self.instance_class}', batch_size={self._batch_size})"
+        )
@@ -0,0 +1,498 @@
+"""
+Asyncio database management module for PostgreSQL and SQL Server access.
+
+This module provides the AsyncDatabaseManager class, the asyncio counterpart of
+DatabaseManager. It uses SQLAlchemy's asyncio extension with asyncpg (PostgreSQL)
+and aioodbc (SQL Server), so that many concurrent queries of one event loop share
+a few pooled connections instead of holding one thread each.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from core.config import ConfigManager
+from core.database import _record_query_timeout
+from core.query_stats import (
+    DEFAULT_SLOW_QUERY_THRESHOLD_MS,
+    instrument_engine,
+    query_stats,
+)
+
+# asyncio driver per database backend of the configured connection strings
+_ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "mssql": "aioodbc",
+    "sqlite": "aiosqlite",
+}
+
+
+def _to_async_url(connection_string: str) -> Any:
+    """
+    Convert a configured (sync driver) connection string to its asyncio driver.
+
+    postgresql:// and postgresql+psycopg2:// use asyncpg, mssql+pyodbc:// uses
+    aioodbc. Connection strings that already name an asyncio driver are kept.
+
+    Args:
+        connection_string: SQLAlchemy connection string
+
+    Returns:
+        SQLAlchemy URL using the asyncio driver
+
+    Raises:
+        ValueError: If the database backend has no supported asyncio driver
+    """
+    url = make_url(connection_string)
+    backend = url.get_backend_name()
+
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver available for database type '{backend}'")
+
+    if url.get_driver_name() in _ASYNC_DRIVERS.values():
+        return url
+
+    return url.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}")
+
+
+class AsyncDatabaseManager:
+    """
+    Asyncio database manager for PostgreSQL and SQL Server databases.
+
+    Loads the same configuration as DatabaseManager ({database}_type,
+    {database}_connection_string, pool and timeout settings) and runs queries on an
+    AsyncEngine. The engine is bound to the event loop that first uses it, so each
+    manager owns its engine; close it with dispose() or ``async with``.
+    """
+
+    def __init__(self, database_name: str):
+        """
+        Initialize AsyncDatabaseManager for a specific database.
+
+        Args:
+            database_name: Name of the database configuration to load
+
+        Raises:
+            ValueError: If database_name is empty or None
+        """
+        if (
+            not database_name
+            or not isinstance(database_name, str)
+            or not database_name.strip()
+        ):
+            raise ValueError("database_name must be a non-empty string")
+
+        self.database_name = database_name
+        self.engine = None
+        self._logger = None
+        self._config_manager = None
+        self._default_query_timeout = None
+        self._query_class_timeouts = {}
+
+    @property
+    def logger(self):
+        """Get the logger instance, initializing if necessary."""
+        if self._logger is None:
+            try:
+                from prefect import get_run_logger
+
+                self._logger = get_run_logger()
+            except (ImportError, RuntimeError):
+                self._logger = logging.getLogger(
+                    f"AsyncDatabaseManager.{self.database_name}"
+                )
+        return self._logger
+
+    @property
+    def db_engine(self):
+        """Get the SQLAlchemy AsyncEngine, initializing if necessary."""
+        if self.engine is None:
+            self._initialize_engine()
+        return self.engine
+
+    def _initialize_engine(self):
+        """
+        Initialize the SQLAlchemy AsyncEngine with configuration from ConfigManager.
+
+        Raises:
+            RuntimeError: If configuration is missing or invalid, or engine
+                creation fails
+        """
+        if self.engine is not None:
+            return
+
+        try:
+            if self._config_manager is None:
+                self._config_manager = ConfigManager()
+
+            db_type = self._config_manager.get_variable(f"{self.database_name}_type")
+            connection_string = self._config_manager.get_secret(
+                f"{self.database_name}_connection_string"
+            )
+
+            if not db_type:
+                raise ValueError(
+                    f"Database type not configured for '{self.database_name}'"
+                )
+            if db_type.lower() not in ("postgresql", "sqlserver"):
+                raise ValueError(
+                    f"Unsupported database type '{db_type}' for "
+                    f"'{self.database_name}'. Supported types: postgresql, sqlserver"
+                )
+            if not connection_string:
+                raise ValueError(
+                    f"Connection string not configured for '{self.database_name}'"
+                )
+
+            pool_size = int(
+                self._config_manager.get_variable(f"{self.database_name}_pool_size", 5)
+            )
+            max_overflow = int(
+                self._config_manager.get_variable(
+                    f"{self.database_name}_max_overflow", 10
+                )
+            )
+
+            query_stats.set_slow_query_threshold(
+                self.database_name,
+                self._parse_slow_query_threshold(
+                    self._config_manager.get_variable(
+                        f"{self.database_name}_slow_query_threshold_ms",
+                        DEFAULT_SLOW_QUERY_THRESHOLD_MS,
+                    )
+                ),
+            )
+            self._default_query_timeout = self._parse_query_timeout(
+                self._config_manager.get_variable(f"{self.database_name}_query_timeout")
+            )
+
+            self.engine = create_async_engine(
+                _to_async_url(connection_string),
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=True,
+            )
+            # Event hooks run on the sync engine behind the AsyncEngine
+            instrument_engine(self.engine.sync_engine, self.database_name)
+
+            self.logger.info(
+                f"Created async SQLAlchemy engine for '{self.database_name}' "
+                f"(type: {db_type}, driver: {self.engine.dialect.driver}, "
+                f"pool_size: {pool_size}, max_overflow: {max_overflow})"
+            )
+
+        except Exception as e:
+            error_msg = f"Failed to initialize async engine for database '{self.database_name}': {e}"  # noqa E501
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def _parse_query_timeout(self, value: Any) -> Optional[float]:
+        """Convert a configured timeout to positive seconds, ignoring bad values."""
+        if value is None or value == "":
+            return None
+
+        try:
+            timeout = float(value)
+        except (TypeError, ValueError):
+            timeout = 0
+
+        if timeout <= 0:
+            self.logger.warning(
+                f"Ignoring invalid query timeout {value!r} "
+                f"for database '{self.database_name}'"
+            )
+            return None
+
+        return timeout
+
+    def _parse_slow_query_threshold(self, value: Any) -> float:
+        """Convert a configured slow-query threshold to milliseconds, or the default."""
+        try:
+            threshold_ms = float(value)
+        except (TypeError, ValueError):
+            threshold_ms = -1
+
+        if not threshold_ms >= 0:
+            self.logger.warning(
+                f"Ignoring invalid slow query threshold {value!r} "
+                f"for database '{self.database_name}'"
+            )
+            return DEFAULT_SLOW_QUERY_THRESHOLD_MS
+
+        return threshold_ms
+
+    def get_query_timeout(self, query_class: Optional[str] = None) -> Optional[float]:
+        """
+        Get the configured statement timeout for a class of queries.
+
+        Uses the same configuration keys as DatabaseManager.get_query_timeout.
+
+        Args:
+            query_class: Name of the query class, or None for the database default
+
+        Returns:
+            Timeout in seconds, or None if no timeout is configured
+        """
+        if self.engine is None:
+            self._initialize_engine()
+
+        if query_class is None:
+            return self._default_query_timeout
+
+        if query_class not in self._query_class_timeouts:
+            self._query_class_timeouts[query_class] = self._parse_query_timeout(
+                self._config_manager.get_variable(
+                    f"{self.database_name}_query_timeout_{query_class}"
+                )
+            )
+
+        class_timeout = self._query_class_timeouts[query_class]
+        return (
+            class_timeout if class_timeout is not None else self._default_query_timeout
+        )
+
+    async def execute_query(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+        query_class: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Execute a SQL query in its own transaction and return the results.
+
+        The query holds a pooled connection only while it runs, so concurrent
+        callers on one event loop share the pool. A query still running after the
+        timeout is cancelled (asyncpg also cancels it on the server).
+
+        Args:
+            query: SQL query string
+            params: Optional query parameters
+            timeout: Query timeout in seconds (must be positive). Defaults to the
+                configured timeout of query_class, or none when not configured
+            query_class: Name of the query class used for configuration and
+                metrics (e.g. "monitoring", "source")
+
+        Returns:
+            List of dictionaries representing query results, or
+            [{"affected_rows": n}] for statements that return no rows
+
+        Raises:
+            ValueError: If query is empty or timeout is not positive
+            RuntimeError: If query execution fails or times out
+        """
+        if not query or not isinstance(query, str):
+            raise ValueError("Query must be a non-empty string")
+
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Timeout must be a positive number")
+
+        try:
+            if timeout is None:
+                timeout = self.get_query_timeout(query_class)
+
+            self.logger.debug(
+                f"Executing async query for database '{self.database_name}'"
+            )
+
+            return await asyncio.wait_for(self._execute(query, params), timeout)
+
+        except asyncio.TimeoutError as e:
+            _record_query_timeout(self.database_name, query_class or "default")
+            error_msg = f"Query timeout ({timeout}s) exceeded for database '{self.database_name}'"  # noqa E501
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+        except Exception as e:
+            error_msg = (
+                f"Query execution failed for database '{self.database_name}': {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    async def _execute(self, query: str, params: Optional[dict]) -> list[dict]:
+        """Run one statement in a transaction and convert its result."""
+        async with self.db_engine.begin() as conn:
+            result = await conn.execute(text(query), params or {})
+
+            if result.returns_rows:
+                return [dict(row._mapping) for row in result.fetchall()]
+
+            return [{"affected_rows": result.rowcount}]
+
+    async def execute_transaction(self, queries: list[tuple]) -> list[dict]:
+        """
+        Execute multiple queries within a single transaction.
+
+        Args:
+            queries: List of (query_string, params_dict) tuples
+
+        Returns:
+            List of dictionaries representing combined results from all queries
+
+        Raises:
+            ValueError: If queries list is empty or contains invalid tuples
+            RuntimeError: If transaction execution fails (automatically rolls back)
+        """
+        if not queries or not isinstance(queries, list):
+            raise ValueError("Queries must be a non-empty list")
+
+        for i, query_tuple in enumerate(queries):
+            if not isinstance(query_tuple, tuple) or len(query_tuple) != 2:
+                raise ValueError(
+                    f"Query at index {i} must be a tuple of (query_string, params_dict)"
+                )
+            query_str, params = query_tuple
+            if not query_str or not isinstance(query_str, str):
+                raise ValueError(
+                    f"Query string at index {i} must be a non-empty string"
+                )
+            if params is not None and not isinstance(params, dict):
+                raise ValueError(
+                    f"Parameters at index {i} must be a dictionary or None"
+                )
+
+        try:
+            all_results = []
+
+            async with self.db_engine.begin() as conn:
+                for query_str, params in queries:
+                    result = await conn.execute(text(query_str), params or {})
+                    if result.returns_rows:
+                        all_results.extend(
+                            dict(row._mapping) for row in result.fetchall()
+                        )
+
+            self.logger.debug(
+                f"Transaction with {len(queries)} queries committed for "
+                f"database '{self.database_name}'"
+            )
+
+            return all_results
+
+        except Exception as e:
+            error_msg = (
+                f"Transaction execution failed for database '{self.database_name}': {e}. "  # noqa E501
+                f"All changes have been rolled back."
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    async def health_check(self) -> dict[str, Any]:
+        """
+        Perform database health check of connectivity and query response time.
+
+        Returns the same structure as DatabaseManager.health_check. Migration
+        status is not checked (migrations run through the sync DatabaseManager),
+        so migration_status is always None.
+
+        Returns:
+            Dictionary containing database_name, status (healthy/degraded/
+            unhealthy), connection, query_test, migration_status,
+            response_time_ms, timestamp and error
+        """
+        from datetime import datetime, timezone
+
+        health_status = {
+            "database_name": self.database_name,
+            "status": "unhealthy",
+            "connection": False,
+            "query_test": False,
+            "migration_status": None,
+            "response_time_ms": None,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "error": None,
+        }
+
+        try:
+            async with self.db_engine.connect() as conn:
+                health_status["connection"] = True
+
+                query_start = time.perf_counter()
+                result = await conn.execute(text("SELECT 1 as health_check"))
+                rows = result.fetchall()
+                response_time_ms = round((time.perf_counter() - query_start) * 1000, 2)
+
+            if rows:
+                health_status["query_test"] = True
+                health_status["response_time_ms"] = response_time_ms
+            else:
+                health_status["error"] = "Query test returned no results"
+
+        except Exception as e:
+            health_status["error"] = f"Connection or query test failed: {e}"
+            self.logger.error(
+                f"Connection/query test failed for database '{self.database_name}': {e}"
+            )
+
+        if health_status["connection"] and health_status["query_test"]:
+            # 5 seconds threshold for degraded, as in DatabaseManager
+            if health_status["response_time_ms"] > 5000:
+                health_status["status"] = "degraded"
+            else:
+                health_status["status"] = "healthy"
+        elif health_status["connection"]:
+            health_status["status"] = "degraded"
+
+        self.logger.debug(
+            f"Async health check for database '{self.database_name}': "
+            f"{health_status['status']}"
+        )
+
+        return health_status
+
+    def get_pool_status(self) -> dict[str, Any]:
+        """
+        Get connection pool status of the async engine.
+
+        Returns:
+            Dictionary containing database_name, pool_size, checked_in,
+            checked_out, overflow, max_connections, utilization_percent and
+            pool_class
+
+        Raises:
+            RuntimeError: If pool status retrieval fails
+        """
+        try:
+            pool = self.db_engine.pool
+            checked_out = pool.checkedout()
+            max_connections = pool.size() + max(pool._max_overflow, 0)
+
+            return {
+                "database_name": self.database_name,
+                "pool_size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": checked_out,
+                "overflow": pool.overflow(),
+                "max_connections": max_connections,
+                "utilization_percent": round(
+                    checked_out / max_connections * 100 if max_connections else 0, 2
+                ),
+                "pool_class": pool.__class__.__name__,
+            }
+
+        except Exception as e:
+            error_msg = f"Failed to retrieve pool status for database '{self.database_name}': {e}"  # noqa E501
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    async def dispose(self) -> None:
+        """Close the pooled connections of this manager's engine."""
+        if self.engine is not None:
+            self.logger.debug(
+                f"Disposing async engine for database '{self.database_name}'"
+            )
+            await self.engine.dispose()
+            self.engine = None
+
+    async def __aenter__(self) -> "AsyncDatabaseManager":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit, disposing the engine."""
+        await self.dispose()
@@ -0,0 +1,425 @@
+"""
+Asyncio distributed processing module.
+
+This module provides AsyncDistributedProcessor, the asyncio counterpart of
+DistributedProcessor for Prefect async flows. It claims, completes and fails
+records with the same statements and ownership checks through an
+AsyncDatabaseManager, so hundreds of I/O-bound record operations can overlap on a
+few pooled connections instead of needing one thread each.
+"""
+
+import asyncio
+import socket
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from core.async_database import AsyncDatabaseManager
+from core.config import ConfigManager
+from core.distributed import (
+    _MARK_RECORD_COMPLETED_QUERY,
+    _MARK_RECORD_FAILED_QUERY,
+    DEFAULT_LEASE_SECONDS,
+    _build_queue_status,
+    _ProcessorBase,
+    _queue_status_queries,
+)
+
+
+def _affected_rows(results: list[dict]) -> int:
+    """Read the affected row count returned by AsyncDatabaseManager.execute_query."""
+    return results[0].get("affected_rows", 0) if results else 0
+
+
+class AsyncDistributedProcessor(_ProcessorBase):
+    """
+    Asyncio distributed processor for atomic record claiming and status management.
+
+    Offers the claim, completion, failure, queue status and health check API of
+    DistributedProcessor as coroutines. Claims use the same FOR UPDATE SKIP LOCKED
+    statement, so sync and async processors can work on the same queue.
+
+    Example:
+        async with AsyncDatabaseManager("rpa_db") as rpa_db:
+            processor = AsyncDistributedProcessor(rpa_db)
+            records = await processor.claim_records_batch("survey_processor", 100)
+            await asyncio.gather(*(handle(processor, record) for record in records))
+    """
+
+    def __init__(
+        self,
+        rpa_db_manager: AsyncDatabaseManager,
+        source_db_manager: Optional[AsyncDatabaseManager] = None,
+        config_manager: Optional[ConfigManager] = None,
+    ):
+        """
+        Initialize AsyncDistributedProcessor with AsyncDatabaseManager instances.
+
+        Args:
+            rpa_db_manager: AsyncDatabaseManager for PostgreSQL (queue and results)
+            source_db_manager: Optional AsyncDatabaseManager for source data
+            config_manager: Optional ConfigManager for distributed processing configuration
+
+        Raises:
+            ValueError: If rpa_db_manager is None
+            TypeError: If managers are not AsyncDatabaseManager instances
+            RuntimeError: If configuration validation fails
+        """
+        if rpa_db_manager is None:
+            raise ValueError("rpa_db_manager cannot be None")
+
+        if not isinstance(rpa_db_manager, AsyncDatabaseManager):
+            raise TypeError("rpa_db_manager must be an AsyncDatabaseManager instance")
+
+        if source_db_manager is not None and not isinstance(
+            source_db_manager, AsyncDatabaseManager
+        ):
+            raise TypeError(
+                "source_db_manager must be an AsyncDatabaseManager instance or None"
+            )
+
+        self.rpa_db = rpa_db_manager
+        self.source_db = source_db_manager
+        self.config_manager = config_manager or ConfigManager()
+
+        try:
+            self.config = self.config_manager.get_distributed_config()
+        except (ValueError, RuntimeError) as e:
+            raise RuntimeError(
+                f"Failed to load distributed processing configuration: {e}"
+            ) from e
+
+        self.logger = self.rpa_db.logger
+        self.lease_seconds = self.config.get("lease_seconds", DEFAULT_LEASE_SECONDS)
+        self.instance_id = self._generate_instance_id()
+
+        self.logger.info(
+            f"AsyncDistributedProcessor initialized with instance_id: "
+            f"{self.instance_id}, config: {self.config}"
+        )
+
+    async def claim_records_batch(
+        self, flow_name: str, batch_size: int, lease_seconds: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Claim a batch of pending records atomically for processing.
+
+        See DistributedProcessor.claim_records_batch.
+
+        Args:
+            flow_name: Name of the flow to claim records for
+            batch_size: Maximum number of records to claim
+            lease_seconds: Lease duration in seconds (uses config lease_seconds if None)
+
+        Returns:
+            List of claimed records with id, payload, retry_count, and created_at fields
+
+        Raises:
+            ValueError: If flow_name is empty or batch_size is invalid
+            RuntimeError: If database operation fails
+        """
+        if not flow_name or not isinstance(flow_name, str):
+            raise ValueError("flow_name must be a non-empty string")
+
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        if lease_seconds is None:
+            lease_seconds = self.lease_seconds
+        if not isinstance(lease_seconds, int) or lease_seconds <= 0:
+            raise ValueError("lease_seconds must be a positive integer")
+
+        try:
+            claim_query, query_params = self._claim_records_query(
+                flow_name, batch_size, lease_seconds
+            )
+            results = await self.rpa_db.execute_query(claim_query, query_params)
+
+            claimed_records = [
+                {
+                    "id": row["id"],
+                    "payload": row["payload"],
+                    "retry_count": row["retry_count"],
+                    "created_at": row["created_at"],
+                }
+                for row in results
+            ]
+
+            self.logger.info(
+                f"Claimed {len(claimed_records)} records for flow '{flow_name}' "
+                f"with instance_id '{self.instance_id}'"
+            )
+
+            return claimed_records
+
+        except Exception as e:
+            error_msg = (
+                f"Failed to claim records for flow '{flow_name}' "
+                f"(batch_size: {batch_size}, instance_id: '{self.instance_id}'): {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    async def mark_record_completed(
+        self, record_id: int, result: dict[str, Any]
+    ) -> None:
+        """
+        Mark a record as completed and store the processing result.
+
+        See DistributedProcessor.mark_record_completed; oversized results are
+        spilled to result_spill_dir in a worker thread.
+
+        Args:
+            record_id: ID of the record to mark as completed
+            result: Processing result to store in processing_results
+
+        Raises:
+            ValueError: If record_id is invalid, result is not a dictionary, or
+                result exceeds result_max_bytes and no spill directory is configured
+            RuntimeError: If database operation fails or record not found
+        """
+        if not isinstance(record_id, int) or record_id <= 0:
+            raise ValueError("record_id must be a positive integer")
+
+        if not isinstance(result, dict):
+            raise ValueError("result must be a dictionary")
+
+        result_json, result_size = self._serialize_result(record_id, result)
+
+        try:
+            spill_path = None
+            if self._should_spill_result(result_size):
+                spill_path = await asyncio.to_thread(
+                    self._spill_result, record_id, result_json
+                )
+                result_json = None
+
+            results = await self.rpa_db.execute_query(
+                _MARK_RECORD_COMPLETED_QUERY,
+                {
+                    "record_id": record_id,
+                    "result": result_json,
+                    "result_size": result_size,
+                    "spill_path": spill_path,
+                    "instance_id": self.instance_id,
+                },
+            )
+        except Exception as e:
+            error_msg = (
+                f"Failed to mark record {record_id} as completed "
+                f"for instance_id '{self.instance_id}': {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        if _affected_rows(results) == 0:
+            if spill_path is not None:
+                await asyncio.to_thread(self._discard_spilled_result, spill_path)
+            error_msg = (
+                f"Record {record_id} not found or not in processing state "
+                f"for instance_id '{self.instance_id}'"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        self.logger.debug(f"Marked record {record_id} as completed")
+
+    async def mark_record_failed(self, record_id: int, error_message: str) -> None:
+        """
+        Mark a record as failed and increment retry count.
+
+        See DistributedProcessor.mark_record_failed.
+
+        Args:
+            record_id: ID of the record to mark as failed
+            error_message: Error message describing the failure
+
+        Raises:
+            ValueError: If record_id is invalid or error_message is empty
+            RuntimeError: If database operation fails or record not found
+        """
+        if not isinstance(record_id, int) or record_id <= 0:
+            raise ValueError("record_id must be a positive integer")
+
+        if not isinstance(error_message, str) or not error_message.strip():
+            raise ValueError("error_message must be a non-empty string")
+
+        try:
+            results = await self.rpa_db.execute_query(
+                _MARK_RECORD_FAILED_QUERY,
+                {
+                    "record_id": record_id,
+                    "error_message": error_message.strip(),
+                    "instance_id": self.instance_id,
+                },
+            )
+        except Exception as e:
+            error_msg = (
+                f"Failed to mark record {record_id} as failed "
+                f"for instance_id '{self.instance_id}': {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        if _affected_rows(results) == 0:
+            error_msg = (
+                f"Record {record_id} not found or not in processing state "
+                f"for instance_id '{self.instance_id}'"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        self.logger.debug(f"Marked record {record_id} as failed")
+
+    async def get_queue_status(
+        self, flow_name: Optional[str] = None, exact: bool = False
+    ) -> dict[str, Any]:
+        """
+        Get queue status with counts by status and optionally by flow_name.
+
+        See DistributedProcessor.get_queue_status; the system-wide and by-flow
+        counts are queried concurrently.
+
+        Args:
+            flow_name: Optional flow name to filter results. If None, returns all flows.
+            exact: If True, count records in processing_queue instead of reading the
+                counters table (default: False)
+
+        Returns:
+            Dictionary with total_records, pending_records, processing_records,
+            completed_records, failed_records, flow_name and, if flow_name is
+            None, by_flow
+
+        Raises:
+            ValueError: If flow_name is an empty string
+            RuntimeError: If database operation fails
+        """
+        if flow_name is not None and (
+            not isinstance(flow_name, str) or not flow_name.strip()
+        ):
+            raise ValueError("flow_name must be a non-empty string or None")
+
+        try:
+            status_query, query_params, by_flow_query = _queue_status_queries(
+                flow_name, exact
+            )
+
+            if flow_name is None:
+                results, by_flow_results = await asyncio.gather(
+                    self.rpa_db.execute_query(status_query, query_params),
+                    self.rpa_db.execute_query(by_flow_query, {}),
+                )
+                by_flow_rows = [tuple(row.values()) for row in by_flow_results]
+            else:
+                results = await self.rpa_db.execute_query(status_query, query_params)
+                by_flow_rows = None
+
+            return _build_queue_status(
+                flow_name, [tuple(row.values()) for row in results], by_flow_rows
+            )
+
+        except Exception as e:
+            error_msg = f"Failed to get queue status for flow '{flow_name}': {e}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    async def health_check(self) -> dict[str, Any]:
+        """
+        Perform health check of the distributed processing system.
+
+        Returns the same structure as DistributedProcessor.health_check. The
+        database checks run concurrently; rpa_db problems make the system
+        unhealthy, source_db and queue status problems make it degraded.
+
+        Returns:
+            Dictionary with status, databases, queue_status, instance_info,
+            timestamp and, if unhealthy, error
+        """
+        health_status = {
+            "status": "healthy",
+            "databases": {},
+            "queue_status": {},
+            "instance_info": {
+                "instance_id": self.instance_id,
+                "hostname": socket.gethostname(),
+                "rpa_db_name": self.rpa_db.database_name,
+                "source_db_name": self.source_db.database_name
+                if self.source_db
+                else None,
+            },
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+        checks = [self.rpa_db.health_check()]
+        if self.source_db:
+            checks.append(self.source_db.health_check())
+        database_health = await asyncio.gather(*checks, return_exceptions=True)
+
+        for name, db_health in zip(("rpa_db", "source_db"), database_health):
+            if isinstance(db_health, Exception):
+                self.logger.error(f"Failed to check {name} health: {db_health}")
+                db_health = {
+                    "status": "unhealthy",
+                    "connection": False,
+                    "error": str(db_health),
+                }
+            health_status["databases"][name] = db_health
+
+        rpa_db_health = health_status["databases"]["rpa_db"]
+        source_db_health = health_status["databases"].get("source_db", {})
+
+        if rpa_db_health.get("status") == "unhealthy":
+            health_status["status"] = "unhealthy"
+            health_status["error"] = (
+                f"RPA database unhealthy: {rpa_db_health.get('error', 'Unknown error')}"
+            )
+        elif rpa_db_health.get("status") == "degraded" or source_db_health.get(
+            "status"
+        ) in ("degraded", "unhealthy"):
+            health_status["status"] = "degraded"
+
+        if rpa_db_health.get("connection", False):
+            try:
+                queue_status = await self.get_queue_status()
+                health_status["queue_status"] = {
+                    key: queue_status[key]
+                    for key in (
+                        "pending_records",
+                        "processing_records",
+                        "completed_records",
+                        "failed_records",
+                        "total_records",
+                    )
+                }
+            except Exception as e:
+                self.logger.warning(f"Failed to retrieve queue status: {e}")
+                health_status["queue_status"] = self._unknown_queue_status(str(e))
+                if health_status["status"] == "healthy":
+                    health_status["status"] = "degraded"
+        else:
+            health_status["queue_status"] = self._unknown_queue_status(
+                "Database connection unavailable"
+            )
+
+        self.logger.info(f"Health check completed: {health_status['status']}")
+
+        return health_status
+
+    @staticmethod
+    def _unknown_queue_status(error: str) -> dict[str, Any]:
+        """Queue status reported when the counts cannot be read."""
+        return {
+            "pending_records": -1,
+            "processing_records": -1,
+            "completed_records": -1,
+            "failed_records": -1,
+            "total_records": -1,
+            "error": error,
+        }
+
+    def __repr__(self) -> str:
+        """String representation of AsyncDistributedProcessor."""
+        source_db_name = self.source_db.database_name if self.source_db else "None"
+        return (
+            f"AsyncDistributedProcessor(rpa_db='{self.rpa_db.database_name}', "
+            f"source_db='{source_db_name}', instance_id='{self.instance_id}')"
+        )
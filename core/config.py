@@ -3,12 +3,23 @@ Configuration settings for the RPA solution.
 """
 
 import os
+import threading
+import time
 from pathlib import Path
 from typing import Any, Optional
 
 from dotenv import load_dotenv
-from prefect.blocks.system import Secret
-from prefect.variables import Variable
+
+from core.config_snapshot import (
+    SNAPSHOT_KEY_ENV,
+    SNAPSHOT_PATH_ENV,
+    load_config_snapshot,
+)
+from core.lazy_import import lazy_import
+
+# Prefect is only imported when a value is not found in the environment or snapshot
+Secret = lazy_import("prefect.blocks.system", "Secret")
+Variable = lazy_import("prefect.variables", "Variable")
 
 # Base paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -43,6 +54,90 @@ SAMPLE_PRODUCTS = [
     {"product": "Widget B", "quantity": 50, "price": 15.75, "date": "2024-01-19"},
 ]
 
+# Seconds a Prefect variable or secret lookup (including a miss) is reused before
+# it is fetched again; override with CONFIG_CACHE_TTL_SECONDS, 0 disables caching
+DEFAULT_CONFIG_CACHE_TTL_SECONDS = 300
+
+# Page size of the Prefect list calls in ConfigManager.preload (the default API limit)
+PRELOAD_PAGE_SIZE = 200
+
+# Cached result of a Prefect name that does not exist
+_MISSING = object()
+
+# Result of a cache lookup for a name that is not (or no longer) cached
+_UNCACHED = object()
+
+
+class _PrefectValueCache:
+    """
+    Process-wide TTL cache of Prefect variable and secret lookups.
+
+    Entries are keyed by kind ("variable" or "secret") and Prefect name and hold
+    the value, or _MISSING for names that do not exist. After a complete listing
+    (see ConfigManager.preload), names absent from it are misses until the listing
+    expires.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple[str, str], tuple[Any, float]] = {}
+        self._listed_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, name: str) -> Any:
+        """Return the cached value, _MISSING, or _UNCACHED."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((kind, name))
+            if entry is not None and entry[1] > now:
+                return entry[0]
+            if self._listed_until.get(kind, 0) > now:
+                return _MISSING
+        return _UNCACHED
+
+    def set(self, kind: str, name: str, value: Any, ttl_seconds: float) -> None:
+        """Cache the value (or _MISSING) of one name."""
+        with self._lock:
+            self._entries[(kind, name)] = (value, time.monotonic() + ttl_seconds)
+
+    def set_listing(
+        self, kind: str, values: dict[str, Any], ttl_seconds: float
+    ) -> None:
+        """Cache a complete listing; all other names are cached as misses."""
+        expires_at = time.monotonic() + ttl_seconds
+        with self._lock:
+            for name, value in values.items():
+                self._entries[(kind, name)] = (value, expires_at)
+            self._listed_until[kind] = expires_at
+
+    def clear(self) -> None:
+        """Drop all cached values and listings."""
+        with self._lock:
+            self._entries.clear()
+            self._listed_until.clear()
+
+
+# Shared by all ConfigManager instances of the process
+_prefect_cache = _PrefectValueCache()
+
+# Configuration snapshots read by this process, by path (None if unusable)
+_snapshots: dict[str, Optional[dict[str, Any]]] = {}
+_snapshots_lock = threading.Lock()
+
+
+def _get_snapshot(path: str) -> Optional[dict[str, Any]]:
+    """Read and verify a configuration snapshot once per process."""
+    with _snapshots_lock:
+        if path not in _snapshots:
+            try:
+                _snapshots[path] = load_config_snapshot(
+                    Path(path), os.getenv(SNAPSHOT_KEY_ENV)
+                )
+                print(f"📦 Loaded config snapshot: {path}")
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring config snapshot {path}: {e}")
+                _snapshots[path] = None
+        return _snapshots[path]
+
 
 class ConfigManager:
     """
@@ -61,10 +156,19 @@ class ConfigManager:
     3. Prefect: {environment}.{flow}.{key} - Flow-specific in specific environment
     4. Prefect: {environment}.global.{key} - Global in specific environment
     5. Prefect: global.{key} - Base global (backwards compatibility)
+
+    Prefect lookups, including names that do not exist, are cached process-wide
+    for cache_ttl_seconds; preload() fills the cache with a few list calls. A
+    signed configuration snapshot (see core.config_snapshot) answers Prefect
+    lookups without API calls; names it does not contain still use the API.
     """
 
     def __init__(
-        self, flow_name: Optional[str] = None, environment: Optional[str] = None
+        self,
+        flow_name: Optional[str] = None,
+        environment: Optional[str] = None,
+        cache_ttl_seconds: Optional[float] = None,
+        snapshot_path: Optional[str] = None,
     ):
         """
         Initialize the configuration manager.
@@ -73,14 +177,55 @@ class ConfigManager:
             flow_name: Name of the flow (e.g., 'rpa1', 'rpa2')
             environment: Environment name (e.g., 'development', 'staging', 'production')
                         If None, will be detected from PREFECT_ENVIRONMENT env var
+            cache_ttl_seconds: Seconds Prefect lookups are cached (0 disables).
+                        If None, read from CONFIG_CACHE_TTL_SECONDS or
+                        DEFAULT_CONFIG_CACHE_TTL_SECONDS
+            snapshot_path: Configuration snapshot to read Prefect values from.
+                        If None, read from CONFIG_SNAPSHOT_PATH
         """
         self.flow_name = flow_name
         self.environment = environment or self._detect_environment()
-        self._cache = {}
+        if cache_ttl_seconds is None:
+            cache_ttl_seconds = float(
+                os.getenv("CONFIG_CACHE_TTL_SECONDS", DEFAULT_CONFIG_CACHE_TTL_SECONDS)
+            )
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._cache = _prefect_cache
+
+        self.snapshot_path = snapshot_path or os.getenv(SNAPSHOT_PATH_ENV)
+        self._snapshot = self._load_snapshot()
 
         # Load .env files
         self._load_env_files()
 
+    def _load_snapshot(self) -> Optional[dict[str, Any]]:
+        """Get the configuration snapshot of this environment and flow, if configured."""
+        if not self.snapshot_path:
+            return None
+
+        snapshot = _get_snapshot(self.snapshot_path)
+        if snapshot is None:
+            return None
+
+        if snapshot["environment"] != self.environment:
+            print(
+                f"⚠️ Ignoring config snapshot {self.snapshot_path}: it was created "
+                f"for environment '{snapshot['environment']}', not "
+                f"'{self.environment}'"
+            )
+            return None
+
+        # A snapshot lacks the overrides of other flows, which would otherwise
+        # resolve to the global values it contains
+        if self.flow_name is not None and snapshot.get("flow_name") != self.flow_name:
+            print(
+                f"⚠️ Ignoring config snapshot {self.snapshot_path}: it was created "
+                f"for flow '{snapshot.get('flow_name')}', not '{self.flow_name}'"
+            )
+            return None
+
+        return snapshot
+
     def _detect_environment(self) -> str:
         """Detect current environment from environment variables."""
         return os.getenv("PREFECT_ENVIRONMENT", "development")
@@ -123,33 +268,18 @@ class ConfigManager:
         if env_value is not None:
             return env_value
 
-        # 2. Try Prefect secrets (fallback)
-        # Try flow-specific secret first
+        # 2. Try Prefect secrets (fallback): flow-specific, environment-specific
+        # global, then base global secret (for backwards compatibility)
+        block_key = key.replace("_", "-")
+        secret_names = [
+            f"{self.environment}-global-{block_key}",
+            f"global-{block_key}",
+        ]
         if self.flow_name:
-            try:
-                secret_name = (
-                    f"{self.environment}-{self.flow_name}-{key.replace('_', '-')}"
-                )
-                secret = Secret.load(secret_name)
-                return secret.get()
-            except ValueError:
-                pass
-
-        # Try environment-specific global secret
-        try:
-            secret_name = f"{self.environment}-global-{key.replace('_', '-')}"
-            secret = Secret.load(secret_name)
-            return secret.get()
-        except ValueError:
-            pass
+            secret_names.insert(0, f"{self.environment}-{self.flow_name}-{block_key}")
 
-        # Fall back to base global secret (for backwards compatibility)
-        try:
-            secret_name = f"global-{key.replace('_', '-')}"
-            secret = Secret.load(secret_name)
-            return secret.get()
-        except ValueError:
-            return default
+        value = self._resolve_prefect_value("secret", secret_names)
+        return default if value is _MISSING else value
 
     def get_variable(self, key: str, default: Any = None) -> Any:
         """
@@ -172,28 +302,156 @@ class ConfigManager:
         if env_value is not None:
             return env_value
 
-        # 2. Try Prefect variables (fallback)
-        # Try flow-specific variable first
+        # 2. Try Prefect variables (fallback): flow-specific, environment-specific
+        # global, then base global variable
+        var_names = [f"{self.environment}_global_{key}", f"global_{key}"]
         if self.flow_name:
+            var_names.insert(0, f"{self.environment}_{self.flow_name}_{key}")
+
+        value = self._resolve_prefect_value("variable", var_names)
+        return default if value is _MISSING else value
+
+    def _resolve_prefect_value(self, kind: str, names: list[str]) -> Any:
+        """
+        Resolve the first existing Prefect name, most specific first.
+
+        A key with any of its names in the configuration snapshot is resolved
+        from the snapshot alone; other keys are looked up through the cache.
+
+        Returns:
+            The value, or _MISSING if none of the names exist
+        """
+        if self._snapshot is not None:
+            snapshot_values = self._snapshot[
+                "secrets" if kind == "secret" else "variables"
+            ]
+            for name in names:
+                if name in snapshot_values:
+                    return snapshot_values[name]
+
+        for name in names:
+            value = self._get_prefect_value(kind, name)
+            if value is not _MISSING:
+                return value
+
+        return _MISSING
+
+    def _get_prefect_value(self, kind: str, name: str) -> Any:
+        """
+        Look up a Prefect variable or secret through the TTL cache.
+
+        Returns:
+            The value, or _MISSING if the name does not exist
+        """
+        if self.cache_ttl_seconds > 0:
+            value = self._cache.get(kind, name)
+            if value is not _UNCACHED:
+                return value
+
+        if kind == "secret":
             try:
-                var_name = f"{self.environment}_{self.flow_name}_{key}"
-                return Variable.get(var_name)
+                value = Secret.load(name).get()
             except ValueError:
-                pass
+                value = _MISSING
+        else:
+            try:
+                value = Variable.get(name)
+            except ValueError:
+                value = None
+            # Variable.get returns None for variables that do not exist
+            if value is None:
+                value = _MISSING
 
-        # Try environment-specific global variable
-        try:
-            var_name = f"{self.environment}_global_{key}"
-            return Variable.get(var_name)
-        except ValueError:
-            pass
+        if self.cache_ttl_seconds > 0:
+            self._cache.set(kind, name, value, self.cache_ttl_seconds)
+
+        return value
+
+    def preload(self) -> dict[str, int]:
+        """
+        Fetch all Prefect variables and secrets into the lookup cache.
+
+        Lists variables and secret blocks in a few API calls instead of up to three
+        round trips per configuration key. Names that are absent from the listing
+        are cached as misses. A failed preload only logs a warning; lookups then
+        fall back to fetching each name.
+
+        Returns:
+            Dictionary with the number of "variables" and "secrets" loaded
+        """
+        loaded = {"variables": 0, "secrets": 0}
+        if self.cache_ttl_seconds <= 0:
+            return loaded
 
-        # Fall back to base global variable
         try:
-            var_name = f"global_{key}"
-            return Variable.get(var_name)
-        except ValueError:
-            return default
+            variables, secrets = self._list_prefect_values()
+        except Exception as e:
+            print(f"⚠️ Configuration preload failed, using per-key lookups: {e}")
+            return loaded
+
+        self._cache.set_listing("variable", variables, self.cache_ttl_seconds)
+        self._cache.set_listing("secret", secrets, self.cache_ttl_seconds)
+        loaded = {"variables": len(variables), "secrets": len(secrets)}
+
+        print(
+            f"📦 Preloaded {loaded['variables']} Prefect variables and "
+            f"{loaded['secrets']} secrets"
+        )
+        return loaded
+
+    @staticmethod
+    def _list_prefect_values() -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        List all Prefect variables and secret blocks, page by page.
+
+        Returns:
+            Tuple of (variables by name, secret values by block name)
+        """
+        from prefect.client.orchestration import get_client
+        from prefect.client.schemas.objects import Variable
+
+        with get_client(sync_client=True) as client:
+            # read_variables() has no offset and returns only the first page
+            variables = {}
+            offset = 0
+            while True:
+                response = client.request(
+                    "POST",
+                    "/variables/filter",
+                    json={"offset": offset, "limit": PRELOAD_PAGE_SIZE},
+                )
+                page = Variable.model_validate_list(response.json())
+                for variable in page:
+                    if variable.value is not None:
+                        variables[variable.name] = variable.value
+                if len(page) < PRELOAD_PAGE_SIZE:
+                    break
+                offset += PRELOAD_PAGE_SIZE
+
+            secrets = {}
+            offset = 0
+            while True:
+                documents = client.read_block_documents_by_type(
+                    "secret",
+                    offset=offset,
+                    limit=PRELOAD_PAGE_SIZE,
+                    include_secrets=True,
+                )
+                for document in documents:
+                    if document.name and not document.is_anonymous:
+                        secrets[document.name] = document.data.get("value")
+                if len(documents) < PRELOAD_PAGE_SIZE:
+                    break
+                offset += PRELOAD_PAGE_SIZE
+
+        return variables, secrets
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached Prefect lookups and snapshots of this process."""
+        _prefect_cache.clear()
+        with _snapshots_lock:
+            _snapshots.clear()
 
     def get_config(self, key: str, default: Any = None, is_secret: bool = False) -> Any:
         """
@@ -244,6 +502,23 @@ class ConfigManager:
                 "cleanup_timeout_hours": int,
                 "max_retries": int,
                 "health_check_interval": int,
+                "worker_poll_interval": int,
+                "lease_seconds": int,
+                "enqueue_chunk_size": int,
+                "result_max_bytes": Optional[int],
+                "result_spill_dir": Optional[str],
+                "priority_aging_seconds": Optional[int],
+                "source_cache_enabled": bool,
+                "source_cache_max_entries": int,
+                "source_cache_ttl_seconds": int,
+                "source_cache_path": Optional[str],
+                "process_pool_workers": Optional[int],
+                "task_chunk_size": int,
+                "adaptive_batch_enabled": bool,
+                "adaptive_batch_min_size": int,
+                "adaptive_batch_max_size": int,
+                "adaptive_batch_target_seconds": int,
+                "instance_class": Optional[str],
                 "required_databases": list[str],
                 "enable_distributed_processing": bool
             }
@@ -264,11 +539,79 @@ class ConfigManager:
             "health_check_interval": self._get_int_config(
                 "DISTRIBUTED_PROCESSOR_HEALTH_CHECK_INTERVAL", 300
             ),
+            "worker_poll_interval": self._get_int_config(
+                "DISTRIBUTED_PROCESSOR_WORKER_POLL_INTERVAL", 30
+            ),
+            "lease_seconds": self._get_int_config(
+                "DISTRIBUTED_PROCESSOR_LEASE_SECONDS", 60
+            ),
+            "enqueue_chunk_size": self._get_int_config(
+                "DISTRIBUTED_PROCESSOR_ENQUEUE_CHUNK_SIZE", 10000
+            ),
             "enable_distributed_processing": self._get_bool_config(
                 "DISTRIBUTED_PROCESSOR_ENABLED", True
             ),
         }
 
+        # Result storage: no size cap and no spill directory unless configured
+        config["result_max_bytes"] = self._get_optional_int_config(
+            "DISTRIBUTED_PROCESSOR_RESULT_MAX_BYTES"
+        )
+        config["result_spill_dir"] = (
+            self.get_config("DISTRIBUTED_PROCESSOR_RESULT_SPILL_DIR") or None
+        )
+
+        # Priority aging for claiming: disabled (strict priority order) unless set
+        config["priority_aging_seconds"] = self._get_optional_int_config(
+            "DISTRIBUTED_PROCESSOR_PRIORITY_AGING_SECONDS"
+        )
+
+        # Read-through cache for source database rows: disabled unless enabled,
+        # memory only unless a shared SQLite path is configured
+        config["source_cache_enabled"] = self._get_bool_config(
+            "DISTRIBUTED_PROCESSOR_SOURCE_CACHE_ENABLED", False
+        )
+        config["source_cache_max_entries"] = self._get_int_config(
+            "DISTRIBUTED_PROCESSOR_SOURCE_CACHE_MAX_ENTRIES", 10000
+        )
+        config["source_cache_ttl_seconds"] = self._get_int_config(
+            "DISTRIBUTED_PROCESSOR_SOURCE_CACHE_TTL_SECONDS", 300
+        )
+        config["source_cache_path"] = (
+            self.get_config("DISTRIBUTED_PROCESSOR_SOURCE_CACHE_PATH") or None
+        )
+
+        # Worker processes for use_process_pool flows: sized from the container
+        # CPU quota unless set
+        config["process_pool_workers"] = self._get_optional_int_config(
+            "DISTRIBUTED_PROCESSOR_PROCESS_POOL_WORKERS"
+        )
+
+        # Records processed per Prefect task in distributed flows: one task per
+        # record unless set
+        config["task_chunk_size"] = self._get_int_config(
+            "DISTRIBUTED_PROCESSOR_TASK_CHUNK_SIZE", 1
+        )
+
+        # Adaptive batch sizing when no batch size is given: disabled (fixed
+        # default_batch_size) unless enabled; learned sizes are stored per
+        # instance class, derived from the CPU quota unless set
+        config["adaptive_batch_enabled"] = self._get_bool_config(
+            "DISTRIBUTED_PROCESSOR_ADAPTIVE_BATCH_ENABLED", False
+        )
+        config["adaptive_batch_min_size"] = self._get_int_config(
+            "DISTRIBUTED_PROCESSOR_ADAPTIVE_BATCH_MIN_SIZE", 1
+        )
+        config["adaptive_batch_max_size"] = self._get_int_config(
+            "DISTRIBUTED_PROCESSOR_ADAPTIVE_BATCH_MAX_SIZE", 1000
+        )
+        config["adaptive_batch_target_seconds"] = self._get_int_config(
+            "DISTRIBUTED_PROCESSOR_ADAPTIVE_BATCH_TARGET_SECONDS", 30
+        )
+        config["instance_class"] = (
+            self.get_config("DISTRIBUTED_PROCESSOR_INSTANCE_CLASS") or None
+        )
+
         # Get required databases configuration
         required_databases = self.get_config(
             "DISTRIBUTED_PROCESSOR_REQUIRED_DATABASES", "rpa_db,SurveyHub"
@@ -331,6 +674,26 @@ class ConfigManager:
         # For any other type, use default
         return default
 
+    def _get_optional_int_config(self, key: str) -> Optional[int]:
+        """
+        Get optional positive integer configuration value.
+
+        Args:
+            key: Configuration key
+
+        Returns:
+            Integer configuration value, or None if the key is not set
+
+        Raises:
+            ValueError: If value is set but is not a positive integer
+        """
+        value = self.get_config(key)
+
+        if value is None or (isinstance(value, str) and not value.strip()):
+            return None
+
+        return self._get_int_config(key, 1)
+
     def _get_bool_config(self, key: str, default: bool) -> bool:
         """
         Get boolean configuration value with validation.
@@ -405,6 +768,108 @@ class ConfigManager:
                 f"got: {config['health_check_interval']}"
             )
 
+        # Validate worker fallback poll interval
+        if "worker_poll_interval" in config and (
+            config["worker_poll_interval"] <= 0 or config["worker_poll_interval"] > 3600
+        ):
+            raise ValueError(
+                f"worker_poll_interval must be between 1 and 3600 seconds, "
+                f"got: {config['worker_poll_interval']}"
+            )
+
+        # Validate claim lease duration
+        if "lease_seconds" in config and (
+            config["lease_seconds"] < 10 or config["lease_seconds"] > 3600
+        ):
+            raise ValueError(
+                f"lease_seconds must be between 10 and 3600 seconds, "
+                f"got: {config['lease_seconds']}"
+            )
+
+        # Validate streaming enqueue chunk size
+        if "enqueue_chunk_size" in config and (
+            config["enqueue_chunk_size"] <= 0 or config["enqueue_chunk_size"] > 100000
+        ):
+            raise ValueError(
+                f"enqueue_chunk_size must be between 1 and 100000, "
+                f"got: {config['enqueue_chunk_size']}"
+            )
+
+        # Validate result size cap
+        if config.get("result_max_bytes") is not None and (
+            config["result_max_bytes"] < 1024
+        ):
+            raise ValueError(
+                f"result_max_bytes must be at least 1024 bytes, "
+                f"got: {config['result_max_bytes']}"
+            )
+
+        # Validate source cache bounds
+        if "source_cache_max_entries" in config and (
+            config["source_cache_max_entries"] <= 0
+            or config["source_cache_max_entries"] > 1000000
+        ):
+            raise ValueError(
+                f"source_cache_max_entries must be between 1 and 1000000, "
+                f"got: {config['source_cache_max_entries']}"
+            )
+
+        if "source_cache_ttl_seconds" in config and (
+            config["source_cache_ttl_seconds"] <= 0
+            or config["source_cache_ttl_seconds"] > 86400
+        ):
+            raise ValueError(
+                f"source_cache_ttl_seconds must be between 1 and 86400 seconds, "
+                f"got: {config['source_cache_ttl_seconds']}"
+            )
+
+        # Validate priority aging interval
+        if config.get("priority_aging_seconds") is not None and (
+            config["priority_aging_seconds"] > 86400
+        ):
+            raise ValueError(
+                f"priority_aging_seconds must be between 1 and 86400 seconds, "
+                f"got: {config['priority_aging_seconds']}"
+            )
+
+        # Validate process pool size
+        if config.get("process_pool_workers") is not None and (
+            config["process_pool_workers"] > 256
+        ):
+            raise ValueError(
+                f"process_pool_workers must be between 1 and 256, "
+                f"got: {config['process_pool_workers']}"
+            )
+
+        # Validate records per task
+        if "task_chunk_size" in config and (
+            config["task_chunk_size"] <= 0 or config["task_chunk_size"] > 1000
+        ):
+            raise ValueError(
+                f"task_chunk_size must be between 1 and 1000, "
+                f"got: {config['task_chunk_size']}"
+            )
+
+        # Validate adaptive batch size bounds and target duration
+        if "adaptive_batch_max_size" in config and (
+            config["adaptive_batch_max_size"] > 1000
+            or config["adaptive_batch_min_size"] > config["adaptive_batch_max_size"]
+        ):
+            raise ValueError(
+                f"adaptive batch size bounds must satisfy "
+                f"1 <= adaptive_batch_min_size <= adaptive_batch_max_size <= 1000, "
+                f"got: {config['adaptive_batch_min_size']}.."
+                f"{config['adaptive_batch_max_size']}"
+            )
+
+        if "adaptive_batch_target_seconds" in config and (
+            config["adaptive_batch_target_seconds"] > 3600
+        ):
+            raise ValueError(
+                f"adaptive_batch_target_seconds must be between 1 and 3600 seconds, "
+                f"got: {config['adaptive_batch_target_seconds']}"
+            )
+
         # Validate required databases are configured
         for db_name in config["required_databases"]:
             db_type_key = f"{db_name.upper()}_TYPE"
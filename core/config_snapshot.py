@@ -0,0 +1,193 @@
+"""
+Offline configuration snapshots.
+
+A snapshot holds the Prefect variables and secrets that a flow in one environment
+resolves through ConfigManager, signed with HMAC-SHA256. It is baked into the image
+or mounted into the container; ConfigManager loads it with one file read (see
+CONFIG_SNAPSHOT_PATH) and only asks the Prefect API for names it does not contain,
+so scaling out workers does not multiply Prefect API requests at startup.
+
+Usage:
+    CONFIG_SNAPSHOT_KEY=... python -m core.config_snapshot production \\
+        --flow rpa1 --output config/snapshot.rpa1.json
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+# Environment variables naming the snapshot file and its signing key
+SNAPSHOT_PATH_ENV = "CONFIG_SNAPSHOT_PATH"
+SNAPSHOT_KEY_ENV = "CONFIG_SNAPSHOT_KEY"
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def _signature(content: dict[str, Any], signing_key: str) -> str:
+    """HMAC-SHA256 of the canonical JSON form of the snapshot content."""
+    payload = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hmac.new(
+        signing_key.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+
+def _snapshot_prefixes(environment: str, flow_name: Optional[str]) -> dict[str, tuple]:
+    """Prefect name prefixes ConfigManager looks up for an environment and flow."""
+    variable_prefixes = [f"{environment}_global_", "global_"]
+    secret_prefixes = [f"{environment}-global-", "global-"]
+    if flow_name:
+        variable_prefixes.insert(0, f"{environment}_{flow_name}_")
+        secret_prefixes.insert(0, f"{environment}-{flow_name}-")
+    return {"variables": tuple(variable_prefixes), "secrets": tuple(secret_prefixes)}
+
+
+def create_config_snapshot(
+    environment: str,
+    output_path: Path,
+    signing_key: str,
+    flow_name: Optional[str] = None,
+) -> dict[str, int]:
+    """
+    Resolve the Prefect configuration of an environment and flow into a snapshot.
+
+    Lists all Prefect variables and secret blocks and keeps those in the
+    flow-specific, environment-global and global namespaces. The file is written
+    atomically with owner-only permissions, as it contains secret values.
+
+    Args:
+        environment: Environment name (e.g. 'development', 'production')
+        output_path: Snapshot file to write
+        signing_key: Key used to sign the snapshot
+        flow_name: Optional flow name (e.g. 'rpa1')
+
+    Returns:
+        Dictionary with the number of "variables" and "secrets" written
+
+    Raises:
+        ValueError: If signing_key is empty
+        RuntimeError: If the Prefect API cannot be listed
+    """
+    from core.config import ConfigManager
+
+    if not signing_key:
+        raise ValueError("signing_key must be a non-empty string")
+
+    try:
+        variables, secrets = ConfigManager._list_prefect_values()
+    except Exception as e:
+        raise RuntimeError(f"Failed to list Prefect configuration: {e}") from e
+
+    prefixes = _snapshot_prefixes(environment, flow_name)
+    content = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "environment": environment,
+        "flow_name": flow_name,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "variables": {
+            name: value
+            for name, value in variables.items()
+            if name.startswith(prefixes["variables"])
+        },
+        "secrets": {
+            name: value
+            for name, value in secrets.items()
+            if name.startswith(prefixes["secrets"])
+        },
+    }
+    snapshot = {**content, "signature": _signature(content, signing_key)}
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(f".{output_path.name}.tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as snapshot_file:
+        json.dump(snapshot, snapshot_file, indent=2, sort_keys=True, default=str)
+    os.replace(temp_path, output_path)
+
+    return {
+        "variables": len(content["variables"]),
+        "secrets": len(content["secrets"]),
+    }
+
+
+def load_config_snapshot(path: Path, signing_key: Optional[str]) -> dict[str, Any]:
+    """
+    Read a snapshot and verify its signature.
+
+    Args:
+        path: Snapshot file
+        signing_key: Key the snapshot was signed with
+
+    Returns:
+        Snapshot dictionary with environment, flow_name, created_at, variables
+        and secrets
+
+    Raises:
+        ValueError: If the signing key is missing, the file is not a snapshot of
+            a supported format, or the signature does not match
+        OSError: If the file cannot be read
+    """
+    if not signing_key:
+        raise ValueError(f"{SNAPSHOT_KEY_ENV} is required to verify the snapshot")
+
+    with open(path, encoding="utf-8") as snapshot_file:
+        snapshot = json.load(snapshot_file)
+
+    if not isinstance(snapshot, dict) or "signature" not in snapshot:
+        raise ValueError(f"{path} is not a configuration snapshot")
+
+    content = {key: value for key, value in snapshot.items() if key != "signature"}
+    if not hmac.compare_digest(
+        str(snapshot["signature"]), _signature(content, signing_key)
+    ):
+        raise ValueError(f"Signature of configuration snapshot {path} does not match")
+
+    if content.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported configuration snapshot format: {content.get('format_version')}"
+        )
+
+    return content
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point for creating a configuration snapshot."""
+    parser = argparse.ArgumentParser(
+        description="Resolve the Prefect configuration of an environment and flow "
+        "into a signed snapshot file"
+    )
+    parser.add_argument("environment", help="Environment name (e.g. production)")
+    parser.add_argument("--flow", help="Flow name (e.g. rpa1)")
+    parser.add_argument(
+        "--output", required=True, type=Path, help="Snapshot file to write"
+    )
+    args = parser.parse_args(argv)
+
+    signing_key = os.getenv(SNAPSHOT_KEY_ENV)
+    if not signing_key:
+        print(f"❌ {SNAPSHOT_KEY_ENV} must be set to sign the snapshot")
+        return 1
+
+    try:
+        counts = create_config_snapshot(
+            args.environment, args.output, signing_key, flow_name=args.flow
+        )
+    except (RuntimeError, OSError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(
+        f"✅ Wrote {counts['variables']} variables and {counts['secrets']} secrets "
+        f"to {args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
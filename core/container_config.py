@@ -103,6 +103,9 @@ class ContainerConfigManager(ConfigManager):
         - CONTAINER_MONITORING_* -> monitoring configuration
         - CONTAINER_SECURITY_* -> security configuration
 
+        Prefect values are read from the configuration snapshot when one is in
+        use (reported as config_snapshot), so loading makes no API calls for them.
+
         Returns:
             Dictionary containing complete container configuration
         """
@@ -110,6 +113,7 @@ class ContainerConfigManager(ConfigManager):
             "container_id": self.container_id,
             "environment": self.environment,
             "flow_name": self.flow_name,
+            "config_snapshot": self.snapshot_path if self._snapshot else None,
             "databases": self._load_database_configs(),
             "services": self._load_service_dependencies(),
             "monitoring": self._load_monitoring_config(),
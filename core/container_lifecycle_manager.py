@@ -19,12 +19,13 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Optional
 
-import psutil
-
 from core.container_config import ContainerConfigManager
 from core.health_monitor import HealthMonitor
+from core.lazy_import import lazy_import
 from core.service_orchestrator import ServiceOrchestrator
 
+psutil = lazy_import("psutil")
+
 
 class ContainerState(Enum):
     """Container lifecycle states"""
@@ -6,16 +6,21 @@ query execution, migration management, and health monitoring across different
 database types using SQLAlchemy and Pyway.
 """
 
+import atexit
+import io
+import json
 import logging
+import math
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import urlparse
 
-from pyway.configfile import ConfigFile
-
-# Migration-related imports
-from pyway.migrate import Migrate
-
 # Database-related imports
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import (
@@ -36,6 +41,16 @@ from tenacity import (
 
 # Import existing configuration management
 from core.config import ConfigManager
+from core.lazy_import import lazy_import
+from core.query_stats import (
+    DEFAULT_SLOW_QUERY_THRESHOLD_MS,
+    instrument_engine,
+    query_stats,
+)
+
+# Migration-related imports, only needed by run_migrations() and get_migration_status()
+ConfigFile = lazy_import("pyway.configfile", "ConfigFile")
+Migrate = lazy_import("pyway.migrate", "Migrate")
 
 
 def _is_transient_error(exception: Exception) -> bool:
@@ -113,12 +128,363 @@ def _create_retry_decorator(
     )
 
 
+# Table and column names accepted by bulk_insert (optionally schema-qualified)
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+
+# NULL marker used in COPY CSV data, so that empty strings stay empty strings
+_COPY_NULL = "\\N"
+
+# Characters that require a COPY CSV field to be quoted
+_COPY_QUOTED_CHARS = (",", '"', "\r", "\n")
+
+# Plain "INSERT INTO t (a, b) VALUES (:a, :b)" statements, which execute_many can
+# load with COPY on PostgreSQL
+_SIMPLE_INSERT_PATTERN = re.compile(
+    r"^\s*INSERT\s+INTO\s+(?P<table>\S+)\s*\((?P<columns>[^()]*)\)\s*"
+    r"VALUES\s*\((?P<values>[^()]*)\)\s*;?\s*$",
+    re.IGNORECASE,
+)
+_BIND_PARAMETER_PATTERN = re.compile(r"^:([A-Za-z_][A-Za-z0-9_]*)$")
+
+# Named bind parameters in a statement, as recognized by sqlalchemy.text()
+_STATEMENT_BIND_PATTERN = re.compile(r"(?<![:\w\\]):(\w+)(?!:)")
+
+
+def _to_json_value(value: Any) -> Any:
+    """Convert a bulk insert value to a bind parameter (JSON for dicts and lists)."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def _to_bind_value(value: Any) -> Any:
+    """
+    Convert an execute_many value to a bind parameter.
+
+    Dicts have no SQL type of their own and are written as JSON. Lists are left
+    to the driver, which binds them as arrays (e.g. "WHERE id = ANY(:ids)").
+    """
+    if isinstance(value, dict):
+        return json.dumps(value, default=str)
+    return value
+
+
+def _to_copy_value(value: Any) -> str:
+    """Convert a bulk insert value to a COPY CSV field (None becomes NULL)."""
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex input format
+        return "\\x" + bytes(value).hex()
+
+    field = str(_to_json_value(value))
+    # Only unquoted fields are compared with the NULL marker, so a string equal
+    # to it must be quoted to stay a string
+    if field == _COPY_NULL or any(char in field for char in _COPY_QUOTED_CHARS):
+        return '"' + field.replace('"', '""') + '"'
+    return field
+
+
+def _parse_simple_insert(
+    query: str,
+) -> Optional[tuple[str, list[str], list[str]]]:
+    """
+    Recognize a single-row INSERT whose values are all bind parameters.
+
+    Returns:
+        Tuple of table, column names and bind parameter names, or None if the
+        statement has any other shape (expressions, RETURNING, ON CONFLICT, ...)
+    """
+    match = _SIMPLE_INSERT_PATTERN.match(query)
+    if match is None or not _IDENTIFIER_PATTERN.match(match.group("table")):
+        return None
+
+    columns = [column.strip() for column in match.group("columns").split(",")]
+    values = [value.strip() for value in match.group("values").split(",")]
+    if len(columns) != len(values) or not all(
+        _IDENTIFIER_PATTERN.match(column) for column in columns
+    ):
+        return None
+
+    bind_names = []
+    for value in values:
+        bind_match = _BIND_PARAMETER_PATTERN.match(value)
+        if bind_match is None:
+            return None
+        bind_names.append(bind_match.group(1))
+
+    return match.group("table"), columns, bind_names
+
+
+# Row shapes produced by stream_query / iter_query
+_ROW_FORMATS = ("dict", "tuple", "row")
+
+
+def _format_rows(rows: Sequence[Any], row_format: str) -> list:
+    """Convert SQLAlchemy Row objects to dicts, plain tuples or leave them as is."""
+    if row_format == "dict":
+        return [dict(row._mapping) for row in rows]
+    if row_format == "tuple":
+        return [tuple(row) for row in rows]
+    return list(rows)
+
+
+# Default for execute_query_with_timeout when neither the caller nor the
+# configuration sets a timeout
+DEFAULT_QUERY_TIMEOUT_SECONDS = 30
+
+# Driver messages of statements cancelled by a timeout: PostgreSQL
+# statement_timeout / cancel() and pyodbc query timeout (HYT00) / cancel (HY008)
+_STATEMENT_TIMEOUT_INDICATORS = (
+    "canceling statement due to statement timeout",
+    "canceling statement due to user request",
+    "query timeout expired",
+    "hyt00",
+    "hy008",
+)
+
+# Number of statements cancelled by a timeout, per (database_name, query_class)
+_query_timeout_counts: dict[tuple[str, str], int] = {}
+_query_timeout_counts_lock = threading.Lock()
+
+
+def _is_statement_timeout(exception: Exception) -> bool:
+    """Check whether an exception is a statement cancelled by a query timeout."""
+    error_message = str(exception).lower()
+    return any(
+        indicator in error_message for indicator in _STATEMENT_TIMEOUT_INDICATORS
+    )
+
+
+def _record_query_timeout(database_name: str, query_class: str) -> None:
+    """Count one query timeout for the metrics export."""
+    key = (database_name, query_class)
+    with _query_timeout_counts_lock:
+        _query_timeout_counts[key] = _query_timeout_counts.get(key, 0) + 1
+
+
+def get_query_timeout_counts() -> list[dict[str, Any]]:
+    """
+    Report how many statements of this process were cancelled by a timeout.
+
+    Returns:
+        One dictionary per database and query class containing database_name,
+        query_class and timeouts (total count since process start)
+    """
+    with _query_timeout_counts_lock:
+        counts = sorted(_query_timeout_counts.items())
+
+    return [
+        {"database_name": database_name, "query_class": query_class, "timeouts": count}
+        for (database_name, query_class), count in counts
+    ]
+
+
+def reset_query_timeout_counts() -> None:
+    """Clear the query timeout counters (used by tests)."""
+    with _query_timeout_counts_lock:
+        _query_timeout_counts.clear()
+
+
+def _cancel_statement(dbapi_connection: Any, dbapi_cursor: Any) -> None:
+    """
+    Ask the driver to cancel the statement running on a connection.
+
+    psycopg2 cancels through the connection, pyodbc through the cursor and
+    sqlite3 through Connection.interrupt(). Failures are ignored: the statement
+    may already have finished.
+    """
+    cancel = (
+        getattr(dbapi_connection, "cancel", None)
+        or getattr(dbapi_cursor, "cancel", None)
+        or getattr(dbapi_connection, "interrupt", None)
+    )
+    if cancel is None:
+        return
+
+    try:
+        cancel()
+    except Exception:
+        pass
+
+
+@contextmanager
+def _statement_timeout(conn: Any, timeout: Optional[float]):
+    """
+    Limit how long the statements executed on conn inside the block may run.
+
+    PostgreSQL gets SET LOCAL statement_timeout, which ends with the current
+    transaction. SQL Server (pyodbc) gets the connection's query timeout, which
+    applies to cursors created while it is set and is restored afterwards so the
+    pooled connection does not keep it. Other databases are not limited.
+    """
+    if timeout is None:
+        yield
+        return
+
+    dialect_name = conn.dialect.name
+
+    if dialect_name == "postgresql":
+        conn.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {max(1, int(timeout * 1000))}"
+        )
+        yield
+
+    elif dialect_name == "mssql":
+        dbapi_connection = conn.connection.dbapi_connection
+        previous_timeout = dbapi_connection.timeout
+        dbapi_connection.timeout = max(1, math.ceil(timeout))
+        try:
+            yield
+        finally:
+            dbapi_connection.timeout = previous_timeout
+
+    else:
+        yield
+
+
+# Process-wide registry of SQLAlchemy engines shared by all DatabaseManager
+# instances, keyed by database name and connection settings, so that managers
+# created per record or per task reuse one connection pool per database
+_engine_registry: dict[tuple[str, str, int, int], Any] = {}
+_engine_registry_lock = threading.Lock()
+
+
+def _get_shared_engine(
+    database_name: str, connection_string: str, pool_size: int, max_overflow: int
+) -> tuple[Any, bool]:
+    """
+    Get the shared engine for a database, creating it on first use.
+
+    Args:
+        database_name: Name of the database configuration
+        connection_string: SQLAlchemy connection string
+        pool_size: Number of connections kept in the pool
+        max_overflow: Connections allowed beyond pool_size
+
+    Returns:
+        Tuple of the shared SQLAlchemy engine (QueuePool) and whether it was
+        created by this call
+    """
+    key = (database_name, connection_string, pool_size, max_overflow)
+
+    # pyodbc sends executemany parameter sets to SQL Server as one array
+    # instead of one round trip per row
+    dialect_options = {}
+    if connection_string.startswith("mssql+pyodbc"):
+        dialect_options["fast_executemany"] = True
+
+    with _engine_registry_lock:
+        engine = _engine_registry.get(key)
+        if engine is not None:
+            return engine, False
+        engine = create_engine(
+            connection_string,
+            poolclass=QueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,
+            echo=False,  # Set to True for SQL debugging
+            **dialect_options,
+        )
+        instrument_engine(engine, database_name)
+        _engine_registry[key] = engine
+        return engine, True
+
+
+def _is_shared_engine(engine: Any) -> bool:
+    """Check whether an engine is owned by the shared engine registry."""
+    with _engine_registry_lock:
+        return any(shared is engine for shared in _engine_registry.values())
+
+
+def get_engine_registry_status() -> list[dict[str, Any]]:
+    """
+    Report the shared connection pools of this process and how full they are.
+
+    Returns:
+        One dictionary per pool containing:
+            - database_name: Name of the database configuration
+            - url: Connection URL with the password hidden
+            - pool_class: Type of connection pool being used
+            - pool_size: Configured pool size
+            - max_connections: pool_size plus max_overflow
+            - checked_out: Number of connections currently in use
+            - checked_in: Number of idle connections in the pool
+            - overflow: Number of overflow connections beyond pool_size
+            - utilization_percent: checked_out as percentage of max_connections
+    """
+    with _engine_registry_lock:
+        engines = list(_engine_registry.items())
+
+    status = []
+    for (database_name, _, pool_size, max_overflow), engine in engines:
+        pool = engine.pool
+        checked_out = pool.checkedout()
+        max_connections = pool_size + max_overflow
+        status.append(
+            {
+                "database_name": database_name,
+                "url": engine.url.render_as_string(hide_password=True),
+                "pool_class": pool.__class__.__name__,
+                "pool_size": pool_size,
+                "max_connections": max_connections,
+                "checked_out": checked_out,
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "utilization_percent": round(
+                    checked_out / max_connections * 100 if max_connections else 0, 2
+                ),
+            }
+        )
+    return status
+
+
+def dispose_engines() -> None:
+    """
+    Close the connections of all shared engines and empty the registry.
+
+    Called automatically at interpreter exit. DatabaseManager instances created
+    afterwards get new engines.
+    """
+    with _engine_registry_lock:
+        engines = list(_engine_registry.values())
+        _engine_registry.clear()
+
+    for engine in engines:
+        engine.dispose()
+
+
+def _reset_engines_after_fork() -> None:
+    """
+    Give a forked child process fresh connection pools.
+
+    Connections inherited from the parent must not be used or closed by the
+    child, so the pools are replaced without closing them (close=False). The
+    engines stay registered and keep working in the child with new connections.
+    """
+    global _engine_registry_lock
+
+    _engine_registry_lock = threading.Lock()
+    for engine in _engine_registry.values():
+        engine.dispose(close=False)
+
+
+atexit.register(dispose_engines)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_engines_after_fork)
+
+
 class DatabaseManager:
     """
     Unified database manager for PostgreSQL and SQL Server databases.
 
     Provides connection pooling, query execution, migration management,
-    and health monitoring capabilities through a single interface.
+    and health monitoring capabilities through a single interface. Instances
+    with the same database configuration share one process-wide engine and
+    connection pool (see get_engine_registry_status).
     """
 
     def __init__(self, database_name: str):
@@ -143,6 +509,11 @@ class DatabaseManager:
         self._logger = None
         self._config_manager = None
 
+        # Statement timeouts in seconds: the database default (loaded with the
+        # engine) and per query class (loaded on first use)
+        self._default_query_timeout = None
+        self._query_class_timeouts = {}
+
         # Initialize logger lazily
         self._initialize_logger()
 
@@ -257,18 +628,30 @@ class DatabaseManager:
                 )
             )
 
-            # Create SQLAlchemy engine with QueuePool
-            self.engine = create_engine(
-                connection_string,
-                poolclass=QueuePool,
-                pool_size=pool_size,
-                max_overflow=max_overflow,
-                pool_pre_ping=True,
-                echo=False,  # Set to True for SQL debugging
+            # Statements at or above this duration go to the slow-query log
+            query_stats.set_slow_query_threshold(
+                self.database_name,
+                self._parse_slow_query_threshold(
+                    self._config_manager.get_variable(
+                        f"{self.database_name}_slow_query_threshold_ms",
+                        DEFAULT_SLOW_QUERY_THRESHOLD_MS,
+                    )
+                ),
+            )
+
+            # Optional statement timeout applied to every query of this database
+            self._default_query_timeout = self._parse_query_timeout(
+                self._config_manager.get_variable(f"{self.database_name}_query_timeout")
+            )
+
+            # Share one SQLAlchemy engine (QueuePool) per database per process
+            self.engine, created = _get_shared_engine(
+                self.database_name, connection_string, pool_size, max_overflow
             )
 
             self.logger.info(
-                f"Created SQLAlchemy engine for '{self.database_name}' "
+                f"{'Created' if created else 'Reusing shared'} SQLAlchemy engine "
+                f"for '{self.database_name}' "
                 f"(type: {db_type}, pool_size: {pool_size}, "
                 f"max_overflow: {max_overflow})"
             )
@@ -280,6 +663,86 @@ class DatabaseManager:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def _parse_query_timeout(self, value: Any) -> Optional[float]:
+        """Convert a configured timeout to positive seconds, ignoring bad values."""
+        if value is None or value == "":
+            return None
+
+        try:
+            timeout = float(value)
+        except (TypeError, ValueError):
+            timeout = 0
+
+        if timeout <= 0:
+            self.logger.warning(
+                f"Ignoring invalid query timeout {value!r} "
+                f"for database '{self.database_name}'"
+            )
+            return None
+
+        return timeout
+
+    def _parse_slow_query_threshold(self, value: Any) -> float:
+        """Convert a configured slow-query threshold to milliseconds, or the default."""
+        try:
+            threshold_ms = float(value)
+        except (TypeError, ValueError):
+            threshold_ms = -1
+
+        if not threshold_ms >= 0:
+            self.logger.warning(
+                f"Ignoring invalid slow query threshold {value!r} "
+                f"for database '{self.database_name}'"
+            )
+            return DEFAULT_SLOW_QUERY_THRESHOLD_MS
+
+        return threshold_ms
+
+    def get_query_timeout(self, query_class: Optional[str] = None) -> Optional[float]:
+        """
+        Get the configured statement timeout for a class of queries.
+
+        Looks up {database_name}_query_timeout_{query_class} (for example
+        RPA_DB_QUERY_TIMEOUT_MONITORING) and falls back to the database default
+        {database_name}_query_timeout. Values are cached per manager.
+
+        Args:
+            query_class: Name of the query class (e.g. "monitoring", "source"),
+                or None for the database default
+
+        Returns:
+            Timeout in seconds, or None if no timeout is configured
+        """
+        if self.engine is None:
+            self._initialize_engine()
+
+        if query_class is None:
+            return self._default_query_timeout
+
+        if query_class not in self._query_class_timeouts:
+            self._query_class_timeouts[query_class] = self._parse_query_timeout(
+                self._config_manager.get_variable(
+                    f"{self.database_name}_query_timeout_{query_class}"
+                )
+            )
+
+        class_timeout = self._query_class_timeouts[query_class]
+        return (
+            class_timeout if class_timeout is not None else self._default_query_timeout
+        )
+
+    def _handle_query_timeout(
+        self, error: Exception, timeout: float, query_class: Optional[str]
+    ) -> RuntimeError:
+        """Count and log a statement cancelled by its timeout."""
+        _record_query_timeout(self.database_name, query_class or "default")
+        error_msg = (
+            f"Query timeout ({timeout}s) exceeded for database "
+            f"'{self.database_name}': {error}"
+        )
+        self.logger.error(error_msg)
+        return RuntimeError(error_msg)
+
     def execute_query(self, query: str, params: Optional[dict] = None) -> list[dict]:
         """
         Execute a SQL query and return results as list of dictionaries.
@@ -297,10 +760,15 @@ class DatabaseManager:
         if not query or not isinstance(query, str):
             raise ValueError("Query must be a non-empty string")
 
+        timeout = None
+
         try:
             self.logger.debug(f"Executing query for database '{self.database_name}'")
 
-            with self.db_engine.connect() as conn:
+            engine = self.db_engine
+            timeout = self._default_query_timeout
+
+            with engine.connect() as conn, _statement_timeout(conn, timeout):
                 # Use SQLAlchemy text() for parameterized queries
                 sql_text = text(query)
                 result = conn.execute(sql_text, params or {})
@@ -329,6 +797,8 @@ class DatabaseManager:
                     return [{"affected_rows": affected_rows}]
 
         except Exception as e:
+            if timeout is not None and _is_statement_timeout(e):
+                raise self._handle_query_timeout(e, timeout, None) from e
             error_msg = (
                 f"Query execution failed for database '{self.database_name}': {e}"
             )
@@ -336,15 +806,28 @@ class DatabaseManager:
             raise RuntimeError(error_msg) from e
 
     def execute_query_with_timeout(
-        self, query: str, params: Optional[dict] = None, timeout: int = 30
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+        query_class: Optional[str] = None,
     ) -> list[dict]:
         """
-        Execute a SQL query with timeout control.
+        Execute a SQL query that the database cancels after a timeout.
+
+        The timeout is enforced by the database per statement: SET LOCAL
+        statement_timeout on PostgreSQL and the pyodbc query timeout on SQL
+        Server. Cancelled statements are counted per query class (see
+        get_query_timeout_counts).
 
         Args:
             query: SQL query string
             params: Optional query parameters
-            timeout: Query timeout in seconds (must be positive)
+            timeout: Query timeout in seconds (must be positive). Defaults to the
+                configured timeout of query_class (see get_query_timeout), then
+                DEFAULT_QUERY_TIMEOUT_SECONDS
+            query_class: Name of the query class used for configuration and
+                metrics (e.g. "monitoring", "source")
 
         Returns:
             List of dictionaries representing query results
@@ -356,20 +839,22 @@ class DatabaseManager:
         if not query or not isinstance(query, str):
             raise ValueError("Query must be a non-empty string")
 
-        if timeout <= 0:
+        if timeout is not None and timeout <= 0:
             raise ValueError("Timeout must be a positive integer")
 
         try:
+            if timeout is None:
+                timeout = (
+                    self.get_query_timeout(query_class) or DEFAULT_QUERY_TIMEOUT_SECONDS
+                )
+
             self.logger.debug(
                 f"Executing query with {timeout}s timeout for database '{self.database_name}'"  # noqa E501
             )
 
-            with self.db_engine.connect() as conn:
+            with self.db_engine.connect() as conn, _statement_timeout(conn, timeout):
                 # Use SQLAlchemy text() for parameterized queries
                 sql_text = text(query)
-
-                # Execute query (timeout handling would be implemented at the engine level  # noqa E501
-                # or using asyncio for more advanced timeout control)
                 result = conn.execute(sql_text, params or {})
 
                 # Convert results to list of dictionaries
@@ -389,10 +874,194 @@ class DatabaseManager:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
         except Exception as e:
+            if _is_statement_timeout(e):
+                raise self._handle_query_timeout(e, timeout, query_class) from e
             error_msg = f"Query execution with timeout failed for database '{self.database_name}': {e}"  # noqa E501
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def stream_query(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        chunk_size: int = 1000,
+        row_format: str = "dict",
+        timeout: Optional[float] = None,
+        query_class: Optional[str] = None,
+    ) -> Iterator[list]:
+        """
+        Execute a SQL query and yield its results lazily in chunks of rows.
+
+        Unlike execute_query, the result set is never loaded into memory as a
+        whole: rows are fetched chunk_size at a time. PostgreSQL (psycopg2) uses a
+        server-side (named) cursor; SQL Server (pyodbc) reads the result stream
+        incrementally with fetchmany. The pooled connection stays checked out
+        until the iterator is exhausted or closed, so callers that stop early
+        should close it (e.g. with contextlib.closing).
+
+        Args:
+            query: SQL query string
+            params: Optional query parameters
+            chunk_size: Number of rows fetched from the database per chunk
+            row_format: "dict" (column name to value), "tuple" (plain tuples)
+                or "row" (SQLAlchemy named rows with attribute access)
+            timeout: Maximum seconds for the whole stream, including the time the
+                caller spends between chunks. A statement still running at the
+                deadline is cancelled. Defaults to the configured timeout of
+                query_class (see get_query_timeout); no limit if none is set
+            query_class: Name of the query class used for configuration and
+                metrics
+
+        Returns:
+            Iterator over lists of at most chunk_size rows
+
+        Raises:
+            ValueError: If query, chunk_size, row_format or timeout are invalid
+            RuntimeError: If query execution fails or times out (raised while
+                iterating)
+
+        Example:
+            for chunk in db_manager.stream_query(
+                "SELECT * FROM survey_results WHERE processed_at >= :since",
+                {"since": month_start},
+                chunk_size=5000,
+            ):
+                writer.writerows(chunk)
+        """
+        if not query or not isinstance(query, str):
+            raise ValueError("Query must be a non-empty string")
+
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+
+        if row_format not in _ROW_FORMATS:
+            raise ValueError(
+                f"row_format must be one of {', '.join(_ROW_FORMATS)}, "
+                f"got {row_format!r}"
+            )
+
+        if timeout is not None and timeout <= 0:
+            raise ValueError("Timeout must be a positive integer")
+
+        return self._stream_chunks(
+            query, params, chunk_size, row_format, timeout, query_class
+        )
+
+    def iter_query(
+        self,
+        query: str,
+        params: Optional[dict] = None,
+        chunk_size: int = 1000,
+        row_format: str = "dict",
+        timeout: Optional[float] = None,
+        query_class: Optional[str] = None,
+    ) -> Iterator[Any]:
+        """
+        Execute a SQL query and yield its result rows one at a time.
+
+        Row-by-row view of stream_query: rows are still fetched from the database
+        chunk_size at a time, and the connection is held until the iterator is
+        exhausted or closed.
+
+        Args:
+            query: SQL query string
+            params: Optional query parameters
+            chunk_size: Number of rows fetched from the database per round trip
+            row_format: "dict", "tuple" or "row" (see stream_query)
+            timeout: Maximum seconds for the whole stream (see stream_query)
+            query_class: Name of the query class used for configuration and
+                metrics
+
+        Returns:
+            Iterator over result rows
+
+        Raises:
+            ValueError: If query, chunk_size, row_format or timeout are invalid
+            RuntimeError: If query execution fails or times out (raised while
+                iterating)
+        """
+        chunks = self.stream_query(
+            query, params, chunk_size, row_format, timeout, query_class
+        )
+        return (row for chunk in chunks for row in chunk)
+
+    def _stream_chunks(
+        self,
+        query: str,
+        params: Optional[dict],
+        chunk_size: int,
+        row_format: str,
+        timeout: Optional[float],
+        query_class: Optional[str],
+    ) -> Iterator[list]:
+        """Generator behind stream_query; holds one connection while it runs."""
+        total_rows = 0
+        timed_out = threading.Event()
+
+        try:
+            if timeout is None:
+                timeout = self.get_query_timeout(query_class)
+
+            self.logger.debug(
+                f"Streaming query for database '{self.database_name}' "
+                f"(chunk_size: {chunk_size}, timeout: {timeout})"
+            )
+
+            with self.db_engine.connect() as conn, _statement_timeout(conn, timeout):
+                cursors = []
+                cancel_timer = None
+
+                if timeout is not None:
+                    deadline = time.monotonic() + timeout
+                    dbapi_connection = conn.connection.dbapi_connection
+
+                    def _cancel_running_statement():
+                        timed_out.set()
+                        _cancel_statement(
+                            dbapi_connection, cursors[0] if cursors else None
+                        )
+
+                    cancel_timer = threading.Timer(timeout, _cancel_running_statement)
+                    cancel_timer.daemon = True
+                    cancel_timer.start()
+
+                try:
+                    result = conn.execution_options(
+                        stream_results=True, yield_per=chunk_size
+                    ).execute(text(query), params or {})
+                    cursors.append(result.cursor)
+
+                    if not result.returns_rows:
+                        return
+
+                    for partition in result.partitions(chunk_size):
+                        if timeout is not None and time.monotonic() > deadline:
+                            timed_out.set()
+                            raise TimeoutError("stream exceeded its timeout")
+                        total_rows += len(partition)
+                        yield _format_rows(partition, row_format)
+                finally:
+                    # Stop the timer before the connection goes back to the pool,
+                    # so it cannot cancel a statement of the next checkout
+                    if cancel_timer is not None:
+                        cancel_timer.cancel()
+                        cancel_timer.join()
+
+            self.logger.debug(
+                f"Streamed query completed for database '{self.database_name}', "
+                f"returned {total_rows} rows"
+            )
+
+        except Exception as e:
+            if timed_out.is_set() or _is_statement_timeout(e):
+                raise self._handle_query_timeout(e, timeout, query_class) from e
+            error_msg = (
+                f"Streaming query failed for database '{self.database_name}' "
+                f"after {total_rows} rows: {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
     def execute_transaction(self, queries: list[tuple]) -> list[dict]:
         """
         Execute multiple queries within a single transaction.
@@ -475,6 +1144,240 @@ class DatabaseManager:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def bulk_insert(
+        self, table: str, columns: list[str], rows: Iterable[Sequence[Any]]
+    ) -> int:
+        """
+        Insert many rows in one round trip, committed as a single transaction.
+
+        PostgreSQL databases stream the rows with COPY ... FROM STDIN (CSV format);
+        other databases (SQL Server) use a parameterized INSERT executed with
+        executemany. Dict and list values are written as JSON, bytes as bytea and
+        None as NULL. Callers loading very large inputs should pass rows in chunks.
+
+        Args:
+            table: Target table name
+            columns: Column names, in the order of the values in each row
+            rows: Row value sequences matching columns
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            ValueError: If table, columns or a row are invalid
+            RuntimeError: If the insert fails (the whole call is rolled back)
+
+        Example:
+            count = db_manager.bulk_insert(
+                "processing_queue",
+                ["flow_name", "payload"],
+                [("survey_processor", {"survey_id": 1001})],
+            )
+        """
+        if not isinstance(table, str) or not _IDENTIFIER_PATTERN.match(table):
+            raise ValueError(f"Invalid table name: {table!r}")
+
+        if not columns or not isinstance(columns, list):
+            raise ValueError("columns must be a non-empty list")
+
+        for column in columns:
+            if not isinstance(column, str) or not _IDENTIFIER_PATTERN.match(column):
+                raise ValueError(f"Invalid column name: {column!r}")
+
+        rows = list(rows)
+        for i, row in enumerate(rows):
+            if len(row) != len(columns):
+                raise ValueError(
+                    f"Row at index {i} has {len(row)} values, expected {len(columns)}"
+                )
+
+        if not rows:
+            return 0
+
+        try:
+            engine = self.db_engine
+
+            if engine.dialect.name == "postgresql":
+                self._copy_rows(table, columns, rows)
+                method = "COPY"
+
+            else:
+                placeholders = ", ".join(f":{column}" for column in columns)
+                insert_query = text(
+                    f"INSERT INTO {table} ({', '.join(columns)}) "
+                    f"VALUES ({placeholders})"
+                )
+                param_list = [
+                    {
+                        column: _to_json_value(value)
+                        for column, value in zip(columns, row)
+                    }
+                    for row in rows
+                ]
+
+                with engine.begin() as conn:
+                    # A list of parameter sets is executed with executemany
+                    conn.execute(insert_query, param_list)
+
+                method = "executemany"
+
+            self.logger.debug(
+                f"Bulk inserted {len(rows)} rows into {table} using {method} "
+                f"for database '{self.database_name}'"
+            )
+
+            return len(rows)
+
+        except Exception as e:
+            error_msg = (
+                f"Bulk insert of {len(rows)} rows into {table} failed "
+                f"for database '{self.database_name}': {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def execute_many(
+        self,
+        query: str,
+        param_list: Iterable[dict],
+        chunk_size: int = 1000,
+    ) -> list[int]:
+        """
+        Execute one statement with many parameter sets, chunk_size sets at a time.
+
+        Each chunk is one executemany call on one connection, committed as its own
+        transaction. On SQL Server (pyodbc) the engine uses fast_executemany, so a
+        chunk is sent as a single parameter array. On PostgreSQL, plain
+        "INSERT INTO t (a, b) VALUES (:a, :b)" statements are loaded with COPY
+        unless a value is a list; any other statement uses the driver's
+        executemany. Dict values are written as JSON; list values are bound by the
+        driver (PostgreSQL arrays, e.g. "WHERE id = ANY(:ids)").
+
+        Args:
+            query: SQL statement with named bind parameters (:name)
+            param_list: Parameter dictionaries, one per execution
+            chunk_size: Number of parameter sets executed per round trip
+
+        Returns:
+            Affected row count of each chunk, in order (-1 where the driver
+            cannot report it)
+
+        Raises:
+            ValueError: If query, chunk_size or a parameter set are invalid,
+                including a parameter set missing a bind parameter of the query
+                (checked before any chunk is executed)
+            RuntimeError: If a chunk fails; that chunk is rolled back, earlier
+                chunks stay committed
+
+        Example:
+            counts = db_manager.execute_many(
+                "UPDATE customer_orders SET status = :status WHERE order_id = :id",
+                [{"id": 1, "status": "shipped"}, {"id": 2, "status": "cancelled"}],
+                chunk_size=500,
+            )
+        """
+        if not query or not isinstance(query, str):
+            raise ValueError("Query must be a non-empty string")
+
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+
+        param_list = list(param_list)
+        for i, params in enumerate(param_list):
+            if not isinstance(params, dict):
+                raise ValueError(f"Parameters at index {i} must be a dictionary")
+
+        if not param_list:
+            return []
+
+        bind_names = set(_STATEMENT_BIND_PATTERN.findall(query))
+        for i, params in enumerate(param_list):
+            missing = bind_names.difference(params)
+            if missing:
+                raise ValueError(
+                    f"Parameters at index {i} are missing bind parameters: "
+                    f"{sorted(missing)}"
+                )
+
+        chunk_counts = []
+
+        try:
+            engine = self.db_engine
+            simple_insert = (
+                _parse_simple_insert(query)
+                if engine.dialect.name == "postgresql"
+                and not any(
+                    isinstance(value, list)
+                    for params in param_list
+                    for value in params.values()
+                )
+                else None
+            )
+            statement = text(query)
+
+            for start in range(0, len(param_list), chunk_size):
+                chunk = param_list[start : start + chunk_size]
+
+                if simple_insert is not None:
+                    table, columns, bind_names = simple_insert
+                    self._copy_rows(
+                        table,
+                        columns,
+                        [[params[name] for name in bind_names] for params in chunk],
+                    )
+                    chunk_counts.append(len(chunk))
+                    continue
+
+                bound_chunk = [
+                    {key: _to_bind_value(value) for key, value in params.items()}
+                    for params in chunk
+                ]
+                with engine.begin() as conn:
+                    # A list of parameter sets is executed with executemany
+                    result = conn.execute(statement, bound_chunk)
+                    chunk_counts.append(result.rowcount)
+
+            self.logger.debug(
+                f"Executed statement with {len(param_list)} parameter sets in "
+                f"{len(chunk_counts)} chunks using "
+                f"{'COPY' if simple_insert is not None else 'executemany'} "
+                f"for database '{self.database_name}'"
+            )
+
+            return chunk_counts
+
+        except Exception as e:
+            error_msg = (
+                f"execute_many failed for database '{self.database_name}' "
+                f"after {len(chunk_counts)} committed chunks: {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def _copy_rows(
+        self, table: str, columns: list[str], rows: Iterable[Sequence[Any]]
+    ) -> None:
+        """Load rows into a PostgreSQL table with COPY ... FROM STDIN (CSV)."""
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(",".join(_to_copy_value(value) for value in row) + "\n")
+        buffer.seek(0)
+
+        connection = self.db_engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY {table} ({', '.join(columns)}) FROM STDIN "
+                    f"WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+                    buffer,
+                )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
     def run_migrations(self) -> None:
         """
         Execute pending database migrations using Pyway.
@@ -905,6 +1808,38 @@ class DatabaseManager:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def get_query_stats(self) -> dict[str, Any]:
+        """
+        Get per-statement latency statistics of this database for this process.
+
+        Statistics are recorded by event hooks on the shared engine for every
+        statement, grouped by normalized query fingerprint (see core.query_stats).
+
+        Returns:
+            Dictionary containing:
+                - database_name: Name of the database
+                - slow_query_threshold_ms: Duration logged as slow query
+                - statements: Per-fingerprint count, errors, rows, total/max/avg
+                  latency and histogram buckets, slowest total time first
+                - checkout_wait: Connection checkout wait statistics, or None
+                  if no connection was checked out yet
+        """
+        checkout_wait = [
+            entry
+            for entry in query_stats.get_checkout_wait_stats()
+            if entry["database_name"] == self.database_name
+        ]
+
+        return {
+            "database_name": self.database_name,
+            "slow_query_threshold_ms": query_stats.get_slow_query_threshold(
+                self.database_name
+            )
+            * 1000,
+            "statements": query_stats.get_statement_stats(self.database_name),
+            "checkout_wait": checkout_wait[0] if checkout_wait else None,
+        }
+
     # Retry-enabled database operations
 
     def execute_query_with_retry(
@@ -1196,12 +2131,14 @@ class DatabaseManager:
                     f"'{self.database_name}': {exc_type.__name__}: {exc_val}"
                 )
 
-            # Clean up engine resources if they exist
+            # Clean up engine resources if they exist; shared engines stay open
+            # for the other managers and are disposed by dispose_engines()
             if self.engine is not None:
-                self.logger.debug(
-                    f"Disposing engine for database '{self.database_name}'"
-                )
-                self.engine.dispose()
+                if not _is_shared_engine(self.engine):
+                    self.logger.debug(
+                        f"Disposing engine for database '{self.database_name}'"
+                    )
+                    self.engine.dispose()
                 self.engine = None
 
             self.logger.debug(
@@ -7,15 +7,359 @@ locking to ensure each record is processed exactly once, even when multiple
 container instances are running concurrently.
 """
 
+import itertools
+import json
+import os
 import socket
+import threading
 import uuid
-from typing import Any, Optional
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Callable, Optional
 
+from core.adaptive_batch import AdaptiveBatchSizer
 from core.config import ConfigManager
 from core.database import DatabaseManager, _create_retry_decorator
+from core.source_cache import (
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_TTL_SECONDS,
+    SourceRowCache,
+)
+from core.survey_scoring import calculate_satisfaction_score
+
+# Claim lease duration used when the configuration does not provide one
+DEFAULT_LEASE_SECONDS = 60
+
+# Records per chunk for stream_records_to_queue when not configured
+DEFAULT_ENQUEUE_CHUNK_SIZE = 10000
+
+# Survey ids per source lookup; SQL Server accepts at most 2100 bind parameters
+SOURCE_LOOKUP_CHUNK_SIZE = 2000
+
+# Queue priorities: lower values are claimed first (see migration V011)
+PRIORITY_HIGH = 0
+DEFAULT_PRIORITY = 100
+PRIORITY_LOW = 200
+MAX_PRIORITY = 1000
+
+
+# Status counts reported by get_queue_status
+_QUEUE_STATUSES = ("pending", "processing", "completed", "failed")
+
+# Update the queue status and store the result in one statement; nothing is
+# inserted when the ownership check does not match
+_MARK_RECORD_COMPLETED_QUERY = """
+    WITH completed AS (
+        UPDATE processing_queue
+        SET status = 'completed',
+            completed_at = CURRENT_TIMESTAMP,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = :record_id
+          AND status = 'processing'
+          AND flow_instance_id = :instance_id
+        RETURNING id
+    )
+    INSERT INTO processing_results
+        (queue_id, result, result_size_bytes, spill_path)
+    SELECT id, CAST(:result AS jsonb), :result_size, :spill_path
+    FROM completed
+    ON CONFLICT (queue_id) DO UPDATE
+    SET result = EXCLUDED.result,
+        result_size_bytes = EXCLUDED.result_size_bytes,
+        spill_path = EXCLUDED.spill_path,
+        created_at = CURRENT_TIMESTAMP;
+"""
+
+_MARK_RECORD_FAILED_QUERY = """
+    UPDATE processing_queue
+    SET status = 'failed',
+        error_message = :error_message,
+        retry_count = retry_count + 1,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = :record_id
+      AND status = 'processing'
+      AND flow_instance_id = :instance_id;
+"""
+
+
+def _queue_status_queries(
+    flow_name: Optional[str], exact: bool
+) -> tuple[str, dict[str, Any], str]:
+    """
+    Build the get_queue_status statements.
+
+    Returns:
+        Tuple of (status query, its parameters, by-flow query)
+    """
+    if exact:
+        count_expression = "COUNT(*)"
+        source_table = "processing_queue"
+    else:
+        count_expression = "CAST(SUM(record_count) AS BIGINT)"
+        source_table = "processing_queue_stats"
+
+    if flow_name:
+        # Get status for specific flow
+        status_query = f"""
+            SELECT status, {count_expression} as count
+            FROM {source_table}
+            WHERE flow_name = :flow_name
+            GROUP BY status
+        """
+        query_params = {"flow_name": flow_name}
+    else:
+        # Get system-wide status
+        status_query = f"""
+            SELECT status, {count_expression} as count
+            FROM {source_table}
+            GROUP BY status
+        """
+        query_params = {}
+
+    by_flow_query = f"""
+        SELECT flow_name, status, {count_expression} as count
+        FROM {source_table}
+        GROUP BY flow_name, status
+        HAVING {count_expression} > 0
+        ORDER BY flow_name, status
+    """
+
+    return status_query, query_params, by_flow_query
+
+
+def _build_queue_status(
+    flow_name: Optional[str],
+    status_rows: Iterable[Any],
+    by_flow_rows: Optional[Iterable[Any]] = None,
+) -> dict[str, Any]:
+    """
+    Build the get_queue_status result from (status, count) rows.
+
+    Args:
+        flow_name: Flow the counts were filtered by, or None
+        status_rows: Rows of (status, count)
+        by_flow_rows: Rows of (flow_name, status, count), added as "by_flow"
+            when given
+
+    Returns:
+        Queue status dictionary (see DistributedProcessor.get_queue_status)
+    """
+    status_counts = dict.fromkeys(_QUEUE_STATUSES, 0)
+    for row in status_rows:
+        status = row[0]
+        count = row[1]
+        if status in status_counts:
+            status_counts[status] = count
+
+    queue_status = {
+        "total_records": sum(status_counts.values()),
+        "pending_records": status_counts["pending"],
+        "processing_records": status_counts["processing"],
+        "completed_records": status_counts["completed"],
+        "failed_records": status_counts["failed"],
+        "flow_name": flow_name,
+    }
+
+    if by_flow_rows is not None:
+        by_flow = {}
+        for row in by_flow_rows:
+            flow = row[0]
+            status = row[1]
+            count = row[2]
+
+            if flow not in by_flow:
+                by_flow[flow] = {**dict.fromkeys(_QUEUE_STATUSES, 0), "total": 0}
+
+            by_flow[flow][status] = count
+            by_flow[flow]["total"] += count
+
+        queue_status["by_flow"] = by_flow
+
+    return queue_status
+
+
+class _ProcessorBase:
+    """
+    Database-independent parts shared by DistributedProcessor and
+    AsyncDistributedProcessor (see core.async_distributed).
+
+    Subclasses set rpa_db, config, instance_id and logger.
+    """
+
+    def _generate_instance_id(self) -> str:
+        """
+        Generate unique instance ID using hostname and UUID.
+
+        Creates a unique identifier for this container/process instance to prevent
+        hostname collisions and enable tracking of which instance processed which records.
+
+        Returns:
+            Unique instance identifier string in format: hostname-uuid_prefix
+
+        Example:
+            "rpa-worker-1-abc123de"
+        """
+        try:
+            # Get hostname (container name in Kubernetes/Docker environments)
+            hostname = socket.gethostname()
+
+            # Generate UUID and take first 8 characters for brevity
+            uuid_prefix = str(uuid.uuid4()).replace("-", "")[:8]
+
+            # Combine hostname and UUID prefix
+            instance_id = f"{hostname}-{uuid_prefix}"
+
+            self.logger.debug(f"Generated instance_id: {instance_id}")
+
+            return instance_id
+
+        except Exception as e:
+            # Fallback to UUID-only if hostname fails
+            fallback_id = f"unknown-{str(uuid.uuid4()).replace('-', '')[:8]}"
+            self.logger.warning(
+                f"Failed to get hostname for instance ID generation: {e}. "
+                f"Using fallback: {fallback_id}"
+            )
+            return fallback_id
+
+    @property
+    def database_name(self) -> str:
+        """Get the database name from the rpa_db manager."""
+        return self.rpa_db.database_name
+
+    def _claim_records_query(
+        self, flow_name: str, batch_size: int, lease_seconds: int
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Build the claim_records_batch statement and its parameters.
+
+        Returns:
+            Tuple of (claim query, query parameters)
+        """
+        # Ordering by priority - age / aging equals ordering by
+        # priority * aging + created_at epoch, which does not depend on now()
+        aging_seconds = self.config.get("priority_aging_seconds")
+        if aging_seconds:
+            order_by = (
+                "priority * :aging_seconds + EXTRACT(EPOCH FROM created_at) ASC, "
+                "created_at ASC"
+            )
+        else:
+            order_by = "priority ASC, created_at ASC"
+
+        # SQL query to atomically claim records using FOR UPDATE SKIP LOCKED
+        claim_query = f"""
+            UPDATE processing_queue
+            SET status = 'processing',
+                flow_instance_id = :instance_id,
+                claimed_at = CURRENT_TIMESTAMP,
+                lease_expires_at = CURRENT_TIMESTAMP
+                    + :lease_seconds * INTERVAL '1 second',
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id IN (
+                SELECT id FROM processing_queue
+                WHERE flow_name = :flow_name AND status = 'pending'
+                ORDER BY {order_by}
+                LIMIT :batch_size
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING id, payload, retry_count, created_at;
+        """
+
+        query_params = {
+            "flow_name": flow_name,
+            "batch_size": batch_size,
+            "instance_id": self.instance_id,
+            "lease_seconds": lease_seconds,
+        }
+        if aging_seconds:
+            query_params["aging_seconds"] = aging_seconds
+
+        return claim_query, query_params
+
+    def _serialize_result(
+        self, record_id: int, result: dict[str, Any]
+    ) -> tuple[str, int]:
+        """
+        Serialize a processing result and enforce the result size cap.
+
+        Args:
+            record_id: ID of the record the result belongs to
+            result: Processing result dictionary
+
+        Returns:
+            Tuple of (JSON string, size in bytes)
+
+        Raises:
+            ValueError: If the result exceeds result_max_bytes and no spill
+                directory is configured
+        """
+        result_json = json.dumps(result, default=str)
+        result_size = len(result_json.encode("utf-8"))
+
+        max_bytes = self.config.get("result_max_bytes")
+        if (
+            max_bytes is not None
+            and result_size > max_bytes
+            and not self.config.get("result_spill_dir")
+        ):
+            raise ValueError(
+                f"Result for record {record_id} is {result_size} bytes, exceeding "
+                f"result_max_bytes ({max_bytes}); configure "
+                f"DISTRIBUTED_PROCESSOR_RESULT_SPILL_DIR to store large results on disk"
+            )
+
+        return result_json, result_size
+
+    def _should_spill_result(self, result_size: int) -> bool:
+        """Whether a result of result_size bytes must be spilled to disk."""
+        max_bytes = self.config.get("result_max_bytes")
+        return max_bytes is not None and result_size > max_bytes
+
+    def _spill_result(self, record_id: int, result_json: str) -> str:
+        """
+        Write an oversized result to the spill directory.
+
+        The file is written under a temporary name and renamed so readers never
+        see a partially written result. The name includes the instance ID, so an
+        instance that lost its claim cannot overwrite the result of the owner.
+
+        Args:
+            record_id: ID of the record the result belongs to
+            result_json: Serialized result
+
+        Returns:
+            Path of the spilled result file
+        """
+        spill_dir = Path(self.config["result_spill_dir"])
+        spill_dir.mkdir(parents=True, exist_ok=True)
+
+        spill_path = spill_dir / f"{record_id}.{self.instance_id}.json"
+        temp_path = spill_dir / f".{record_id}.{self.instance_id}.json.tmp"
+        temp_path.write_text(result_json, encoding="utf-8")
+        os.replace(temp_path, spill_path)
+
+        self.logger.info(f"Spilled result for record {record_id} to {spill_path}")
+
+        return str(spill_path)
+
+    def _discard_spilled_result(self, spill_path: Optional[str]) -> None:
+        """
+        Delete a spilled result that no processing_results row refers to.
+
+        Called when the ownership-checked UPDATE did not match the record.
+        Failures are logged; a leftover file does not affect the stored result.
+        """
+        if spill_path is None:
+            return
+
+        try:
+            Path(spill_path).unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Failed to delete spilled result {spill_path}: {e}")
 
 
-class DistributedProcessor:
+class DistributedProcessor(_ProcessorBase):
     """
     Distributed processor for atomic record claiming and status management.
 
@@ -79,6 +423,27 @@ class DistributedProcessor:
         # Use DatabaseManager's logger for consistency
         self.logger = self.rpa_db.logger
 
+        # Default claim lease duration, renewed by LeaseHeartbeat while processing
+        self.lease_seconds = self.config.get("lease_seconds", DEFAULT_LEASE_SECONDS)
+
+        # Optional read-through cache in front of source survey lookups
+        self.source_cache = None
+        if self.config.get("source_cache_enabled", False):
+            self.source_cache = SourceRowCache(
+                max_entries=self.config.get(
+                    "source_cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES
+                ),
+                ttl_seconds=self.config.get(
+                    "source_cache_ttl_seconds", DEFAULT_CACHE_TTL_SECONDS
+                ),
+                disk_path=self.config.get("source_cache_path"),
+                logger=self.logger,
+            )
+
+        # Adaptive batch sizers per flow, created on first use
+        self._batch_sizers: dict[str, AdaptiveBatchSizer] = {}
+        self._batch_sizers_lock = threading.Lock()
+
         # Generate unique instance ID for this container/process
         self.instance_id = self._generate_instance_id()
 
@@ -87,60 +452,24 @@ class DistributedProcessor:
             f"config: {self.config}"
         )
 
-    def _generate_instance_id(self) -> str:
-        """
-        Generate unique instance ID using hostname and UUID.
-
-        Creates a unique identifier for this container/process instance to prevent
-        hostname collisions and enable tracking of which instance processed which records.
-
-        Returns:
-            Unique instance identifier string in format: hostname-uuid_prefix
-
-        Example:
-            "rpa-worker-1-abc123de"
-        """
-        try:
-            # Get hostname (container name in Kubernetes/Docker environments)
-            hostname = socket.gethostname()
-
-            # Generate UUID and take first 8 characters for brevity
-            uuid_prefix = str(uuid.uuid4()).replace("-", "")[:8]
-
-            # Combine hostname and UUID prefix
-            instance_id = f"{hostname}-{uuid_prefix}"
-
-            self.logger.debug(f"Generated instance_id: {instance_id}")
-
-            return instance_id
-
-        except Exception as e:
-            # Fallback to UUID-only if hostname fails
-            fallback_id = f"unknown-{str(uuid.uuid4()).replace('-', '')[:8]}"
-            self.logger.warning(
-                f"Failed to get hostname for instance ID generation: {e}. "
-                f"Using fallback: {fallback_id}"
-            )
-            return fallback_id
-
-    @property
-    def database_name(self) -> str:
-        """Get the database name from the rpa_db manager."""
-        return self.rpa_db.database_name
-
     def claim_records_batch(
-        self, flow_name: str, batch_size: int
+        self, flow_name: str, batch_size: int, lease_seconds: Optional[int] = None
     ) -> list[dict[str, Any]]:
         """
         Claim a batch of pending records atomically for processing.
 
         Uses FOR UPDATE SKIP LOCKED to prevent race conditions when multiple
         containers attempt to claim records simultaneously. Records are claimed
-        in FIFO order (oldest first) and atomically updated to 'processing' status.
+        by priority (lowest value first) and FIFO within a priority, and atomically
+        updated to 'processing' status. When priority_aging_seconds is configured,
+        a record gains one priority level for every priority_aging_seconds it has
+        waited so low-priority work is not starved. Each claimed record gets a lease that expires after lease_seconds unless
+        it is extended with renew_leases (see start_lease_heartbeat).
 
         Args:
             flow_name: Name of the flow to claim records for
             batch_size: Maximum number of records to claim
+            lease_seconds: Lease duration in seconds (uses config lease_seconds if None)
 
         Returns:
             List of claimed records with id, payload, retry_count, and created_at fields.
@@ -163,35 +492,20 @@ class DistributedProcessor:
         if not isinstance(batch_size, int) or batch_size <= 0:
             raise ValueError("batch_size must be a positive integer")
 
+        if lease_seconds is None:
+            lease_seconds = self.lease_seconds
+        if not isinstance(lease_seconds, int) or lease_seconds <= 0:
+            raise ValueError("lease_seconds must be a positive integer")
+
         self.logger.info(
             f"Claiming batch of {batch_size} records for flow '{flow_name}' "
-            f"with instance_id '{self.instance_id}'"
+            f"with instance_id '{self.instance_id}' (lease: {lease_seconds}s)"
         )
 
         try:
-            # SQL query to atomically claim records using FOR UPDATE SKIP LOCKED
-            claim_query = """
-                UPDATE processing_queue
-                SET status = 'processing',
-                    flow_instance_id = :instance_id,
-                    claimed_at = CURRENT_TIMESTAMP,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id IN (
-                    SELECT id FROM processing_queue
-                    WHERE flow_name = :flow_name AND status = 'pending'
-                    ORDER BY created_at ASC
-                    LIMIT :batch_size
-                    FOR UPDATE SKIP LOCKED
-                )
-                RETURNING id, payload, retry_count, created_at;
-            """
-
-            # Execute the claim query with parameters
-            query_params = {
-                "flow_name": flow_name,
-                "batch_size": batch_size,
-                "instance_id": self.instance_id,
-            }
+            claim_query, query_params = self._claim_records_query(
+                flow_name, batch_size, lease_seconds
+            )
 
             results = self.rpa_db.execute_query(claim_query, query_params)
 
@@ -233,16 +547,19 @@ class DistributedProcessor:
         """
         Mark a record as completed and store the processing result.
 
-        Updates the record status to 'completed', stores the result in the payload field,
-        and sets the completed_at timestamp. This method should be called after
-        successful processing of a claimed record.
+        Updates the record status to 'completed' and sets the completed_at timestamp,
+        storing the result in processing_results in the same statement. The queue
+        payload keeps the original input. Results larger than result_max_bytes are
+        spilled to result_spill_dir. This method should be called after successful
+        processing of a claimed record.
 
         Args:
             record_id: ID of the record to mark as completed
-            result: Processing result to store in the payload field
+            result: Processing result to store in processing_results
 
         Raises:
-            ValueError: If record_id is invalid or result is not a dictionary
+            ValueError: If record_id is invalid, result is not a dictionary, or
+                result exceeds result_max_bytes and no spill directory is configured
             RuntimeError: If database operation fails or record not found
 
         Example:
@@ -256,36 +573,34 @@ class DistributedProcessor:
         if not isinstance(result, dict):
             raise ValueError("result must be a dictionary")
 
+        result_json, result_size = self._serialize_result(record_id, result)
+
         self.logger.info(
             f"Marking record {record_id} as completed with instance_id '{self.instance_id}'"
         )
 
         try:
-            # SQL query to update record status to completed
-            update_query = """
-                UPDATE processing_queue
-                SET status = 'completed',
-                    payload = :result,
-                    completed_at = CURRENT_TIMESTAMP,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = :record_id
-                  AND status = 'processing'
-                  AND flow_instance_id = :instance_id;
-            """
+            spill_path = None
+            if self._should_spill_result(result_size):
+                spill_path = self._spill_result(record_id, result_json)
+                result_json = None
 
             # Execute the update query
             query_params = {
                 "record_id": record_id,
-                "result": result,
+                "result": result_json,
+                "result_size": result_size,
+                "spill_path": spill_path,
                 "instance_id": self.instance_id,
             }
 
             rows_affected = self.rpa_db.execute_query(
-                update_query, query_params, return_count=True
+                _MARK_RECORD_COMPLETED_QUERY, query_params, return_count=True
             )
 
             # Check if record was found and updated
             if rows_affected == 0:
+                self._discard_spilled_result(spill_path)
                 error_msg = (
                     f"Record {record_id} not found or not in processing state "
                     f"for instance_id '{self.instance_id}'"
@@ -341,19 +656,7 @@ class DistributedProcessor:
         )
 
         try:
-            # SQL query to update record status to failed and increment retry count
-            update_query = """
-                UPDATE processing_queue
-                SET status = 'failed',
-                    error_message = :error_message,
-                    retry_count = retry_count + 1,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = :record_id
-                  AND status = 'processing'
-                  AND flow_instance_id = :instance_id;
-            """
-
-            # Execute the update query
+            # Update record status to failed and increment retry count
             query_params = {
                 "record_id": record_id,
                 "error_message": error_message.strip(),
@@ -361,7 +664,7 @@ class DistributedProcessor:
             }
 
             rows_affected = self.rpa_db.execute_query(
-                update_query, query_params, return_count=True
+                _MARK_RECORD_FAILED_QUERY, query_params, return_count=True
             )
 
             # Check if record was found and updated
@@ -390,112 +693,735 @@ class DistributedProcessor:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
-    def add_records_to_queue(
-        self, flow_name: str, records: list[dict[str, Any]]
-    ) -> int:
+    def mark_records_completed_batch(
+        self, completions: list[tuple[int, dict[str, Any]]]
+    ) -> list[int]:
         """
-        Add new records to the processing queue with pending status.
+        Mark a batch of records as completed in a single statement.
 
-        Supports batch insertion for efficient bulk record addition. All records
-        are added with 'pending' status and can be claimed by any processor instance.
-        Validates required fields (flow_name, payload) before insertion.
+        Applies all (record_id, result) pairs with one UPDATE ... FROM unnest(...)
+        instead of one round trip per record, storing the results in
+        processing_results within the same statement. The same ownership check and
+        result size handling as mark_record_completed are applied per record: only
+        rows that are still in 'processing' state and claimed by this instance are
+        updated.
 
         Args:
-            flow_name: Name of the flow that will process these records
-            records: List of record dictionaries, each containing 'payload' field
+            completions: List of (record_id, result) tuples
 
         Returns:
-            Number of records successfully added to the queue
+            List of record IDs that were not updated because they were not found,
+            not in processing state, or claimed by another instance.
+            Empty list if every record was updated.
 
         Raises:
-            ValueError: If flow_name is empty, records is empty, or validation fails
+            ValueError: If completions is not a list, contains invalid entries, or
+                a result exceeds result_max_bytes and no spill directory is configured
             RuntimeError: If database operation fails
 
         Example:
-            records = [
-                {"payload": {"survey_id": 1001, "customer_id": "CUST001"}},
-                {"payload": {"survey_id": 1002, "customer_id": "CUST002"}}
-            ]
-            count = processor.add_records_to_queue("survey_processor", records)
+            unmatched = processor.mark_records_completed_batch(
+                [(101, {"score": 8.5}), (102, {"score": 7.0})]
+            )
         """
         # Validate input parameters
-        if not flow_name or not isinstance(flow_name, str):
-            raise ValueError("flow_name must be a non-empty string")
+        if not isinstance(completions, list):
+            raise ValueError("completions must be a list of (record_id, result) tuples")
 
-        if not isinstance(records, list) or len(records) == 0:
-            raise ValueError("records must be a non-empty list")
+        record_ids = self._validate_batch_record_ids(completions, "completions")
 
-        # Validate each record
-        for i, record in enumerate(records):
-            if not isinstance(record, dict):
-                raise ValueError(f"Record at index {i} must be a dictionary")
+        for i, (_record_id, result) in enumerate(completions):
+            if not isinstance(result, dict):
+                raise ValueError(f"Result at index {i} must be a dictionary")
 
-            if "payload" not in record:
-                raise ValueError(
-                    f"Record at index {i} missing required 'payload' field"
-                )
+        if not completions:
+            return []
 
-            if not isinstance(record["payload"], dict):
-                raise ValueError(f"Record at index {i} 'payload' must be a dictionary")
+        serialized = [
+            self._serialize_result(record_id, result)
+            for record_id, result in completions
+        ]
 
         self.logger.info(
-            f"Adding {len(records)} records to queue for flow '{flow_name}'"
+            f"Marking {len(completions)} records as completed "
+            f"with instance_id '{self.instance_id}'"
         )
 
         try:
-            # Use batch insertion for efficiency
-            if len(records) == 1:
-                # Single record insertion
-                insert_query = """
-                    INSERT INTO processing_queue (flow_name, payload, status, created_at, updated_at)
-                    VALUES (:flow_name, :payload, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                """  # noqa: E501
-                query_params = {
-                    "flow_name": flow_name,
-                    "payload": records[0]["payload"],
-                }
-                self.rpa_db.execute_query(insert_query, query_params)
-                inserted_count = 1
-
-            else:
-                # Batch insertion using VALUES clause
-                values_placeholders = []
-                query_params = {"flow_name": flow_name}
-
-                for i, record in enumerate(records):
-                    values_placeholders.append(
-                        f"(:flow_name, :payload_{i}, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
-                    )
-                    query_params[f"payload_{i}"] = record["payload"]
+            results_json = []
+            spill_paths = []
+            for record_id, (result_json, result_size) in zip(record_ids, serialized):
+                if self._should_spill_result(result_size):
+                    spill_paths.append(self._spill_result(record_id, result_json))
+                    results_json.append(None)
+                else:
+                    spill_paths.append(None)
+                    results_json.append(result_json)
+
+            # Single UPDATE joined against the unnested arrays, with the results
+            # of the updated rows inserted into processing_results
+            update_query = """
+                WITH batch AS (
+                    SELECT *
+                    FROM unnest(
+                        CAST(:record_ids AS integer[]),
+                        CAST(:results AS jsonb[]),
+                        CAST(:result_sizes AS integer[]),
+                        CAST(:spill_paths AS text[])
+                    ) AS batch(id, result, result_size, spill_path)
+                ),
+                completed AS (
+                    UPDATE processing_queue AS q
+                    SET status = 'completed',
+                        completed_at = CURRENT_TIMESTAMP,
+                        updated_at = CURRENT_TIMESTAMP
+                    FROM batch
+                    WHERE q.id = batch.id
+                      AND q.status = 'processing'
+                      AND q.flow_instance_id = :instance_id
+                    RETURNING q.id
+                ),
+                stored AS (
+                    INSERT INTO processing_results
+                        (queue_id, result, result_size_bytes, spill_path)
+                    SELECT batch.id, batch.result, batch.result_size, batch.spill_path
+                    FROM batch
+                    JOIN completed ON completed.id = batch.id
+                    ON CONFLICT (queue_id) DO UPDATE
+                    SET result = EXCLUDED.result,
+                        result_size_bytes = EXCLUDED.result_size_bytes,
+                        spill_path = EXCLUDED.spill_path,
+                        created_at = CURRENT_TIMESTAMP
+                )
+                SELECT id FROM completed;
+            """
 
-                insert_query = f"""
-                    INSERT INTO processing_queue (flow_name, payload, status, created_at, updated_at)
-                    VALUES {", ".join(values_placeholders)}
-                """
+            query_params = {
+                "record_ids": record_ids,
+                "results": results_json,
+                "result_sizes": [result_size for _json, result_size in serialized],
+                "spill_paths": spill_paths,
+                "instance_id": self.instance_id,
+            }
 
-                self.rpa_db.execute_query(insert_query, query_params)
-                inserted_count = len(records)
+            results = self.rpa_db.execute_query(update_query, query_params)
 
-            self.logger.info(
-                f"Successfully added {inserted_count} records to queue for flow '{flow_name}'"
+            unmatched_ids = self._collect_unmatched_ids(
+                record_ids, results, "completed"
             )
+            unmatched = set(unmatched_ids)
+            for record_id, spill_path in zip(record_ids, spill_paths):
+                if record_id in unmatched:
+                    self._discard_spilled_result(spill_path)
 
-            return inserted_count
+            return unmatched_ids
 
         except Exception as e:
-            error_msg = f"Failed to add {len(records)} records to queue for flow '{flow_name}': {e}"
-            self.logger.error(error_msg)
+            error_msg = (
+                f"Failed to mark {len(completions)} records as completed "
+                f"for instance_id '{self.instance_id}': {e}"
+            )
+            self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
-    def get_queue_status(self, flow_name: Optional[str] = None) -> dict[str, Any]:
+    def mark_records_failed_batch(self, failures: list[tuple[int, str]]) -> list[int]:
+        """
+        Mark a batch of records as failed in a single statement.
+
+        Applies all (record_id, error_message) pairs with one UPDATE ... FROM
+        unnest(...), incrementing retry_count for each record. The same ownership
+        check as mark_record_failed is applied per record.
+
+        Args:
+            failures: List of (record_id, error_message) tuples
+
+        Returns:
+            List of record IDs that were not updated because they were not found,
+            not in processing state, or claimed by another instance.
+            Empty list if every record was updated.
+
+        Raises:
+            ValueError: If failures is not a list or contains invalid entries
+            RuntimeError: If database operation fails
+
+        Example:
+            unmatched = processor.mark_records_failed_batch(
+                [(103, "Invalid survey data format")]
+            )
+        """
+        # Validate input parameters
+        if not isinstance(failures, list):
+            raise ValueError(
+                "failures must be a list of (record_id, error_message) tuples"
+            )
+
+        record_ids = self._validate_batch_record_ids(failures, "failures")
+
+        for i, (_record_id, error_message) in enumerate(failures):
+            if not isinstance(error_message, str) or not error_message.strip():
+                raise ValueError(
+                    f"Error message at index {i} must be a non-empty string"
+                )
+
+        if not failures:
+            return []
+
+        self.logger.info(
+            f"Marking {len(failures)} records as failed "
+            f"with instance_id '{self.instance_id}'"
+        )
+
+        try:
+            # Single UPDATE joined against the unnested (id, error_message) arrays
+            update_query = """
+                UPDATE processing_queue AS q
+                SET status = 'failed',
+                    error_message = batch.error_message,
+                    retry_count = q.retry_count + 1,
+                    updated_at = CURRENT_TIMESTAMP
+                FROM unnest(
+                    CAST(:record_ids AS integer[]),
+                    CAST(:error_messages AS text[])
+                ) AS batch(id, error_message)
+                WHERE q.id = batch.id
+                  AND q.status = 'processing'
+                  AND q.flow_instance_id = :instance_id
+                RETURNING q.id;
+            """
+
+            query_params = {
+                "record_ids": record_ids,
+                "error_messages": [
+                    error_message.strip() for _record_id, error_message in failures
+                ],
+                "instance_id": self.instance_id,
+            }
+
+            results = self.rpa_db.execute_query(update_query, query_params)
+
+            return self._collect_unmatched_ids(record_ids, results, "failed")
+
+        except Exception as e:
+            error_msg = (
+                f"Failed to mark {len(failures)} records as failed "
+                f"for instance_id '{self.instance_id}': {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def get_record_result(self, record_id: int) -> Optional[dict[str, Any]]:
+        """
+        Get the stored processing result for a completed record.
+
+        Reads the result from processing_results, loading it from the spill
+        directory when it was stored on disk.
+
+        Args:
+            record_id: ID of the completed record
+
+        Returns:
+            Result dictionary, or None if no result is stored for the record
+
+        Raises:
+            ValueError: If record_id is not a positive integer
+            RuntimeError: If database operation or reading the spill file fails
+
+        Example:
+            result = processor.get_record_result(record_id)
+        """
+        if not isinstance(record_id, int) or record_id <= 0:
+            raise ValueError("record_id must be a positive integer")
+
+        try:
+            result_query = """
+                SELECT result, spill_path
+                FROM processing_results
+                WHERE queue_id = :record_id
+            """
+
+            results = self.rpa_db.execute_query(result_query, {"record_id": record_id})
+
+            if not results:
+                return None
+
+            result, spill_path = results[0][0], results[0][1]
+            if spill_path:
+                return json.loads(Path(spill_path).read_text(encoding="utf-8"))
+
+            return result
+
+        except Exception as e:
+            error_msg = f"Failed to get result for record {record_id}: {e}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def _validate_batch_record_ids(
+        self, entries: list[tuple[int, Any]], argument_name: str
+    ) -> list[int]:
+        """
+        Validate (record_id, value) pairs for batch status updates.
+
+        Args:
+            entries: List of (record_id, value) tuples
+            argument_name: Argument name used in error messages
+
+        Returns:
+            List of record IDs in input order
+
+        Raises:
+            ValueError: If an entry is malformed, an ID is invalid or duplicated
+        """
+        record_ids = []
+        for i, entry in enumerate(entries):
+            if not isinstance(entry, tuple) or len(entry) != 2:
+                raise ValueError(
+                    f"Entry at index {i} in {argument_name} must be a "
+                    f"(record_id, value) tuple"
+                )
+
+            record_id = entry[0]
+            if not isinstance(record_id, int) or record_id <= 0:
+                raise ValueError(
+                    f"record_id at index {i} in {argument_name} must be a "
+                    f"positive integer"
+                )
+            record_ids.append(record_id)
+
+        if len(set(record_ids)) != len(record_ids):
+            raise ValueError(f"{argument_name} must not contain duplicate record_ids")
+
+        return record_ids
+
+    def _collect_unmatched_ids(
+        self, record_ids: list[int], results: list[Any], target_status: str
+    ) -> list[int]:
+        """
+        Compare requested record IDs against the IDs returned by a batch UPDATE.
+
+        Args:
+            record_ids: Record IDs that were submitted
+            results: Rows returned by the UPDATE ... RETURNING id statement
+            target_status: Status the records were moved to (for logging)
+
+        Returns:
+            List of submitted record IDs that were not updated, in input order
+        """
+        updated_ids = {row[0] for row in results or []}
+        unmatched_ids = [
+            record_id for record_id in record_ids if record_id not in updated_ids
+        ]
+
+        if unmatched_ids:
+            self.logger.warning(
+                f"{len(unmatched_ids)} of {len(record_ids)} records were not marked "
+                f"as {target_status} (not found or not in processing state "
+                f"for instance_id '{self.instance_id}'): {unmatched_ids[:10]}"
+            )
+
+        self.logger.info(
+            f"Successfully marked {len(record_ids) - len(unmatched_ids)} records "
+            f"as {target_status} with instance_id '{self.instance_id}'"
+        )
+
+        return unmatched_ids
+
+    def add_records_to_queue(
+        self,
+        flow_name: str,
+        records: list[dict[str, Any]],
+        priority: int = DEFAULT_PRIORITY,
+    ) -> int:
+        """
+        Add new records to the processing queue with pending status.
+
+        Supports batch insertion for efficient bulk record addition. All records
+        are added with 'pending' status and can be claimed by any processor instance.
+        Validates required fields (flow_name, payload) before insertion.
+
+        Args:
+            flow_name: Name of the flow that will process these records
+            records: List of record dictionaries, each containing 'payload' field
+                and optionally a 'priority' overriding the priority argument
+            priority: Priority for the records, 0 (PRIORITY_HIGH) to MAX_PRIORITY;
+                lower values are claimed first (default: DEFAULT_PRIORITY)
+
+        Returns:
+            Number of records successfully added to the queue
+
+        Raises:
+            ValueError: If flow_name is empty, records is empty, or validation fails
+            RuntimeError: If database operation fails
+
+        Example:
+            records = [
+                {"payload": {"survey_id": 1001, "customer_id": "CUST001"}},
+                {"payload": {"survey_id": 1002, "customer_id": "CUST002"}}
+            ]
+            count = processor.add_records_to_queue("survey_processor", records)
+
+            # Urgent records are claimed ahead of any backlog
+            processor.add_records_to_queue(
+                "survey_processor", urgent_records, priority=PRIORITY_HIGH
+            )
+        """
+        # Validate input parameters
+        if not flow_name or not isinstance(flow_name, str):
+            raise ValueError("flow_name must be a non-empty string")
+
+        if not isinstance(records, list) or len(records) == 0:
+            raise ValueError("records must be a non-empty list")
+
+        if not self._is_valid_priority(priority):
+            raise ValueError(
+                f"priority must be an integer between 0 and {MAX_PRIORITY}"
+            )
+
+        self._validate_queue_records(records)
+
+        self.logger.info(
+            f"Adding {len(records)} records to queue for flow '{flow_name}'"
+        )
+
+        try:
+            # Use batch insertion for efficiency
+            if len(records) == 1:
+                # Single record insertion
+                insert_query = """
+                    INSERT INTO processing_queue (flow_name, payload, status, created_at, updated_at, priority)
+                    VALUES (:flow_name, :payload, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, :priority)
+                """  # noqa: E501
+                query_params = {
+                    "flow_name": flow_name,
+                    "payload": records[0]["payload"],
+                    "priority": records[0].get("priority", priority),
+                }
+                self.rpa_db.execute_query(insert_query, query_params)
+                inserted_count = 1
+
+            else:
+                # Batch insertion using VALUES clause
+                values_placeholders = []
+                query_params = {"flow_name": flow_name}
+
+                for i, record in enumerate(records):
+                    values_placeholders.append(
+                        f"(:flow_name, :payload_{i}, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, :priority_{i})"  # noqa: E501
+                    )
+                    query_params[f"payload_{i}"] = record["payload"]
+                    query_params[f"priority_{i}"] = record.get("priority", priority)
+
+                insert_query = f"""
+                    INSERT INTO processing_queue (flow_name, payload, status, created_at, updated_at, priority)
+                    VALUES {", ".join(values_placeholders)}
+                """
+
+                self.rpa_db.execute_query(insert_query, query_params)
+                inserted_count = len(records)
+
+            self.logger.info(
+                f"Successfully added {inserted_count} records to queue for flow '{flow_name}'"
+            )
+
+            return inserted_count
+
+        except Exception as e:
+            error_msg = f"Failed to add {len(records)} records to queue for flow '{flow_name}': {e}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def add_records_to_queue_idempotent(
+        self,
+        flow_name: str,
+        records: list[dict[str, Any]],
+        dedup_key: Optional[str] = None,
+        priority: int = DEFAULT_PRIORITY,
+    ) -> dict[str, int]:
+        """
+        Add records to the processing queue, skipping records already enqueued.
+
+        Each record carries a deduplication key, unique per flow_name (see
+        migration V012). Records whose key is already present in the queue, or
+        repeated within the same call, are skipped with ON CONFLICT DO NOTHING,
+        so re-running an enqueue step never schedules the same work twice.
+        Records are written in chunks of enqueue_chunk_size with one INSERT ...
+        SELECT FROM unnest(...) statement per chunk.
+
+        Args:
+            flow_name: Name of the flow that will process these records
+            records: List of record dictionaries, each containing 'payload' field
+                and optionally 'priority' and 'dedup_key' fields
+            dedup_key: Payload field whose value is used as the deduplication key
+                for records without an explicit 'dedup_key' (e.g. "survey_id")
+            priority: Priority for the records, 0 (PRIORITY_HIGH) to MAX_PRIORITY;
+                lower values are claimed first (default: DEFAULT_PRIORITY)
+
+        Returns:
+            Dictionary with the number of records 'inserted' and 'skipped'
+
+        Raises:
+            ValueError: If flow_name is empty, records is empty, validation fails,
+                or a record has no deduplication key
+            RuntimeError: If database operation fails
+
+        Example:
+            counts = processor.add_records_to_queue_idempotent(
+                "survey_processor", records, dedup_key="survey_id"
+            )
+            # {"inserted": 40, "skipped": 10}
+        """
+        # Validate input parameters
+        if not flow_name or not isinstance(flow_name, str):
+            raise ValueError("flow_name must be a non-empty string")
+
+        if not isinstance(records, list) or len(records) == 0:
+            raise ValueError("records must be a non-empty list")
+
+        if not self._is_valid_priority(priority):
+            raise ValueError(
+                f"priority must be an integer between 0 and {MAX_PRIORITY}"
+            )
+
+        self._validate_queue_records(records)
+
+        payloads = []
+        priorities = []
+        dedup_keys = []
+        seen_keys = set()
+
+        for i, record in enumerate(records):
+            key = record.get("dedup_key")
+            if key is None and dedup_key is not None:
+                key = record["payload"].get(dedup_key)
+            if key is None or key == "":
+                raise ValueError(f"Record at index {i} has no deduplication key")
+
+            # Repeats within the call are skipped here rather than sent twice
+            key = str(key)
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+
+            payloads.append(json.dumps(record["payload"], default=str))
+            priorities.append(record.get("priority", priority))
+            dedup_keys.append(key)
+
+        chunk_size = self.config.get("enqueue_chunk_size", DEFAULT_ENQUEUE_CHUNK_SIZE)
+
+        self.logger.info(
+            f"Adding {len(records)} records to queue for flow '{flow_name}' "
+            f"with deduplication ({len(records) - len(dedup_keys)} repeated keys)"
+        )
+
+        insert_query = """
+            INSERT INTO processing_queue
+                (flow_name, payload, status, created_at, updated_at, priority, dedup_key)
+            SELECT :flow_name, batch.payload, 'pending', CURRENT_TIMESTAMP,
+                   CURRENT_TIMESTAMP, batch.priority, batch.dedup_key
+            FROM unnest(
+                CAST(:payloads AS jsonb[]),
+                CAST(:priorities AS integer[]),
+                CAST(:dedup_keys AS text[])
+            ) AS batch(payload, priority, dedup_key)
+            ON CONFLICT (flow_name, dedup_key) WHERE dedup_key IS NOT NULL DO NOTHING
+            RETURNING id
+        """
+
+        inserted_count = 0
+
+        try:
+            for start in range(0, len(dedup_keys), chunk_size):
+                end = start + chunk_size
+                inserted_rows = self.rpa_db.execute_query(
+                    insert_query,
+                    {
+                        "flow_name": flow_name,
+                        "payloads": payloads[start:end],
+                        "priorities": priorities[start:end],
+                        "dedup_keys": dedup_keys[start:end],
+                    },
+                )
+                inserted_count += len(inserted_rows)
+
+        except Exception as e:
+            error_msg = (
+                f"Failed to add {len(records)} records to queue for flow "
+                f"'{flow_name}' ({inserted_count} inserted before the failure): {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        skipped_count = len(records) - inserted_count
+
+        self.logger.info(
+            f"Added {inserted_count} records to queue for flow '{flow_name}', "
+            f"skipped {skipped_count} already enqueued"
+        )
+
+        return {"inserted": inserted_count, "skipped": skipped_count}
+
+    def stream_records_to_queue(
+        self,
+        flow_name: str,
+        payloads: Iterable[dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        priority: int = DEFAULT_PRIORITY,
+        progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    ) -> int:
+        """
+        Stream payloads from any iterable into the processing queue in chunks.
+
+        Bulk enqueue path for large loads: payloads are consumed lazily, so
+        generators of millions of records never need to be held in memory, and
+        each chunk is written with DatabaseManager.bulk_insert (COPY on
+        PostgreSQL) instead of one bind parameter per record. Each chunk is
+        committed on its own; if a chunk fails, earlier chunks stay enqueued.
+
+        Args:
+            flow_name: Name of the flow that will process these records
+            payloads: Iterable or generator of payload dictionaries
+            chunk_size: Records per chunk (uses config enqueue_chunk_size if None)
+            priority: Priority for all records, 0 (PRIORITY_HIGH) to MAX_PRIORITY
+            progress_callback: Optional callable invoked after every chunk with
+                (chunk_number, chunk_records, total_records)
+
+        Returns:
+            Total number of records added to the queue
+
+        Raises:
+            ValueError: If flow_name, chunk_size, priority or a payload is invalid
+            RuntimeError: If writing a chunk fails
+
+        Example:
+            survey_payloads = ({"survey_id": survey_id} for survey_id in survey_ids)
+            count = processor.stream_records_to_queue(
+                "survey_processor", survey_payloads, chunk_size=10000
+            )
+        """
+        if not flow_name or not isinstance(flow_name, str):
+            raise ValueError("flow_name must be a non-empty string")
+
+        if chunk_size is None:
+            chunk_size = self.config.get(
+                "enqueue_chunk_size", DEFAULT_ENQUEUE_CHUNK_SIZE
+            )
+        if (
+            not isinstance(chunk_size, int)
+            or isinstance(chunk_size, bool)
+            or chunk_size <= 0
+        ):
+            raise ValueError("chunk_size must be a positive integer")
+
+        if not self._is_valid_priority(priority):
+            raise ValueError(
+                f"priority must be an integer between 0 and {MAX_PRIORITY}"
+            )
+
+        self.logger.info(
+            f"Streaming records to queue for flow '{flow_name}' "
+            f"(chunk_size: {chunk_size}, priority: {priority})"
+        )
+
+        payload_iterator = iter(payloads)
+        total_records = 0
+        chunk_number = 0
+
+        while True:
+            chunk = list(itertools.islice(payload_iterator, chunk_size))
+            if not chunk:
+                break
+
+            chunk_number += 1
+            rows = []
+            for offset, payload in enumerate(chunk):
+                if not isinstance(payload, dict):
+                    raise ValueError(
+                        f"Payload at index {total_records + offset} must be a dictionary"
+                    )
+                rows.append((flow_name, payload, "pending", priority))
+
+            try:
+                chunk_records = self.rpa_db.bulk_insert(
+                    "processing_queue",
+                    ["flow_name", "payload", "status", "priority"],
+                    rows,
+                )
+            except Exception as e:
+                error_msg = (
+                    f"Failed to enqueue chunk {chunk_number} ({len(rows)} records) "
+                    f"for flow '{flow_name}'; {total_records} records from earlier "
+                    f"chunks were committed: {e}"
+                )
+                self.logger.error(error_msg)
+                raise RuntimeError(error_msg) from e
+
+            total_records += chunk_records
+
+            self.logger.info(
+                f"Enqueued chunk {chunk_number} ({chunk_records} records, "
+                f"{total_records} total) for flow '{flow_name}'"
+            )
+
+            if progress_callback is not None:
+                progress_callback(chunk_number, chunk_records, total_records)
+
+        self.logger.info(
+            f"Successfully streamed {total_records} records in {chunk_number} chunks "
+            f"to queue for flow '{flow_name}'"
+        )
+
+        return total_records
+
+    def _validate_queue_records(self, records: list[dict[str, Any]]) -> None:
+        """
+        Validate the records passed to the add_records_to_queue methods.
+
+        Raises:
+            ValueError: If a record is not a dictionary, has no dictionary payload,
+                or has an invalid priority
+        """
+        for i, record in enumerate(records):
+            if not isinstance(record, dict):
+                raise ValueError(f"Record at index {i} must be a dictionary")
+
+            if "payload" not in record:
+                raise ValueError(
+                    f"Record at index {i} missing required 'payload' field"
+                )
+
+            if not isinstance(record["payload"], dict):
+                raise ValueError(f"Record at index {i} 'payload' must be a dictionary")
+
+            if "priority" in record and not self._is_valid_priority(record["priority"]):
+                raise ValueError(
+                    f"Record at index {i} 'priority' must be an integer "
+                    f"between 0 and {MAX_PRIORITY}"
+                )
+
+    @staticmethod
+    def _is_valid_priority(priority: Any) -> bool:
+        """Whether priority is an integer within the supported range."""
+        return (
+            isinstance(priority, int)
+            and not isinstance(priority, bool)
+            and 0 <= priority <= MAX_PRIORITY
+        )
+
+    def get_queue_status(
+        self, flow_name: Optional[str] = None, exact: bool = False
+    ) -> dict[str, Any]:
         """
         Get queue status with counts by status and optionally by flow_name.
 
         Returns comprehensive queue statistics including record counts by status.
-        Can be filtered by flow_name or return system-wide statistics.
+        Can be filtered by flow_name or return system-wide statistics. Counts are
+        read from the trigger-maintained processing_queue_stats table (see migration
+        V013), so the cost does not grow with the size of processing_queue; pass
+        exact=True to count processing_queue directly instead.
 
         Args:
             flow_name: Optional flow name to filter results. If None, returns all flows.
+            exact: If True, count records in processing_queue instead of reading the
+                counters table (default: False)
 
         Returns:
             Dictionary containing queue status information with the following structure:
@@ -518,6 +1444,9 @@ class DistributedProcessor:
 
             # Get system-wide status
             status = processor.get_queue_status()
+
+            # Count the queue table itself
+            status = processor.get_queue_status(exact=True)
         """
         # Validate input parameters
         if flow_name is not None and (
@@ -525,87 +1454,31 @@ class DistributedProcessor:
         ):
             raise ValueError("flow_name must be a non-empty string or None")
 
-        self.logger.debug(f"Getting queue status for flow: {flow_name or 'all flows'}")
+        self.logger.debug(
+            f"Getting {'exact ' if exact else ''}queue status for flow: "
+            f"{flow_name or 'all flows'}"
+        )
 
         try:
-            if flow_name:
-                # Get status for specific flow
-                status_query = """
-                    SELECT status, COUNT(*) as count
-                    FROM processing_queue
-                    WHERE flow_name = :flow_name
-                    GROUP BY status
-                """
-                query_params = {"flow_name": flow_name}
-
-            else:
-                # Get system-wide status
-                status_query = """
-                    SELECT status, COUNT(*) as count
-                    FROM processing_queue
-                    GROUP BY status
-                """
-                query_params = {}
+            status_query, query_params, by_flow_query = _queue_status_queries(
+                flow_name, exact
+            )
 
             results = self.rpa_db.execute_query(status_query, query_params)
 
-            # Initialize status counts
-            status_counts = {"pending": 0, "processing": 0, "completed": 0, "failed": 0}
-
-            # Process query results
-            for row in results:
-                status = row[0]
-                count = row[1]
-                if status in status_counts:
-                    status_counts[status] = count
-
-            # Calculate total
-            total_records = sum(status_counts.values())
-
-            # Build response
-            queue_status = {
-                "total_records": total_records,
-                "pending_records": status_counts["pending"],
-                "processing_records": status_counts["processing"],
-                "completed_records": status_counts["completed"],
-                "failed_records": status_counts["failed"],
-                "flow_name": flow_name,
-            }
-
             # If no specific flow requested, add breakdown by flow
+            by_flow_results = None
             if flow_name is None:
-                by_flow_query = """
-                    SELECT flow_name, status, COUNT(*) as count
-                    FROM processing_queue
-                    GROUP BY flow_name, status
-                    ORDER BY flow_name, status
-                """
                 by_flow_results = self.rpa_db.execute_query(by_flow_query, {})
 
-                by_flow = {}
-                for row in by_flow_results:
-                    flow = row[0]
-                    status = row[1]
-                    count = row[2]
-
-                    if flow not in by_flow:
-                        by_flow[flow] = {
-                            "pending": 0,
-                            "processing": 0,
-                            "completed": 0,
-                            "failed": 0,
-                            "total": 0,
-                        }
-
-                    by_flow[flow][status] = count
-                    by_flow[flow]["total"] += count
-
-                queue_status["by_flow"] = by_flow
+            queue_status = _build_queue_status(flow_name, results, by_flow_results)
 
             self.logger.debug(
-                f"Queue status retrieved: {total_records} total records "
-                f"({status_counts['pending']} pending, {status_counts['processing']} processing, "
-                f"{status_counts['completed']} completed, {status_counts['failed']} failed)"
+                f"Queue status retrieved: {queue_status['total_records']} total records "
+                f"({queue_status['pending_records']} pending, "
+                f"{queue_status['processing_records']} processing, "
+                f"{queue_status['completed_records']} completed, "
+                f"{queue_status['failed_records']} failed)"
             )
 
             return queue_status
@@ -615,6 +1488,40 @@ class DistributedProcessor:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def refresh_queue_stats(self) -> int:
+        """
+        Recompute the processing_queue_stats counters from processing_queue.
+
+        The counters are kept exact by triggers; this repairs them after manual
+        changes made with triggers disabled. Writers to processing_queue are blocked
+        while the queue is counted, so run it from maintenance, not on a hot path.
+
+        Returns:
+            Number of (flow_name, status) counters that were corrected
+
+        Raises:
+            RuntimeError: If database operation fails
+        """
+        self.logger.info("Recomputing processing queue stats")
+
+        try:
+            results = self.rpa_db.execute_query(
+                "SELECT refresh_processing_queue_stats()", {}
+            )
+            corrected_count = results[0][0] if results else 0
+
+            self.logger.info(
+                f"Recomputed processing queue stats, corrected {corrected_count} "
+                f"counters"
+            )
+
+            return corrected_count
+
+        except Exception as e:
+            error_msg = f"Failed to refresh processing queue stats: {e}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
     def cleanup_orphaned_records(self, timeout_hours: int = 1) -> int:
         """
         Reset stuck processing records after timeout to pending status.
@@ -622,7 +1529,9 @@ class DistributedProcessor:
         Identifies records that have been in 'processing' status for longer than
         the specified timeout and resets them to 'pending' status so they can be
         claimed again. This handles cases where containers crash or fail without
-        properly updating record status.
+        properly updating record status. Records whose lease is still being
+        renewed by their owner are left alone, so long-running records are not
+        processed twice.
 
         Args:
             timeout_hours: Number of hours after which processing records are
@@ -654,10 +1563,12 @@ class DistributedProcessor:
                 SET status = 'pending',
                     flow_instance_id = NULL,
                     claimed_at = NULL,
+                    lease_expires_at = NULL,
                     retry_count = retry_count + 1,
                     updated_at = CURRENT_TIMESTAMP
                 WHERE status = 'processing'
                   AND claimed_at < CURRENT_TIMESTAMP - INTERVAL '{timeout_hours} hours'
+                  AND (lease_expires_at IS NULL OR lease_expires_at < CURRENT_TIMESTAMP)
             """
 
             # Execute the cleanup query
@@ -682,6 +1593,180 @@ class DistributedProcessor:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def renew_leases(
+        self, record_ids: list[int], lease_seconds: Optional[int] = None
+    ) -> list[int]:
+        """
+        Extend the leases of records this instance is still processing.
+
+        Only records in 'processing' status owned by this instance are renewed.
+        Records that were completed, failed, or reclaimed by the lease sweeper are
+        left untouched and omitted from the returned list.
+
+        Args:
+            record_ids: IDs of claimed records to renew
+            lease_seconds: New lease duration in seconds from now
+                (uses config lease_seconds if None)
+
+        Returns:
+            List of record IDs whose lease was renewed
+
+        Raises:
+            ValueError: If record_ids or lease_seconds are invalid
+            RuntimeError: If database operation fails
+
+        Example:
+            renewed_ids = processor.renew_leases([1, 2, 3], lease_seconds=60)
+        """
+        if not isinstance(record_ids, list):
+            raise ValueError("record_ids must be a list")
+
+        for record_id in record_ids:
+            if not isinstance(record_id, int) or record_id <= 0:
+                raise ValueError("record_ids must contain positive integers")
+
+        if lease_seconds is None:
+            lease_seconds = self.lease_seconds
+        if not isinstance(lease_seconds, int) or lease_seconds <= 0:
+            raise ValueError("lease_seconds must be a positive integer")
+
+        if not record_ids:
+            return []
+
+        try:
+            renew_query = """
+                UPDATE processing_queue
+                SET lease_expires_at = CURRENT_TIMESTAMP
+                        + :lease_seconds * INTERVAL '1 second',
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ANY(CAST(:record_ids AS integer[]))
+                  AND status = 'processing'
+                  AND flow_instance_id = :instance_id
+                RETURNING id
+            """
+
+            query_params = {
+                "record_ids": record_ids,
+                "lease_seconds": lease_seconds,
+                "instance_id": self.instance_id,
+            }
+
+            results = self.rpa_db.execute_query(renew_query, query_params)
+            renewed_ids = [row[0] for row in results or []]
+
+            self.logger.debug(
+                f"Renewed {len(renewed_ids)} of {len(record_ids)} leases for "
+                f"{lease_seconds}s (instance_id: '{self.instance_id}')"
+            )
+
+            return renewed_ids
+
+        except Exception as e:
+            error_msg = (
+                f"Failed to renew leases for {len(record_ids)} records "
+                f"(instance_id: '{self.instance_id}'): {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def reclaim_expired_leases(self, flow_name: Optional[str] = None) -> int:
+        """
+        Return processing records with expired leases to pending status.
+
+        Lease sweeper for records held by crashed or stalled instances. Unlike
+        cleanup_orphaned_records, only records whose lease has actually expired are
+        reset, so slow workers that keep renewing their leases are never affected.
+        Reclaimed records have their retry_count incremented.
+
+        Args:
+            flow_name: Optional flow to sweep; None sweeps all flows
+
+        Returns:
+            Number of records that were returned to pending status
+
+        Raises:
+            ValueError: If flow_name is provided but empty or not a string
+            RuntimeError: If database operation fails
+
+        Example:
+            reclaimed_count = processor.reclaim_expired_leases("survey_processor")
+        """
+        if flow_name is not None and (
+            not isinstance(flow_name, str) or not flow_name.strip()
+        ):
+            raise ValueError("flow_name must be a non-empty string or None")
+
+        try:
+            flow_filter = "AND flow_name = :flow_name" if flow_name else ""
+            reclaim_query = f"""
+                UPDATE processing_queue
+                SET status = 'pending',
+                    flow_instance_id = NULL,
+                    claimed_at = NULL,
+                    lease_expires_at = NULL,
+                    retry_count = retry_count + 1,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE status = 'processing'
+                  AND lease_expires_at < CURRENT_TIMESTAMP
+                  {flow_filter}
+                RETURNING id
+            """
+
+            query_params = {"flow_name": flow_name} if flow_name else {}
+
+            results = self.rpa_db.execute_query(reclaim_query, query_params)
+            reclaimed_count = len(results or [])
+
+            scope = f"flow '{flow_name}'" if flow_name else "all flows"
+            if reclaimed_count > 0:
+                self.logger.warning(
+                    f"Reclaimed {reclaimed_count} records with expired leases "
+                    f"for {scope}"
+                )
+            else:
+                self.logger.debug(f"No expired leases found for {scope}")
+
+            return reclaimed_count
+
+        except Exception as e:
+            error_msg = f"Failed to reclaim expired leases: {e}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def start_lease_heartbeat(
+        self,
+        record_ids: list[int],
+        lease_seconds: Optional[int] = None,
+        interval_seconds: Optional[float] = None,
+    ) -> "LeaseHeartbeat":
+        """
+        Start a background heartbeat that keeps renewing leases for claimed records.
+
+        Args:
+            record_ids: IDs of the records being processed
+            lease_seconds: Lease duration applied on every renewal
+                (uses config lease_seconds if None)
+            interval_seconds: Time between renewals (defaults to a third of the lease)
+
+        Returns:
+            Running LeaseHeartbeat; call stop() once the records are acknowledged
+
+        Example:
+            heartbeat = processor.start_lease_heartbeat([r["id"] for r in records])
+            try:
+                ...  # process records
+            finally:
+                heartbeat.stop()
+        """
+        heartbeat = LeaseHeartbeat(
+            self,
+            record_ids,
+            lease_seconds=lease_seconds,
+            interval_seconds=interval_seconds,
+        )
+        heartbeat.start()
+        return heartbeat
+
     def reset_failed_records(self, flow_name: str, max_retries: int = 3) -> int:
         """
         Reset failed records to pending status for retry within retry limits.
@@ -765,23 +1850,151 @@ class DistributedProcessor:
                     reset_query, reset_params, return_count=True
                 )
 
-                self.logger.info(
-                    f"Successfully reset {rows_affected} failed records to pending "
-                    f"for flow '{flow_name}' (max_retries: {max_retries})"
+                self.logger.info(
+                    f"Successfully reset {rows_affected} failed records to pending "
+                    f"for flow '{flow_name}' (max_retries: {max_retries})"
+                )
+
+                return rows_affected
+            else:
+                self.logger.debug(
+                    f"No failed records eligible for reset found for flow '{flow_name}' "
+                    f"(max_retries: {max_retries})"
+                )
+                return 0
+
+        except Exception as e:
+            error_msg = (
+                f"Failed to reset failed records for flow '{flow_name}' "
+                f"(max_retries: {max_retries}): {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def get_batch_sizer(self, flow_name: str) -> AdaptiveBatchSizer:
+        """
+        Get the adaptive batch sizer of a flow, restoring its learned state once.
+
+        The sizer starts from default_batch_size and is bounded by the
+        adaptive_batch_* configuration. It is shared by all callers of this
+        processor for the flow.
+
+        Args:
+            flow_name: Flow whose claim batches are sized
+
+        Returns:
+            AdaptiveBatchSizer for the flow and this instance class
+
+        Example:
+            sizer = processor.get_batch_sizer("survey_processor")
+            records = processor.claim_records_batch("survey_processor", sizer.batch_size)
+        """
+        with self._batch_sizers_lock:
+            batch_sizer = self._batch_sizers.get(flow_name)
+            if batch_sizer is None:
+                batch_sizer = AdaptiveBatchSizer(
+                    self,
+                    flow_name,
+                    initial_batch_size=self.config["default_batch_size"],
+                    min_batch_size=self.config.get("adaptive_batch_min_size", 1),
+                    max_batch_size=self.config.get("adaptive_batch_max_size", 1000),
+                    target_batch_seconds=self.config.get(
+                        "adaptive_batch_target_seconds", 30
+                    ),
+                    instance_class=self.config.get("instance_class"),
+                )
+                self._batch_sizers[flow_name] = batch_sizer
+            return batch_sizer
+
+    def load_batch_size_state(
+        self, flow_name: str, instance_class: str
+    ) -> Optional[dict[str, Any]]:
+        """
+        Load the learned batch size of a flow for an instance class.
+
+        Args:
+            flow_name: Name of the flow
+            instance_class: Instance class the state was stored under
+
+        Returns:
+            Dictionary with batch_size, per_record_seconds, claim_seconds,
+            failure_rate and batches_observed, or None if nothing was learned yet
+
+        Raises:
+            RuntimeError: If database operation fails
+        """
+        try:
+            results = self.rpa_db.execute_query(
+                """
+                SELECT batch_size, per_record_seconds, claim_seconds, failure_rate,
+                       batches_observed
+                FROM processing_batch_sizes
+                WHERE flow_name = :flow_name AND instance_class = :instance_class
+                """,
+                {"flow_name": flow_name, "instance_class": instance_class},
+            )
+
+            if not results:
+                return None
+
+            row = results[0]
+            return {
+                "batch_size": row[0],
+                "per_record_seconds": row[1],
+                "claim_seconds": row[2],
+                "failure_rate": row[3],
+                "batches_observed": row[4],
+            }
+
+        except Exception as e:
+            error_msg = (
+                f"Failed to load batch size state for flow '{flow_name}' "
+                f"({instance_class}): {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def save_batch_size_state(
+        self, flow_name: str, instance_class: str, state: dict[str, Any]
+    ) -> None:
+        """
+        Store the learned batch size of a flow for an instance class.
+
+        Args:
+            flow_name: Name of the flow
+            instance_class: Instance class to store the state under
+            state: Dictionary with batch_size, per_record_seconds, claim_seconds,
+                failure_rate and batches_observed
+
+        Raises:
+            RuntimeError: If database operation fails
+        """
+        try:
+            self.rpa_db.execute_query(
+                """
+                INSERT INTO processing_batch_sizes (
+                    flow_name, instance_class, batch_size, per_record_seconds,
+                    claim_seconds, failure_rate, batches_observed, updated_at
                 )
-
-                return rows_affected
-            else:
-                self.logger.debug(
-                    f"No failed records eligible for reset found for flow '{flow_name}' "
-                    f"(max_retries: {max_retries})"
+                VALUES (
+                    :flow_name, :instance_class, :batch_size, :per_record_seconds,
+                    :claim_seconds, :failure_rate, :batches_observed, CURRENT_TIMESTAMP
                 )
-                return 0
+                ON CONFLICT (flow_name, instance_class) DO UPDATE
+                SET batch_size = EXCLUDED.batch_size,
+                    per_record_seconds = EXCLUDED.per_record_seconds,
+                    claim_seconds = EXCLUDED.claim_seconds,
+                    failure_rate = EXCLUDED.failure_rate,
+                    batches_observed = EXCLUDED.batches_observed,
+                    updated_at = EXCLUDED.updated_at
+                """,
+                {"flow_name": flow_name, "instance_class": instance_class, **state},
+            )
 
         except Exception as e:
             error_msg = (
-                f"Failed to reset failed records for flow '{flow_name}' "
-                f"(max_retries: {max_retries}): {e}"
+                f"Failed to save batch size state for flow '{flow_name}' "
+                f"({instance_class}): {e}"
             )
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
@@ -1072,6 +2285,254 @@ class DistributedProcessor:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def process_survey_batch(
+        self, payloads: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Process a batch of surveys with batched source reads and result writes.
+
+        Batch counterpart of process_survey_logic: source rows for all surveys are
+        read from SurveyHub with one IN query per SOURCE_LOOKUP_CHUNK_SIZE survey
+        ids, transformed in memory, and written to processed_surveys with a single
+        bulk insert, instead of one SELECT and one INSERT per survey. Errors are
+        isolated per survey: invalid payloads, missing surveys and transform
+        failures only fail their own entry, a failed source chunk fails the surveys
+        in that chunk, and if the bulk insert fails the results are stored one by
+        one so that only the rows that cannot be written fail.
+
+        Args:
+            payloads: List of payload dictionaries, each with a 'survey_id' field
+
+        Returns:
+            One outcome per payload, in payload order:
+            {"survey_id": str, "status": "completed", "result": dict} or
+            {"survey_id": str, "status": "failed", "error": str}.
+            The result has the same structure as process_survey_logic's; its
+            processing_duration_ms is the batch duration divided by the batch size.
+
+        Raises:
+            ValueError: If payloads is not a list
+            TypeError: If source_db_manager is not configured
+
+        Example:
+            outcomes = processor.process_survey_batch(
+                [{"survey_id": "SURV-001"}, {"survey_id": "SURV-002"}]
+            )
+            failed = [o for o in outcomes if o["status"] == "failed"]
+        """
+        # Validate input parameters
+        if not isinstance(payloads, list):
+            raise ValueError("payloads must be a list")
+
+        # Check if source database is configured
+        if self.source_db is None:
+            raise TypeError(
+                "source_db_manager is required for multi-database processing"
+            )
+
+        if not payloads:
+            return []
+
+        import time
+        from datetime import datetime, timezone
+
+        start_time = time.time()
+        outcomes = [None] * len(payloads)
+
+        # Step 1: Validate payloads, failing invalid ones individually
+        survey_ids = []
+        for i, payload in enumerate(payloads):
+            survey_id = payload.get("survey_id") if isinstance(payload, dict) else None
+            if not isinstance(payload, dict):
+                error = "payload must be a dictionary"
+            elif "survey_id" not in payload:
+                error = "payload must contain 'survey_id' field"
+            elif not isinstance(survey_id, str) or not survey_id.strip():
+                error = "survey_id must be a non-empty string"
+            else:
+                survey_ids.append(survey_id)
+                continue
+            outcomes[i] = {"survey_id": survey_id, "status": "failed", "error": error}
+
+        self.logger.info(
+            f"Processing batch of {len(payloads)} surveys using multi-database pattern"
+        )
+
+        # Step 2: Read source data from SurveyHub in chunked IN queries
+        source_data, source_errors = self._retrieve_source_survey_batch(
+            list(dict.fromkeys(survey_ids))
+        )
+
+        # Step 3: Transform in memory
+        processed = []
+        for i, payload in enumerate(payloads):
+            if outcomes[i] is not None:
+                continue
+
+            survey_id = payload["survey_id"]
+            try:
+                if survey_id in source_errors:
+                    raise RuntimeError(source_errors[survey_id])
+                if survey_id not in source_data:
+                    raise ValueError(f"Survey {survey_id} not found in source database")
+
+                processed.append(
+                    (i, self._transform_survey_data(source_data[survey_id], payload))
+                )
+            except Exception as e:
+                outcomes[i] = {
+                    "survey_id": survey_id,
+                    "status": "failed",
+                    "error": f"Failed to process survey {survey_id}: {e}",
+                }
+
+        # Step 4: Write all results to PostgreSQL in one bulk insert
+        if processed:
+            processed_at = datetime.now(timezone.utc)
+            processing_duration_ms = int(
+                (time.time() - start_time) * 1000 / len(payloads)
+            )
+            for _i, processed_result in processed:
+                processed_result.update(
+                    {
+                        "processed_at": processed_at,
+                        "processing_duration_ms": processing_duration_ms,
+                        "source": "multi_database_processor",
+                    }
+                )
+
+            store_errors = self._store_survey_results_batch(
+                [processed_result for _i, processed_result in processed]
+            )
+
+            for position, (i, processed_result) in enumerate(processed):
+                survey_id = processed_result["survey_id"]
+                if position in store_errors:
+                    outcomes[i] = {
+                        "survey_id": survey_id,
+                        "status": "failed",
+                        "error": f"Failed to process survey {survey_id}: "
+                        f"{store_errors[position]}",
+                    }
+                else:
+                    outcomes[i] = {
+                        "survey_id": survey_id,
+                        "status": "completed",
+                        "result": processed_result,
+                    }
+
+        failed_count = sum(1 for outcome in outcomes if outcome["status"] == "failed")
+
+        self.logger.info(
+            f"Processed batch of {len(payloads)} surveys in "
+            f"{int((time.time() - start_time) * 1000)}ms "
+            f"({len(payloads) - failed_count} completed, {failed_count} failed)"
+        )
+
+        return outcomes
+
+    def _retrieve_source_survey_batch(
+        self, survey_ids: list[str]
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, str]]:
+        """
+        Retrieve source survey data for many surveys from SurveyHub.
+
+        Surveys found in the source cache are not queried; the others are read
+        with one IN query per SOURCE_LOOKUP_CHUNK_SIZE survey ids. A failing chunk
+        is recorded as an error for each of its surveys instead of failing the
+        whole batch.
+
+        Args:
+            survey_ids: Distinct survey identifiers to retrieve
+
+        Returns:
+            Tuple of (survey data by survey_id, error message by survey_id);
+            surveys missing from both were not found
+        """
+        source_data = {}
+        source_errors = {}
+
+        if self.source_cache is not None:
+            source_data = self.source_cache.get_many(survey_ids)
+            survey_ids = [
+                survey_id for survey_id in survey_ids if survey_id not in source_data
+            ]
+
+        for start in range(0, len(survey_ids), SOURCE_LOOKUP_CHUNK_SIZE):
+            chunk = survey_ids[start : start + SOURCE_LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join(f":survey_id_{i}" for i in range(len(chunk)))
+            source_query = f"""
+                SELECT survey_id, customer_id, response_data, submitted_at, survey_type
+                FROM survey_responses
+                WHERE survey_id IN ({placeholders})
+            """
+            query_params = {
+                f"survey_id_{i}": survey_id for i, survey_id in enumerate(chunk)
+            }
+
+            self.logger.debug(f"Querying source database for {len(chunk)} surveys")
+
+            try:
+                results = self.source_db.execute_query(source_query, query_params)
+            except Exception as e:
+                error_msg = (
+                    f"Failed to retrieve survey data for {len(chunk)} surveys: {e}"
+                )
+                self.logger.error(error_msg)
+                source_errors.update(dict.fromkeys(chunk, error_msg))
+                continue
+
+            for survey_row in results:
+                survey_data = self._survey_row_to_dict(survey_row)
+                if survey_data["survey_id"] not in source_data:
+                    source_data[survey_data["survey_id"]] = survey_data
+                    if self.source_cache is not None:
+                        self.source_cache.set(survey_data["survey_id"], survey_data)
+
+        return source_data, source_errors
+
+    def invalidate_source_survey(self, survey_id: str) -> bool:
+        """
+        Drop a survey from the source cache so the next lookup reads SurveyHub.
+
+        Args:
+            survey_id: Survey identifier to invalidate
+
+        Returns:
+            True if the survey was cached, False otherwise or if caching is disabled
+        """
+        if self.source_cache is None:
+            return False
+
+        invalidated = self.source_cache.invalidate(survey_id)
+        self.logger.debug(
+            f"Invalidated source cache for survey {survey_id}: {invalidated}"
+        )
+        return invalidated
+
+    def get_source_cache_stats(self) -> Optional[dict[str, Any]]:
+        """
+        Get hit/miss metrics of the source cache.
+
+        Returns:
+            Cache statistics (see SourceRowCache.stats), or None if caching is
+            disabled
+        """
+        if self.source_cache is None:
+            return None
+        return self.source_cache.stats()
+
+    @staticmethod
+    def _survey_row_to_dict(survey_row: Any) -> dict[str, Any]:
+        """Convert a survey_responses row to a survey data dictionary."""
+        return {
+            "survey_id": survey_row[0],
+            "customer_id": survey_row[1],
+            "response_data": survey_row[2],  # Assuming JSON/JSONB field
+            "submitted_at": survey_row[3],
+            "survey_type": survey_row[4],
+        }
+
     def _retrieve_source_survey_data(self, survey_id: str) -> dict[str, Any]:
         """
         Retrieve source survey data from SurveyHub database.
@@ -1088,6 +2549,12 @@ class DistributedProcessor:
             ValueError: If survey not found
             RuntimeError: If database query fails
         """
+        if self.source_cache is not None:
+            cached_survey = self.source_cache.get(survey_id)
+            if cached_survey is not None:
+                self.logger.debug(f"Source cache hit for survey {survey_id}")
+                return cached_survey
+
         try:
             # Query source database for survey data
             # Note: In a real implementation, this would query actual SurveyHub tables
@@ -1109,17 +2576,13 @@ class DistributedProcessor:
                 raise ValueError(f"Survey {survey_id} not found in source database")
 
             # Convert result to dictionary
-            survey_row = results[0]
-            survey_data = {
-                "survey_id": survey_row[0],
-                "customer_id": survey_row[1],
-                "response_data": survey_row[2],  # Assuming JSON/JSONB field
-                "submitted_at": survey_row[3],
-                "survey_type": survey_row[4],
-            }
+            survey_data = self._survey_row_to_dict(results[0])
 
             self.logger.debug(f"Retrieved survey data for {survey_id}: {survey_data}")
 
+            if self.source_cache is not None:
+                self.source_cache.set(survey_id, survey_data)
+
             return survey_data
 
         except ValueError:
@@ -1206,7 +2669,9 @@ class DistributedProcessor:
         Calculate satisfaction score based on survey responses.
 
         Implements business logic for satisfaction score calculation based on
-        survey type and response data structure.
+        survey type and response data structure. The scoring rules live in
+        core.survey_scoring, which also provides calculate_satisfaction_scores
+        for scoring many responses at once.
 
         Args:
             response_data: Survey response data (JSON structure)
@@ -1215,57 +2680,7 @@ class DistributedProcessor:
         Returns:
             Calculated satisfaction score (0.0-10.0) or None if calculation fails
         """
-        try:
-            if not isinstance(response_data, dict):
-                self.logger.warning("Invalid response_data format, using default score")
-                return 5.0  # Default neutral score
-
-            # Different scoring logic based on survey type
-            if survey_type == "Customer Satisfaction":
-                # Look for overall satisfaction rating
-                overall_rating = response_data.get("overall_satisfaction")
-                if overall_rating is not None:
-                    return float(overall_rating)
-
-                # Fallback: average of all numeric ratings
-                ratings = []
-                for _key, value in response_data.items():
-                    if isinstance(value, (int, float)) and 0 <= value <= 10:
-                        ratings.append(float(value))
-
-                return sum(ratings) / len(ratings) if ratings else 5.0
-
-            elif survey_type == "Product Feedback":
-                # Product feedback scoring
-                product_rating = response_data.get("product_rating", 5.0)
-                recommendation_score = response_data.get(
-                    "recommendation_likelihood", 5.0
-                )
-
-                # Weighted average: 70% product rating, 30% recommendation
-                return (float(product_rating) * 0.7) + (
-                    float(recommendation_score) * 0.3
-                )
-
-            elif survey_type == "Market Research":
-                # Market research scoring (simpler approach)
-                interest_level = response_data.get("interest_level", 5.0)
-                return float(interest_level)
-
-            else:
-                # Unknown survey type - use simple average
-                numeric_values = []
-                for value in response_data.values():
-                    if isinstance(value, (int, float)) and 0 <= value <= 10:
-                        numeric_values.append(float(value))
-
-                return (
-                    sum(numeric_values) / len(numeric_values) if numeric_values else 5.0
-                )
-
-        except Exception as e:
-            self.logger.warning(f"Failed to calculate satisfaction score: {e}")
-            return None
+        return calculate_satisfaction_score(response_data, survey_type, self.logger)
 
     def _store_survey_results(self, processed_result: dict[str, Any]) -> None:
         """
@@ -1320,6 +2735,68 @@ class DistributedProcessor:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def _store_survey_results_batch(
+        self, processed_results: list[dict[str, Any]]
+    ) -> dict[int, str]:
+        """
+        Store many processed survey results in rpa_db with one bulk insert.
+
+        If the bulk insert fails, the results are stored one by one with
+        _store_survey_results so that a single bad row does not fail the batch.
+
+        Args:
+            processed_results: Processed survey data to store
+
+        Returns:
+            Error message by position in processed_results for results that could
+            not be stored; empty if all were stored
+        """
+        columns = [
+            "survey_id",
+            "customer_id",
+            "customer_name",
+            "survey_type",
+            "processing_status",
+            "processed_at",
+            "processing_duration_ms",
+            "flow_run_id",
+        ]
+        rows = [
+            (
+                processed_result["survey_id"],
+                processed_result["customer_id"],
+                processed_result["customer_name"],
+                processed_result["survey_type"],
+                processed_result["processing_status"],
+                processed_result.get("processed_at"),
+                processed_result.get("processing_duration_ms"),
+                processed_result["flow_run_id"],
+            )
+            for processed_result in processed_results
+        ]
+
+        try:
+            self.rpa_db.bulk_insert("processed_surveys", columns, rows)
+            self.logger.info(
+                f"Successfully stored {len(rows)} survey results in rpa_db"
+            )
+            return {}
+
+        except Exception as e:
+            self.logger.warning(
+                f"Bulk insert of {len(rows)} survey results failed, "
+                f"storing them individually: {e}"
+            )
+
+        store_errors = {}
+        for position, processed_result in enumerate(processed_results):
+            try:
+                self._store_survey_results(processed_result)
+            except Exception as e:
+                store_errors[position] = str(e)
+
+        return store_errors
+
     # Retry-enabled versions of critical operations
 
     def claim_records_batch_with_retry(
@@ -1329,6 +2806,7 @@ class DistributedProcessor:
         max_attempts: int = 3,
         min_wait: float = 1.0,
         max_wait: float = 10.0,
+        lease_seconds: Optional[int] = None,
     ) -> list[dict[str, Any]]:
         """
         Claim a batch of pending records atomically with automatic retry for transient failures.
@@ -1343,6 +2821,7 @@ class DistributedProcessor:
             max_attempts: Maximum number of retry attempts (default: 3)
             min_wait: Minimum wait time between retries in seconds (default: 1.0)
             max_wait: Maximum wait time between retries in seconds (default: 10.0)
+            lease_seconds: Lease duration in seconds (uses config lease_seconds if None)
 
         Returns:
             List of claimed records with id, payload, retry_count, and created_at fields.
@@ -1365,7 +2844,7 @@ class DistributedProcessor:
                 f"Claiming records with retry for flow '{flow_name}' "
                 f"(batch_size: {batch_size}, max_attempts: {max_attempts})"
             )
-            return self.claim_records_batch(flow_name, batch_size)
+            return self.claim_records_batch(flow_name, batch_size, lease_seconds)
 
         try:
             return _claim_with_retry()
@@ -1482,6 +2961,104 @@ class DistributedProcessor:
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    def mark_records_completed_batch_with_retry(
+        self,
+        completions: list[tuple[int, dict[str, Any]]],
+        max_attempts: int = 3,
+        min_wait: float = 1.0,
+        max_wait: float = 10.0,
+    ) -> list[int]:
+        """
+        Mark a batch of records as completed with automatic retry for transient failures.
+
+        This method wraps mark_records_completed_batch with configurable retry logic.
+        Retrying is safe because records that were already moved out of
+        'processing' state are simply reported as unmatched.
+
+        Args:
+            completions: List of (record_id, result) tuples
+            max_attempts: Maximum number of retry attempts (default: 3)
+            min_wait: Minimum wait time between retries in seconds (default: 1.0)
+            max_wait: Maximum wait time between retries in seconds (default: 10.0)
+
+        Returns:
+            List of record IDs that were not updated
+
+        Raises:
+            ValueError: If completions contains invalid entries
+            RuntimeError: If database operation fails after all retry attempts
+        """
+        retry_decorator = _create_retry_decorator(
+            max_attempts=max_attempts, min_wait=min_wait, max_wait=max_wait
+        )
+
+        @retry_decorator
+        def _mark_completed_batch_with_retry():
+            self.logger.debug(
+                f"Marking {len(completions)} records as completed with retry "
+                f"(max_attempts: {max_attempts})"
+            )
+            return self.mark_records_completed_batch(completions)
+
+        try:
+            return _mark_completed_batch_with_retry()
+        except Exception as e:
+            error_msg = (
+                f"Mark records completed batch with retry failed for "
+                f"{len(completions)} records after {max_attempts} attempts: {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def mark_records_failed_batch_with_retry(
+        self,
+        failures: list[tuple[int, str]],
+        max_attempts: int = 3,
+        min_wait: float = 1.0,
+        max_wait: float = 10.0,
+    ) -> list[int]:
+        """
+        Mark a batch of records as failed with automatic retry for transient failures.
+
+        This method wraps mark_records_failed_batch with configurable retry logic.
+        Retrying cannot double-increment retry_count because the ownership check
+        only matches records that are still in 'processing' state.
+
+        Args:
+            failures: List of (record_id, error_message) tuples
+            max_attempts: Maximum number of retry attempts (default: 3)
+            min_wait: Minimum wait time between retries in seconds (default: 1.0)
+            max_wait: Maximum wait time between retries in seconds (default: 10.0)
+
+        Returns:
+            List of record IDs that were not updated
+
+        Raises:
+            ValueError: If failures contains invalid entries
+            RuntimeError: If database operation fails after all retry attempts
+        """
+        retry_decorator = _create_retry_decorator(
+            max_attempts=max_attempts, min_wait=min_wait, max_wait=max_wait
+        )
+
+        @retry_decorator
+        def _mark_failed_batch_with_retry():
+            self.logger.debug(
+                f"Marking {len(failures)} records as failed with retry "
+                f"(max_attempts: {max_attempts})"
+            )
+            return self.mark_records_failed_batch(failures)
+
+        try:
+            return _mark_failed_batch_with_retry()
+        except Exception as e:
+            error_msg = (
+                f"Mark records failed batch with retry failed for "
+                f"{len(failures)} records after {max_attempts} attempts: {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
     def cleanup_orphaned_records_with_retry(
         self,
         timeout_hours: int = 1,
@@ -1598,3 +3175,152 @@ class DistributedProcessor:
             f"DistributedProcessor(rpa_db='{self.rpa_db.database_name}', "
             f"source_db='{source_db_name}', instance_id='{self.instance_id}')"
         )
+
+
+class LeaseHeartbeat:
+    """
+    Background thread that periodically renews leases for claimed records.
+
+    Keeps records owned by a slow but alive instance from being reclaimed by
+    reclaim_expired_leases. Records that stop being renewable (acknowledged or
+    reclaimed elsewhere) are dropped from the heartbeat, which ends on its own
+    once no records are left. Renewal failures are logged and retried on the
+    next beat; the lease only lapses if renewals keep failing past its expiry.
+    """
+
+    def __init__(
+        self,
+        processor: DistributedProcessor,
+        record_ids: list[int],
+        lease_seconds: Optional[int] = None,
+        interval_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize the heartbeat.
+
+        Args:
+            processor: DistributedProcessor that owns the claimed records
+            record_ids: IDs of the records to keep leased
+            lease_seconds: Lease duration applied on every renewal
+                (uses the processor's lease_seconds if None)
+            interval_seconds: Time between renewals (defaults to a third of the lease)
+
+        Raises:
+            ValueError: If lease_seconds or interval_seconds are invalid, or the
+                interval is not shorter than the lease
+        """
+        if lease_seconds is None:
+            lease_seconds = processor.lease_seconds
+        if not isinstance(lease_seconds, int) or lease_seconds <= 0:
+            raise ValueError("lease_seconds must be a positive integer")
+
+        if interval_seconds is None:
+            interval_seconds = lease_seconds / 3
+        if not isinstance(interval_seconds, (int, float)) or interval_seconds <= 0:
+            raise ValueError("interval_seconds must be a positive number")
+        if interval_seconds >= lease_seconds:
+            raise ValueError("interval_seconds must be shorter than lease_seconds")
+
+        self.processor = processor
+        self.lease_seconds = lease_seconds
+        self.interval_seconds = float(interval_seconds)
+        self.logger = processor.logger
+        self.renewals = 0
+
+        self._record_ids = list(record_ids)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def record_ids(self) -> list[int]:
+        """IDs of the records whose leases are still being renewed."""
+        with self._lock:
+            return list(self._record_ids)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the heartbeat thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the heartbeat thread if it is not already running."""
+        if self.is_running or not self._record_ids:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"lease-heartbeat-{self.processor.instance_id}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def release(self, record_ids: list[int]) -> None:
+        """
+        Stop renewing leases for records that have been acknowledged.
+
+        Args:
+            record_ids: IDs of records that no longer need a lease
+        """
+        released = set(record_ids)
+        with self._lock:
+            self._record_ids = [
+                record_id for record_id in self._record_ids if record_id not in released
+            ]
+
+    def beat(self) -> list[int]:
+        """
+        Renew the leases once.
+
+        Returns:
+            IDs of the records whose lease was renewed
+        """
+        record_ids = self.record_ids
+        if not record_ids:
+            return []
+
+        renewed_ids = self.processor.renew_leases(record_ids, self.lease_seconds)
+        self.renewals += 1
+
+        lost_ids = set(record_ids) - set(renewed_ids)
+        if lost_ids:
+            # Acknowledged records drop out here too, so this is not an error
+            self.logger.info(
+                f"Stopped renewing leases for {len(lost_ids)} records no longer "
+                f"processing under instance '{self.processor.instance_id}': "
+                f"{sorted(lost_ids)}"
+            )
+            self.release(list(lost_ids))
+
+        return renewed_ids
+
+    def _run(self) -> None:
+        """Heartbeat loop executed on the background thread."""
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                if not self.beat() and not self.record_ids:
+                    break
+            except Exception as e:
+                self.logger.warning(f"Lease renewal failed, retrying next beat: {e}")
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Stop the heartbeat thread.
+
+        Args:
+            timeout: Maximum time to wait for the thread to finish in seconds
+        """
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def __enter__(self) -> "LeaseHeartbeat":
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.stop()
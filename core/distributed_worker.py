@@ -0,0 +1,456 @@
+"""
+Long-running distributed worker driven by PostgreSQL LISTEN/NOTIFY.
+
+This module provides a worker mode on top of DistributedProcessor that keeps
+claiming and processing records for a flow instead of handling a single batch
+per flow run. Idle workers block on a LISTEN connection and wake up as soon as
+new records are enqueued (see migration V008), with a fallback poll interval so
+that missed notifications only delay work, never lose it. Claimed records are
+kept leased by a heartbeat while processing, and idle workers sweep expired
+leases (see migration V009) so records held by crashed instances are retried.
+"""
+
+import select
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from core.database import DatabaseManager
+from core.distributed import DistributedProcessor
+
+# Channel used by the processing_queue notification triggers (migration V008)
+QUEUE_NOTIFY_CHANNEL = "processing_queue_new_work"
+
+# Maximum time a single wait blocks before re-checking the stop flag
+STOP_CHECK_INTERVAL_SECONDS = 1.0
+
+# Delay before reopening a failed LISTEN connection, doubled per failure
+LISTEN_RETRY_INITIAL_SECONDS = 1.0
+LISTEN_RETRY_MAX_SECONDS = 60.0
+
+
+class QueueNotificationListener:
+    """
+    Dedicated LISTEN connection for processing_queue wakeup notifications.
+
+    Holds one connection outside the DatabaseManager pool (LISTEN requires a
+    session that stays open) and reports whether work arrived for a flow.
+    Connection failures are logged and reported as "no notification" so callers
+    degrade to polling; the connection is re-established on a later wait, after
+    a delay that grows with consecutive failures.
+    """
+
+    def __init__(
+        self, rpa_db_manager: DatabaseManager, channel: str = QUEUE_NOTIFY_CHANNEL
+    ):
+        """
+        Initialize the listener.
+
+        Args:
+            rpa_db_manager: DatabaseManager for the PostgreSQL queue database
+            channel: Notification channel to LISTEN on
+        """
+        self.rpa_db = rpa_db_manager
+        self.channel = channel
+        self.logger = rpa_db_manager.logger
+        self._connection = None
+        self._retry_delay = LISTEN_RETRY_INITIAL_SECONDS
+        self._retry_at = 0.0
+
+    @property
+    def is_listening(self) -> bool:
+        """Whether a LISTEN connection is currently open."""
+        return self._connection is not None
+
+    def start(self) -> None:
+        """
+        Open the dedicated connection and start listening.
+
+        Raises:
+            RuntimeError: If the connection cannot be opened or LISTEN fails
+        """
+        if self._connection is not None:
+            return
+
+        try:
+            pooled_connection = self.rpa_db.db_engine.raw_connection()
+            # Detach so the long-lived session never counts against the pool
+            pooled_connection.detach()
+            connection = pooled_connection.driver_connection
+            connection.autocommit = True
+
+            with connection.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self.channel}"')
+
+            self._connection = connection
+            self.logger.info(f"Listening for queue notifications on '{self.channel}'")
+
+        except Exception as e:
+            error_msg = (
+                f"Failed to start queue notification listener on '{self.channel}': {e}"
+            )
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    def wait(self, flow_name: Optional[str], timeout: float) -> bool:
+        """
+        Block until a notification for flow_name arrives or the timeout expires.
+
+        Args:
+            flow_name: Flow to wait for; None accepts notifications for any flow
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if a matching notification was received, False on timeout or
+            connection failure. After a connection failure False is returned
+            right away (check is_listening) until the retry delay has passed.
+        """
+        if self._connection is None and time.monotonic() < self._retry_at:
+            return False
+
+        try:
+            if self._connection is None:
+                self.start()
+                self._retry_delay = LISTEN_RETRY_INITIAL_SECONDS
+
+            deadline = time.monotonic() + max(timeout, 0.0)
+
+            while True:
+                if self._consume_notifications(flow_name):
+                    return True
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+
+                readable, _, _ = select.select([self._connection], [], [], remaining)
+                if readable:
+                    self._connection.poll()
+
+        except Exception as e:
+            self.logger.warning(
+                f"Queue notification listener failed, falling back to polling "
+                f"(retrying in {self._retry_delay:.0f}s): {e}"
+            )
+            self.close()
+            self._retry_at = time.monotonic() + self._retry_delay
+            self._retry_delay = min(self._retry_delay * 2, LISTEN_RETRY_MAX_SECONDS)
+            return False
+
+    def _consume_notifications(self, flow_name: Optional[str]) -> bool:
+        """
+        Drain received notifications and report whether any matched flow_name.
+
+        Args:
+            flow_name: Flow to match; None matches any notification
+
+        Returns:
+            True if at least one pending notification matched
+        """
+        notifies = self._connection.notifies
+        if not notifies:
+            return False
+
+        matched = any(
+            flow_name is None or notify.payload == flow_name for notify in notifies
+        )
+        notifies.clear()
+        return matched
+
+    def close(self) -> None:
+        """Close the LISTEN connection if it is open."""
+        if self._connection is None:
+            return
+
+        try:
+            self._connection.close()
+        except Exception as e:
+            self.logger.debug(f"Error closing queue notification listener: {e}")
+        finally:
+            self._connection = None
+
+    def __enter__(self) -> "QueueNotificationListener":
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+class DistributedWorker:
+    """
+    Long-running worker that claims and processes records until stopped.
+
+    Claims batches with DistributedProcessor, runs the business logic for each
+    record, and acknowledges the whole batch with the batched status updates.
+    When the queue is empty the worker blocks on LISTEN instead of polling the
+    queue table, waking up immediately when new work is enqueued.
+    """
+
+    def __init__(
+        self,
+        processor: DistributedProcessor,
+        flow_name: str,
+        business_logic_func: Callable[[dict[str, Any]], dict[str, Any]],
+        batch_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        use_notifications: bool = True,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            processor: DistributedProcessor used for claiming and status updates
+            flow_name: Name of the flow whose records this worker processes
+            business_logic_func: Function that processes one record payload
+            batch_size: Records to claim per batch (uses the adaptive batch size
+                if adaptive_batch_enabled, otherwise the config default, if None)
+            poll_interval: Fallback poll interval in seconds when idle
+                (uses config worker_poll_interval if None)
+            use_notifications: Whether to wait on LISTEN/NOTIFY between polls
+
+        Raises:
+            ValueError: If flow_name, business_logic_func, batch_size or
+                poll_interval are invalid
+        """
+        if not flow_name or not isinstance(flow_name, str):
+            raise ValueError("flow_name must be a non-empty string")
+
+        if not callable(business_logic_func):
+            raise ValueError("business_logic_func must be callable")
+
+        self.batch_sizer = None
+        if batch_size is None:
+            if processor.config.get("adaptive_batch_enabled", False):
+                self.batch_sizer = processor.get_batch_sizer(flow_name)
+                batch_size = self.batch_sizer.batch_size
+            else:
+                batch_size = processor.config["default_batch_size"]
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        if poll_interval is None:
+            poll_interval = processor.config.get("worker_poll_interval", 30)
+        if not isinstance(poll_interval, (int, float)) or poll_interval <= 0:
+            raise ValueError("poll_interval must be a positive number")
+
+        self.processor = processor
+        self.flow_name = flow_name
+        self.business_logic_func = business_logic_func
+        self.batch_size = batch_size
+        self.poll_interval = float(poll_interval)
+        self.logger = processor.logger
+
+        self.listener = (
+            QueueNotificationListener(processor.rpa_db) if use_notifications else None
+        )
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        """Request the worker to stop after the current batch."""
+        self._stop_event.set()
+
+    @property
+    def stopped(self) -> bool:
+        """Whether a stop has been requested."""
+        return self._stop_event.is_set()
+
+    def run(
+        self,
+        max_runtime_seconds: Optional[float] = None,
+        max_records: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Claim and process records until stopped or a budget is reached.
+
+        Args:
+            max_runtime_seconds: Optional wall-clock budget for the worker
+            max_records: Optional maximum number of records to claim
+
+        Returns:
+            Dictionary containing totals for the worker run
+        """
+        start_time = time.monotonic()
+        deadline = (
+            start_time + max_runtime_seconds
+            if max_runtime_seconds is not None
+            else None
+        )
+
+        totals = {
+            "flow_name": self.flow_name,
+            "batches": 0,
+            "records_claimed": 0,
+            "records_completed": 0,
+            "records_failed": 0,
+            "wakeups_notified": 0,
+            "wakeups_polled": 0,
+        }
+
+        self.logger.info(
+            f"Starting distributed worker for flow '{self.flow_name}' "
+            f"(batch_size: {self.batch_size}, poll_interval: {self.poll_interval}s, "
+            f"adaptive: {self.batch_sizer is not None}, "
+            f"notifications: {self.listener is not None})"
+        )
+
+        try:
+            while not self.stopped:
+                if max_records is not None and totals["records_claimed"] >= max_records:
+                    break
+
+                if self.batch_sizer is not None:
+                    self.batch_size = self.batch_sizer.batch_size
+                claim_size = self.batch_size
+                if max_records is not None:
+                    claim_size = min(
+                        claim_size, max_records - totals["records_claimed"]
+                    )
+
+                claim_start = time.monotonic()
+                records = self.processor.claim_records_batch_with_retry(
+                    self.flow_name, claim_size
+                )
+                claim_seconds = time.monotonic() - claim_start
+
+                if records:
+                    processing_start = time.monotonic()
+                    batch_totals = self.process_batch(records)
+                    if self.batch_sizer is not None:
+                        self.batch_sizer.record_batch(
+                            len(records),
+                            claim_seconds,
+                            time.monotonic() - processing_start,
+                            batch_totals["failed"],
+                        )
+                    totals["batches"] += 1
+                    totals["records_claimed"] += len(records)
+                    totals["records_completed"] += batch_totals["completed"]
+                    totals["records_failed"] += batch_totals["failed"]
+                    # Keep draining without waiting while there is work
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+                    continue
+
+                # Records freed from crashed instances can be claimed right away
+                if self._reclaim_expired_leases() > 0:
+                    continue
+
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    wait_time = min(self.poll_interval, remaining)
+                else:
+                    wait_time = self.poll_interval
+
+                if self._wait_for_work(wait_time):
+                    totals["wakeups_notified"] += 1
+                else:
+                    totals["wakeups_polled"] += 1
+
+        finally:
+            if self.listener is not None:
+                self.listener.close()
+
+        totals["runtime_seconds"] = round(time.monotonic() - start_time, 3)
+
+        self.logger.info(
+            f"Distributed worker for flow '{self.flow_name}' finished: {totals}"
+        )
+
+        return totals
+
+    def _reclaim_expired_leases(self) -> int:
+        """
+        Sweep expired leases for this worker's flow.
+
+        Returns:
+            Number of reclaimed records (0 if the sweep failed)
+        """
+        try:
+            return self.processor.reclaim_expired_leases(self.flow_name)
+        except Exception as e:
+            self.logger.warning(
+                f"Expired lease sweep failed for flow '{self.flow_name}': {e}"
+            )
+            return 0
+
+    def _wait_for_work(self, timeout: float) -> bool:
+        """
+        Wait for a queue notification, the poll interval, or a stop request.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if woken by a notification, False on timeout or stop
+        """
+        deadline = time.monotonic() + timeout
+
+        while not self.stopped:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            slice_timeout = min(remaining, STOP_CHECK_INTERVAL_SECONDS)
+            if self.listener is not None:
+                if self.listener.wait(self.flow_name, slice_timeout):
+                    return True
+                # Without a connection wait() returns at once; sleep instead
+                if not self.listener.is_listening:
+                    self._stop_event.wait(slice_timeout)
+            else:
+                self._stop_event.wait(slice_timeout)
+
+        return False
+
+    def process_batch(self, records: list[dict[str, Any]]) -> dict[str, int]:
+        """
+        Run business logic for claimed records and acknowledge them in bulk.
+
+        Args:
+            records: Records returned by claim_records_batch
+
+        Returns:
+            Dictionary with "completed" and "failed" counts for the batch
+        """
+        completions = []
+        failures = []
+        unmatched_ids = set()
+
+        # Keep the claim leases alive until the whole batch is acknowledged
+        heartbeat = self.processor.start_lease_heartbeat(
+            [record["id"] for record in records]
+        )
+
+        try:
+            for record in records:
+                try:
+                    result = self.business_logic_func(record["payload"])
+                    completions.append((record["id"], result))
+                except Exception as e:
+                    error_message = str(e) or type(e).__name__
+                    self.logger.error(
+                        f"Failed to process record {record['id']}: {error_message}"
+                    )
+                    failures.append((record["id"], error_message))
+
+            if completions:
+                unmatched_ids.update(
+                    self.processor.mark_records_completed_batch_with_retry(completions)
+                )
+            if failures:
+                unmatched_ids.update(
+                    self.processor.mark_records_failed_batch_with_retry(failures)
+                )
+        finally:
+            heartbeat.stop()
+
+        completed = sum(
+            1 for record_id, _result in completions if record_id not in unmatched_ids
+        )
+
+        return {"completed": completed, "failed": len(records) - completed}
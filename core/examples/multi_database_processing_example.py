@@ -100,25 +100,26 @@ def demonstrate_multi_database_processing():
             print("\n4. Demonstrating multi-database processing...")
             sample_surveys = create_sample_survey_data()
 
-            for survey_payload in sample_surveys:
-                try:
-                    print(f"\n   Processing survey: {survey_payload['survey_id']}")
-
-                    # This would normally:
-                    # 1. Read from SurveyHub (SQL Server)
-                    # 2. Transform the data
-                    # 3. Write to rpa_db (PostgreSQL)
-                    result = processor.process_survey_logic(survey_payload)
-
-                    print(f"   - Customer: {result['customer_name']}")
-                    print(
-                        f"   - Satisfaction Score: {result.get('satisfaction_score', 'N/A')}"
-                    )
-                    print(f"   - Status: {result['processing_status']}")
-                    print(f"   - Duration: {result['processing_duration_ms']}ms")
-
-                except Exception as e:
-                    print(f"   - Error processing {survey_payload['survey_id']}: {e}")
+            # This would normally:
+            # 1. Read all surveys from SurveyHub (SQL Server) in one query
+            # 2. Transform the data
+            # 3. Write all results to rpa_db (PostgreSQL) in one bulk insert
+            outcomes = processor.process_survey_batch(sample_surveys)
+
+            for outcome in outcomes:
+                print(f"\n   Processed survey: {outcome['survey_id']}")
+
+                if outcome["status"] == "failed":
+                    print(f"   - Error: {outcome['error']}")
+                    continue
+
+                result = outcome["result"]
+                print(f"   - Customer: {result['customer_name']}")
+                print(
+                    f"   - Satisfaction Score: {result.get('satisfaction_score', 'N/A')}"
+                )
+                print(f"   - Status: {result['processing_status']}")
+                print(f"   - Duration: {result['processing_duration_ms']}ms")
         else:
             print("\n4. Multi-database processing not available (no source database)")
             print("   In a real environment with SurveyHub connection:")
@@ -3,24 +3,80 @@ Distributed flow template for standardized distributed processing patterns.
 
 This module provides a reusable template for creating distributed Prefect flows
 that use the DistributedProcessor for atomic record claiming and processing.
-It includes module-level instances for performance optimization and standardized
+It includes shared module-level instances, created on first use, and standardized
 error handling patterns.
 """
 
+import threading
+import time
 from typing import Any, Optional
 
 from prefect import flow, get_run_logger, task
+from prefect.futures import resolve_futures_to_results
 
+from core.adaptive_batch import AdaptiveBatchSizer
 from core.config import ConfigManager
 from core.database import DatabaseManager
 from core.distributed import DistributedProcessor
+from core.distributed_worker import DistributedWorker
+from core.process_pool import run_in_process_pool
+from core.task_chunking import chunk_records
+
+# Health check interval for continuous mode when the configuration has none
+DEFAULT_HEALTH_CHECK_INTERVAL_SECONDS = 300
+
+# Records per processing task when the configuration has none (one task per record)
+DEFAULT_TASK_CHUNK_SIZE = 1
+
+# Module-level instances, created on first use and reused across flow runs. They are
+# reachable as module attributes (config_manager, rpa_db_manager, source_db_manager,
+# processor) so importing this module does not load configuration or touch databases.
+_LAZY_INSTANCE_NAMES = (
+    "config_manager",
+    "rpa_db_manager",
+    "source_db_manager",
+    "processor",
+)
+_instances: dict[str, Any] = {}
+_instances_lock = threading.Lock()
+
+
+def _get_instances() -> dict[str, Any]:
+    """Create the shared configuration, database managers and processor once."""
+    with _instances_lock:
+        if not _instances:
+            config_manager = ConfigManager()
+            rpa_db_manager = DatabaseManager("rpa_db")
+            source_db_manager = DatabaseManager("SurveyHub")
+            _instances.update(
+                config_manager=config_manager,
+                rpa_db_manager=rpa_db_manager,
+                source_db_manager=source_db_manager,
+                processor=DistributedProcessor(
+                    rpa_db_manager, source_db_manager, config_manager
+                ),
+            )
+    return _instances
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_INSTANCE_NAMES:
+        return _get_instances()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_processor() -> DistributedProcessor:
+    """
+    Get the shared DistributedProcessor, creating it on first use.
 
-# Module-level instances for performance optimization
-# These are initialized once when the module is imported and reused across flow runs
-config_manager = ConfigManager()
-rpa_db_manager = DatabaseManager("rpa_db")
-source_db_manager = DatabaseManager("SurveyHub")
-processor = DistributedProcessor(rpa_db_manager, source_db_manager, config_manager)
+    A processor assigned to the module attribute (e.g. by tests) takes precedence.
+
+    Returns:
+        DistributedProcessor used by the flows and tasks in this module
+    """
+    if "processor" in globals():
+        return globals()["processor"]
+    return _get_instances()["processor"]
 
 
 @flow(name="distributed-processing-template")
@@ -28,6 +84,13 @@ def distributed_processing_flow(
     flow_name: str,
     batch_size: Optional[int] = None,
     business_logic_func: Optional[callable] = None,
+    batch_acknowledge: bool = False,
+    continuous: bool = False,
+    max_runtime_seconds: Optional[float] = None,
+    max_records: Optional[int] = None,
+    use_process_pool: bool = False,
+    chunk_size: Optional[int] = None,
+    batch_business_logic_func: Optional[callable] = None,
 ) -> dict[str, Any]:
     """
     Distributed processing flow template with health checks and record claiming.
@@ -38,17 +101,50 @@ def distributed_processing_flow(
     3. Processes records in parallel using Prefect's .map() operation
     4. Generates comprehensive processing summaries
 
+    By default one batch is claimed and processed per flow run. With
+    continuous=True the flow keeps draining the queue until it is empty or a
+    runtime/record budget is reached: the next batch is claimed while the current
+    one is being processed, and the health check is repeated only once per
+    configured health_check_interval instead of once per batch.
+
+    With use_process_pool=True, business_logic_func runs in a shared process pool
+    sized from the container's CPU quota (see core.process_pool) instead of on the
+    task runner's threads, so CPU-bound logic is not limited to one core by the
+    GIL. Record statuses are still written by the tasks in this process.
+
+    With chunk_size > 1 each Prefect task processes up to chunk_size records
+    instead of one, cutting task runs, state transitions and log records by that
+    factor; the statuses of a chunk are written with one batched UPDATE per
+    outcome. batch_business_logic_func receives the payloads of a whole chunk at
+    once and must return one result per payload (an Exception instance in place
+    of a result fails only that record). Results are still reported per record.
+
     Args:
         flow_name: Name of the flow for record claiming and logging
-        batch_size: Maximum number of records to claim and process (uses config default if None)
+        batch_size: Maximum number of records to claim and process (uses the adaptive
+            batch size if enabled, otherwise the config default, if None)
         business_logic_func: Optional custom business logic function for processing records
+        batch_acknowledge: If True, record statuses are written with one batched
+            UPDATE for completions and one for failures instead of one per record
+        continuous: If True, keep claiming batches until the queue is empty or a
+            budget is reached
+        max_runtime_seconds: Optional wall-clock budget for continuous mode
+        max_records: Optional maximum number of records to claim in continuous mode
+        use_process_pool: If True, run business_logic_func in worker processes.
+            The function must be an importable module-level function and its
+            payloads and results JSON-serializable
+        chunk_size: Records processed per task (uses config task_chunk_size if None)
+        batch_business_logic_func: Optional function processing a list of payloads
+            per task, used instead of business_logic_func
 
     Returns:
         Dictionary containing processing summary with counts and status information
 
     Raises:
         RuntimeError: If database health check fails (fail-fast behavior)
-        ValueError: If flow_name is empty or batch_size is invalid
+        ValueError: If flow_name is empty, batch_size, chunk_size or a budget is
+            invalid, use_process_pool is set without a business_logic_func, or
+            both business logic functions are given
 
     Example:
         # Basic usage with default business logic
@@ -63,6 +159,18 @@ def distributed_processing_flow(
             batch_size=25,
             business_logic_func=custom_logic
         )
+
+        # Drain the queue for up to 15 minutes in one flow run
+        result = distributed_processing_flow(
+            "survey_processor", batch_size=100, continuous=True,
+            max_runtime_seconds=900
+        )
+
+        # Score 50 records per task with a batch hook
+        result = distributed_processing_flow(
+            "survey_processor", batch_size=500, chunk_size=50,
+            batch_business_logic_func=score_surveys
+        )
     """
     logger = get_run_logger()
 
@@ -70,32 +178,72 @@ def distributed_processing_flow(
     if not flow_name or not isinstance(flow_name, str):
         raise ValueError("flow_name must be a non-empty string")
 
-    # Use configured default batch size if not provided
+    # Use the adaptive or configured default batch size if not provided
+    batch_sizer = None
     if batch_size is None:
-        batch_size = processor.config["default_batch_size"]
+        batch_sizer = _get_batch_sizer(flow_name)
+        batch_size = (
+            batch_sizer.batch_size
+            if batch_sizer is not None
+            else get_processor().config["default_batch_size"]
+        )
     elif not isinstance(batch_size, int) or batch_size <= 0:
         raise ValueError("batch_size must be a positive integer")
 
+    if max_runtime_seconds is not None and (
+        not isinstance(max_runtime_seconds, (int, float)) or max_runtime_seconds <= 0
+    ):
+        raise ValueError("max_runtime_seconds must be a positive number")
+
+    if max_records is not None and (
+        not isinstance(max_records, int) or max_records <= 0
+    ):
+        raise ValueError("max_records must be a positive integer")
+
+    if chunk_size is None:
+        chunk_size = get_processor().config.get(
+            "task_chunk_size", DEFAULT_TASK_CHUNK_SIZE
+        )
+    elif not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+
+    if batch_business_logic_func is not None and business_logic_func is not None:
+        raise ValueError(
+            "business_logic_func and batch_business_logic_func are mutually exclusive"
+        )
+
+    if use_process_pool and business_logic_func is None:
+        raise ValueError("use_process_pool requires a business_logic_func")
+
     logger.info(
         f"Starting distributed processing flow '{flow_name}' with batch_size: {batch_size}"
     )
 
     # 1. Mandatory database health check with fail-fast behavior
-    logger.info("Performing database health check before processing")
-    health_status = processor.health_check()
+    _check_database_health()
+
+    if continuous:
+        return _drain_queue(
+            flow_name,
+            batch_size,
+            business_logic_func,
+            batch_acknowledge,
+            max_runtime_seconds,
+            max_records,
+            use_process_pool,
+            chunk_size,
+            batch_business_logic_func,
+            batch_sizer,
+        )
 
-    if health_status["status"] == "unhealthy":
-        error_msg = f"Database health check failed: {health_status.get('error', 'Unknown error')}"
-        logger.error(error_msg)
-        raise RuntimeError(error_msg)
-    elif health_status["status"] == "degraded":
-        logger.warning(f"Database health check shows degraded status: {health_status}")
-    else:
-        logger.info("Database health check passed - all systems healthy")
+    # 2. Return records with expired leases (crashed instances) to the queue
+    _reclaim_expired_leases(flow_name)
 
-    # 2. Claim records from processing queue with retry logic
+    # 3. Claim records from processing queue with retry logic
     logger.info(f"Claiming batch of {batch_size} records for flow '{flow_name}'")
-    records = processor.claim_records_batch_with_retry(flow_name, batch_size)
+    claim_start = time.monotonic()
+    records = get_processor().claim_records_batch_with_retry(flow_name, batch_size)
+    claim_seconds = time.monotonic() - claim_start
 
     if not records:
         logger.info(f"No records available for processing in flow '{flow_name}'")
@@ -111,24 +259,363 @@ def distributed_processing_flow(
 
     logger.info(f"Successfully claimed {len(records)} records for processing")
 
-    # 3. Process records using Prefect .map() for parallel processing
+    # 4. Process records using Prefect .map() for parallel processing, renewing
+    # the claim leases in the background until every record is acknowledged
     logger.info("Starting parallel record processing")
+    processing_start = time.monotonic()
+    heartbeat = get_processor().start_lease_heartbeat(
+        [record["id"] for record in records]
+    )
+
+    try:
+        results = _collect_batch_results(
+            _submit_batch(
+                records,
+                business_logic_func,
+                batch_acknowledge,
+                use_process_pool,
+                chunk_size,
+                batch_business_logic_func,
+            ),
+            batch_acknowledge,
+            _is_chunked(chunk_size, batch_business_logic_func),
+        )
+
+        # 5. Generate processing summary
+        summary = generate_processing_summary(
+            results, flow_name, batch_size, len(records)
+        )
+    finally:
+        heartbeat.stop()
+
+    if batch_sizer is not None:
+        batch_sizer.record_batch(
+            len(records),
+            claim_seconds,
+            time.monotonic() - processing_start,
+            summary["records_failed"],
+        )
+
+    logger.info(f"Distributed processing flow '{flow_name}' completed: {summary}")
+
+    return summary
+
+
+def _get_batch_sizer(flow_name: str) -> Optional[AdaptiveBatchSizer]:
+    """
+    Get the adaptive batch sizer of a flow if adaptive batch sizing is enabled.
+
+    Args:
+        flow_name: Flow whose claim batches are sized
+
+    Returns:
+        The processor's AdaptiveBatchSizer for the flow, or None when the
+        configured default_batch_size is used
+    """
+    processor = get_processor()
+    if not processor.config.get("adaptive_batch_enabled", False):
+        return None
+    return processor.get_batch_sizer(flow_name)
+
+
+def _check_database_health() -> dict[str, Any]:
+    """
+    Run the processor health check with fail-fast behavior.
+
+    Returns:
+        Health status returned by the processor
+
+    Raises:
+        RuntimeError: If the databases are unhealthy
+    """
+    logger = get_run_logger()
+
+    logger.info("Performing database health check before processing")
+    health_status = get_processor().health_check()
+
+    if health_status["status"] == "unhealthy":
+        error_msg = f"Database health check failed: {health_status.get('error', 'Unknown error')}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+    elif health_status["status"] == "degraded":
+        logger.warning(f"Database health check shows degraded status: {health_status}")
+    else:
+        logger.info("Database health check passed - all systems healthy")
+
+    return health_status
+
+
+def _submit_batch(
+    records: list[dict[str, Any]],
+    business_logic_func: Optional[callable],
+    batch_acknowledge: bool,
+    use_process_pool: bool = False,
+    chunk_size: int = DEFAULT_TASK_CHUNK_SIZE,
+    batch_business_logic_func: Optional[callable] = None,
+) -> Any:
+    """
+    Submit processing tasks for a batch of claimed records.
+
+    The tasks run on the flow's task runner; the returned futures are resolved
+    by _collect_batch_results, so the caller can do other work in between.
 
-    if business_logic_func:
+    Args:
+        records: Claimed records to process
+        business_logic_func: Optional custom business logic function
+        batch_acknowledge: Whether statuses are written in batched updates
+        use_process_pool: Whether business logic runs in the process pool
+        chunk_size: Records processed per task
+        batch_business_logic_func: Optional business logic function for a list
+            of payloads
+
+    Returns:
+        Futures (or results) of the mapped processing tasks
+    """
+    # Only passed when enabled so that task calls are unchanged otherwise
+    pool_kwargs = {"use_process_pool": True} if use_process_pool else {}
+
+    if _is_chunked(chunk_size, batch_business_logic_func):
+        # One task per chunk; with batch_acknowledge the statuses of all chunks
+        # are written together by _collect_batch_results instead
+        return process_records_chunk.map(
+            chunk_records(records, chunk_size),
+            business_logic_func=business_logic_func,
+            batch_business_logic_func=batch_business_logic_func,
+            acknowledge=not batch_acknowledge,
+            **pool_kwargs,
+        )
+    elif batch_acknowledge:
+        # Run business logic only, statuses are written by _collect_batch_results
+        return execute_record_business_logic.map(
+            records, business_logic_func=business_logic_func, **pool_kwargs
+        )
+    elif business_logic_func:
         # Use custom business logic function
-        results = process_record_with_status_custom.map(
-            records, business_logic_func=business_logic_func
+        return process_record_with_status_custom.map(
+            records, business_logic_func=business_logic_func, **pool_kwargs
         )
     else:
         # Use default business logic
-        results = process_record_with_status.map(records)
+        return process_record_with_status.map(records)
 
-    # 4. Generate processing summary
-    summary = generate_processing_summary(results, flow_name, batch_size, len(records))
 
-    logger.info(f"Distributed processing flow '{flow_name}' completed: {summary}")
+def _collect_batch_results(
+    submitted: Any, batch_acknowledge: bool, chunked: bool = False
+) -> list[dict[str, Any]]:
+    """
+    Wait for a submitted batch and return the per-record results.
 
-    return summary
+    Args:
+        submitted: Return value of _submit_batch
+        batch_acknowledge: Whether statuses are written in batched updates
+        chunked: Whether the batch was submitted as chunks of records
+
+    Returns:
+        Per-record processing results (or futures resolving to them)
+    """
+    if chunked:
+        # Each chunk task returns a list of per-record results
+        submitted = [
+            result
+            for chunk_results in resolve_futures_to_results(submitted)
+            for result in chunk_results
+        ]
+
+    if batch_acknowledge:
+        # Write all statuses in two batched updates
+        return acknowledge_records_batch(submitted)
+    return submitted
+
+
+def _is_chunked(
+    chunk_size: int, batch_business_logic_func: Optional[callable] = None
+) -> bool:
+    """Check whether records are processed in chunks instead of one per task."""
+    return batch_business_logic_func is not None or chunk_size > 1
+
+
+def _drain_queue(
+    flow_name: str,
+    batch_size: int,
+    business_logic_func: Optional[callable],
+    batch_acknowledge: bool,
+    max_runtime_seconds: Optional[float],
+    max_records: Optional[int],
+    use_process_pool: bool = False,
+    chunk_size: int = DEFAULT_TASK_CHUNK_SIZE,
+    batch_business_logic_func: Optional[callable] = None,
+    batch_sizer: Optional[AdaptiveBatchSizer] = None,
+) -> dict[str, Any]:
+    """
+    Claim and process batches until the queue is empty or a budget is reached.
+
+    The next batch is claimed (and its leases renewed) while the tasks of the
+    current batch are running, so workers never sit idle waiting on a claim
+    round trip. The health check is repeated once per health_check_interval.
+    If processing fails, prefetched records are left to expire and are returned
+    to the queue by the lease sweeper.
+
+    Args:
+        flow_name: Name of the flow for record claiming and logging
+        batch_size: Maximum number of records to claim per batch
+        business_logic_func: Optional custom business logic function
+        batch_acknowledge: Whether statuses are written in batched updates
+        max_runtime_seconds: Optional wall-clock budget
+        max_records: Optional maximum number of records to claim
+        use_process_pool: Whether business logic runs in the process pool
+        chunk_size: Records processed per task
+        batch_business_logic_func: Optional business logic function for a list
+            of payloads
+        batch_sizer: Optional adaptive sizer that sets the size of every claim
+            after the first and learns from each processed batch
+
+    Returns:
+        Dictionary containing totals across all processed batches
+    """
+    logger = get_run_logger()
+
+    start_time = time.monotonic()
+    deadline = (
+        start_time + max_runtime_seconds if max_runtime_seconds is not None else None
+    )
+    health_check_interval = get_processor().config.get(
+        "health_check_interval", DEFAULT_HEALTH_CHECK_INTERVAL_SECONDS
+    )
+    last_health_check = start_time
+    chunked = _is_chunked(chunk_size, batch_business_logic_func)
+
+    totals = {
+        "flow_name": flow_name,
+        "batch_size": batch_size,
+        "continuous": True,
+        "batches": 0,
+        "records_claimed": 0,
+        "records_processed": 0,
+        "records_completed": 0,
+        "records_failed": 0,
+        "health_checks": 1,
+        "processor_instance": get_processor().instance_id,
+        "errors": [],
+        "error_count": 0,
+    }
+
+    def claim_next_batch(
+        in_flight: int,
+    ) -> tuple[list[dict[str, Any]], Any, float]:
+        """Claim the next batch within the budgets and start its heartbeat."""
+        claim_size = batch_sizer.batch_size if batch_sizer is not None else batch_size
+        if max_records is not None:
+            claim_size = min(
+                claim_size, max_records - totals["records_claimed"] - in_flight
+            )
+        if claim_size <= 0 or (deadline is not None and time.monotonic() >= deadline):
+            return [], None, 0.0
+
+        claim_start = time.monotonic()
+        claimed = get_processor().claim_records_batch_with_retry(flow_name, claim_size)
+        if not claimed and _reclaim_expired_leases(flow_name) > 0:
+            # Records freed from crashed instances can be claimed right away
+            claim_start = time.monotonic()
+            claimed = get_processor().claim_records_batch_with_retry(
+                flow_name, claim_size
+            )
+        claim_seconds = time.monotonic() - claim_start
+        if not claimed:
+            return [], None, claim_seconds
+
+        return (
+            claimed,
+            get_processor().start_lease_heartbeat([record["id"] for record in claimed]),
+            claim_seconds,
+        )
+
+    logger.info(
+        f"Draining queue for flow '{flow_name}' (batch_size: {batch_size}, "
+        f"max_runtime_seconds: {max_runtime_seconds}, max_records: {max_records})"
+    )
+
+    _reclaim_expired_leases(flow_name)
+    records, heartbeat, claim_seconds = claim_next_batch(0)
+
+    while records:
+        next_records, next_heartbeat, next_claim_seconds = [], None, 0.0
+        try:
+            if time.monotonic() - last_health_check >= health_check_interval:
+                _check_database_health()
+                totals["health_checks"] += 1
+                last_health_check = time.monotonic()
+
+            batch_start = time.monotonic()
+            submitted = _submit_batch(
+                records,
+                business_logic_func,
+                batch_acknowledge,
+                use_process_pool,
+                chunk_size,
+                batch_business_logic_func,
+            )
+
+            # Prefetch the next batch while the current batch is processed
+            prefetch_start = time.monotonic()
+            next_records, next_heartbeat, next_claim_seconds = claim_next_batch(
+                len(records)
+            )
+            prefetch_seconds = time.monotonic() - prefetch_start
+
+            summary = generate_processing_summary(
+                _collect_batch_results(submitted, batch_acknowledge, chunked),
+                flow_name,
+                batch_size,
+                len(records),
+            )
+        except Exception:
+            if next_heartbeat is not None:
+                next_heartbeat.stop()
+            raise
+        finally:
+            heartbeat.stop()
+
+        if batch_sizer is not None:
+            # The prefetch claim is counted as claim time of the next batch
+            batch_sizer.record_batch(
+                len(records),
+                claim_seconds,
+                max(time.monotonic() - batch_start - prefetch_seconds, 0.0),
+                summary["records_failed"],
+            )
+
+        totals["batches"] += 1
+        totals["records_claimed"] += len(records)
+        for key in ("records_processed", "records_completed", "records_failed"):
+            totals[key] += summary[key]
+        totals["errors"].extend(summary["errors"])
+        totals["error_count"] += summary["error_count"]
+
+        records, heartbeat, claim_seconds = (
+            next_records,
+            next_heartbeat,
+            next_claim_seconds,
+        )
+
+    totals["errors"] = totals["errors"][:10]  # Limit to first 10 errors
+    totals["success_rate_percent"] = round(
+        totals["records_completed"] / totals["records_processed"] * 100
+        if totals["records_processed"]
+        else 0,
+        2,
+    )
+    totals["runtime_seconds"] = round(time.monotonic() - start_time, 3)
+
+    if max_records is not None and totals["records_claimed"] >= max_records:
+        totals["stop_reason"] = "max_records"
+    elif deadline is not None and time.monotonic() >= deadline:
+        totals["stop_reason"] = "max_runtime"
+    else:
+        totals["stop_reason"] = "queue_empty"
+
+    logger.info(f"Distributed processing flow '{flow_name}' drained queue: {totals}")
+
+    return totals
 
 
 @task(name="process-record-with-status", retries=0)
@@ -160,7 +647,7 @@ def process_record_with_status(record: dict[str, Any]) -> dict[str, Any]:
         result = process_default_business_logic(record["payload"])
 
         # Mark record as completed in database with retry logic
-        processor.mark_record_completed_with_retry(record_id, result)
+        get_processor().mark_record_completed_with_retry(record_id, result)
 
         logger.info(f"Successfully processed record {record_id}")
 
@@ -169,7 +656,7 @@ def process_record_with_status(record: dict[str, Any]) -> dict[str, Any]:
     except Exception as e:
         # Mark record as failed in database with retry logic
         error_message = str(e)
-        processor.mark_record_failed_with_retry(record_id, error_message)
+        get_processor().mark_record_failed_with_retry(record_id, error_message)
 
         logger.error(f"Failed to process record {record_id}: {error_message}")
 
@@ -179,7 +666,9 @@ def process_record_with_status(record: dict[str, Any]) -> dict[str, Any]:
 
 @task(name="process-record-with-status-custom", retries=0)
 def process_record_with_status_custom(
-    record: dict[str, Any], business_logic_func: callable
+    record: dict[str, Any],
+    business_logic_func: callable,
+    use_process_pool: bool = False,
 ) -> dict[str, Any]:
     """
     Process individual record with custom business logic and status management.
@@ -190,6 +679,7 @@ def process_record_with_status_custom(
     Args:
         record: Record dictionary containing id, payload, retry_count, and created_at
         business_logic_func: Custom function to process the record payload
+        use_process_pool: If True, run business_logic_func in the process pool
 
     Returns:
         Dictionary containing processing result with record_id, status, and result/error
@@ -201,10 +691,12 @@ def process_record_with_status_custom(
 
     try:
         # Use custom business logic function
-        result = business_logic_func(record["payload"])
+        result = _run_business_logic(
+            business_logic_func, record["payload"], use_process_pool
+        )
 
         # Mark record as completed in database with retry logic
-        processor.mark_record_completed_with_retry(record_id, result)
+        get_processor().mark_record_completed_with_retry(record_id, result)
 
         logger.info(f"Successfully processed record {record_id} with custom logic")
 
@@ -213,7 +705,7 @@ def process_record_with_status_custom(
     except Exception as e:
         # Mark record as failed in database with retry logic
         error_message = str(e)
-        processor.mark_record_failed_with_retry(record_id, error_message)
+        get_processor().mark_record_failed_with_retry(record_id, error_message)
 
         logger.error(
             f"Failed to process record {record_id} with custom logic: {error_message}"
@@ -222,6 +714,272 @@ def process_record_with_status_custom(
         return {"record_id": record_id, "status": "failed", "error": error_message}
 
 
+@task(name="execute-record-business-logic", retries=0)
+def execute_record_business_logic(
+    record: dict[str, Any],
+    business_logic_func: Optional[callable] = None,
+    use_process_pool: bool = False,
+) -> dict[str, Any]:
+    """
+    Run business logic for a record without writing its status to the database.
+
+    Used together with acknowledge_records_batch so that status updates for a
+    whole batch are written in a single round trip per outcome.
+
+    Args:
+        record: Record dictionary containing id, payload, retry_count, and created_at
+        business_logic_func: Optional custom function to process the record payload.
+            Uses process_default_business_logic if None.
+        use_process_pool: If True, run business_logic_func in the process pool
+
+    Returns:
+        Dictionary containing processing result with record_id, status, and result/error
+    """
+    logger = get_run_logger()
+    record_id = record["id"]
+
+    logger.info(f"Processing record {record_id} (batched acknowledgement)")
+
+    outcome = _execute_business_logic(record, business_logic_func, use_process_pool)
+
+    if outcome["status"] == "failed":
+        logger.error(f"Failed to process record {record_id}: {outcome['error']}")
+
+    return outcome
+
+
+@task(name="process-records-chunk", retries=0)
+def process_records_chunk(
+    records: list[dict[str, Any]],
+    business_logic_func: Optional[callable] = None,
+    batch_business_logic_func: Optional[callable] = None,
+    use_process_pool: bool = False,
+    acknowledge: bool = True,
+) -> list[dict[str, Any]]:
+    """
+    Process a chunk of records in a single task run.
+
+    Business logic failures are isolated per record as in the single-record
+    tasks. With acknowledge=True the statuses of the chunk are written with one
+    batched update per outcome (see acknowledge_records_batch); otherwise they
+    are left to the caller.
+
+    Args:
+        records: Record dictionaries containing id, payload, retry_count, and created_at
+        business_logic_func: Optional custom function to process one record payload.
+            Uses process_default_business_logic if None.
+        batch_business_logic_func: Optional function taking the list of payloads of
+            the chunk and returning one result (or Exception instance) per payload.
+            Used instead of business_logic_func when given.
+        use_process_pool: If True, run business_logic_func in the process pool
+        acknowledge: Whether to write the record statuses in this task
+
+    Returns:
+        List of per-record results in the same shape as process_record_with_status
+    """
+    logger = get_run_logger()
+
+    logger.info(f"Processing chunk of {len(records)} records")
+
+    if batch_business_logic_func is not None:
+        outcomes = _execute_batch_business_logic(records, batch_business_logic_func)
+    else:
+        outcomes = [
+            _execute_business_logic(record, business_logic_func, use_process_pool)
+            for record in records
+        ]
+
+    for outcome in outcomes:
+        if outcome["status"] == "failed":
+            logger.error(
+                f"Failed to process record {outcome['record_id']}: {outcome['error']}"
+            )
+
+    if acknowledge:
+        return _acknowledge_outcomes(outcomes)
+    return outcomes
+
+
+@task(name="acknowledge-records-batch", retries=0)
+def acknowledge_records_batch(outcomes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Write completed and failed statuses for a batch of processed records.
+
+    Issues at most two database statements (one for completions, one for
+    failures). Records whose status could not be written because this instance
+    no longer owns them are reported as failed in the returned results.
+
+    Args:
+        outcomes: Results from execute_record_business_logic tasks
+
+    Returns:
+        List of per-record results in the same shape as process_record_with_status
+    """
+    return _acknowledge_outcomes(outcomes)
+
+
+def _acknowledge_outcomes(outcomes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Write the statuses of processed records with batched updates.
+
+    Args:
+        outcomes: Per-record business logic outcomes
+
+    Returns:
+        Per-record results, with records no longer owned by this instance
+        reported as failed
+    """
+    logger = get_run_logger()
+
+    completions = [
+        (outcome["record_id"], outcome["result"])
+        for outcome in outcomes
+        if outcome["status"] == "completed"
+    ]
+    failures = [
+        (outcome["record_id"], outcome["error"])
+        for outcome in outcomes
+        if outcome["status"] == "failed"
+    ]
+
+    unmatched_ids = set()
+    if completions:
+        unmatched_ids.update(
+            get_processor().mark_records_completed_batch_with_retry(completions)
+        )
+    if failures:
+        unmatched_ids.update(
+            get_processor().mark_records_failed_batch_with_retry(failures)
+        )
+
+    logger.info(
+        f"Acknowledged {len(completions)} completed and {len(failures)} failed records "
+        f"({len(unmatched_ids)} not owned by this instance)"
+    )
+
+    results = []
+    for outcome in outcomes:
+        if outcome["record_id"] in unmatched_ids:
+            results.append(
+                {
+                    "record_id": outcome["record_id"],
+                    "status": "failed",
+                    "error": "Status not recorded: record not in processing state "
+                    f"for instance '{get_processor().instance_id}'",
+                }
+            )
+        else:
+            results.append(outcome)
+
+    return results
+
+
+def _execute_business_logic(
+    record: dict[str, Any],
+    business_logic_func: Optional[callable],
+    use_process_pool: bool = False,
+) -> dict[str, Any]:
+    """
+    Run business logic for one record and capture the outcome.
+
+    Args:
+        record: Record dictionary containing id and payload
+        business_logic_func: Optional custom function (default logic if None)
+        use_process_pool: Whether to run business_logic_func in the process pool
+
+    Returns:
+        Dictionary containing record_id, status, and result/error
+    """
+    record_id = record["id"]
+
+    try:
+        if business_logic_func:
+            result = _run_business_logic(
+                business_logic_func, record["payload"], use_process_pool
+            )
+        else:
+            result = process_default_business_logic(record["payload"])
+
+        return {"record_id": record_id, "status": "completed", "result": result}
+
+    except Exception as e:
+        error_message = str(e) or type(e).__name__
+        return {"record_id": record_id, "status": "failed", "error": error_message}
+
+
+def _execute_batch_business_logic(
+    records: list[dict[str, Any]], batch_business_logic_func: callable
+) -> list[dict[str, Any]]:
+    """
+    Run batch business logic for a chunk of records and capture the outcomes.
+
+    If the function raises or does not return one result per payload, every
+    record of the chunk fails with that error.
+
+    Args:
+        records: Record dictionaries containing id and payload
+        batch_business_logic_func: Function taking a list of payloads
+
+    Returns:
+        One dictionary containing record_id, status, and result/error per record
+    """
+    try:
+        results = list(
+            batch_business_logic_func([record["payload"] for record in records])
+        )
+        if len(results) != len(records):
+            raise ValueError(
+                f"batch_business_logic_func returned {len(results)} results "
+                f"for {len(records)} records"
+            )
+    except Exception as e:
+        error_message = str(e) or type(e).__name__
+        return [
+            {"record_id": record["id"], "status": "failed", "error": error_message}
+            for record in records
+        ]
+
+    outcomes = []
+    for record, result in zip(records, results):
+        if isinstance(result, Exception):
+            outcomes.append(
+                {
+                    "record_id": record["id"],
+                    "status": "failed",
+                    "error": str(result) or type(result).__name__,
+                }
+            )
+        else:
+            outcomes.append(
+                {"record_id": record["id"], "status": "completed", "result": result}
+            )
+    return outcomes
+
+
+def _run_business_logic(
+    business_logic_func: callable, payload: dict[str, Any], use_process_pool: bool
+) -> Any:
+    """
+    Run business logic on a payload in this process or in the process pool.
+
+    Args:
+        business_logic_func: Function to process the record payload
+        payload: Record payload data to process
+        use_process_pool: Whether to run the function in the process pool
+
+    Returns:
+        Business logic result
+    """
+    if not use_process_pool:
+        return business_logic_func(payload)
+
+    return run_in_process_pool(
+        business_logic_func,
+        payload,
+        max_workers=get_processor().config.get("process_pool_workers"),
+    )
+
+
 def process_default_business_logic(payload: dict[str, Any]) -> dict[str, Any]:
     """
     Default business logic for record processing.
@@ -238,19 +996,49 @@ def process_default_business_logic(payload: dict[str, Any]) -> dict[str, Any]:
     Example:
         payload = {"survey_id": 1001, "customer_id": "CUST001"}
         result = process_default_business_logic(payload)
-        # Returns: {"processed": True, "survey_id": 1001, "timestamp": "..."}
+        # Returns: {"processed": True, "processed_at": "...", "processor_instance": "..."}
     """
     # Default implementation - just marks as processed with timestamp
     import datetime
 
+    # The input stays in the queue payload, so it is not copied into the result
     return {
         "processed": True,
-        "original_payload": payload,
         "processed_at": datetime.datetime.now(datetime.UTC).isoformat(),
-        "processor_instance": processor.instance_id,
+        "processor_instance": get_processor().instance_id,
     }
 
 
+def _reclaim_expired_leases(flow_name: str) -> int:
+    """
+    Sweep expired leases for a flow before claiming new records.
+
+    Sweeper failures are logged and ignored so that they never block processing;
+    the records are picked up by the next sweep.
+
+    Args:
+        flow_name: Flow whose expired leases should be reclaimed
+
+    Returns:
+        Number of reclaimed records (0 if the sweep failed)
+    """
+    logger = get_run_logger()
+
+    try:
+        reclaimed_count = get_processor().reclaim_expired_leases(flow_name)
+    except Exception as e:
+        logger.warning(f"Expired lease sweep failed for flow '{flow_name}': {e}")
+        return 0
+
+    if reclaimed_count:
+        logger.warning(
+            f"Reclaimed {reclaimed_count} records with expired leases "
+            f"for flow '{flow_name}'"
+        )
+
+    return reclaimed_count
+
+
 @task(name="generate-processing-summary")
 def generate_processing_summary(
     results: list[dict[str, Any]], flow_name: str, batch_size: int, records_claimed: int
@@ -300,7 +1088,7 @@ def generate_processing_summary(
         "records_completed": completed_count,
         "records_failed": failed_count,
         "success_rate_percent": round(success_rate, 2),
-        "processor_instance": processor.instance_id,
+        "processor_instance": get_processor().instance_id,
         "errors": errors[:10] if errors else [],  # Limit to first 10 errors
         "error_count": len(errors),
     }
@@ -319,11 +1107,69 @@ def generate_processing_summary(
     return summary
 
 
+@flow(name="distributed-worker")
+def distributed_worker_flow(
+    flow_name: str,
+    batch_size: Optional[int] = None,
+    business_logic_func: Optional[callable] = None,
+    poll_interval_seconds: Optional[int] = None,
+    max_runtime_seconds: Optional[int] = None,
+    max_records: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Long-running worker flow that processes records as soon as they are enqueued.
+
+    Unlike distributed_processing_flow, which claims one batch per run, this flow
+    keeps claiming until a budget is reached. While the queue is empty it blocks
+    on PostgreSQL LISTEN and wakes up on enqueue notifications, falling back to
+    polling every poll_interval_seconds for missed notifications.
+
+    Args:
+        flow_name: Name of the flow for record claiming and logging
+        batch_size: Records to claim per batch (uses the adaptive
+            batch size if enabled, otherwise the config default, if None)
+        business_logic_func: Optional custom business logic function
+        poll_interval_seconds: Fallback poll interval (uses config default if None)
+        max_runtime_seconds: Optional wall-clock budget for the worker
+        max_records: Optional maximum number of records to claim
+
+    Returns:
+        Dictionary containing totals for the worker run
+
+    Raises:
+        RuntimeError: If database health check fails (fail-fast behavior)
+        ValueError: If flow_name or batch_size is invalid
+    """
+    logger = get_run_logger()
+
+    processor = get_processor()
+    health_status = processor.health_check()
+    if health_status["status"] == "unhealthy":
+        error_msg = f"Database health check failed: {health_status.get('error', 'Unknown error')}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+
+    worker = DistributedWorker(
+        processor,
+        flow_name,
+        business_logic_func or process_default_business_logic,
+        batch_size=batch_size,
+        poll_interval=poll_interval_seconds,
+    )
+
+    return worker.run(max_runtime_seconds=max_runtime_seconds, max_records=max_records)
+
+
 # Utility functions for flow template usage
 
 
 def create_custom_distributed_flow(
-    flow_name: str, business_logic_func: callable, default_batch_size: int = 100
+    flow_name: str,
+    business_logic_func: callable,
+    default_batch_size: int = 100,
+    batch_acknowledge: bool = False,
+    use_process_pool: bool = False,
+    chunk_size: Optional[int] = None,
 ) -> callable:
     """
     Factory function to create custom distributed flows with specific business logic.
@@ -335,6 +1181,9 @@ def create_custom_distributed_flow(
         flow_name: Name for the custom flow
         business_logic_func: Custom business logic function
         default_batch_size: Default batch size for the flow
+        batch_acknowledge: Whether record statuses are written in batched updates
+        use_process_pool: Whether business logic runs in the process pool
+        chunk_size: Records processed per task (uses config default if None)
 
     Returns:
         Configured flow function ready for deployment
@@ -356,6 +1205,9 @@ def create_custom_distributed_flow(
             flow_name=flow_name,
             batch_size=batch_size,
             business_logic_func=business_logic_func,
+            batch_acknowledge=batch_acknowledge,
+            use_process_pool=use_process_pool,
+            chunk_size=chunk_size,
         )
 
     return custom_flow
@@ -370,7 +1222,7 @@ def get_processor_health() -> dict[str, Any]:
     Returns:
         Dictionary containing current health status
     """
-    return processor.health_check()
+    return get_processor().health_check()
 
 
 def get_queue_status(flow_name: Optional[str] = None) -> dict[str, Any]:
@@ -385,4 +1237,4 @@ def get_queue_status(flow_name: Optional[str] = None) -> dict[str, Any]:
     Returns:
         Dictionary containing queue status information
     """
-    return processor.get_queue_status(flow_name)
+    return get_processor().get_queue_status(flow_name)
@@ -15,9 +15,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-import psutil
+from core.database import DatabaseManager, get_query_timeout_counts
+from core.lazy_import import lazy_import
+from core.query_stats import query_stats
 
-from core.database import DatabaseManager
+psutil = lazy_import("psutil")
 
 
 class HealthStatus(Enum):
@@ -174,6 +176,20 @@ class PrometheusMetrics:
                 "timestamp": time.time(),
             }
 
+    def set_counter(
+        self, name: str, value: float, labels: Optional[dict[str, str]] = None
+    ):
+        """Set a counter metric to a total maintained elsewhere."""
+        labels = labels or {}
+        label_str = ",".join([f'{k}="{v}"' for k, v in labels.items()])
+        metric_key = f"{name}{{{label_str}}}" if label_str else name
+
+        self.metrics[metric_key] = {
+            "type": "counter",
+            "value": value,
+            "timestamp": time.time(),
+        }
+
     def export_prometheus_format(self) -> str:
         """Export metrics in Prometheus format."""
         lines = []
@@ -711,8 +727,24 @@ class HealthMonitor:
         # Update current metrics
         self.get_resource_status()
         self.comprehensive_health_check()
-
-        return self.metrics.export_prometheus_format()
+        self._update_database_query_metrics()
+
+        # Statement latency and connection checkout histograms
+        return self.metrics.export_prometheus_format() + (
+            query_stats.export_prometheus_format()
+        )
+
+    def _update_database_query_metrics(self):
+        """Copy the query timeout counters of this process into the metrics."""
+        for entry in get_query_timeout_counts():
+            self.metrics.set_counter(
+                "database_query_timeouts_total",
+                entry["timeouts"],
+                {
+                    "database": entry["database_name"],
+                    "query_class": entry["query_class"],
+                },
+            )
 
     def get_metrics_dict(self) -> dict[str, Any]:
         """
@@ -0,0 +1,107 @@
+"""
+Lazy imports for heavy optional dependencies.
+
+Prefect, docker, psutil, pyway and httpx take from tens of milliseconds to seconds
+to import, and many code paths (deployment tooling, CLI commands, tests) import a
+module that uses them without ever calling into them. lazy_import() binds a
+module-level name to a stand-in that imports the dependency on first use, so the
+import cost is paid by the code path that needs it and the name stays patchable
+in tests like a regular import.
+
+Usage:
+    psutil = lazy_import("psutil")
+    Variable = lazy_import("prefect.variables", "Variable")
+
+Attribute stand-ins forward calls and attribute access only. Classes used with
+isinstance(), in except clauses or as base classes must be reached through a
+module stand-in at the point of use (e.g. ``except docker.errors.NotFound``).
+"""
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Any, Optional
+
+# Serializes the first import of a stand-in across threads
+_load_lock = threading.RLock()
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, module_name: str):
+        self._module_name = module_name
+        self._module: Optional[ModuleType] = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            with _load_lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._module_name)
+        return self._module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._module_name}' ({state})>"
+
+
+class _LazyAttribute:
+    """Stand-in for a module attribute that is imported on first use."""
+
+    def __init__(self, module_name: str, attribute: str):
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target: Any = None
+        self._loaded = False
+
+    def _load(self) -> Any:
+        if not self._loaded:
+            with _load_lock:
+                if not self._loaded:
+                    module = importlib.import_module(self._module_name)
+                    self._target = getattr(module, self._attribute)
+                    self._loaded = True
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._loaded else "not loaded"
+        return f"<lazy attribute '{self._module_name}.{self._attribute}' ({state})>"
+
+
+def lazy_import(module_name: str, attribute: Optional[str] = None) -> Any:
+    """
+    Bind a module, or an attribute of a module, that is imported on first use.
+
+    Args:
+        module_name: Dotted module name (e.g. 'psutil', 'prefect.variables')
+        attribute: Optional attribute of the module (e.g. 'Variable')
+
+    Returns:
+        Stand-in that imports the module on first attribute access or call and
+        then forwards to the module or attribute. Import errors surface at that
+        point, not when lazy_import() is called.
+    """
+    if attribute is None:
+        return _LazyModule(module_name)
+    return _LazyAttribute(module_name, attribute)
+
+
+def is_loaded(stand_in: Any) -> bool:
+    """Return whether a lazy_import() stand-in has imported its target yet."""
+    if isinstance(stand_in, _LazyModule):
+        return stand_in._module is not None
+    if isinstance(stand_in, _LazyAttribute):
+        return stand_in._loaded
+    return True
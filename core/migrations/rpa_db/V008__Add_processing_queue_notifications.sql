@@ -0,0 +1,60 @@
+-- Migration V008: Add LISTEN/NOTIFY wakeups for processing_queue
+-- Sends a notification on channel 'processing_queue_new_work' whenever records become
+-- pending, with the flow_name as payload. Long-running workers LISTEN on this channel
+-- and claim immediately instead of polling the queue table.
+-- Notifications are transactional: they are delivered only when the enqueue commits,
+-- and duplicate (channel, payload) pairs within one transaction are collapsed.
+
+-- Notify once per distinct flow_name for newly inserted pending records
+CREATE OR REPLACE FUNCTION notify_processing_queue_inserted()
+RETURNS TRIGGER AS $$
+DECLARE
+    pending_flow RECORD;
+BEGIN
+    FOR pending_flow IN
+        SELECT DISTINCT flow_name FROM new_rows WHERE status = 'pending'
+    LOOP
+        PERFORM pg_notify('processing_queue_new_work', pending_flow.flow_name);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Notify once per distinct flow_name for records returned to pending
+-- (reset_failed_records, cleanup_orphaned_records)
+CREATE OR REPLACE FUNCTION notify_processing_queue_requeued()
+RETURNS TRIGGER AS $$
+DECLARE
+    pending_flow RECORD;
+BEGIN
+    FOR pending_flow IN
+        SELECT DISTINCT new_rows.flow_name
+        FROM new_rows
+        JOIN old_rows ON old_rows.id = new_rows.id
+        WHERE new_rows.status = 'pending' AND old_rows.status <> 'pending'
+    LOOP
+        PERFORM pg_notify('processing_queue_new_work', pending_flow.flow_name);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Statement-level triggers with transition tables: one notification per flow per
+-- statement, regardless of how many rows a bulk insert or reset touches
+DROP TRIGGER IF EXISTS notify_processing_queue_insert ON processing_queue;
+CREATE TRIGGER notify_processing_queue_insert
+    AFTER INSERT ON processing_queue
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_processing_queue_inserted();
+
+DROP TRIGGER IF EXISTS notify_processing_queue_requeue ON processing_queue;
+CREATE TRIGGER notify_processing_queue_requeue
+    AFTER UPDATE ON processing_queue
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_processing_queue_requeued();
+
+COMMENT ON FUNCTION notify_processing_queue_inserted() IS
+'Sends pg_notify(processing_queue_new_work, flow_name) for newly enqueued pending records';
+
+COMMENT ON FUNCTION notify_processing_queue_requeued() IS
+'Sends pg_notify(processing_queue_new_work, flow_name) for records reset to pending';
@@ -0,0 +1,23 @@
+-- Migration V009: Add lease-based claiming to processing_queue
+-- Claimed records carry a lease_expires_at timestamp that workers extend with a
+-- heartbeat while processing. Records whose lease has expired belong to a crashed
+-- or stalled worker and are returned to 'pending' by reclaim_expired_leases,
+-- with seconds-level granularity instead of the hour-based orphan cleanup.
+
+ALTER TABLE processing_queue
+    ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP;
+
+-- Give records already in processing a lease so they are covered by the sweeper
+UPDATE processing_queue
+SET lease_expires_at = COALESCE(claimed_at, CURRENT_TIMESTAMP) + INTERVAL '1 hour'
+WHERE status = 'processing' AND lease_expires_at IS NULL;
+
+-- Partial index for the lease sweeper
+-- This supports: WHERE status = 'processing' AND lease_expires_at < ?
+-- Used by reclaim_expired_leases to find records held by dead workers
+CREATE INDEX IF NOT EXISTS idx_processing_queue_processing_lease
+ON processing_queue(lease_expires_at)
+WHERE status = 'processing';
+
+COMMENT ON COLUMN processing_queue.lease_expires_at IS
+'Time at which the claim on a processing record expires unless renewed by a heartbeat';
@@ -0,0 +1,25 @@
+-- Migration V010: Store processing results outside processing_queue
+-- mark_record_completed used to overwrite processing_queue.payload with the result,
+-- rewriting a possibly large TOASTed value on the hot queue table and losing the
+-- input needed for replay. Results now live in processing_results keyed by queue id;
+-- processing_queue.payload keeps the original input. Results larger than the
+-- configured size cap are spilled to disk and only their path is stored here.
+
+CREATE TABLE IF NOT EXISTS processing_results (
+    queue_id INTEGER PRIMARY KEY REFERENCES processing_queue(id) ON DELETE CASCADE,
+    result JSONB,
+    result_size_bytes INTEGER NOT NULL DEFAULT 0,
+    spill_path TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CHECK (result IS NOT NULL OR spill_path IS NOT NULL)
+);
+
+-- Index for time-based archiving of old results
+CREATE INDEX IF NOT EXISTS idx_processing_results_created_at
+ON processing_results(created_at);
+
+COMMENT ON TABLE processing_results IS
+'Processing results for completed processing_queue records (one row per queue record)';
+
+COMMENT ON COLUMN processing_results.spill_path IS
+'File holding the JSON result when it exceeded the configured result size cap';
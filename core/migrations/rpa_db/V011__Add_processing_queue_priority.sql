@@ -0,0 +1,34 @@
+-- Migration V011: Add priority-aware claiming to processing_queue
+-- Records are claimed by priority (lower value first) and FIFO within a priority,
+-- so urgent records no longer wait behind bulk backfills.
+-- Priority levels used by DistributedProcessor: 0 = high, 100 = normal (default),
+-- 200 = low; any value between 0 and 1000 is accepted.
+
+ALTER TABLE processing_queue
+    ADD COLUMN IF NOT EXISTS priority INTEGER NOT NULL DEFAULT 100;
+
+ALTER TABLE processing_queue
+    DROP CONSTRAINT IF EXISTS processing_queue_priority_check;
+
+ALTER TABLE processing_queue
+    ADD CONSTRAINT processing_queue_priority_check CHECK (priority BETWEEN 0 AND 1000);
+
+-- Carry over the priority hint existing pending records keep in their payload
+UPDATE processing_queue
+SET priority = CASE payload->>'priority'
+        WHEN 'high' THEN 0
+        WHEN 'low' THEN 200
+        ELSE 100
+    END
+WHERE status = 'pending' AND payload ? 'priority';
+
+-- Partial index for priority claiming
+-- This supports: WHERE flow_name = ? AND status = 'pending' ORDER BY priority, created_at
+-- Used by claim_records_batch so high-priority claims stay an index range scan
+-- regardless of how many lower-priority records are pending
+CREATE INDEX IF NOT EXISTS idx_processing_queue_pending_priority
+ON processing_queue(flow_name, priority, created_at)
+WHERE status = 'pending';
+
+COMMENT ON COLUMN processing_queue.priority IS
+'Claim priority, lower values are claimed first (0 = high, 100 = normal, 200 = low)';
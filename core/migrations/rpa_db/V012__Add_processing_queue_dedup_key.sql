@@ -0,0 +1,17 @@
+-- Migration V012: Add deduplication keys to processing_queue
+-- Re-running an enqueue step used to insert the same source records again, so the
+-- fleet processed them twice. Records may now carry a dedup_key that is unique per
+-- flow; add_records_to_queue_idempotent inserts with ON CONFLICT DO NOTHING and
+-- reports how many records were skipped. Records without a key are unaffected.
+
+ALTER TABLE processing_queue
+    ADD COLUMN IF NOT EXISTS dedup_key VARCHAR(255);
+
+-- Unique partial index enforcing one record per flow and deduplication key
+-- This supports: INSERT ... ON CONFLICT (flow_name, dedup_key) WHERE dedup_key IS NOT NULL
+CREATE UNIQUE INDEX IF NOT EXISTS idx_processing_queue_flow_dedup_key
+ON processing_queue(flow_name, dedup_key)
+WHERE dedup_key IS NOT NULL;
+
+COMMENT ON COLUMN processing_queue.dedup_key IS
+'Optional deduplication key, unique per flow_name; duplicate enqueues are skipped';
@@ -0,0 +1,149 @@
+-- Migration V013: Trigger-maintained record counters for processing_queue
+-- get_queue_status used to run COUNT(*) ... GROUP BY over the whole processing_queue
+-- on every dashboard refresh and health check. processing_queue_stats keeps one
+-- counter per (flow_name, status), updated incrementally by statement-level
+-- triggers, so queue status is read from a handful of rows instead.
+-- refresh_processing_queue_stats() recomputes the counters exactly.
+
+CREATE TABLE IF NOT EXISTS processing_queue_stats (
+    flow_name VARCHAR(100) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    record_count BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (flow_name, status)
+);
+
+COMMENT ON TABLE processing_queue_stats IS
+'Record counts per flow_name and status, maintained by triggers on processing_queue';
+
+-- Apply the net change of one INSERT, UPDATE or DELETE statement to the counters.
+-- Counters are upserted in (flow_name, status) order so concurrent statements lock
+-- counter rows in the same order and cannot deadlock on them.
+CREATE OR REPLACE FUNCTION apply_processing_queue_stats_delta()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO processing_queue_stats (flow_name, status, record_count, updated_at)
+        SELECT flow_name, status, COUNT(*), CURRENT_TIMESTAMP
+        FROM new_rows
+        GROUP BY flow_name, status
+        ORDER BY flow_name, status
+        ON CONFLICT (flow_name, status) DO UPDATE
+        SET record_count = processing_queue_stats.record_count + EXCLUDED.record_count,
+            updated_at = EXCLUDED.updated_at;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO processing_queue_stats (flow_name, status, record_count, updated_at)
+        SELECT flow_name, status, -COUNT(*), CURRENT_TIMESTAMP
+        FROM old_rows
+        GROUP BY flow_name, status
+        ORDER BY flow_name, status
+        ON CONFLICT (flow_name, status) DO UPDATE
+        SET record_count = processing_queue_stats.record_count + EXCLUDED.record_count,
+            updated_at = EXCLUDED.updated_at;
+
+    ELSIF TG_OP = 'UPDATE' THEN
+        -- Only rows whose status (or flow) changed move between counters;
+        -- heartbeats and result writes leave the counters untouched
+        INSERT INTO processing_queue_stats (flow_name, status, record_count, updated_at)
+        SELECT flow_name, status, SUM(delta), CURRENT_TIMESTAMP
+        FROM (
+            SELECT new_rows.flow_name, new_rows.status, 1 AS delta
+            FROM new_rows
+            JOIN old_rows ON old_rows.id = new_rows.id
+            WHERE new_rows.status IS DISTINCT FROM old_rows.status
+               OR new_rows.flow_name IS DISTINCT FROM old_rows.flow_name
+            UNION ALL
+            SELECT old_rows.flow_name, old_rows.status, -1 AS delta
+            FROM old_rows
+            JOIN new_rows ON new_rows.id = old_rows.id
+            WHERE new_rows.status IS DISTINCT FROM old_rows.status
+               OR new_rows.flow_name IS DISTINCT FROM old_rows.flow_name
+        ) AS changes
+        GROUP BY flow_name, status
+        HAVING SUM(delta) <> 0
+        ORDER BY flow_name, status
+        ON CONFLICT (flow_name, status) DO UPDATE
+        SET record_count = processing_queue_stats.record_count + EXCLUDED.record_count,
+            updated_at = EXCLUDED.updated_at;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- TRUNCATE does not fire row or transition-table triggers; clear the counters
+CREATE OR REPLACE FUNCTION reset_processing_queue_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM processing_queue_stats;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Recompute every counter from processing_queue and return how many were corrected.
+-- Blocks writers to processing_queue while counting so no delta is missed.
+CREATE OR REPLACE FUNCTION refresh_processing_queue_stats()
+RETURNS INTEGER AS $$
+DECLARE
+    corrected INTEGER;
+BEGIN
+    LOCK TABLE processing_queue IN SHARE ROW EXCLUSIVE MODE;
+
+    WITH actual AS (
+        SELECT flow_name, status, COUNT(*) AS record_count
+        FROM processing_queue
+        GROUP BY flow_name, status
+    ),
+    drifted AS (
+        SELECT COALESCE(actual.flow_name, stats.flow_name) AS flow_name,
+               COALESCE(actual.status, stats.status) AS status,
+               COALESCE(actual.record_count, 0) AS record_count
+        FROM actual
+        FULL OUTER JOIN processing_queue_stats AS stats
+            ON stats.flow_name = actual.flow_name AND stats.status = actual.status
+        WHERE stats.record_count IS DISTINCT FROM COALESCE(actual.record_count, 0)
+    ),
+    corrected_rows AS (
+        INSERT INTO processing_queue_stats (flow_name, status, record_count, updated_at)
+        SELECT flow_name, status, record_count, CURRENT_TIMESTAMP
+        FROM drifted
+        ON CONFLICT (flow_name, status) DO UPDATE
+        SET record_count = EXCLUDED.record_count,
+            updated_at = EXCLUDED.updated_at
+        RETURNING 1
+    )
+    SELECT COUNT(*) INTO corrected FROM corrected_rows;
+
+    RETURN corrected;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS processing_queue_stats_insert ON processing_queue;
+CREATE TRIGGER processing_queue_stats_insert
+    AFTER INSERT ON processing_queue
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_processing_queue_stats_delta();
+
+DROP TRIGGER IF EXISTS processing_queue_stats_update ON processing_queue;
+CREATE TRIGGER processing_queue_stats_update
+    AFTER UPDATE ON processing_queue
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_processing_queue_stats_delta();
+
+DROP TRIGGER IF EXISTS processing_queue_stats_delete ON processing_queue;
+CREATE TRIGGER processing_queue_stats_delete
+    AFTER DELETE ON processing_queue
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION apply_processing_queue_stats_delta();
+
+DROP TRIGGER IF EXISTS processing_queue_stats_truncate ON processing_queue;
+CREATE TRIGGER processing_queue_stats_truncate
+    AFTER TRUNCATE ON processing_queue
+    FOR EACH STATEMENT EXECUTE FUNCTION reset_processing_queue_stats();
+
+-- Seed the counters from the existing records
+SELECT refresh_processing_queue_stats();
+
+COMMENT ON FUNCTION refresh_processing_queue_stats() IS
+'Recomputes processing_queue_stats from processing_queue; returns the number of corrected counters';
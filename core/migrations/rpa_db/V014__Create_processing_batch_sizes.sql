@@ -0,0 +1,20 @@
+-- Migration V014: Learned batch sizes for adaptive record claiming
+-- AdaptiveBatchSizer (core/adaptive_batch.py) adjusts the claim batch size of a
+-- flow toward a target batch duration. The learned size and the smoothed
+-- observations it is based on are kept per flow and instance class, so new
+-- containers of the same size start from what earlier ones learned.
+
+CREATE TABLE IF NOT EXISTS processing_batch_sizes (
+    flow_name VARCHAR(100) NOT NULL,
+    instance_class VARCHAR(100) NOT NULL,
+    batch_size INTEGER NOT NULL CHECK (batch_size > 0),
+    per_record_seconds DOUBLE PRECISION,
+    claim_seconds DOUBLE PRECISION,
+    failure_rate DOUBLE PRECISION,
+    batches_observed INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (flow_name, instance_class)
+);
+
+COMMENT ON TABLE processing_batch_sizes IS
+'Adaptive claim batch size per flow_name and instance class, maintained by AdaptiveBatchSizer';
@@ -16,6 +16,10 @@ from prefect import get_run_logger, task
 from core.database import DatabaseManager
 from core.distributed import DistributedProcessor
 
+# Query class of the analysis queries below; their statement timeout is
+# configured with RPA_DB_QUERY_TIMEOUT_MONITORING (see DatabaseManager)
+MONITORING_QUERY_CLASS = "monitoring"
+
 
 def _get_logger():
     """Get logger with fallback for non-Prefect contexts."""
@@ -370,6 +374,8 @@ def distributed_system_maintenance(
     orphaned_timeout_hours: int = 2,
     max_retries: int = 3,
     dry_run: bool = False,
+    reclaim_expired_leases: bool = True,
+    refresh_queue_stats: bool = False,
 ) -> dict[str, Any]:
     """
     Perform maintenance operations on the distributed processing system.
@@ -384,6 +390,10 @@ def distributed_system_maintenance(
         orphaned_timeout_hours: Hours after which records are considered orphaned
         max_retries: Maximum retry count for failed record reset
         dry_run: If True, only report what would be done without making changes
+        reclaim_expired_leases: Whether to return records with expired claim
+            leases to pending
+        refresh_queue_stats: Whether to recompute the queue status counters from
+            processing_queue (blocks queue writers while counting)
 
     Returns:
         Dictionary containing maintenance operation results
@@ -405,7 +415,9 @@ def distributed_system_maintenance(
             "dry_run": dry_run,
             "operations_performed": [],
             "cleanup_results": {},
+            "lease_results": {},
             "reset_results": {},
+            "stats_results": {},
             "before_status": {},
             "after_status": {},
             "recommendations": [],
@@ -449,6 +461,29 @@ def distributed_system_maintenance(
                 "cleanup_orphaned_records"
             )
 
+        # Expired lease sweep (seconds-level recovery from crashed instances)
+        if reclaim_expired_leases:
+            logger.info("Reclaiming records with expired leases")
+
+            if dry_run:
+                expired_count = _count_expired_leases(processor)
+                maintenance_results["lease_results"] = {
+                    "operation": "reclaim_expired_leases",
+                    "dry_run": True,
+                    "expired_leases_found": expired_count,
+                    "records_reclaimed": 0,
+                    "message": f"Would reclaim {expired_count} expired leases",
+                }
+            else:
+                reclaimed_count = processor.reclaim_expired_leases()
+                maintenance_results["lease_results"] = {
+                    "operation": "reclaim_expired_leases",
+                    "dry_run": False,
+                    "records_reclaimed": reclaimed_count,
+                }
+
+            maintenance_results["operations_performed"].append("reclaim_expired_leases")
+
         # Failed records reset
         if reset_failed_records:
             logger.info(f"Resetting failed records (max_retries: {max_retries})")
@@ -494,6 +529,27 @@ def distributed_system_maintenance(
 
             maintenance_results["operations_performed"].append("reset_failed_records")
 
+        # Queue status counters recompute (repairs drift in processing_queue_stats)
+        if refresh_queue_stats:
+            logger.info("Recomputing queue status counters")
+
+            if dry_run:
+                maintenance_results["stats_results"] = {
+                    "operation": "refresh_queue_stats",
+                    "dry_run": True,
+                    "counters_corrected": 0,
+                    "message": "Would recompute queue status counters",
+                }
+            else:
+                corrected_count = processor.refresh_queue_stats()
+                maintenance_results["stats_results"] = {
+                    "operation": "refresh_queue_stats",
+                    "dry_run": False,
+                    "counters_corrected": corrected_count,
+                }
+
+            maintenance_results["operations_performed"].append("refresh_queue_stats")
+
         # Get final queue status
         logger.info("Getting final queue status")
         final_status = processor.get_queue_status()
@@ -522,12 +578,24 @@ def distributed_system_maintenance(
                 )
                 logger.info(f"  - Cleaned up {cleaned} orphaned records")
 
+            if reclaim_expired_leases:
+                reclaimed = maintenance_results["lease_results"].get(
+                    "records_reclaimed", 0
+                )
+                logger.info(f"  - Reclaimed {reclaimed} records with expired leases")
+
             if reset_failed_records:
                 reset_total = maintenance_results["reset_results"].get(
                     "total_records_reset", 0
                 )
                 logger.info(f"  - Reset {reset_total} failed records for retry")
 
+            if refresh_queue_stats:
+                corrected = maintenance_results["stats_results"].get(
+                    "counters_corrected", 0
+                )
+                logger.info(f"  - Corrected {corrected} queue status counters")
+
         return maintenance_results
 
     except Exception as e:
@@ -684,7 +752,8 @@ def _analyze_orphaned_records(
 ) -> dict[str, Any]:
     """Analyze orphaned records in the processing queue."""
     try:
-        # Query for potentially orphaned records (processing for > 1 hour)
+        # Query for potentially orphaned records (processing for > 1 hour without
+        # a live lease)
         query = """
         SELECT
             flow_name,
@@ -695,6 +764,7 @@ def _analyze_orphaned_records(
         FROM processing_queue
         WHERE status = 'processing'
         AND claimed_at < NOW() - INTERVAL '1 hour'
+        AND (lease_expires_at IS NULL OR lease_expires_at < NOW())
         """
 
         if flow_name:
@@ -705,7 +775,9 @@ def _analyze_orphaned_records(
 
         query += " GROUP BY flow_name ORDER BY orphaned_count DESC"
 
-        results = processor.rpa_db.execute_query(query, params)
+        results = processor.rpa_db.execute_query_with_timeout(
+            query, params, query_class=MONITORING_QUERY_CLASS
+        )
 
         total_orphaned = sum(row["orphaned_count"] for row in results)
 
@@ -754,7 +826,9 @@ def _analyze_processing_performance(
 
         query += " GROUP BY flow_name ORDER BY total_processed DESC"
 
-        results = processor.rpa_db.execute_query(query, params)
+        results = processor.rpa_db.execute_query_with_timeout(
+            query, params, query_class=MONITORING_QUERY_CLASS
+        )
 
         if results:
             total_processed = sum(row["total_processed"] for row in results)
@@ -817,7 +891,9 @@ def _calculate_performance_metrics(
             query += " AND flow_name = :flow_name"
             params["flow_name"] = flow_name
 
-        results = processor.rpa_db.execute_query(query, params)
+        results = processor.rpa_db.execute_query_with_timeout(
+            query, params, query_class=MONITORING_QUERY_CLASS
+        )
 
         if results and results[0]["total_processed"]:
             result = results[0]
@@ -909,7 +985,9 @@ def _analyze_processing_errors(
 
         query += " GROUP BY flow_name, error_message ORDER BY error_count DESC LIMIT 20"
 
-        results = processor.rpa_db.execute_query(query, params)
+        results = processor.rpa_db.execute_query_with_timeout(
+            query, params, query_class=MONITORING_QUERY_CLASS
+        )
 
         # Group errors by flow
         errors_by_flow = {}
@@ -985,7 +1063,9 @@ def _analyze_performance_trends(
             " GROUP BY DATE_TRUNC('hour', claimed_at), flow_name ORDER BY hour DESC"
         )
 
-        results = processor.rpa_db.execute_query(query, params)
+        results = processor.rpa_db.execute_query_with_timeout(
+            query, params, query_class=MONITORING_QUERY_CLASS
+        )
 
         # Calculate trend metrics
         hourly_totals = {}
@@ -1182,11 +1262,33 @@ def _count_orphaned_records(processor: DistributedProcessor, timeout_hours: int)
         SELECT COUNT(*) as count
         FROM processing_queue
         WHERE status = 'processing'
-        AND claimed_at < NOW() - INTERVAL ':timeout_hours hours'
+        AND claimed_at < NOW() - make_interval(hours => :timeout_hours)
+        AND (lease_expires_at IS NULL OR lease_expires_at < NOW())
+        """
+
+        results = processor.rpa_db.execute_query_with_timeout(
+            query,
+            {"timeout_hours": timeout_hours},
+            query_class=MONITORING_QUERY_CLASS,
+        )
+        return results[0]["count"] if results else 0
+
+    except Exception:
+        return 0
+
+
+def _count_expired_leases(processor: DistributedProcessor) -> int:
+    """Count processing records with expired leases without reclaiming them."""
+    try:
+        query = """
+        SELECT COUNT(*) as count
+        FROM processing_queue
+        WHERE status = 'processing'
+        AND lease_expires_at < NOW()
         """
 
-        results = processor.rpa_db.execute_query(
-            query, {"timeout_hours": timeout_hours}
+        results = processor.rpa_db.execute_query_with_timeout(
+            query, {}, query_class=MONITORING_QUERY_CLASS
         )
         return results[0]["count"] if results else 0
 
@@ -1207,8 +1309,10 @@ def _count_resettable_failed_records(
         AND retry_count < :max_retries
         """
 
-        results = processor.rpa_db.execute_query(
-            query, {"flow_name": flow_name, "max_retries": max_retries}
+        results = processor.rpa_db.execute_query_with_timeout(
+            query,
+            {"flow_name": flow_name, "max_retries": max_retries},
+            query_class=MONITORING_QUERY_CLASS,
         )
         return results[0]["count"] if results else 0
 
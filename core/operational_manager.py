@@ -11,10 +11,14 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-import docker
-from docker.models.services import Service
+from core.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from docker.models.services import Service
+
+docker = lazy_import("docker")
 
 
 class DeploymentStatus(Enum):
@@ -152,7 +156,7 @@ class OperationalManager:
     and automated incident response.
     """
 
-    def __init__(self, docker_client: Optional[docker.DockerClient] = None):
+    def __init__(self, docker_client: Optional["docker.DockerClient"] = None):
         """Initialize the operational manager"""
         self.docker_client = docker_client or docker.from_env()
         self.logger = logging.getLogger(__name__)
@@ -589,7 +593,7 @@ class OperationalManager:
                 uptime_percentage=0.0,
             )
 
-    def _get_service_status(self, service: Service) -> str:
+    def _get_service_status(self, service: "Service") -> str:
         """Get the current status of a service"""
         try:
             tasks = service.tasks()
@@ -13,10 +13,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-import psutil
-
 from core.database import DatabaseManager
 from core.health_monitor import HealthMonitor, StructuredLogger
+from core.lazy_import import lazy_import
+
+psutil = lazy_import("psutil")
 
 
 class PerformanceLevel(Enum):
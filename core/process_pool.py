@@ -0,0 +1,185 @@
+"""
+Process pool for CPU-bound business logic.
+
+Prefect's default task runner executes tasks on threads, so CPU-bound business
+logic in a distributed flow is limited to one core by the GIL. This module runs
+business logic functions in a ProcessPoolExecutor sized from the container's CPU
+quota. Only the business logic runs in the worker processes: payloads and results
+cross the process boundary as compact JSON, and database status updates stay in
+the parent process where the connection pools live.
+
+Business logic functions run in the pool must be importable module-level
+functions (they are pickled by reference) and must not use the module-level
+database managers of the parent process.
+"""
+
+import json
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+# cgroup files that hold the container CPU quota
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+# Shared pool, created on first use and reused across flow runs
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_cpu_limit() -> int:
+    """
+    Get the number of CPUs this container may use.
+
+    Uses the cgroup CPU quota (v2 cpu.max or v1 cfs quota/period) rounded up,
+    capped at the CPUs the process is allowed to run on.
+
+    Returns:
+        Number of usable CPUs (at least 1)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        available_cpus = len(os.sched_getaffinity(0))
+    else:
+        available_cpus = os.cpu_count() or 1
+
+    quota = _read_cgroup_cpu_quota()
+    if quota is not None:
+        available_cpus = min(available_cpus, math.ceil(quota))
+
+    return max(1, available_cpus)
+
+
+def _read_cgroup_cpu_quota() -> Optional[float]:
+    """Read the cgroup CPU quota in CPUs, or None if there is no quota."""
+    try:
+        # Try to read from cgroup v2: "<quota> <period>" or "max <period>"
+        if os.path.exists(CGROUP_V2_CPU_MAX):
+            with open(CGROUP_V2_CPU_MAX) as f:
+                quota, period = f.read().split()[:2]
+            if quota == "max":
+                return None
+            return int(quota) / int(period)
+
+        # Try to read from cgroup v1 (quota is -1 when unlimited)
+        if os.path.exists(CGROUP_V1_CPU_QUOTA) and os.path.exists(CGROUP_V1_CPU_PERIOD):
+            with open(CGROUP_V1_CPU_QUOTA) as f:
+                quota = int(f.read().strip())
+            with open(CGROUP_V1_CPU_PERIOD) as f:
+                period = int(f.read().strip())
+            if quota > 0 and period > 0:
+                return quota / period
+
+    except (OSError, ValueError):
+        return None
+
+    return None
+
+
+def get_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Get the shared process pool, creating it on first use.
+
+    Worker processes are started with the "spawn" method so that they never
+    inherit locks or connections held by threads of the parent process. The pool
+    size is fixed when the pool is created.
+
+    Args:
+        max_workers: Number of worker processes (uses get_cpu_limit() if None)
+
+    Returns:
+        Shared ProcessPoolExecutor
+
+    Raises:
+        ValueError: If max_workers is not a positive integer
+    """
+    global _process_pool
+
+    if max_workers is not None and (
+        not isinstance(max_workers, int) or max_workers <= 0
+    ):
+        raise ValueError("max_workers must be a positive integer")
+
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=max_workers or get_cpu_limit(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def shutdown_process_pool(wait: bool = True) -> None:
+    """
+    Shut down the shared process pool.
+
+    The next call to get_process_pool creates a new pool.
+
+    Args:
+        wait: Whether to wait for running business logic to finish
+    """
+    global _process_pool
+
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+def run_in_process_pool(
+    business_logic_func: Callable[[dict[str, Any]], Any],
+    payload: dict[str, Any],
+    max_workers: Optional[int] = None,
+) -> Any:
+    """
+    Run a business logic function on a payload in the shared process pool.
+
+    Blocks the calling thread until the result is available, so it can be called
+    from Prefect tasks running on a thread pool.
+
+    Args:
+        business_logic_func: Importable module-level function taking a payload
+        payload: JSON-serializable record payload
+        max_workers: Pool size if the pool has not been created yet
+
+    Returns:
+        Business logic result, after a JSON round trip (values that are not JSON
+        types are converted to strings, as when results are stored)
+
+    Raises:
+        RuntimeError: If a worker process died while running the business logic
+        Exception: Any exception raised by the business logic itself
+    """
+    global _process_pool
+
+    pool = get_process_pool(max_workers)
+
+    try:
+        future = pool.submit(
+            _execute_business_logic, business_logic_func, serialize(payload)
+        )
+        return json.loads(future.result())
+    except BrokenProcessPool as e:
+        # A crashed worker breaks the whole pool; replace it for later records
+        with _process_pool_lock:
+            if _process_pool is pool:
+                _process_pool = None
+        pool.shutdown(wait=False)
+        raise RuntimeError(f"Business logic worker process died: {e}") from e
+
+
+def serialize(value: Any) -> bytes:
+    """Serialize a payload or result to compact JSON bytes."""
+    return json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _execute_business_logic(
+    business_logic_func: Callable[[dict[str, Any]], Any], payload: bytes
+) -> bytes:
+    """Run business logic in a worker process on a serialized payload."""
+    return serialize(business_logic_func(json.loads(payload)))
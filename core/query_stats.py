@@ -0,0 +1,348 @@
+"""
+Per-statement latency statistics for DatabaseManager engines.
+
+This module attaches SQLAlchemy event hooks to the shared engines created by
+core.database. Every executed statement is normalized to a fingerprint (literals
+and bind parameters replaced by ?) and its latency and row count are recorded in
+a histogram per database and fingerprint. The time spent waiting for a pooled
+connection is recorded per database, and statements slower than a configurable
+threshold are written to a slow-query log. HealthMonitor exports everything in
+Prometheus text format.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Statements at or above this duration are logged unless a database overrides it
+DEFAULT_SLOW_QUERY_THRESHOLD_MS = 1000
+
+# Fingerprints tracked per process; further statements are grouped as "other"
+MAX_FINGERPRINTS = 500
+OTHER_FINGERPRINT = "other"
+
+# Length of normalized SQL kept for logs and the Prometheus "query" label
+MAX_FINGERPRINT_LENGTH = 200
+
+slow_query_logger = logging.getLogger("core.database.slow_queries")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\?|\$\d+")
+_VALUE_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+_REPEATED_VALUE_LISTS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\((?:\.\.\.|\?)\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint_query(statement: str) -> str:
+    """
+    Normalize a SQL statement so that executions differing only in values match.
+
+    String and number literals and bind parameters of every paramstyle become ?,
+    lists of values such as IN (?, ?, ?) or multi-row VALUES collapse to (...),
+    and whitespace is collapsed.
+
+    Args:
+        statement: SQL statement as sent to the driver
+
+    Returns:
+        Normalized statement, at most MAX_FINGERPRINT_LENGTH characters
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(...)", normalized)
+    normalized = _REPEATED_VALUE_LISTS.sub("(...)", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return normalized[:MAX_FINGERPRINT_LENGTH]
+
+
+def _fingerprint_id(fingerprint: str) -> str:
+    """Short stable identifier of a fingerprint for metric labels."""
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:12]
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+class _Histogram:
+    """Cumulative-bucket latency histogram with a row total."""
+
+    __slots__ = ("buckets", "count", "total_seconds", "max_seconds", "rows", "errors")
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.errors = 0
+
+    def observe(self, seconds: float, rows: int = 0, error: bool = False) -> None:
+        for i, upper_bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= upper_bound:
+                self.buckets[i] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.rows += max(rows, 0)
+        if error:
+            self.errors += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_seconds": round(self.total_seconds, 6),
+            "max_seconds": round(self.max_seconds, 6),
+            "avg_ms": round(self.total_seconds / self.count * 1000, 3)
+            if self.count
+            else 0.0,
+            "buckets": dict(zip(LATENCY_BUCKETS, self.buckets)),
+        }
+
+
+class QueryStats:
+    """
+    Thread-safe statement and connection checkout statistics of one process.
+
+    A single module-level instance (query_stats) is shared by all engines.
+    """
+
+    def __init__(self, max_fingerprints: int = MAX_FINGERPRINTS):
+        self.max_fingerprints = max_fingerprints
+        self._statements: dict[tuple[str, str], _Histogram] = {}
+        self._checkout_waits: dict[str, _Histogram] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._slow_query_thresholds: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def set_slow_query_threshold(self, database_name: str, threshold_ms: float) -> None:
+        """Set the duration at or above which statements of a database are logged."""
+        with self._lock:
+            self._slow_query_thresholds[database_name] = threshold_ms / 1000
+
+    def get_slow_query_threshold(self, database_name: str) -> float:
+        """Get the slow-query threshold of a database in seconds."""
+        with self._lock:
+            return self._slow_query_thresholds.get(
+                database_name, DEFAULT_SLOW_QUERY_THRESHOLD_MS / 1000
+            )
+
+    def record_statement(
+        self,
+        database_name: str,
+        statement: str,
+        seconds: float,
+        rows: int = 0,
+        error: bool = False,
+    ) -> str:
+        """
+        Record one executed statement.
+
+        Returns:
+            Fingerprint the statement was recorded under
+        """
+        fingerprint = fingerprint_query(statement)
+
+        with self._lock:
+            key = (database_name, fingerprint)
+            histogram = self._statements.get(key)
+            if histogram is None:
+                if len(self._statements) >= self.max_fingerprints:
+                    key = (database_name, OTHER_FINGERPRINT)
+                    fingerprint = OTHER_FINGERPRINT
+                    histogram = self._statements.get(key)
+                if histogram is None:
+                    histogram = self._statements[key] = _Histogram()
+                    self._fingerprints[fingerprint] = _fingerprint_id(fingerprint)
+            histogram.observe(seconds, rows, error)
+
+        return fingerprint
+
+    def record_checkout_wait(self, database_name: str, seconds: float) -> None:
+        """Record the time spent waiting for a pooled connection."""
+        with self._lock:
+            histogram = self._checkout_waits.get(database_name)
+            if histogram is None:
+                histogram = self._checkout_waits[database_name] = _Histogram()
+            histogram.observe(seconds)
+
+    def get_statement_stats(self, database_name: Optional[str] = None) -> list[dict]:
+        """
+        Report statement statistics, slowest total time first.
+
+        Args:
+            database_name: Only report this database (all databases if None)
+
+        Returns:
+            One dictionary per database and fingerprint with the fingerprint,
+            its id, count, errors, rows, total/max/avg latency and buckets
+        """
+        with self._lock:
+            stats = [
+                {
+                    "database_name": db_name,
+                    "fingerprint": fingerprint,
+                    "fingerprint_id": self._fingerprints[fingerprint],
+                    **histogram.to_dict(),
+                }
+                for (db_name, fingerprint), histogram in self._statements.items()
+                if database_name is None or db_name == database_name
+            ]
+
+        return sorted(stats, key=lambda entry: entry["total_seconds"], reverse=True)
+
+    def get_checkout_wait_stats(self) -> list[dict]:
+        """Report connection checkout wait statistics per database."""
+        with self._lock:
+            return [
+                {"database_name": db_name, **histogram.to_dict()}
+                for db_name, histogram in sorted(self._checkout_waits.items())
+            ]
+
+    def reset(self) -> None:
+        """Clear all recorded statistics (thresholds are kept)."""
+        with self._lock:
+            self._statements.clear()
+            self._checkout_waits.clear()
+            self._fingerprints.clear()
+
+    def export_prometheus_format(self) -> str:
+        """Export the statistics as Prometheus histograms and counters."""
+        lines = []
+
+        statements = self.get_statement_stats()
+        if statements:
+            lines.append("# TYPE database_query_duration_seconds histogram")
+            for entry in statements:
+                labels = (
+                    f'database="{_escape_label(entry["database_name"])}",'
+                    f'fingerprint="{entry["fingerprint_id"]}",'
+                    f'query="{_escape_label(entry["fingerprint"])}"'
+                )
+                lines.extend(
+                    _histogram_lines("database_query_duration_seconds", labels, entry)
+                )
+            lines.append("# TYPE database_query_rows_total counter")
+            lines.extend(
+                f'database_query_rows_total{{database="{_escape_label(entry["database_name"])}",'
+                f'fingerprint="{entry["fingerprint_id"]}"}} {entry["rows"]}'
+                for entry in statements
+            )
+            lines.append("# TYPE database_query_errors_total counter")
+            lines.extend(
+                f'database_query_errors_total{{database="{_escape_label(entry["database_name"])}",'
+                f'fingerprint="{entry["fingerprint_id"]}"}} {entry["errors"]}'
+                for entry in statements
+            )
+
+        checkout_waits = self.get_checkout_wait_stats()
+        if checkout_waits:
+            lines.append("# TYPE database_connection_checkout_wait_seconds histogram")
+            for entry in checkout_waits:
+                labels = f'database="{_escape_label(entry["database_name"])}"'
+                lines.extend(
+                    _histogram_lines(
+                        "database_connection_checkout_wait_seconds", labels, entry
+                    )
+                )
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _histogram_lines(name: str, labels: str, entry: dict[str, Any]) -> list[str]:
+    """Render one histogram series (buckets, sum and count)."""
+    lines = [
+        f'{name}_bucket{{{labels},le="{upper_bound}"}} {count}'
+        for upper_bound, count in entry["buckets"].items()
+    ]
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {entry["count"]}')
+    lines.append(f"{name}_sum{{{labels}}} {entry['total_seconds']}")
+    lines.append(f"{name}_count{{{labels}}} {entry['count']}")
+    return lines
+
+
+# Process-wide statistics shared by all instrumented engines
+query_stats = QueryStats()
+
+
+def _instrument_pool_checkout(pool: Any, database_name: str) -> None:
+    """Time how long getting a connection from the pool takes."""
+    get_connection = pool._do_get
+
+    def _timed_do_get():
+        start = time.perf_counter()
+        try:
+            return get_connection()
+        finally:
+            query_stats.record_checkout_wait(database_name, time.perf_counter() - start)
+
+    pool._do_get = _timed_do_get
+
+
+def instrument_engine(engine: Any, database_name: str) -> None:
+    """
+    Record latency, row counts and slow queries of every statement on an engine.
+
+    Engines that are not SQLAlchemy engines (e.g. test doubles) are left alone.
+
+    Args:
+        engine: SQLAlchemy engine shared by the DatabaseManager instances
+        database_name: Name of the database configuration, used as metric label
+    """
+    if not isinstance(engine, Engine):
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if context is not None:
+            context._query_stats_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        start = getattr(context, "_query_stats_start", None)
+        if start is None:
+            return
+        seconds = time.perf_counter() - start
+        rows = cursor.rowcount if isinstance(cursor.rowcount, int) else 0
+        fingerprint = query_stats.record_statement(
+            database_name, statement, seconds, rows
+        )
+        if seconds >= query_stats.get_slow_query_threshold(database_name):
+            slow_query_logger.warning(
+                f"Slow query on '{database_name}' took {seconds * 1000:.1f}ms "
+                f"(rows: {rows}, executemany: {many}): {fingerprint}"
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        context = exception_context.execution_context
+        start = getattr(context, "_query_stats_start", None)
+        if start is None or exception_context.statement is None:
+            return
+        query_stats.record_statement(
+            database_name,
+            exception_context.statement,
+            time.perf_counter() - start,
+            error=True,
+        )
+
+    @event.listens_for(engine, "engine_disposed")
+    def _engine_disposed(disposed_engine):
+        # dispose() replaces the pool, so the new one needs the checkout timer
+        _instrument_pool_checkout(disposed_engine.pool, database_name)
+
+    _instrument_pool_checkout(engine.pool, database_name)
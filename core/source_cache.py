@@ -0,0 +1,298 @@
+"""
+Read-through cache for source database rows.
+
+This module provides SourceRowCache, a bounded in-memory LRU cache with a TTL and
+an optional SQLite tier shared by the processes on one host. DistributedProcessor
+uses it in front of SurveyHub lookups so that retries and re-runs of the same
+survey do not query the source database again while the cached row is fresh.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+# Defaults used when the configuration does not provide cache settings
+DEFAULT_CACHE_MAX_ENTRIES = 10000
+DEFAULT_CACHE_TTL_SECONDS = 300
+
+# Expired rows are pruned from the disk tier once every this many writes
+DISK_PRUNE_INTERVAL = 1000
+
+
+class SourceRowCache:
+    """
+    Bounded LRU cache with TTL and an optional shared on-disk tier.
+
+    Lookups check the in-memory tier first, then the SQLite tier (if a path is
+    configured); disk hits are promoted to memory. Entries expire ttl_seconds after
+    they were stored in either tier. Values must be JSON-serializable dictionaries
+    when the disk tier is used; non-JSON values such as datetimes are stored as
+    strings there. Disk tier failures are logged and the cache degrades to memory
+    only, so a cache problem never fails a lookup.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        disk_path: Optional[str] = None,
+        logger: Optional[Any] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept in memory
+            ttl_seconds: Time after which an entry is no longer served
+            disk_path: Optional SQLite file shared by processes on the host
+            logger: Optional logger for disk tier warnings
+
+        Raises:
+            ValueError: If max_entries or ttl_seconds is not positive
+        """
+        if not isinstance(max_entries, int) or max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+
+        if not isinstance(ttl_seconds, (int, float)) or ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be a positive number")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = float(ttl_seconds)
+        self.disk_path = disk_path
+        self.logger = logger
+
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk: Optional[sqlite3.Connection] = None
+        self._disk_writes = 0
+        self._stats = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+        if disk_path:
+            self._open_disk_tier(disk_path)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key, or None on a miss or expired entry.
+
+        Args:
+            key: Cache key (e.g. a survey_id)
+
+        Returns:
+            Cached value or None
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return value
+                del self._entries[key]
+
+            disk_entry = self._disk_get(key, now)
+            if disk_entry is not None:
+                expires_at, value = disk_entry
+                self._store_in_memory(key, value, expires_at)
+                self._stats["disk_hits"] += 1
+                return value
+
+            self._stats["misses"] += 1
+            return None
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Return the cached values for the keys that are present and fresh.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Dictionary of key to cached value for the hits only
+        """
+        hits = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                hits[key] = value
+        return hits
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in memory and, if configured, in the disk tier.
+
+        Args:
+            key: Cache key
+            value: Value to cache (None values are not cached)
+        """
+        if value is None:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+
+        with self._lock:
+            self._store_in_memory(key, value, expires_at)
+            self._disk_set(key, value, expires_at)
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Remove a key from both tiers.
+
+        Args:
+            key: Cache key to remove
+
+        Returns:
+            True if the key was present in either tier
+        """
+        with self._lock:
+            removed = self._entries.pop(key, None) is not None
+            removed = self._disk_delete(key) or removed
+            if removed:
+                self._stats["invalidations"] += 1
+            return removed
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            self._disk_execute("DELETE FROM source_cache")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return hit/miss counters and the current size.
+
+        Returns:
+            Dictionary with hits, disk_hits, misses, evictions, invalidations,
+            entries, max_entries, hit_rate_percent and disk_tier
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["max_entries"] = self.max_entries
+        stats["hit_rate_percent"] = round(
+            (stats["hits"] + stats["disk_hits"]) / lookups * 100 if lookups else 0, 2
+        )
+        stats["disk_tier"] = self._disk is not None
+        return stats
+
+    def close(self) -> None:
+        """Close the disk tier connection."""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+    def _store_in_memory(self, key: str, value: Any, expires_at: float) -> None:
+        """Insert or refresh an entry and evict the least recently used ones."""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _open_disk_tier(self, disk_path: str) -> None:
+        """Open (and create) the SQLite tier, disabling it on failure."""
+        try:
+            Path(disk_path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                disk_path, timeout=5, check_same_thread=False, isolation_level=None
+            )
+            # WAL lets readers in other processes proceed while one process writes
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS source_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+            self._disk = connection
+        except Exception as e:
+            self._warn(f"Source cache disk tier disabled for '{disk_path}': {e}")
+            self._disk = None
+
+    def _disk_get(self, key: str, now: float) -> Optional[tuple[float, Any]]:
+        """Read a fresh entry from the disk tier."""
+        if self._disk is None:
+            return None
+
+        try:
+            row = self._disk.execute(
+                "SELECT value, expires_at FROM source_cache "
+                "WHERE cache_key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+        except Exception as e:
+            self._warn(f"Source cache disk read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+        return row[1], json.loads(row[0])
+
+    def _disk_set(self, key: str, value: Any, expires_at: float) -> None:
+        """Write an entry to the disk tier."""
+        if self._disk is None:
+            return
+
+        try:
+            serialized = json.dumps(value, default=str)
+        except (TypeError, ValueError) as e:
+            self._warn(f"Source cache value for '{key}' is not serializable: {e}")
+            return
+
+        self._disk_execute(
+            "INSERT OR REPLACE INTO source_cache (cache_key, value, expires_at) "
+            "VALUES (?, ?, ?)",
+            (key, serialized, expires_at),
+        )
+
+        self._disk_writes += 1
+        if self._disk_writes % DISK_PRUNE_INTERVAL == 0:
+            self._disk_execute(
+                "DELETE FROM source_cache WHERE expires_at <= ?", (time.time(),)
+            )
+
+    def _disk_delete(self, key: str) -> bool:
+        """Delete an entry from the disk tier and report whether it existed."""
+        cursor = self._disk_execute(
+            "DELETE FROM source_cache WHERE cache_key = ?", (key,)
+        )
+        return cursor is not None and cursor.rowcount > 0
+
+    def _disk_execute(
+        self, statement: str, params: tuple = ()
+    ) -> Optional[sqlite3.Cursor]:
+        """Run a write statement on the disk tier, logging failures."""
+        if self._disk is None:
+            return None
+
+        try:
+            return self._disk.execute(statement, params)
+        except Exception as e:
+            self._warn(f"Source cache disk write failed: {e}")
+            return None
+
+    def _warn(self, message: str) -> None:
+        """Log a warning if a logger is configured."""
+        if self.logger is not None:
+            self.logger.warning(message)
@@ -0,0 +1,288 @@
+"""
+Satisfaction scoring for survey responses.
+
+This module holds the satisfaction score rules used by DistributedProcessor and
+a batch engine for re-scoring large numbers of surveys. The batch engine scores a
+whole list of responses in one pass and averages ratings with NumPy array
+operations; results are identical to the per-record function. NumPy is optional:
+without it, or for small batches, ratings are averaged response by response.
+"""
+
+import sys
+from itertools import chain, compress
+from typing import Any, Optional
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Score used when a response has no usable ratings
+DEFAULT_SATISFACTION_SCORE = 5.0
+
+# Product Feedback weights: 70% product rating, 30% recommendation likelihood
+PRODUCT_RATING_WEIGHT = 0.7
+RECOMMENDATION_WEIGHT = 0.3
+
+# Below this many averaged responses the NumPy setup costs more than it saves;
+# the first this many are also sampled to check the values are all numeric
+VECTORIZE_MIN_BATCH_SIZE = 64
+
+# Python 3.12+ sums floats with Neumaier compensation; the vectorized mean has
+# to reproduce the same summation to return bit-identical averages
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+
+_CUSTOMER_SATISFACTION = "Customer Satisfaction"
+_PRODUCT_FEEDBACK = "Product Feedback"
+_MARKET_RESEARCH = "Market Research"
+
+
+def calculate_satisfaction_score(
+    response_data: dict[str, Any], survey_type: str, logger: Optional[Any] = None
+) -> Optional[float]:
+    """
+    Calculate the satisfaction score of one survey response.
+
+    Args:
+        response_data: Survey response data (JSON structure)
+        survey_type: Type of survey (affects scoring algorithm)
+        logger: Optional logger for invalid responses
+
+    Returns:
+        Calculated satisfaction score (0.0-10.0) or None if calculation fails
+    """
+    try:
+        if not isinstance(response_data, dict):
+            _warn(logger, "Invalid response_data format, using default score")
+            return DEFAULT_SATISFACTION_SCORE
+
+        # Different scoring logic based on survey type
+        if survey_type == _CUSTOMER_SATISFACTION:
+            # Look for overall satisfaction rating
+            overall_rating = response_data.get("overall_satisfaction")
+            if overall_rating is not None:
+                return float(overall_rating)
+
+            # Fallback: average of all numeric ratings
+            return _mean_rating(response_data)
+
+        elif survey_type == _PRODUCT_FEEDBACK:
+            product_rating = response_data.get(
+                "product_rating", DEFAULT_SATISFACTION_SCORE
+            )
+            recommendation_score = response_data.get(
+                "recommendation_likelihood", DEFAULT_SATISFACTION_SCORE
+            )
+            return (float(product_rating) * PRODUCT_RATING_WEIGHT) + (
+                float(recommendation_score) * RECOMMENDATION_WEIGHT
+            )
+
+        elif survey_type == _MARKET_RESEARCH:
+            interest_level = response_data.get(
+                "interest_level", DEFAULT_SATISFACTION_SCORE
+            )
+            return float(interest_level)
+
+        else:
+            # Unknown survey type - use simple average
+            return _mean_rating(response_data)
+
+    except Exception as e:
+        _warn(logger, f"Failed to calculate satisfaction score: {e}")
+        return None
+
+
+def calculate_satisfaction_scores(
+    responses: list[tuple[dict[str, Any], str]], logger: Optional[Any] = None
+) -> list[Optional[float]]:
+    """
+    Calculate satisfaction scores for many survey responses at once.
+
+    Responses are scored in a single pass without a function call per response.
+    Rules that read one or two fields are applied inline; responses scored by the
+    mean of their ratings are collected and averaged together with NumPy array
+    operations (when NumPy is installed, there are enough of them and their values
+    are numeric). Scores are
+    identical to calculate_satisfaction_score for every response, including the
+    default score for non-dict responses and None for responses whose ratings
+    cannot be converted to numbers.
+
+    Args:
+        responses: List of (response_data, survey_type) pairs
+        logger: Optional logger for invalid responses
+
+    Returns:
+        One score (or None) per response, in input order
+
+    Example:
+        scores = calculate_satisfaction_scores(
+            [({"overall_satisfaction": 8}, "Customer Satisfaction"),
+             ({"interest_level": 6}, "Market Research")]
+        )
+    """
+    scores: list[Optional[float]] = [None] * len(responses)
+    mean_positions: list[int] = []
+    mean_responses: list[dict[str, Any]] = []
+
+    for position, (response_data, survey_type) in enumerate(responses):
+        if not isinstance(response_data, dict):
+            _warn(logger, "Invalid response_data format, using default score")
+            scores[position] = DEFAULT_SATISFACTION_SCORE
+            continue
+
+        try:
+            if survey_type == _CUSTOMER_SATISFACTION:
+                overall_rating = response_data.get("overall_satisfaction")
+                if overall_rating is None:
+                    mean_positions.append(position)
+                    mean_responses.append(response_data)
+                else:
+                    scores[position] = float(overall_rating)
+
+            elif survey_type == _PRODUCT_FEEDBACK:
+                scores[position] = (
+                    float(
+                        response_data.get("product_rating", DEFAULT_SATISFACTION_SCORE)
+                    )
+                    * PRODUCT_RATING_WEIGHT
+                ) + (
+                    float(
+                        response_data.get(
+                            "recommendation_likelihood", DEFAULT_SATISFACTION_SCORE
+                        )
+                    )
+                    * RECOMMENDATION_WEIGHT
+                )
+
+            elif survey_type == _MARKET_RESEARCH:
+                scores[position] = float(
+                    response_data.get("interest_level", DEFAULT_SATISFACTION_SCORE)
+                )
+
+            else:
+                mean_positions.append(position)
+                mean_responses.append(response_data)
+
+        except Exception as e:
+            _warn(logger, f"Failed to calculate satisfaction score: {e}")
+
+    mean_scores = None
+    if (
+        NUMPY_AVAILABLE
+        and len(mean_responses) >= VECTORIZE_MIN_BATCH_SIZE
+        and _has_only_numeric_values(mean_responses[:VECTORIZE_MIN_BATCH_SIZE])
+    ):
+        mean_scores = _mean_ratings(mean_responses)
+    if mean_scores is None:
+        mean_scores = list(map(_mean_rating, mean_responses))
+
+    for position, score in zip(mean_positions, mean_scores):
+        scores[position] = score
+
+    return scores
+
+
+def _mean_rating(response_data: dict[str, Any]) -> float:
+    """Average the numeric 0-10 values of one response."""
+    ratings = [
+        float(value)
+        for value in response_data.values()
+        if isinstance(value, (int, float)) and 0 <= value <= 10
+    ]
+    return sum(ratings) / len(ratings) if ratings else DEFAULT_SATISFACTION_SCORE
+
+
+def _has_only_numeric_values(response_datas: list[dict[str, Any]]) -> bool:
+    """
+    Check whether responses contain int/float values only.
+
+    Filtering out text answers value by value costs more in NumPy than averaging
+    saves, so responses with mixed values are averaged in Python instead.
+    """
+    value_types = set(map(type, chain.from_iterable(map(dict.values, response_datas))))
+    return all(issubclass(value_type, (int, float)) for value_type in value_types)
+
+
+def _mean_ratings(response_datas: list[dict[str, Any]]) -> Optional[list[float]]:
+    """
+    Average the numeric 0-10 values of many responses with array operations.
+
+    All values are flattened into one array together with the row they belong to.
+    Rows are then summed column by column (the first rating of every row, then
+    the second, ...), reproducing the order and compensation of Python's sum() so
+    every mean is bit-identical to _mean_rating.
+
+    Returns:
+        List of means, or None if a value cannot be converted to a float
+    """
+    row_count = len(response_datas)
+    lengths = np.fromiter(map(len, response_datas), dtype=np.int64, count=row_count)
+    values = list(chain.from_iterable(map(dict.values, response_datas)))
+    rows = np.repeat(np.arange(row_count), lengths)
+
+    # Keep the int/float values (bool included, as with isinstance)
+    value_types = set(map(type, values))
+    numeric_types = {
+        value_type for value_type in value_types if issubclass(value_type, (int, float))
+    }
+    if value_types != numeric_types:
+        is_numeric = np.fromiter(
+            map(numeric_types.__contains__, map(type, values)),
+            dtype=bool,
+            count=len(values),
+        )
+        values = list(compress(values, is_numeric))
+        rows = rows[is_numeric]
+
+    try:
+        ratings = np.fromiter(values, dtype=np.float64, count=len(values))
+    except (OverflowError, TypeError, ValueError):
+        return None
+
+    in_range = (ratings >= 0) & (ratings <= 10)
+    ratings = ratings[in_range]
+    rows = rows[in_range]
+
+    counts = np.bincount(rows, minlength=row_count)
+    starts = np.cumsum(counts) - counts
+
+    # With rows ordered by rating count, the rows that have a rating in a given
+    # column are a prefix, so each column is one slice operation
+    order = np.argsort(-counts, kind="stable")
+    sorted_counts = counts[order]
+    sorted_starts = starts[order]
+    totals = np.zeros(row_count)
+    compensation = np.zeros(row_count)
+
+    for column in range(int(sorted_counts[0]) if row_count else 0):
+        active = int(np.searchsorted(-sorted_counts, -column, side="left"))
+        column_values = ratings[sorted_starts[:active] + column]
+        running = totals[:active]
+        new_totals = running + column_values
+        if _COMPENSATED_SUM:
+            compensation[:active] += np.where(
+                np.abs(running) >= np.abs(column_values),
+                (running - new_totals) + column_values,
+                (column_values - new_totals) + running,
+            )
+        totals[:active] = new_totals
+
+    if _COMPENSATED_SUM:
+        totals += compensation
+
+    means = np.empty(row_count)
+    means[order] = np.where(
+        sorted_counts > 0,
+        totals / np.maximum(sorted_counts, 1),
+        DEFAULT_SATISFACTION_SCORE,
+    )
+    return means.tolist()
+
+
+def _warn(logger: Optional[Any], message: str) -> None:
+    """Log a warning if a logger is configured."""
+    if logger is not None:
+        logger.warning(message)
@@ -0,0 +1,96 @@
+"""
+Chunked task mapping for distributed flows.
+
+Mapping a task over claimed records creates one Prefect task run per record,
+each with its own state transitions, API calls and log records. For small,
+fast records that orchestration overhead is larger than the work itself. The
+helpers in this module map a per-record task over chunks of records instead, so
+one task run processes chunk_size records while results are still returned per
+record.
+"""
+
+from typing import Any, Callable
+
+from prefect import task, unmapped
+from prefect.futures import resolve_futures_to_results
+
+
+def chunk_records(records: list[Any], chunk_size: int) -> list[list[Any]]:
+    """
+    Split records into consecutive chunks.
+
+    Args:
+        records: Records to split
+        chunk_size: Maximum number of records per chunk
+
+    Returns:
+        List of chunks in input order
+
+    Raises:
+        ValueError: If chunk_size is not a positive integer
+    """
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+
+    return [
+        records[start : start + chunk_size]
+        for start in range(0, len(records), chunk_size)
+    ]
+
+
+@task(name="run-record-chunk", retries=0)
+def run_record_chunk(
+    records: list[dict[str, Any]],
+    record_func: Callable[..., dict[str, Any]],
+    record_kwargs: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """
+    Run a per-record function for every record of a chunk in one task run.
+
+    Args:
+        records: Records of the chunk
+        record_func: Function processing one record (e.g. the .fn of a task)
+        record_kwargs: Keyword arguments passed to record_func for every record
+
+    Returns:
+        Per-record results in input order
+    """
+    return [record_func(record, **record_kwargs) for record in records]
+
+
+def map_in_chunks(
+    record_task: Any, records: list[dict[str, Any]], chunk_size: int, **kwargs: Any
+) -> list[dict[str, Any]]:
+    """
+    Map a per-record task over records, chunk_size records per task run.
+
+    With chunk_size 1 this is record_task.map(records, **kwargs). Otherwise the
+    undecorated function of record_task runs for each record of a chunk inside a
+    single run-record-chunk task run, so the per-record function must handle
+    its own errors (as the record tasks of the distributed flows do).
+
+    Args:
+        record_task: Prefect task processing one record
+        records: Claimed records to process
+        chunk_size: Records processed per task run
+        **kwargs: Keyword arguments passed to the task for every record
+
+    Returns:
+        Per-record results in input order
+
+    Raises:
+        ValueError: If chunk_size is not a positive integer
+    """
+    if chunk_size == 1:
+        return resolve_futures_to_results(record_task.map(records, **kwargs))
+
+    futures = run_record_chunk.map(
+        chunk_records(records, chunk_size),
+        record_func=unmapped(record_task.fn),
+        record_kwargs=unmapped(kwargs),
+    )
+    return [
+        result
+        for chunk_results in resolve_futures_to_results(futures)
+        for result in chunk_results
+    ]
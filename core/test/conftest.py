@@ -205,3 +205,26 @@ def sqlserver_available():
         return True
     except Exception:
         return False
+
+
+@pytest.fixture(autouse=True)
+def reset_config_cache():
+    """Give every test an empty Prefect configuration lookup cache."""
+    from core.config import ConfigManager
+
+    ConfigManager.clear_cache()
+    yield
+    ConfigManager.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_engine_registry():
+    """Give every test an empty shared engine registry and query statistics."""
+    from core.database import dispose_engines
+    from core.query_stats import query_stats
+
+    dispose_engines()
+    query_stats.reset()
+    yield
+    dispose_engines()
+    query_stats.reset()
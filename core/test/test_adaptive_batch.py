@@ -0,0 +1,205 @@
+"""
+Unit tests for adaptive batch sizing.
+
+Tests the AdaptiveBatchSizer control loop and the persistence of its learned
+state with a mocked DistributedProcessor.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.adaptive_batch import AdaptiveBatchSizer, get_instance_class
+
+
+def _make_sizer(processor=None, **kwargs):
+    """Create a sizer with no stored state unless a processor is given."""
+    if processor is None:
+        processor = Mock()
+        processor.load_batch_size_state.return_value = None
+    options = {
+        "initial_batch_size": 100,
+        "min_batch_size": 10,
+        "max_batch_size": 1000,
+        "target_batch_seconds": 30,
+        "instance_class": "4cpu",
+    }
+    options.update(kwargs)
+    return AdaptiveBatchSizer(processor, "survey_processor", **options)
+
+
+class TestGetInstanceClass:
+    """Test instance class resolution."""
+
+    def test_configured_instance_class(self):
+        """Test that a configured instance class is used as is."""
+        assert get_instance_class("worker-large") == "worker-large"
+
+    def test_instance_class_from_cpu_limit(self):
+        """Test that the instance class defaults to the CPU quota."""
+        with patch("core.adaptive_batch.get_cpu_limit", return_value=4):
+            assert get_instance_class() == "4cpu"
+
+
+class TestAdaptiveBatchSizer:
+    """Test the AdaptiveBatchSizer control loop."""
+
+    def test_init_validation(self):
+        """Test that invalid parameters are rejected."""
+        with pytest.raises(ValueError, match="flow_name must be a non-empty string"):
+            AdaptiveBatchSizer(Mock(), "", 100)
+
+        with pytest.raises(ValueError, match="Batch size bounds"):
+            _make_sizer(min_batch_size=0)
+
+        with pytest.raises(ValueError, match="Batch size bounds"):
+            _make_sizer(min_batch_size=500, max_batch_size=100)
+
+        with pytest.raises(ValueError, match="target_batch_seconds must be positive"):
+            _make_sizer(target_batch_seconds=0)
+
+    def test_initial_size_clamped_to_bounds(self):
+        """Test that the initial batch size respects the bounds."""
+        assert _make_sizer(initial_batch_size=5000).batch_size == 1000
+        assert _make_sizer(initial_batch_size=1).batch_size == 10
+
+    def test_fast_records_grow_at_most_double(self):
+        """Test that fast batches grow the size by at most the growth factor."""
+        sizer = _make_sizer()
+
+        # 100 records in 1 s would fit 3000 records into the 30 s target
+        assert sizer.record_batch(100, 0.0, 1.0) == 200
+        assert sizer.record_batch(200, 0.0, 2.0) == 400
+
+    def test_slow_records_shrink_at_most_half(self):
+        """Test that slow batches shrink the size by at most the shrink factor."""
+        sizer = _make_sizer()
+
+        # 100 records in 300 s would fit 10 records into the 30 s target
+        assert sizer.record_batch(100, 0.0, 300.0) == 50
+
+    def test_converges_to_target_duration(self):
+        """Test that the size settles where a batch fills the target duration."""
+        sizer = _make_sizer()
+
+        for _ in range(20):
+            # Records take 0.1 s each, so 300 records fill 30 s
+            sizer.record_batch(sizer.batch_size, 0.0, sizer.batch_size * 0.1)
+
+        assert sizer.batch_size == 300
+
+    def test_size_stays_within_bounds(self):
+        """Test that learned sizes never leave the configured bounds."""
+        sizer = _make_sizer(initial_batch_size=800)
+
+        for _ in range(5):
+            sizer.record_batch(sizer.batch_size, 0.0, 0.001)
+        assert sizer.batch_size == 1000
+
+        for _ in range(20):
+            sizer.record_batch(sizer.batch_size, 0.0, sizer.batch_size * 100.0)
+        assert sizer.batch_size == 10
+
+    def test_slow_claims_reduce_processing_budget(self):
+        """Test that claim latency is taken out of the target duration."""
+        sizer = _make_sizer()
+
+        # 10 s claims leave 20 s of processing at 0.1 s per record
+        sizer.record_batch(100, 10.0, 10.0)
+        sizer.record_batch(sizer.batch_size, 10.0, sizer.batch_size * 0.1)
+
+        assert sizer.batch_size == 200
+
+    def test_failures_shrink_the_batch(self):
+        """Test that failing records lead to smaller batches."""
+        sizer = _make_sizer()
+
+        # Half of the records fail: 300 records fit the target, scaled to 150
+        sizer.record_batch(100, 0.0, 10.0, records_failed=50)
+
+        assert sizer.batch_size == 150
+
+    def test_empty_batch_is_ignored(self):
+        """Test that empty claims do not change the learned state."""
+        sizer = _make_sizer()
+
+        assert sizer.record_batch(0, 0.5, 0.0) == 100
+        assert sizer.batches_observed == 0
+        sizer.processor.save_batch_size_state.assert_not_called()
+
+
+class TestAdaptiveBatchPersistence:
+    """Test loading and saving the learned state."""
+
+    def test_restores_learned_state(self):
+        """Test that a new sizer starts from the stored batch size."""
+        processor = Mock()
+        processor.load_batch_size_state.return_value = {
+            "batch_size": 250,
+            "per_record_seconds": 0.12,
+            "claim_seconds": 0.05,
+            "failure_rate": 0.0,
+            "batches_observed": 40,
+        }
+
+        sizer = _make_sizer(processor)
+
+        processor.load_batch_size_state.assert_called_once_with(
+            "survey_processor", "4cpu"
+        )
+        assert sizer.batch_size == 250
+        assert sizer.batches_observed == 40
+
+    def test_restored_size_clamped_to_bounds(self):
+        """Test that a stored size outside new bounds is clamped."""
+        processor = Mock()
+        processor.load_batch_size_state.return_value = {"batch_size": 900}
+
+        assert _make_sizer(processor, max_batch_size=500).batch_size == 500
+
+    def test_load_failure_keeps_initial_size(self):
+        """Test that an unavailable state table does not stop processing."""
+        processor = Mock()
+        processor.load_batch_size_state.side_effect = RuntimeError("no table")
+
+        sizer = _make_sizer(processor)
+
+        assert sizer.batch_size == 100
+        processor.logger.warning.assert_called_once()
+
+    def test_saves_when_size_changes(self):
+        """Test that a changed batch size is persisted."""
+        sizer = _make_sizer()
+
+        sizer.record_batch(100, 0.0, 1.0)
+
+        sizer.processor.save_batch_size_state.assert_called_once_with(
+            "survey_processor", "4cpu", sizer.state()
+        )
+        assert sizer.state()["batch_size"] == 200
+        assert sizer.state()["batches_observed"] == 1
+
+    def test_unchanged_size_saved_only_after_interval(self):
+        """Test that an unchanged size is not written after every batch."""
+        sizer = _make_sizer()
+        sizer.record_batch(100, 0.0, 30.0)
+        sizer.processor.save_batch_size_state.reset_mock()
+
+        sizer.record_batch(100, 0.0, 30.0)
+        sizer.processor.save_batch_size_state.assert_not_called()
+
+        with patch("core.adaptive_batch.PERSIST_INTERVAL_SECONDS", 0):
+            sizer.record_batch(100, 0.0, 30.0)
+        sizer.processor.save_batch_size_state.assert_called_once()
+
+    def test_save_failure_is_logged(self):
+        """Test that a failed save is logged and retried on the next batch."""
+        sizer = _make_sizer()
+        sizer.processor.save_batch_size_state.side_effect = RuntimeError("down")
+
+        assert sizer.record_batch(100, 0.0, 1.0) == 200
+
+        sizer.processor.logger.warning.assert_called_once()
+        sizer.processor.save_batch_size_state.side_effect = None
+        sizer.record_batch(200, 0.0, 6.0)
+        assert sizer.processor.save_batch_size_state.call_count == 2
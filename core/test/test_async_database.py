@@ -0,0 +1,154 @@
+"""
+Unit tests for AsyncDatabaseManager.
+
+Tests run the manager against a file-based SQLite database through aiosqlite;
+the configuration is mocked.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from core.async_database import AsyncDatabaseManager, _to_async_url
+from core.database import get_query_timeout_counts, reset_query_timeout_counts
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+def config_values(tmp_path):
+    """Configuration of the async_db database."""
+    return {
+        "async_db_type": "postgresql",
+        "async_db_connection_string": f"sqlite:///{tmp_path / 'async.db'}",
+        "async_db_pool_size": "2",
+        "async_db_max_overflow": "0",
+    }
+
+
+@pytest.fixture
+def db_manager(config_values):
+    """AsyncDatabaseManager with mocked configuration."""
+    with patch("core.async_database.ConfigManager") as mock_config_class:
+        mock_config = mock_config_class.return_value
+        mock_config.get_variable.side_effect = lambda key, default=None: (
+            config_values.get(key, default)
+        )
+        mock_config.get_secret.side_effect = lambda key: config_values.get(key)
+        yield AsyncDatabaseManager("async_db")
+
+
+class TestToAsyncUrl:
+    """Test conversion of configured connection strings."""
+
+    @pytest.mark.parametrize(
+        "connection_string, drivername",
+        [
+            ("postgresql://u:p@host/db", "postgresql+asyncpg"),
+            ("postgresql+psycopg2://u:p@host/db", "postgresql+asyncpg"),
+            ("mssql+pyodbc://u:p@host/db", "mssql+aioodbc"),
+            ("postgresql+asyncpg://u:p@host/db", "postgresql+asyncpg"),
+        ],
+    )
+    def test_sync_drivers_are_replaced(self, connection_string, drivername):
+        """Test that sync drivers map to their asyncio driver."""
+        assert _to_async_url(connection_string).drivername == drivername
+
+    def test_unsupported_backend(self):
+        """Test that backends without asyncio driver are rejected."""
+        with pytest.raises(ValueError, match="No asyncio driver"):
+            _to_async_url("oracle://u:p@host/db")
+
+
+class TestAsyncDatabaseManager:
+    """Test query execution, transactions and health checks."""
+
+    def test_init_requires_database_name(self):
+        """Test that an empty database name is rejected."""
+        with pytest.raises(ValueError, match="database_name must be a non-empty"):
+            AsyncDatabaseManager(" ")
+
+    @pytest.mark.asyncio
+    async def test_execute_query_commits_and_returns_rows(self, db_manager):
+        """Test writes are committed and reads return dictionaries."""
+        async with db_manager:
+            await db_manager.execute_query("CREATE TABLE t (id INTEGER, name TEXT)")
+            inserted = await db_manager.execute_query(
+                "INSERT INTO t VALUES (:id, :name)", {"id": 1, "name": "a"}
+            )
+            rows = await db_manager.execute_query("SELECT id, name FROM t")
+
+        assert inserted == [{"affected_rows": 1}]
+        assert rows == [{"id": 1, "name": "a"}]
+        assert db_manager.engine is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_the_pool(self, db_manager):
+        """Test that more concurrent queries than connections all complete."""
+        async with db_manager:
+            results = await asyncio.gather(
+                *(db_manager.execute_query(f"SELECT {i} AS n") for i in range(20))
+            )
+            pool_status = db_manager.get_pool_status()
+
+        assert sorted(rows[0]["n"] for rows in results) == list(range(20))
+        assert pool_status["max_connections"] == 2
+        assert pool_status["checked_out"] == 0
+
+    @pytest.mark.asyncio
+    async def test_execute_transaction_rolls_back_on_error(self, db_manager):
+        """Test that a failing transaction leaves no changes."""
+        async with db_manager:
+            await db_manager.execute_query("CREATE TABLE t (id INTEGER)")
+
+            with pytest.raises(RuntimeError, match="All changes have been rolled back"):
+                await db_manager.execute_transaction(
+                    [
+                        ("INSERT INTO t VALUES (:id)", {"id": 1}),
+                        ("INSERT INTO missing_table VALUES (1)", None),
+                    ]
+                )
+            rows = await db_manager.execute_query("SELECT COUNT(*) AS n FROM t")
+
+        assert rows == [{"n": 0}]
+
+    @pytest.mark.asyncio
+    async def test_query_timeout(self, db_manager):
+        """Test that a query exceeding its timeout raises and is counted."""
+        reset_query_timeout_counts()
+
+        async def slow_execute(query, params):
+            await asyncio.sleep(1)
+
+        with patch.object(db_manager, "_execute", side_effect=slow_execute):
+            with pytest.raises(RuntimeError, match=r"Query timeout \(0.01s\)"):
+                await db_manager.execute_query(
+                    "SELECT 1", timeout=0.01, query_class="monitoring"
+                )
+
+        assert get_query_timeout_counts() == [
+            {"database_name": "async_db", "query_class": "monitoring", "timeouts": 1}
+        ]
+        reset_query_timeout_counts()
+
+    @pytest.mark.asyncio
+    async def test_health_check(self, db_manager):
+        """Test a healthy database report."""
+        async with db_manager:
+            health = await db_manager.health_check()
+
+        assert health["status"] == "healthy"
+        assert health["connection"] is True
+        assert health["query_test"] is True
+        assert health["response_time_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_health_check_unhealthy(self, db_manager, config_values):
+        """Test that configuration errors are reported as unhealthy."""
+        config_values["async_db_type"] = None
+
+        health = await db_manager.health_check()
+
+        assert health["status"] == "unhealthy"
+        assert "Database type not configured" in health["error"]
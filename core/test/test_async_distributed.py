@@ -0,0 +1,179 @@
+"""
+Unit tests for the AsyncDistributedProcessor class.
+
+Tests claiming, status updates, queue status and health checks against a mocked
+AsyncDatabaseManager.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.async_database import AsyncDatabaseManager
+from core.async_distributed import AsyncDistributedProcessor
+from core.database import DatabaseManager
+from core.distributed import _MARK_RECORD_COMPLETED_QUERY
+
+
+@pytest.fixture
+def config_manager():
+    """ConfigManager returning the default distributed configuration."""
+    config_manager = Mock()
+    config_manager.get_distributed_config.return_value = {
+        "default_batch_size": 100,
+        "lease_seconds": 60,
+    }
+    return config_manager
+
+
+def _async_db_manager(database_name: str) -> Mock:
+    """Mock AsyncDatabaseManager with coroutine methods."""
+    db_manager = Mock(spec=AsyncDatabaseManager)
+    db_manager.database_name = database_name
+    db_manager.logger = Mock()
+    return db_manager
+
+
+@pytest.fixture
+def processor(config_manager):
+    """AsyncDistributedProcessor with mocked database managers."""
+    return AsyncDistributedProcessor(
+        _async_db_manager("rpa_db"),
+        _async_db_manager("SurveyHub"),
+        config_manager=config_manager,
+    )
+
+
+class TestAsyncDistributedProcessorInitialization:
+    """Test initialization checks."""
+
+    def test_rejects_sync_database_manager(self, config_manager):
+        """Test that a sync DatabaseManager cannot be used."""
+        with pytest.raises(TypeError, match="AsyncDatabaseManager instance"):
+            AsyncDistributedProcessor(
+                Mock(spec=DatabaseManager), config_manager=config_manager
+            )
+
+    def test_shares_instance_id_format(self, processor):
+        """Test that instance ids use the DistributedProcessor format."""
+        assert processor.database_name == "rpa_db"
+        assert len(processor.instance_id.rsplit("-", 1)[1]) == 8
+
+
+class TestAsyncDistributedProcessorRecords:
+    """Test claiming and marking records."""
+
+    @pytest.mark.asyncio
+    async def test_claim_records_batch(self, processor):
+        """Test that claimed rows are returned with the sync record format."""
+        processor.rpa_db.execute_query.return_value = [
+            {"id": 1, "payload": {"a": 1}, "retry_count": 0, "created_at": "t"}
+        ]
+
+        records = await processor.claim_records_batch("survey_processor", 10)
+
+        assert records == [
+            {"id": 1, "payload": {"a": 1}, "retry_count": 0, "created_at": "t"}
+        ]
+        query, params = processor.rpa_db.execute_query.call_args[0]
+        assert "FOR UPDATE SKIP LOCKED" in query
+        assert params == {
+            "flow_name": "survey_processor",
+            "batch_size": 10,
+            "instance_id": processor.instance_id,
+            "lease_seconds": 60,
+        }
+
+    @pytest.mark.asyncio
+    async def test_claim_records_batch_validates_arguments(self, processor):
+        """Test that invalid batch sizes are rejected before querying."""
+        with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+            await processor.claim_records_batch("survey_processor", 0)
+
+        processor.rpa_db.execute_query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mark_record_completed(self, processor):
+        """Test that the result is stored with the ownership check."""
+        processor.rpa_db.execute_query.return_value = [{"affected_rows": 1}]
+
+        await processor.mark_record_completed(7, {"score": 8.5})
+
+        query, params = processor.rpa_db.execute_query.call_args[0]
+        assert query == _MARK_RECORD_COMPLETED_QUERY
+        assert params["record_id"] == 7
+        assert params["result"] == '{"score": 8.5}'
+        assert params["instance_id"] == processor.instance_id
+
+    @pytest.mark.asyncio
+    async def test_mark_record_failed_not_owned(self, processor):
+        """Test that a record claimed by another instance raises."""
+        processor.rpa_db.execute_query.return_value = [{"affected_rows": 0}]
+
+        with pytest.raises(RuntimeError, match="not found or not in processing state"):
+            await processor.mark_record_failed(7, "boom")
+
+    @pytest.mark.asyncio
+    async def test_database_errors_are_wrapped(self, processor):
+        """Test that database failures raise RuntimeError with context."""
+        processor.rpa_db.execute_query.side_effect = RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError, match="Failed to mark record 7 as failed"):
+            await processor.mark_record_failed(7, "boom")
+
+
+class TestAsyncDistributedProcessorStatus:
+    """Test queue status and health checks."""
+
+    @pytest.mark.asyncio
+    async def test_get_queue_status_all_flows(self, processor):
+        """Test system-wide counts with the by-flow breakdown."""
+        processor.rpa_db.execute_query.side_effect = [
+            [{"status": "pending", "count": 3}, {"status": "failed", "count": 1}],
+            [
+                {"flow_name": "rpa1", "status": "pending", "count": 3},
+                {"flow_name": "rpa2", "status": "failed", "count": 1},
+            ],
+        ]
+
+        status = await processor.get_queue_status()
+
+        assert status["total_records"] == 4
+        assert status["pending_records"] == 3
+        assert status["by_flow"]["rpa1"]["total"] == 3
+        assert status["by_flow"]["rpa2"]["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_health_check(self, processor):
+        """Test that source database problems degrade the system."""
+        processor.rpa_db.health_check.return_value = {
+            "status": "healthy",
+            "connection": True,
+        }
+        processor.source_db.health_check.side_effect = RuntimeError("unreachable")
+        processor.rpa_db.execute_query.side_effect = [
+            [{"status": "pending", "count": 2}],
+            [],
+        ]
+
+        health = await processor.health_check()
+
+        assert health["status"] == "degraded"
+        assert health["databases"]["source_db"]["error"] == "unreachable"
+        assert health["queue_status"]["pending_records"] == 2
+        assert health["instance_info"]["source_db_name"] == "SurveyHub"
+
+    @pytest.mark.asyncio
+    async def test_health_check_rpa_db_unhealthy(self, processor):
+        """Test that an unreachable rpa_db makes the system unhealthy."""
+        processor.rpa_db.health_check = AsyncMock(
+            return_value={"status": "unhealthy", "connection": False, "error": "down"}
+        )
+        processor.source_db.health_check.return_value = {"status": "healthy"}
+
+        health = await processor.health_check()
+
+        assert health["status"] == "unhealthy"
+        assert health["error"] == "RPA database unhealthy: down"
+        assert health["queue_status"]["total_records"] == -1
+        processor.rpa_db.execute_query.assert_not_called()
@@ -1,6 +1,8 @@
 """Tests for configuration module."""
 
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -15,6 +17,7 @@ from core.config import (
     PROJECT_ROOT,
     REPORT_PREFIX,
     SAMPLE_PRODUCTS,
+    ConfigManager,
 )
 
 pytestmark = pytest.mark.unit
@@ -59,3 +62,130 @@ def test_sample_products():
         assert isinstance(product["price"], (int, float))
         assert product["quantity"] > 0
         assert product["price"] > 0
+
+
+class TestConfigManagerCache:
+    """Test caching of Prefect variable and secret lookups."""
+
+    @pytest.fixture
+    def mock_variable(self):
+        with patch("core.config.Variable") as mock_variable:
+            yield mock_variable
+
+    @pytest.fixture
+    def mock_secret(self):
+        with patch("core.config.Secret") as mock_secret:
+            yield mock_secret
+
+    def test_variable_lookups_are_cached(self, mock_variable):
+        """Test that a resolved variable is fetched once per TTL."""
+        mock_variable.get.side_effect = lambda name: (
+            "42" if name == "test_global_batch_size" else None
+        )
+        config = ConfigManager(environment="test")
+
+        assert config.get_variable("batch_size") == "42"
+        assert ConfigManager(environment="test").get_variable("batch_size") == "42"
+        assert mock_variable.get.call_count == 1
+
+    def test_misses_are_cached(self, mock_variable, mock_secret):
+        """Test that names that do not exist are not fetched again."""
+        mock_variable.get.return_value = None
+        mock_secret.load.side_effect = ValueError("not found")
+        config = ConfigManager("rpa1", environment="test")
+
+        assert config.get_variable("missing", "a") == "a"
+        assert config.get_variable("missing", "b") == "b"
+        assert config.get_secret("missing_secret") is None
+        assert config.get_secret("missing_secret") is None
+
+        # flow-specific, environment-global and global name once each
+        assert mock_variable.get.call_count == 3
+        assert mock_secret.load.call_count == 3
+        assert mock_secret.load.call_args_list[0][0][0] == "test-rpa1-missing-secret"
+
+    def test_ttl_zero_disables_cache(self, mock_variable):
+        """Test that every lookup is fetched when caching is disabled."""
+        mock_variable.get.return_value = "value"
+        config = ConfigManager(environment="test", cache_ttl_seconds=0)
+
+        config.get_variable("key")
+        config.get_variable("key")
+
+        assert mock_variable.get.call_count == 2
+
+    def test_environment_variables_are_not_cached(self, mock_variable):
+        """Test that environment variables take precedence over cached values."""
+        mock_variable.get.return_value = "from_prefect"
+        config = ConfigManager(environment="test")
+        assert config.get_variable("cache_probe") == "from_prefect"
+
+        with patch.dict("os.environ", {"TEST_GLOBAL_CACHE_PROBE": "from_env"}):
+            assert config.get_variable("cache_probe") == "from_env"
+
+    def test_preload(self, mock_variable, mock_secret):
+        """Test that preloaded values and misses need no further API calls."""
+        client = MagicMock()
+        client.__enter__.return_value = client
+        client.request.return_value.json.return_value = [
+            {"name": "test_global_rpa_db_type", "value": "postgresql"}
+        ]
+        client.read_block_documents_by_type.return_value = [
+            SimpleNamespace(
+                name="test-global-rpa-db-connection-string",
+                is_anonymous=False,
+                data={"value": "postgresql://localhost/rpa"},
+            )
+        ]
+        config = ConfigManager(environment="test")
+
+        with patch(
+            "prefect.client.orchestration.get_client", return_value=client
+        ) as mock_get_client:
+            loaded = config.preload()
+
+        mock_get_client.assert_called_once_with(sync_client=True)
+        assert loaded == {"variables": 1, "secrets": 1}
+        assert config.get_variable("rpa_db_type") == "postgresql"
+        assert config.get_secret("rpa_db_connection_string") == (
+            "postgresql://localhost/rpa"
+        )
+        assert config.get_variable("rpa_db_pool_size", 5) == 5
+        mock_variable.get.assert_not_called()
+        mock_secret.load.assert_not_called()
+
+    def test_failed_preload_falls_back_to_lookups(self, mock_variable):
+        """Test that a failing preload leaves per-key lookups working."""
+        mock_variable.get.return_value = "value"
+        config = ConfigManager(environment="test")
+
+        with patch(
+            "prefect.client.orchestration.get_client",
+            side_effect=RuntimeError("API unreachable"),
+        ):
+            assert config.preload() == {"variables": 0, "secrets": 0}
+
+        assert config.get_variable("key") == "value"
+
+    def test_preload_pages_through_variables(self, mock_variable, mock_secret):
+        """Test that variables beyond the first page are listed."""
+        client = MagicMock()
+        client.__enter__.return_value = client
+        pages = [
+            [{"name": f"test_global_key_{i}", "value": i} for i in range(200)],
+            [{"name": "test_global_rpa_db_type", "value": "postgresql"}],
+        ]
+        client.request.return_value.json.side_effect = pages
+        client.read_block_documents_by_type.return_value = []
+        config = ConfigManager(environment="test")
+
+        with patch("prefect.client.orchestration.get_client", return_value=client):
+            loaded = config.preload()
+
+        assert loaded == {"variables": 201, "secrets": 0}
+        offsets = [
+            call.kwargs["json"]["offset"] for call in client.request.call_args_list
+        ]
+        assert offsets == [0, 200]
+        assert config.get_variable("rpa_db_type") == "postgresql"
+        mock_variable.get.assert_not_called()
@@ -0,0 +1,169 @@
+"""
+Unit tests for offline configuration snapshots.
+
+Tests creating and verifying signed snapshots and how ConfigManager resolves
+Prefect values from them.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from core.config import ConfigManager
+from core.config_snapshot import (
+    create_config_snapshot,
+    load_config_snapshot,
+    main,
+)
+
+SIGNING_KEY = "test-signing-key"
+
+PREFECT_VARIABLES = {
+    "production_rpa1_batch_size": 50,
+    "production_global_rpa_db_type": "postgresql",
+    "production_rpa2_batch_size": 10,
+    "staging_global_rpa_db_type": "postgresql",
+}
+PREFECT_SECRETS = {
+    "production-global-rpa-db-connection-string": "postgresql://prod/rpa",
+    "staging-global-rpa-db-connection-string": "postgresql://staging/rpa",
+}
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    """Snapshot of the production rpa1 configuration."""
+    path = tmp_path / "snapshot.json"
+    with patch.object(
+        ConfigManager,
+        "_list_prefect_values",
+        return_value=(PREFECT_VARIABLES, PREFECT_SECRETS),
+    ):
+        create_config_snapshot("production", path, SIGNING_KEY, flow_name="rpa1")
+    return path
+
+
+class TestConfigSnapshotFile:
+    """Test writing and verifying snapshot files."""
+
+    def test_snapshot_contains_flow_and_environment_names(self, snapshot_path):
+        """Test that only names of the environment and flow are kept."""
+        snapshot = load_config_snapshot(snapshot_path, SIGNING_KEY)
+
+        assert snapshot["environment"] == "production"
+        assert snapshot["flow_name"] == "rpa1"
+        assert snapshot["variables"] == {
+            "production_rpa1_batch_size": 50,
+            "production_global_rpa_db_type": "postgresql",
+        }
+        assert snapshot["secrets"] == {
+            "production-global-rpa-db-connection-string": "postgresql://prod/rpa"
+        }
+        assert os.stat(snapshot_path).st_mode & 0o777 == 0o600
+
+    def test_tampered_snapshot_is_rejected(self, snapshot_path):
+        """Test that a modified snapshot fails verification."""
+        snapshot = json.loads(snapshot_path.read_text())
+        snapshot["variables"]["production_rpa1_batch_size"] = 5000
+        snapshot_path.write_text(json.dumps(snapshot))
+
+        with pytest.raises(ValueError, match="Signature .* does not match"):
+            load_config_snapshot(snapshot_path, SIGNING_KEY)
+
+    def test_wrong_key_is_rejected(self, snapshot_path):
+        """Test that a snapshot does not verify with another key."""
+        with pytest.raises(ValueError, match="does not match"):
+            load_config_snapshot(snapshot_path, "other-key")
+
+    def test_cli_requires_signing_key(self, tmp_path, monkeypatch, capsys):
+        """Test that the command refuses to write unsigned snapshots."""
+        monkeypatch.delenv("CONFIG_SNAPSHOT_KEY", raising=False)
+
+        exit_code = main(["production", "--output", str(tmp_path / "s.json")])
+
+        assert exit_code == 1
+        assert "CONFIG_SNAPSHOT_KEY must be set" in capsys.readouterr().out
+        assert not (tmp_path / "s.json").exists()
+
+
+class TestConfigManagerSnapshot:
+    """Test ConfigManager lookups backed by a snapshot."""
+
+    @pytest.fixture
+    def snapshot_env(self, snapshot_path, monkeypatch):
+        monkeypatch.setenv("CONFIG_SNAPSHOT_PATH", str(snapshot_path))
+        monkeypatch.setenv("CONFIG_SNAPSHOT_KEY", SIGNING_KEY)
+
+    def test_values_come_from_snapshot(self, snapshot_env):
+        """Test that snapshot values need no Prefect API calls."""
+        with (
+            patch("core.config.Variable") as mock_variable,
+            patch("core.config.Secret") as mock_secret,
+        ):
+            config = ConfigManager("rpa1", environment="production")
+
+            assert config.get_variable("batch_size") == 50
+            assert config.get_variable("rpa_db_type") == "postgresql"
+            assert config.get_secret("rpa_db_connection_string") == (
+                "postgresql://prod/rpa"
+            )
+
+        mock_variable.get.assert_not_called()
+        mock_secret.load.assert_not_called()
+
+    def test_missing_names_fall_back_to_api(self, snapshot_env):
+        """Test that names missing from the snapshot are fetched."""
+        with patch("core.config.Variable") as mock_variable:
+            mock_variable.get.side_effect = lambda name: (
+                "7" if name == "global_max_retries" else None
+            )
+            config = ConfigManager("rpa1", environment="production")
+
+            assert config.get_variable("max_retries") == "7"
+
+    def test_environment_variables_override_snapshot(self, snapshot_env, monkeypatch):
+        """Test that environment variables still take precedence."""
+        monkeypatch.setenv("PRODUCTION_RPA1_BATCH_SIZE", "20")
+
+        config = ConfigManager("rpa1", environment="production")
+
+        assert config.get_variable("batch_size") == "20"
+
+    def test_snapshot_of_other_environment_is_ignored(self, snapshot_env):
+        """Test that a production snapshot is not used for staging."""
+        with patch("core.config.Variable") as mock_variable:
+            mock_variable.get.return_value = "from_api"
+            config = ConfigManager("rpa1", environment="staging")
+
+            assert config.get_variable("rpa_db_type") == "from_api"
+
+    def test_snapshot_of_other_flow_is_ignored(self, snapshot_env):
+        """Test that an rpa1 snapshot does not hide the overrides of rpa2."""
+        with patch("core.config.Variable") as mock_variable:
+            mock_variable.get.side_effect = lambda name: (
+                "99" if name == "production_rpa2_batch_size" else None
+            )
+            config = ConfigManager("rpa2", environment="production")
+
+            assert config.get_variable("batch_size") == "99"
+
+    def test_flow_snapshot_serves_lookups_without_flow(self, snapshot_env):
+        """Test that a flow snapshot also serves the global names."""
+        with patch("core.config.Variable") as mock_variable:
+            config = ConfigManager(environment="production")
+
+            assert config.get_variable("rpa_db_type") == "postgresql"
+
+        mock_variable.get.assert_not_called()
+
+    def test_invalid_snapshot_is_ignored(self, snapshot_env, monkeypatch):
+        """Test that lookups use the API when the snapshot cannot be verified."""
+        monkeypatch.setenv("CONFIG_SNAPSHOT_KEY", "other-key")
+
+        with patch("core.config.Variable") as mock_variable:
+            mock_variable.get.return_value = "from_api"
+            config = ConfigManager("rpa1", environment="production")
+
+            assert config.get_variable("batch_size") == "from_api"
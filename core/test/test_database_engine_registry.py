@@ -0,0 +1,108 @@
+"""
+Unit tests for the shared engine registry of DatabaseManager.
+
+Tests that managers share one engine per database configuration, that shared
+pools survive context manager exit, and that the registry reports, disposes
+and resets its pools after fork.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core import database
+from core.database import (
+    DatabaseManager,
+    dispose_engines,
+    get_engine_registry_status,
+)
+
+
+@pytest.fixture
+def database_config():
+    """Configure test_db with a SQLite connection string."""
+    settings = {
+        "test_db_type": "postgresql",
+        "test_db_pool_size": "2",
+        "test_db_max_overflow": "3",
+    }
+    with patch("core.database.ConfigManager") as mock_config_class:
+        mock_config = Mock()
+        mock_config_class.return_value = mock_config
+        mock_config.environment = "test"
+        mock_config.get_variable.side_effect = lambda key, default=None: settings.get(
+            key, default
+        )
+        mock_config.get_secret.return_value = "sqlite://"
+        yield settings
+
+
+class TestSharedEngineRegistry:
+    """Test sharing of engines between DatabaseManager instances."""
+
+    def test_managers_share_one_engine(self, database_config):
+        """Test that managers for the same database reuse one engine."""
+        with patch(
+            "core.database.create_engine", side_effect=lambda *a, **kw: Mock()
+        ) as mock_create_engine:
+            first = DatabaseManager("test_db").db_engine
+            second = DatabaseManager("test_db").db_engine
+
+        assert first is second
+        mock_create_engine.assert_called_once()
+
+    def test_different_pool_settings_get_separate_engines(self, database_config):
+        """Test that the registry is keyed by connection settings."""
+        with patch("core.database.create_engine", side_effect=lambda *a, **kw: Mock()):
+            first = DatabaseManager("test_db").db_engine
+            database_config["test_db_pool_size"] = "4"
+            second = DatabaseManager("test_db").db_engine
+
+        assert first is not second
+
+    def test_context_manager_exit_keeps_shared_engine_open(self, database_config):
+        """Test that leaving a context does not close the pool of other managers."""
+        with patch("core.database.create_engine", side_effect=lambda *a, **kw: Mock()):
+            other = DatabaseManager("test_db")
+            with DatabaseManager("test_db") as db_manager:
+                engine = db_manager.db_engine
+
+        engine.dispose.assert_not_called()
+        assert db_manager.engine is None
+        assert other.db_engine is engine
+
+    def test_registry_status_reports_pool_usage(self, database_config):
+        """Test pool usage reporting with a real pool."""
+        engine = DatabaseManager("test_db").db_engine
+
+        with engine.connect():
+            status = get_engine_registry_status()
+
+        assert len(status) == 1
+        assert status[0]["database_name"] == "test_db"
+        assert status[0]["pool_class"] == "QueuePool"
+        assert status[0]["pool_size"] == 2
+        assert status[0]["max_connections"] == 5
+        assert status[0]["checked_out"] == 1
+        assert status[0]["utilization_percent"] == 20.0
+
+    def test_dispose_engines(self, database_config):
+        """Test that disposal closes every pool and empties the registry."""
+        with patch("core.database.create_engine", side_effect=lambda *a, **kw: Mock()):
+            engine = DatabaseManager("test_db").db_engine
+
+            dispose_engines()
+
+            engine.dispose.assert_called_once_with()
+            assert get_engine_registry_status() == []
+            assert DatabaseManager("test_db").db_engine is not engine
+
+    def test_fork_replaces_pools_without_closing_them(self, database_config):
+        """Test that a forked child gets new pools and keeps the engines."""
+        with patch("core.database.create_engine", side_effect=lambda *a, **kw: Mock()):
+            engine = DatabaseManager("test_db").db_engine
+
+        database._reset_engines_after_fork()
+
+        engine.dispose.assert_called_once_with(close=False)
+        assert DatabaseManager("test_db").db_engine is engine
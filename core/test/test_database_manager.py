@@ -5,14 +5,23 @@ Tests cover initialization, logger setup, context manager behavior,
 configuration integration, and error handling scenarios.
 """
 
-from unittest.mock import Mock, patch
+import csv
+import io
+import json
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.exc import TimeoutError as SQLTimeoutError
 from sqlalchemy.pool import QueuePool
 
-from core.database import DatabaseManager
+from core import database
+from core.database import (
+    DatabaseManager,
+    get_query_timeout_counts,
+    reset_query_timeout_counts,
+)
 
 
 class TestDatabaseManagerInitialization:
@@ -346,6 +355,7 @@ class TestDatabaseManagerConfigurationIntegration:
             max_overflow=15,
             pool_pre_ping=True,
             echo=False,
+            fast_executemany=True,
         )
 
         assert db_manager.engine == mock_engine
@@ -831,6 +841,146 @@ class TestDatabaseManagerQueryWithTimeout:
             )
 
 
+class TestDatabaseManagerStatementTimeouts:
+    """Test enforcement and configuration of statement timeouts."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_timeout_counts(self):
+        reset_query_timeout_counts()
+        yield
+        reset_query_timeout_counts()
+
+    def _make_manager(self, dialect_name):
+        """Create a DatabaseManager with a mocked engine for the given dialect."""
+        db_manager = DatabaseManager("test_db")
+        db_manager._logger = Mock()
+        db_manager.engine = MagicMock()
+        conn = db_manager.engine.connect.return_value.__enter__.return_value
+        conn.dialect.name = dialect_name
+        conn.execute.return_value.fetchall.return_value = []
+        return db_manager, conn
+
+    def test_postgresql_sets_local_statement_timeout(self):
+        """Test that PostgreSQL queries run with SET LOCAL statement_timeout."""
+        db_manager, conn = self._make_manager("postgresql")
+
+        db_manager.execute_query_with_timeout("SELECT 1", timeout=2.5)
+
+        conn.exec_driver_sql.assert_called_once_with(
+            "SET LOCAL statement_timeout = 2500"
+        )
+        conn.execute.assert_called_once()
+
+    def test_sqlserver_sets_and_restores_pyodbc_timeout(self):
+        """Test that the pyodbc query timeout is set only for the query."""
+        db_manager, conn = self._make_manager("mssql")
+        dbapi_connection = conn.connection.dbapi_connection
+        dbapi_connection.timeout = 0
+        seen = []
+        conn.execute.side_effect = lambda *args: (
+            seen.append(dbapi_connection.timeout) or MagicMock()
+        )
+
+        db_manager.execute_query_with_timeout("SELECT 1", timeout=5)
+
+        assert seen == [5]
+        assert dbapi_connection.timeout == 0
+
+    def test_statement_timeout_is_counted(self):
+        """Test that cancelled statements raise RuntimeError and are counted."""
+        db_manager, conn = self._make_manager("postgresql")
+        conn.execute.side_effect = Exception(
+            "QueryCanceled: canceling statement due to statement timeout"
+        )
+
+        with pytest.raises(RuntimeError, match=r"Query timeout \(1s\) exceeded"):
+            db_manager.execute_query_with_timeout(
+                "SELECT pg_sleep(10)", timeout=1, query_class="monitoring"
+            )
+
+        assert get_query_timeout_counts() == [
+            {"database_name": "test_db", "query_class": "monitoring", "timeouts": 1}
+        ]
+
+    def test_query_class_timeouts_from_configuration(self, mock_config_manager):
+        """Test per-class timeouts falling back to the database default."""
+        mock_config_manager.get_variable.side_effect = lambda key, default=None: {
+            "test_db_type": "postgresql",
+            "test_db_query_timeout": "20",
+            "test_db_query_timeout_monitoring": "5",
+        }.get(key, default)
+
+        with patch("core.database.create_engine"):
+            db_manager = DatabaseManager("test_db")
+            assert db_manager.get_query_timeout() == 20
+            assert db_manager.get_query_timeout("monitoring") == 5
+            assert db_manager.get_query_timeout("source") == 20
+
+    def test_default_timeout_applies_to_execute_query(self, mock_config_manager):
+        """Test that a configured database timeout limits execute_query too."""
+        mock_config_manager.get_variable.side_effect = lambda key, default=None: {
+            "test_db_type": "postgresql",
+            "test_db_query_timeout": "15",
+        }.get(key, default)
+
+        with patch("core.database.create_engine") as mock_create_engine:
+            conn = mock_create_engine.return_value.connect.return_value.__enter__()
+            conn.dialect.name = "postgresql"
+            DatabaseManager("test_db").execute_query("SELECT 1")
+
+        conn.exec_driver_sql.assert_called_once_with(
+            "SET LOCAL statement_timeout = 15000"
+        )
+
+    def test_stream_query_cancels_after_timeout(self, tmp_path):
+        """Test that a stream still running at its deadline is cancelled."""
+        db_manager = DatabaseManager("test_db")
+        db_manager._logger = Mock()
+        db_manager.engine = create_engine(f"sqlite:///{tmp_path / 'slow.db'}")
+
+        slow_query = (
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) "
+            "SELECT count(*) FROM n"
+        )
+        with pytest.raises(RuntimeError, match=r"Query timeout \(0.2s\) exceeded"):
+            list(db_manager.stream_query(slow_query, timeout=0.2))
+
+        assert get_query_timeout_counts()[0]["query_class"] == "default"
+
+    def test_stream_query_deadline_includes_consumer_time(self, tmp_path):
+        """Test that a slow consumer cannot hold the stream past its timeout."""
+        db_manager = DatabaseManager("test_db")
+        db_manager._logger = Mock()
+        db_manager.engine = create_engine(f"sqlite:///{tmp_path / 'rows.db'}")
+
+        stream = db_manager.stream_query(
+            "SELECT 1 UNION ALL SELECT 2", chunk_size=1, timeout=0.1
+        )
+        assert next(stream) == [{"1": 1}]
+        with patch.object(database.time, "monotonic", return_value=1e12):
+            with pytest.raises(RuntimeError, match="Query timeout"):
+                next(stream)
+
+    def test_stream_query_stops_timer_before_releasing_connection(self, tmp_path):
+        """Test that the cancel timer is stopped while the stream holds its connection."""
+        db_manager = DatabaseManager("test_db")
+        db_manager._logger = Mock()
+        db_manager.engine = create_engine(
+            f"sqlite:///{tmp_path / 'rows.db'}", poolclass=QueuePool
+        )
+        checked_out = []
+
+        with patch.object(database.threading, "Timer") as mock_timer:
+            mock_timer.return_value.cancel.side_effect = lambda: checked_out.append(
+                db_manager.engine.pool.checkedout()
+            )
+            list(db_manager.stream_query("SELECT 1", timeout=5))
+
+        assert checked_out == [1]
+        mock_timer.return_value.join.assert_called_once_with()
+        assert db_manager.engine.pool.checkedout() == 0
+
+
 class TestDatabaseManagerTransactionExecution:
     """Test DatabaseManager transaction execution functionality."""
 
@@ -1066,6 +1216,355 @@ class TestDatabaseManagerTransactionExecution:
         mock_conn.execute.assert_called_once()
 
 
+class TestDatabaseManagerBulkInsert:
+    """Test DatabaseManager bulk_insert functionality."""
+
+    def _make_manager(self, dialect_name):
+        """Create a DatabaseManager with a mocked engine for the given dialect."""
+        db_manager = DatabaseManager("test_db")
+        db_manager._logger = Mock()
+        db_manager.engine = MagicMock()
+        db_manager.engine.dialect.name = dialect_name
+        return db_manager
+
+    def test_bulk_insert_postgresql_uses_copy(self):
+        """Test that PostgreSQL rows are streamed with COPY in CSV format."""
+        db_manager = self._make_manager("postgresql")
+        raw_connection = db_manager.engine.raw_connection.return_value
+        cursor = raw_connection.cursor.return_value.__enter__.return_value
+        copied = {}
+        cursor.copy_expert.side_effect = lambda sql, buffer: copied.update(
+            sql=sql, data=buffer.read()
+        )
+
+        count = db_manager.bulk_insert(
+            "processing_queue",
+            ["flow_name", "payload", "error_message"],
+            [
+                ("survey_processor", {"survey_id": 1001, "note": 'a,"b"'}, None),
+                ("survey_processor", {"survey_id": 1002}, ""),
+            ],
+        )
+
+        assert count == 2
+        assert copied["sql"] == (
+            "COPY processing_queue (flow_name, payload, error_message) FROM STDIN "
+            "WITH (FORMAT csv, NULL '\\N')"
+        )
+        rows = list(csv.reader(io.StringIO(copied["data"])))
+        assert json.loads(rows[0][1]) == {"survey_id": 1001, "note": 'a,"b"'}
+        assert rows[0][2] == "\\N"
+        assert rows[1][2] == ""
+        raw_connection.commit.assert_called_once()
+        raw_connection.close.assert_called_once()
+
+    def test_bulk_insert_postgresql_quotes_null_marker_string(self):
+        """Test that a string equal to the NULL marker is not loaded as NULL."""
+        db_manager = self._make_manager("postgresql")
+        raw_connection = db_manager.engine.raw_connection.return_value
+        cursor = raw_connection.cursor.return_value.__enter__.return_value
+        copied = {}
+        cursor.copy_expert.side_effect = lambda sql, buffer: copied.update(
+            data=buffer.read()
+        )
+
+        db_manager.bulk_insert("notes", ["id", "body", "note"], [(1, "\\N", None)])
+
+        assert copied["data"] == '1,"\\N",\\N\n'
+
+    def test_bulk_insert_postgresql_copies_bytes_as_bytea(self):
+        """Test that bytes are written in bytea hex format, not as a repr."""
+        db_manager = self._make_manager("postgresql")
+        raw_connection = db_manager.engine.raw_connection.return_value
+        cursor = raw_connection.cursor.return_value.__enter__.return_value
+        copied = {}
+        cursor.copy_expert.side_effect = lambda sql, buffer: copied.update(
+            data=buffer.read()
+        )
+
+        db_manager.bulk_insert("files", ["id", "content"], [(1, b"\x00\xffab")])
+
+        rows = list(csv.reader(io.StringIO(copied["data"])))
+        assert rows == [["1", "\\x00ff6162"]]
+
+    def test_bulk_insert_postgresql_rolls_back_on_error(self):
+        """Test that a failed COPY is rolled back and wrapped in RuntimeError."""
+        db_manager = self._make_manager("postgresql")
+        raw_connection = db_manager.engine.raw_connection.return_value
+        cursor = raw_connection.cursor.return_value.__enter__.return_value
+        cursor.copy_expert.side_effect = Exception("invalid input syntax")
+
+        with pytest.raises(RuntimeError, match="Bulk insert of 1 rows into t failed"):
+            db_manager.bulk_insert("t", ["a"], [(1,)])
+
+        raw_connection.rollback.assert_called_once()
+        raw_connection.commit.assert_not_called()
+        raw_connection.close.assert_called_once()
+
+    def test_bulk_insert_sqlserver_uses_executemany(self):
+        """Test that non-PostgreSQL databases use executemany."""
+        db_manager = self._make_manager("mssql")
+        conn = db_manager.engine.begin.return_value.__enter__.return_value
+
+        count = db_manager.bulk_insert(
+            "dbo.survey_ids", ["survey_id", "meta"], [(1, {"x": 1}), (2, None)]
+        )
+
+        assert count == 2
+        statement, param_list = conn.execute.call_args[0]
+        assert str(statement) == (
+            "INSERT INTO dbo.survey_ids (survey_id, meta) VALUES (:survey_id, :meta)"
+        )
+        assert param_list == [
+            {"survey_id": 1, "meta": '{"x": 1}'},
+            {"survey_id": 2, "meta": None},
+        ]
+
+    def test_bulk_insert_validation(self):
+        """Test identifier and row validation."""
+        db_manager = self._make_manager("postgresql")
+
+        with pytest.raises(ValueError, match="Invalid table name"):
+            db_manager.bulk_insert("queue; DROP TABLE x", ["a"], [(1,)])
+
+        with pytest.raises(ValueError, match="Invalid column name"):
+            db_manager.bulk_insert("t", ["a b"], [(1,)])
+
+        with pytest.raises(ValueError, match="columns must be a non-empty list"):
+            db_manager.bulk_insert("t", [], [(1,)])
+
+        with pytest.raises(ValueError, match="Row at index 1 has 1 values"):
+            db_manager.bulk_insert("t", ["a", "b"], [(1, 2), (3,)])
+
+        assert db_manager.bulk_insert("t", ["a"], iter([])) == 0
+        db_manager.engine.raw_connection.assert_not_called()
+
+
+class TestDatabaseManagerExecuteMany:
+    """Test DatabaseManager execute_many functionality."""
+
+    def _make_manager(self, tmp_path):
+        """Create a DatabaseManager on a SQLite table with three rows."""
+        db_manager = DatabaseManager("test_db")
+        db_manager._logger = Mock()
+        db_manager.engine = create_engine(f"sqlite:///{tmp_path / 'many.db'}")
+        with db_manager.engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE orders (id INTEGER, status TEXT)")
+            conn.exec_driver_sql(
+                "INSERT INTO orders VALUES (?, ?)", [(1, "new"), (2, "new"), (3, "new")]
+            )
+        return db_manager
+
+    def test_execute_many_returns_counts_per_chunk(self, tmp_path):
+        """Test that each chunk is executed and its affected rows reported."""
+        db_manager = self._make_manager(tmp_path)
+
+        counts = db_manager.execute_many(
+            "UPDATE orders SET status = :status WHERE id = :id",
+            [
+                {"id": 1, "status": "shipped"},
+                {"id": 2, "status": "shipped"},
+                {"id": 99, "status": "shipped"},
+            ],
+            chunk_size=2,
+        )
+
+        assert counts == [2, 0]
+        with db_manager.engine.connect() as conn:
+            statuses = conn.exec_driver_sql(
+                "SELECT status FROM orders ORDER BY id"
+            ).fetchall()
+        assert [row[0] for row in statuses] == ["shipped", "shipped", "new"]
+
+    def test_execute_many_postgresql_simple_insert_uses_copy(self):
+        """Test that plain INSERT ... VALUES statements are loaded with COPY."""
+        db_manager = DatabaseManager("test_db")
+        db_manager._logger = Mock()
+        db_manager.engine = MagicMock()
+        db_manager.engine.dialect.name = "postgresql"
+        raw_connection = db_manager.engine.raw_connection.return_value
+        cursor = raw_connection.cursor.return_value.__enter__.return_value
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(
+            (sql, buffer.read())
+        )
+
+        counts = db_manager.execute_many(
+            "INSERT INTO survey_results (survey_id, details) "
+            "VALUES (:survey_id, :details)",
+            [{"survey_id": i, "details": {"n": i}} for i in range(3)],
+            chunk_size=2,
+        )
+
+        assert counts == [2, 1]
+        assert copied[0][0].startswith("COPY survey_results (survey_id, details)")
+        rows = list(csv.reader(io.StringIO(copied[1][1])))
+        assert rows == [["2", '{"n": 2}']]
+        db_manager.engine.begin.assert_not_called()
+
+    def test_execute_many_postgresql_other_statements_use_executemany(self):
+        """Test that statements COPY cannot express fall back to executemany."""
+        db_manager = DatabaseManager("test_db")
+        db_manager._logger = Mock()
+        db_manager.engine = MagicMock()
+        db_manager.engine.dialect.name = "postgresql"
+        conn = db_manager.engine.begin.return_value.__enter__.return_value
+        conn.execute.return_value.rowcount = 1
+
+        counts = db_manager.execute_many(
+            "INSERT INTO t (a, b) VALUES (:a, NOW()) ON CONFLICT DO NOTHING",
+            [{"a": 1}],
+        )
+
+        assert counts == [1]
+        db_manager.engine.raw_connection.assert_not_called()
+        assert conn.execute.call_args[0][1] == [{"a": 1}]
+
+    def test_execute_many_binds_lists_as_arrays(self):
+        """Test that list values reach the driver as lists, not JSON text."""
+        db_manager = DatabaseManager("test_db")
+        db_manager._logger = Mock()
+        db_manager.engine = MagicMock()
+        db_manager.engine.dialect.name = "postgresql"
+        conn = db_manager.engine.begin.return_value.__enter__.return_value
+        conn.execute.return_value.rowcount = 2
+
+        db_manager.execute_many(
+            "UPDATE t SET meta = :meta WHERE id = ANY(:ids)",
+            [{"ids": [1, 2], "meta": {"checked": True}}],
+        )
+        db_manager.execute_many(
+            "INSERT INTO t (id, tags) VALUES (:id, :tags)",
+            [{"id": 1, "tags": ["a", "b"]}],
+        )
+
+        first, second = conn.execute.call_args_list
+        assert first[0][1] == [{"ids": [1, 2], "meta": '{"checked": true}'}]
+        # Lists cannot be written with COPY, so the INSERT uses executemany
+        assert second[0][1] == [{"id": 1, "tags": ["a", "b"]}]
+        db_manager.engine.raw_connection.assert_not_called()
+
+    def test_execute_many_missing_bind_parameter_runs_nothing(self, tmp_path):
+        """Test that every parameter set is checked before the first chunk."""
+        db_manager = self._make_manager(tmp_path)
+
+        with pytest.raises(ValueError, match=r"index 2 are missing .*\['status'\]"):
+            db_manager.execute_many(
+                "UPDATE orders SET status = :status WHERE id = :id",
+                [
+                    {"id": 1, "status": "shipped"},
+                    {"id": 2, "status": "shipped"},
+                    {"id": 3},
+                ],
+                chunk_size=1,
+            )
+
+        with db_manager.engine.connect() as conn:
+            statuses = conn.exec_driver_sql("SELECT status FROM orders").fetchall()
+        assert {row[0] for row in statuses} == {"new"}
+
+    def test_execute_many_validation(self, tmp_path):
+        """Test parameter validation and error wrapping."""
+        db_manager = self._make_manager(tmp_path)
+
+        with pytest.raises(ValueError, match="Query must be a non-empty string"):
+            db_manager.execute_many("", [{"a": 1}])
+
+        with pytest.raises(ValueError, match="chunk_size must be a positive integer"):
+            db_manager.execute_many("SELECT 1", [{"a": 1}], chunk_size=0)
+
+        with pytest.raises(ValueError, match="Parameters at index 1"):
+            db_manager.execute_many("SELECT 1", [{"a": 1}, (2,)])
+
+        assert db_manager.execute_many("SELECT 1", []) == []
+
+        with pytest.raises(RuntimeError, match="after 0 committed chunks"):
+            db_manager.execute_many("UPDATE missing SET a = :a", [{"a": 1}])
+
+
+class TestDatabaseManagerStreamQuery:
+    """Test DatabaseManager stream_query and iter_query functionality."""
+
+    def _make_manager(self, tmp_path, row_count):
+        """Create a DatabaseManager on a SQLite table with row_count rows."""
+        db_manager = DatabaseManager("test_db")
+        db_manager._logger = Mock()
+        db_manager.engine = create_engine(
+            f"sqlite:///{tmp_path / 'stream.db'}", poolclass=QueuePool
+        )
+        with db_manager.engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE surveys (id INTEGER, name TEXT)")
+            if row_count:
+                conn.exec_driver_sql(
+                    "INSERT INTO surveys VALUES (?, ?)",
+                    [(i, f"survey_{i}") for i in range(row_count)],
+                )
+        return db_manager
+
+    def test_stream_query_yields_chunks(self, tmp_path):
+        """Test that rows are returned in chunks of at most chunk_size."""
+        db_manager = self._make_manager(tmp_path, 5)
+
+        chunks = list(
+            db_manager.stream_query(
+                "SELECT id, name FROM surveys WHERE id >= :min_id ORDER BY id",
+                {"min_id": 0},
+                chunk_size=2,
+            )
+        )
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert chunks[0][0] == {"id": 0, "name": "survey_0"}
+
+    def test_iter_query_row_formats(self, tmp_path):
+        """Test dict, tuple and named row output."""
+        db_manager = self._make_manager(tmp_path, 3)
+        query = "SELECT id, name FROM surveys ORDER BY id"
+
+        dicts = list(db_manager.iter_query(query, chunk_size=2))
+        tuples = list(db_manager.iter_query(query, row_format="tuple"))
+        rows = list(db_manager.iter_query(query, row_format="row"))
+
+        assert dicts[2] == {"id": 2, "name": "survey_2"}
+        assert tuples == [(0, "survey_0"), (1, "survey_1"), (2, "survey_2")]
+        assert type(tuples[0]) is tuple
+        assert rows[1].name == "survey_1"
+
+    def test_stream_query_is_lazy_and_releases_connection(self, tmp_path):
+        """Test that no query runs before iteration and closing frees the pool."""
+        db_manager = DatabaseManager("test_db")
+        db_manager.engine = MagicMock()
+
+        db_manager.iter_query("SELECT 1")
+        db_manager.engine.connect.assert_not_called()
+
+        db_manager = self._make_manager(tmp_path, 10)
+        iterator = db_manager.iter_query("SELECT id FROM surveys", chunk_size=3)
+        assert next(iterator) == {"id": 0}
+        iterator.close()
+        assert db_manager.engine.pool.checkedout() == 0
+
+    def test_stream_query_validation(self):
+        """Test parameter validation happens when the stream is created."""
+        db_manager = DatabaseManager("test_db")
+
+        with pytest.raises(ValueError, match="Query must be a non-empty string"):
+            db_manager.stream_query("")
+
+        with pytest.raises(ValueError, match="chunk_size must be a positive integer"):
+            db_manager.stream_query("SELECT 1", chunk_size=0)
+
+        with pytest.raises(ValueError, match="row_format must be one of"):
+            db_manager.iter_query("SELECT 1", row_format="json")
+
+    def test_stream_query_error_wrapped(self, tmp_path):
+        """Test that database errors surface as RuntimeError while iterating."""
+        db_manager = self._make_manager(tmp_path, 0)
+
+        with pytest.raises(RuntimeError, match="Streaming query failed"):
+            list(db_manager.stream_query("SELECT * FROM missing_table"))
+
+
 class TestDatabaseManagerMigrations:
     """Test DatabaseManager migration functionality using Pyway."""
 
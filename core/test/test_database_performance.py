@@ -19,7 +19,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from core.database import DatabaseManager
+from core.database import DatabaseManager, dispose_engines
 
 
 class TestConnectionPoolPerformance:
@@ -579,8 +579,13 @@ class TestMemoryAndResourceManagement:
         end_time = time.time()
         total_time = end_time - start_time
 
-        # Verify resource cleanup
-        assert len(dispose_calls) == num_iterations
+        # Verify resource cleanup: the shared pool stays open across contexts and
+        # is closed once by dispose_engines
+        assert len(dispose_calls) == 0
+        self.mock_create_engine.assert_called_once()
+        dispose_engines()
+        end_time = time.time()
+        assert len(dispose_calls) == 1
 
         # Verify performance
         avg_time_per_context = total_time / num_iterations
@@ -694,8 +699,11 @@ class TestMemoryAndResourceManagement:
         total_time = end_time - start_time
 
         # Verify engine creation efficiency
-        # Each instance should create its own engine (current implementation)
-        assert len(engine_creation_calls) == num_instances
+        # All instances share one engine from the process-wide registry
+        assert len(engine_creation_calls) == 1
+        assert all(
+            db_manager.engine is db_managers[0].engine for db_manager in db_managers
+        )
 
         # Verify creation performance
         avg_creation_time = total_time / num_instances
@@ -5,12 +5,19 @@ Tests class initialization, instance ID generation, and basic functionality
 without requiring actual database connections.
 """
 
+import json
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 
 from core.database import DatabaseManager
-from core.distributed import DistributedProcessor
+from core.distributed import (
+    DEFAULT_PRIORITY,
+    PRIORITY_HIGH,
+    DistributedProcessor,
+    LeaseHeartbeat,
+)
 
 
 class TestDistributedProcessorInitialization:
@@ -331,7 +338,7 @@ class TestClaimRecordsBatch:
         # Verify SQL query structure
         assert "UPDATE processing_queue" in query
         assert "FOR UPDATE SKIP LOCKED" in query
-        assert "ORDER BY created_at ASC" in query
+        assert "ORDER BY priority ASC, created_at ASC" in query
         assert "RETURNING id, payload, retry_count, created_at" in query
 
         # Verify query parameters
@@ -445,7 +452,7 @@ class TestClaimRecordsBatch:
         assert "WHERE id IN (" in query
         assert "SELECT id FROM processing_queue" in query
         assert "WHERE flow_name = :flow_name AND status = 'pending'" in query
-        assert "ORDER BY created_at ASC" in query
+        assert "ORDER BY priority ASC, created_at ASC" in query
         assert "LIMIT :batch_size" in query
         assert "FOR UPDATE SKIP LOCKED" in query
         assert "RETURNING id, payload, retry_count, created_at" in query
@@ -469,10 +476,10 @@ class TestClaimRecordsBatch:
         assert result[1]["created_at"] == "2024-01-15 09:30:00"  # middle
         assert result[2]["created_at"] == "2024-01-15 10:00:00"  # newest last
 
-        # Verify SQL query includes ORDER BY created_at ASC
+        # Verify SQL query orders FIFO within a priority
         call_args = self.mock_rpa_db.execute_query.call_args
         query = call_args[0][0]
-        assert "ORDER BY created_at ASC" in query
+        assert "ORDER BY priority ASC, created_at ASC" in query
 
 
 class TestMarkRecordCompleted:
@@ -509,7 +516,8 @@ class TestMarkRecordCompleted:
         # Verify SQL query structure
         assert "UPDATE processing_queue" in query
         assert "SET status = 'completed'" in query
-        assert "payload = :result" in query
+        assert "payload = :result" not in query
+        assert "INSERT INTO processing_results" in query
         assert "completed_at = CURRENT_TIMESTAMP" in query
         assert "updated_at = CURRENT_TIMESTAMP" in query
         assert "WHERE id = :record_id" in query
@@ -518,7 +526,9 @@ class TestMarkRecordCompleted:
 
         # Verify query parameters
         assert params["record_id"] == 123
-        assert params["result"] == result
+        assert json.loads(params["result"]) == result
+        assert params["result_size"] == len(params["result"].encode("utf-8"))
+        assert params["spill_path"] is None
         assert params["instance_id"] == self.processor.instance_id
 
         # Verify return_count=True was passed
@@ -633,7 +643,7 @@ class TestMarkRecordCompleted:
         # Verify database was called with empty result
         call_args = self.mock_rpa_db.execute_query.call_args
         params = call_args[0][1]
-        assert params["result"] == {}
+        assert json.loads(params["result"]) == {}
 
     def test_mark_record_completed_complex_result(self):
         """Test marking record as completed with complex result data."""
@@ -662,7 +672,7 @@ class TestMarkRecordCompleted:
         # Verify complex result was passed correctly
         call_args = self.mock_rpa_db.execute_query.call_args
         params = call_args[0][1]
-        assert params["result"] == result
+        assert json.loads(params["result"]) == result
         assert params["record_id"] == 456
 
     def test_mark_record_completed_instance_id_verification(self):
@@ -1000,6 +1010,792 @@ class TestMarkRecordFailed:
         assert self.processor.instance_id in success_log
 
 
+class TestMarkRecordsBatch:
+    """Test batched mark_records_completed_batch/mark_records_failed_batch methods."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_rpa_db = Mock(spec=DatabaseManager)
+        self.mock_logger = Mock()
+        self.mock_rpa_db.logger = self.mock_logger
+        self.mock_rpa_db.database_name = "rpa_db"
+
+        self.processor = DistributedProcessor(rpa_db_manager=self.mock_rpa_db)
+
+    def test_mark_records_completed_batch_single_statement(self):
+        """Test that a whole batch of completions is applied with one query."""
+        self.mock_rpa_db.execute_query.return_value = [(1,), (2,), (3,)]
+
+        completions = [(1, {"score": 8.5}), (2, {"score": 7.0}), (3, {"score": 9.0})]
+        unmatched = self.processor.mark_records_completed_batch(completions)
+
+        assert unmatched == []
+        self.mock_rpa_db.execute_query.assert_called_once()
+
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert "UPDATE processing_queue AS q" in query
+        assert "SET status = 'completed'" in query
+        assert "unnest(" in query
+        assert "AND q.status = 'processing'" in query
+        assert "AND q.flow_instance_id = :instance_id" in query
+        assert "RETURNING q.id" in query
+
+        assert params["record_ids"] == [1, 2, 3]
+        assert [json.loads(r) for r in params["results"]] == [
+            {"score": 8.5},
+            {"score": 7.0},
+            {"score": 9.0},
+        ]
+        assert params["instance_id"] == self.processor.instance_id
+
+    def test_mark_records_completed_batch_reports_unmatched_ids(self):
+        """Test that records not owned by this instance are returned as unmatched."""
+        self.mock_rpa_db.execute_query.return_value = [(2,)]
+
+        unmatched = self.processor.mark_records_completed_batch(
+            [(1, {"a": 1}), (2, {"b": 2}), (3, {"c": 3})]
+        )
+
+        assert unmatched == [1, 3]
+        warning_message = self.mock_logger.warning.call_args[0][0]
+        assert "2 of 3 records were not marked as completed" in warning_message
+
+    def test_mark_records_completed_batch_serializes_datetimes(self):
+        """Test that non-JSON-native result values are serialized as strings."""
+        from datetime import datetime, timezone
+
+        self.mock_rpa_db.execute_query.return_value = [(1,)]
+        processed_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        self.processor.mark_records_completed_batch(
+            [(1, {"processed_at": processed_at})]
+        )
+
+        params = self.mock_rpa_db.execute_query.call_args[0][1]
+        assert json.loads(params["results"][0]) == {"processed_at": str(processed_at)}
+
+    def test_mark_records_completed_batch_empty(self):
+        """Test that an empty batch does not touch the database."""
+        assert self.processor.mark_records_completed_batch([]) == []
+        self.mock_rpa_db.execute_query.assert_not_called()
+
+    def test_mark_records_completed_batch_validation(self):
+        """Test input validation for batched completions."""
+        with pytest.raises(ValueError, match="completions must be a list"):
+            self.processor.mark_records_completed_batch("not a list")
+
+        with pytest.raises(ValueError, match="must be a \\(record_id, value\\) tuple"):
+            self.processor.mark_records_completed_batch([1, 2])
+
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            self.processor.mark_records_completed_batch([(0, {})])
+
+        with pytest.raises(ValueError, match="Result at index 0 must be a dictionary"):
+            self.processor.mark_records_completed_batch([(1, "not a dict")])
+
+        with pytest.raises(ValueError, match="duplicate record_ids"):
+            self.processor.mark_records_completed_batch([(1, {}), (1, {})])
+
+        self.mock_rpa_db.execute_query.assert_not_called()
+
+    def test_mark_records_completed_batch_database_error(self):
+        """Test that database errors are wrapped in RuntimeError."""
+        self.mock_rpa_db.execute_query.side_effect = Exception("Connection lost")
+
+        with pytest.raises(RuntimeError, match="Failed to mark 1 records as completed"):
+            self.processor.mark_records_completed_batch([(1, {"ok": True})])
+
+    def test_mark_records_failed_batch_single_statement(self):
+        """Test that a whole batch of failures is applied with one query."""
+        self.mock_rpa_db.execute_query.return_value = [(10,), (11,)]
+
+        unmatched = self.processor.mark_records_failed_batch(
+            [(10, "  Invalid format  "), (11, "Timeout")]
+        )
+
+        assert unmatched == []
+        self.mock_rpa_db.execute_query.assert_called_once()
+
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert "SET status = 'failed'" in query
+        assert "retry_count = q.retry_count + 1" in query
+        assert "AND q.flow_instance_id = :instance_id" in query
+        assert params["record_ids"] == [10, 11]
+        assert params["error_messages"] == ["Invalid format", "Timeout"]
+
+    def test_mark_records_failed_batch_reports_unmatched_ids(self):
+        """Test that failures for records owned elsewhere are returned."""
+        self.mock_rpa_db.execute_query.return_value = []
+
+        unmatched = self.processor.mark_records_failed_batch([(10, "error")])
+
+        assert unmatched == [10]
+
+    def test_mark_records_failed_batch_validation(self):
+        """Test input validation for batched failures."""
+        with pytest.raises(ValueError, match="failures must be a list"):
+            self.processor.mark_records_failed_batch(None)
+
+        with pytest.raises(ValueError, match="must be a non-empty string"):
+            self.processor.mark_records_failed_batch([(1, "   ")])
+
+        self.mock_rpa_db.execute_query.assert_not_called()
+
+    def test_batch_methods_with_retry(self):
+        """Test retry wrappers delegate to the batch methods."""
+        self.mock_rpa_db.execute_query.return_value = [(1,)]
+
+        assert (
+            self.processor.mark_records_completed_batch_with_retry([(1, {"ok": True})])
+            == []
+        )
+        assert self.processor.mark_records_failed_batch_with_retry([(1, "error")]) == []
+        assert self.mock_rpa_db.execute_query.call_count == 2
+
+
+class TestLeaseClaiming:
+    """Test lease-based claiming, renewal and expired lease sweeping."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_rpa_db = Mock(spec=DatabaseManager)
+        self.mock_logger = Mock()
+        self.mock_rpa_db.logger = self.mock_logger
+        self.mock_rpa_db.database_name = "rpa_db"
+
+        self.processor = DistributedProcessor(rpa_db_manager=self.mock_rpa_db)
+
+    def test_claim_sets_lease_from_config(self):
+        """Test that claimed records get a lease using the configured duration."""
+        self.mock_rpa_db.execute_query.return_value = []
+
+        self.processor.claim_records_batch("survey_processor", 5)
+
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert "lease_expires_at = CURRENT_TIMESTAMP" in query
+        assert params["lease_seconds"] == self.processor.lease_seconds
+        assert self.processor.lease_seconds == self.processor.config["lease_seconds"]
+
+    def test_claim_with_explicit_lease(self):
+        """Test that an explicit lease duration overrides the configuration."""
+        self.mock_rpa_db.execute_query.return_value = []
+
+        self.processor.claim_records_batch("survey_processor", 5, lease_seconds=15)
+
+        params = self.mock_rpa_db.execute_query.call_args[0][1]
+        assert params["lease_seconds"] == 15
+
+    def test_claim_invalid_lease(self):
+        """Test lease duration validation."""
+        for invalid in (0, -5, "30", 1.5):
+            with pytest.raises(
+                ValueError, match="lease_seconds must be a positive integer"
+            ):
+                self.processor.claim_records_batch("flow", 5, lease_seconds=invalid)
+
+        self.mock_rpa_db.execute_query.assert_not_called()
+
+    def test_renew_leases_only_for_owned_processing_records(self):
+        """Test that renewal is restricted to this instance's processing records."""
+        self.mock_rpa_db.execute_query.return_value = [(1,), (3,)]
+
+        renewed = self.processor.renew_leases([1, 2, 3], lease_seconds=30)
+
+        assert renewed == [1, 3]
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert "SET lease_expires_at = CURRENT_TIMESTAMP" in query
+        assert "AND status = 'processing'" in query
+        assert "AND flow_instance_id = :instance_id" in query
+        assert params == {
+            "record_ids": [1, 2, 3],
+            "lease_seconds": 30,
+            "instance_id": self.processor.instance_id,
+        }
+
+    def test_renew_leases_validation_and_empty_list(self):
+        """Test renewal input validation and the empty-list shortcut."""
+        assert self.processor.renew_leases([]) == []
+
+        with pytest.raises(ValueError, match="record_ids must be a list"):
+            self.processor.renew_leases((1, 2))
+
+        with pytest.raises(ValueError, match="positive integers"):
+            self.processor.renew_leases([1, 0])
+
+        self.mock_rpa_db.execute_query.assert_not_called()
+
+    def test_renew_leases_database_error(self):
+        """Test that renewal failures are wrapped in RuntimeError."""
+        self.mock_rpa_db.execute_query.side_effect = Exception("connection lost")
+
+        with pytest.raises(RuntimeError, match="Failed to renew leases"):
+            self.processor.renew_leases([1])
+
+    def test_reclaim_expired_leases(self):
+        """Test that only expired leases are reclaimed, across all flows."""
+        self.mock_rpa_db.execute_query.return_value = [(4,), (9,)]
+
+        reclaimed = self.processor.reclaim_expired_leases()
+
+        assert reclaimed == 2
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert "SET status = 'pending'" in query
+        assert "lease_expires_at = NULL" in query
+        assert "retry_count = retry_count + 1" in query
+        assert "AND lease_expires_at < CURRENT_TIMESTAMP" in query
+        assert "flow_name = :flow_name" not in query
+        assert params == {}
+        self.mock_logger.warning.assert_called()
+
+    def test_reclaim_expired_leases_for_flow(self):
+        """Test sweeping a single flow."""
+        self.mock_rpa_db.execute_query.return_value = []
+
+        assert self.processor.reclaim_expired_leases("survey_processor") == 0
+
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert "AND flow_name = :flow_name" in query
+        assert params == {"flow_name": "survey_processor"}
+
+    def test_reclaim_expired_leases_errors(self):
+        """Test sweeper validation and database error handling."""
+        with pytest.raises(ValueError, match="flow_name must be a non-empty string"):
+            self.processor.reclaim_expired_leases("  ")
+
+        self.mock_rpa_db.execute_query.side_effect = Exception("timeout")
+        with pytest.raises(RuntimeError, match="Failed to reclaim expired leases"):
+            self.processor.reclaim_expired_leases()
+
+
+class TestLeaseHeartbeat:
+    """Test the LeaseHeartbeat background renewal."""
+
+    def setup_method(self):
+        """Set up a mocked processor."""
+        self.processor = Mock()
+        self.processor.lease_seconds = 60
+        self.processor.instance_id = "test-instance"
+        self.processor.logger = Mock()
+
+    def test_interval_defaults_to_third_of_lease(self):
+        """Test default renewal interval and validation."""
+        heartbeat = LeaseHeartbeat(self.processor, [1, 2])
+
+        assert heartbeat.lease_seconds == 60
+        assert heartbeat.interval_seconds == 20.0
+
+        with pytest.raises(ValueError, match="shorter than lease_seconds"):
+            LeaseHeartbeat(self.processor, [1], lease_seconds=10, interval_seconds=10)
+
+        with pytest.raises(ValueError, match="lease_seconds must be a positive"):
+            LeaseHeartbeat(self.processor, [1], lease_seconds=0)
+
+    def test_beat_drops_records_no_longer_owned(self):
+        """Test that records that could not be renewed stop being renewed."""
+        self.processor.renew_leases.return_value = [1]
+        heartbeat = LeaseHeartbeat(self.processor, [1, 2])
+
+        assert heartbeat.beat() == [1]
+
+        self.processor.renew_leases.assert_called_once_with([1, 2], 60)
+        assert heartbeat.record_ids == [1]
+        assert heartbeat.renewals == 1
+
+    def test_release_skips_acknowledged_records(self):
+        """Test that released records are not renewed."""
+        heartbeat = LeaseHeartbeat(self.processor, [1, 2, 3])
+
+        heartbeat.release([1, 3])
+        self.processor.renew_leases.return_value = [2]
+        heartbeat.beat()
+
+        self.processor.renew_leases.assert_called_once_with([2], 60)
+
+    def test_background_thread_renews_until_stopped(self):
+        """Test that the thread renews periodically and tolerates failures."""
+        self.processor.renew_leases.side_effect = [
+            Exception("transient"),
+            [1],
+            [1],
+            [1],
+            [1],
+        ]
+        heartbeat = LeaseHeartbeat(
+            self.processor, [1], lease_seconds=1, interval_seconds=0.01
+        )
+
+        with heartbeat:
+            assert heartbeat.is_running
+            deadline = time.monotonic() + 2
+            while heartbeat.renewals < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert not heartbeat.is_running
+        assert heartbeat.renewals >= 2
+        self.processor.logger.warning.assert_called()
+
+    def test_thread_exits_when_all_leases_lost(self):
+        """Test that the heartbeat ends once no records remain."""
+        self.processor.renew_leases.return_value = []
+        heartbeat = LeaseHeartbeat(
+            self.processor, [1], lease_seconds=1, interval_seconds=0.01
+        )
+
+        heartbeat.start()
+        heartbeat._thread.join(2)
+
+        assert not heartbeat.is_running
+        assert heartbeat.record_ids == []
+        heartbeat.stop()
+
+
+class TestLeaseMigration:
+    """Test the V009 lease migration."""
+
+    migration_path = "core/migrations/rpa_db/V009__Add_processing_queue_leases.sql"
+
+    def test_migration_adds_lease_column_and_index(self):
+        """Test that the lease column and sweeper index are created."""
+        with open(self.migration_path) as f:
+            content = f.read()
+
+        assert "ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP" in content
+        assert "idx_processing_queue_processing_lease" in content
+        assert "ON processing_queue(lease_expires_at)" in content
+        assert "WHERE status = 'processing';" in content
+
+
+class TestResultStorage:
+    """Test result storage in processing_results with size cap and spill-to-disk."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_rpa_db = Mock(spec=DatabaseManager)
+        self.mock_logger = Mock()
+        self.mock_rpa_db.logger = self.mock_logger
+        self.mock_rpa_db.database_name = "rpa_db"
+
+        self.processor = DistributedProcessor(rpa_db_manager=self.mock_rpa_db)
+        self.large_result = {"data": "x" * 2000}
+
+    def test_completion_keeps_payload_and_stores_result(self):
+        """Test that completion no longer overwrites the queue payload."""
+        self.mock_rpa_db.execute_query.return_value = 1
+
+        self.processor.mark_record_completed(7, {"score": 9})
+
+        query = self.mock_rpa_db.execute_query.call_args[0][0]
+        assert "payload" not in query
+        assert "WITH completed AS (" in query
+        assert "SELECT id, CAST(:result AS jsonb), :result_size, :spill_path" in query
+        assert "ON CONFLICT (queue_id) DO UPDATE" in query
+
+    def test_result_over_cap_without_spill_dir_is_rejected(self):
+        """Test that oversized results are rejected when spilling is not configured."""
+        self.processor.config["result_max_bytes"] = 1024
+        self.processor.config["result_spill_dir"] = None
+
+        with pytest.raises(ValueError, match="exceeding result_max_bytes \\(1024\\)"):
+            self.processor.mark_record_completed(7, self.large_result)
+
+        with pytest.raises(ValueError, match="Result for record 8"):
+            self.processor.mark_records_completed_batch(
+                [(7, {"ok": True}), (8, self.large_result)]
+            )
+
+        self.mock_rpa_db.execute_query.assert_not_called()
+
+    def test_result_over_cap_is_spilled_to_disk(self, tmp_path):
+        """Test that oversized results are written to the spill directory."""
+        self.processor.config["result_max_bytes"] = 1024
+        self.processor.config["result_spill_dir"] = str(tmp_path / "results")
+        self.mock_rpa_db.execute_query.return_value = 1
+
+        self.processor.mark_record_completed(7, self.large_result)
+
+        params = self.mock_rpa_db.execute_query.call_args[0][1]
+        spill_name = f"7.{self.processor.instance_id}.json"
+        spill_path = tmp_path / "results" / spill_name
+        assert params["result"] is None
+        assert params["spill_path"] == str(spill_path)
+        assert params["result_size"] > 1024
+        assert json.loads(spill_path.read_text()) == self.large_result
+        # No temporary files are left behind
+        assert [p.name for p in (tmp_path / "results").iterdir()] == [spill_name]
+
+    def test_spill_of_unowned_record_is_discarded(self, tmp_path):
+        """Test that a lost claim neither keeps nor overwrites a spilled result."""
+        self.processor.config["result_max_bytes"] = 1024
+        self.processor.config["result_spill_dir"] = str(tmp_path)
+        owner_result = tmp_path / "7.other-instance.json"
+        owner_result.write_text(json.dumps({"owner": True}))
+        self.mock_rpa_db.execute_query.return_value = 0
+
+        with pytest.raises(RuntimeError, match="not found or not in processing"):
+            self.processor.mark_record_completed(7, self.large_result)
+
+        assert [p.name for p in tmp_path.iterdir()] == [owner_result.name]
+        assert json.loads(owner_result.read_text()) == {"owner": True}
+
+    def test_batch_spills_only_oversized_results(self, tmp_path):
+        """Test that batch completion spills per record."""
+        self.processor.config["result_max_bytes"] = 1024
+        self.processor.config["result_spill_dir"] = str(tmp_path)
+        self.mock_rpa_db.execute_query.return_value = [(1,), (2,)]
+
+        unmatched = self.processor.mark_records_completed_batch(
+            [(1, {"small": True}), (2, self.large_result)]
+        )
+
+        assert unmatched == []
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert "INSERT INTO processing_results" in query
+        assert "JOIN completed ON completed.id = batch.id" in query
+        assert json.loads(params["results"][0]) == {"small": True}
+        assert params["results"][1] is None
+        spill_path = tmp_path / f"2.{self.processor.instance_id}.json"
+        assert params["spill_paths"] == [None, str(spill_path)]
+        assert params["result_sizes"][1] > 1024
+        assert spill_path.exists()
+
+    def test_batch_discards_spills_of_unmatched_records(self, tmp_path):
+        """Test that spilled results of records not updated are deleted."""
+        self.processor.config["result_max_bytes"] = 1024
+        self.processor.config["result_spill_dir"] = str(tmp_path)
+        self.mock_rpa_db.execute_query.return_value = [(1,)]
+
+        unmatched = self.processor.mark_records_completed_batch(
+            [(1, self.large_result), (2, self.large_result)]
+        )
+
+        assert unmatched == [2]
+        assert [p.name for p in tmp_path.iterdir()] == [
+            f"1.{self.processor.instance_id}.json"
+        ]
+
+    def test_get_record_result_inline(self):
+        """Test reading a result stored in the database."""
+        self.mock_rpa_db.execute_query.return_value = [({"score": 9}, None)]
+
+        assert self.processor.get_record_result(7) == {"score": 9}
+
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert "FROM processing_results" in query
+        assert params == {"record_id": 7}
+
+    def test_get_record_result_spilled(self, tmp_path):
+        """Test reading a result from the spill directory."""
+        spill_path = tmp_path / "7.json"
+        spill_path.write_text(json.dumps(self.large_result))
+        self.mock_rpa_db.execute_query.return_value = [(None, str(spill_path))]
+
+        assert self.processor.get_record_result(7) == self.large_result
+
+    def test_get_record_result_missing_and_errors(self, tmp_path):
+        """Test missing results, validation and unreadable spill files."""
+        self.mock_rpa_db.execute_query.return_value = []
+        assert self.processor.get_record_result(7) is None
+
+        with pytest.raises(ValueError, match="record_id must be a positive integer"):
+            self.processor.get_record_result(0)
+
+        self.mock_rpa_db.execute_query.return_value = [
+            (None, str(tmp_path / "missing.json"))
+        ]
+        with pytest.raises(RuntimeError, match="Failed to get result for record 7"):
+            self.processor.get_record_result(7)
+
+    def test_results_migration(self):
+        """Test the V010 processing_results migration."""
+        with open(
+            "core/migrations/rpa_db/V010__Create_processing_results_table.sql"
+        ) as f:
+            content = f.read()
+
+        assert "CREATE TABLE IF NOT EXISTS processing_results" in content
+        assert (
+            "queue_id INTEGER PRIMARY KEY REFERENCES processing_queue(id) "
+            "ON DELETE CASCADE" in content
+        )
+        assert "CHECK (result IS NOT NULL OR spill_path IS NOT NULL)" in content
+
+
+class TestPriorityQueue:
+    """Test priority-aware enqueueing and claiming."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_rpa_db = Mock(spec=DatabaseManager)
+        self.mock_logger = Mock()
+        self.mock_rpa_db.logger = self.mock_logger
+        self.mock_rpa_db.database_name = "rpa_db"
+
+        self.processor = DistributedProcessor(rpa_db_manager=self.mock_rpa_db)
+
+    def test_add_records_default_priority(self):
+        """Test that records get the default priority when none is given."""
+        self.processor.add_records_to_queue("flow", [{"payload": {"a": 1}}])
+
+        params = self.mock_rpa_db.execute_query.call_args[0][1]
+        assert params["priority"] == DEFAULT_PRIORITY
+
+    def test_add_records_with_priority_and_per_record_override(self):
+        """Test batch priority with a per-record override."""
+        self.processor.add_records_to_queue(
+            "flow",
+            [{"payload": {"a": 1}}, {"payload": {"a": 2}, "priority": 500}],
+            priority=PRIORITY_HIGH,
+        )
+
+        params = self.mock_rpa_db.execute_query.call_args[0][1]
+        assert params["priority_0"] == PRIORITY_HIGH
+        assert params["priority_1"] == 500
+
+    def test_add_records_invalid_priority(self):
+        """Test priority validation."""
+        for invalid in (-1, 1001, "high", True, 1.0):
+            with pytest.raises(ValueError, match="priority must be an integer"):
+                self.processor.add_records_to_queue(
+                    "flow", [{"payload": {}}], priority=invalid
+                )
+
+        with pytest.raises(ValueError, match="Record at index 1 'priority'"):
+            self.processor.add_records_to_queue(
+                "flow", [{"payload": {}}, {"payload": {}, "priority": -5}]
+            )
+
+        self.mock_rpa_db.execute_query.assert_not_called()
+
+    def test_claim_with_priority_aging(self):
+        """Test that aging orders by priority weighted against wait time."""
+        self.processor.config["priority_aging_seconds"] = 30
+        self.mock_rpa_db.execute_query.return_value = []
+
+        self.processor.claim_records_batch("flow", 5)
+
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert (
+            "ORDER BY priority * :aging_seconds + EXTRACT(EPOCH FROM created_at) ASC"
+            in query
+        )
+        assert params["aging_seconds"] == 30
+
+    def test_claim_without_aging_uses_strict_priority(self):
+        """Test that strict priority ordering is used when aging is disabled."""
+        self.processor.config["priority_aging_seconds"] = None
+        self.mock_rpa_db.execute_query.return_value = []
+
+        self.processor.claim_records_batch("flow", 5)
+
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert "ORDER BY priority ASC, created_at ASC" in query
+        assert "aging_seconds" not in params
+
+    def test_priority_migration(self):
+        """Test the V011 priority migration."""
+        with open(
+            "core/migrations/rpa_db/V011__Add_processing_queue_priority.sql"
+        ) as f:
+            content = f.read()
+
+        assert (
+            "ADD COLUMN IF NOT EXISTS priority INTEGER NOT NULL DEFAULT 100" in content
+        )
+        assert "ON processing_queue(flow_name, priority, created_at)" in content
+        assert "WHERE status = 'pending';" in content
+
+
+class TestStreamRecordsToQueue:
+    """Test chunked streaming enqueue via bulk_insert."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_rpa_db = Mock(spec=DatabaseManager)
+        self.mock_logger = Mock()
+        self.mock_rpa_db.logger = self.mock_logger
+        self.mock_rpa_db.database_name = "rpa_db"
+        self.mock_rpa_db.bulk_insert.side_effect = lambda table, columns, rows: len(
+            rows
+        )
+
+        self.processor = DistributedProcessor(rpa_db_manager=self.mock_rpa_db)
+
+    def test_stream_consumes_generator_in_chunks(self):
+        """Test that a generator is enqueued chunk by chunk with progress."""
+        consumed = []
+
+        def payloads():
+            for survey_id in range(5):
+                consumed.append(survey_id)
+                yield {"survey_id": survey_id}
+
+        progress = []
+        total = self.processor.stream_records_to_queue(
+            "survey_processor",
+            payloads(),
+            chunk_size=2,
+            priority=PRIORITY_HIGH,
+            progress_callback=lambda *args: progress.append(args),
+        )
+
+        assert total == 5
+        assert progress == [(1, 2, 2), (2, 2, 4), (3, 1, 5)]
+        assert self.mock_rpa_db.bulk_insert.call_count == 3
+
+        table, columns, rows = self.mock_rpa_db.bulk_insert.call_args_list[0][0]
+        assert table == "processing_queue"
+        assert columns == ["flow_name", "payload", "status", "priority"]
+        assert rows == [
+            ("survey_processor", {"survey_id": 0}, "pending", PRIORITY_HIGH),
+            ("survey_processor", {"survey_id": 1}, "pending", PRIORITY_HIGH),
+        ]
+        self.mock_rpa_db.execute_query.assert_not_called()
+
+    def test_stream_uses_configured_chunk_size(self):
+        """Test that the chunk size defaults to configuration."""
+        self.processor.config["enqueue_chunk_size"] = 3
+
+        total = self.processor.stream_records_to_queue(
+            "flow", ({"n": n} for n in range(7))
+        )
+
+        assert total == 7
+        chunk_sizes = [
+            len(call[0][2]) for call in self.mock_rpa_db.bulk_insert.call_args_list
+        ]
+        assert chunk_sizes == [3, 3, 1]
+
+    def test_stream_empty_iterable(self):
+        """Test that an empty iterable enqueues nothing."""
+        assert self.processor.stream_records_to_queue("flow", []) == 0
+        self.mock_rpa_db.bulk_insert.assert_not_called()
+
+    def test_stream_validation(self):
+        """Test parameter and payload validation."""
+        with pytest.raises(ValueError, match="flow_name must be a non-empty string"):
+            self.processor.stream_records_to_queue("", [{}])
+
+        with pytest.raises(ValueError, match="chunk_size must be a positive integer"):
+            self.processor.stream_records_to_queue("flow", [{}], chunk_size=0)
+
+        with pytest.raises(ValueError, match="priority must be an integer"):
+            self.processor.stream_records_to_queue("flow", [{}], priority=-1)
+
+        with pytest.raises(ValueError, match="Payload at index 3 must be a dictionary"):
+            self.processor.stream_records_to_queue(
+                "flow", [{}, {}, {}, "bad"], chunk_size=2
+            )
+
+    def test_stream_chunk_failure_reports_committed_records(self):
+        """Test that a failing chunk reports how many records were committed."""
+        self.mock_rpa_db.bulk_insert.side_effect = [2, Exception("disk full")]
+
+        with pytest.raises(
+            RuntimeError, match="chunk 2 .*; 2 records from earlier chunks"
+        ):
+            self.processor.stream_records_to_queue(
+                "flow", [{"n": n} for n in range(4)], chunk_size=2
+            )
+
+
+class TestIdempotentEnqueue:
+    """Test deduplicated enqueueing with ON CONFLICT DO NOTHING."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_rpa_db = Mock(spec=DatabaseManager)
+        self.mock_logger = Mock()
+        self.mock_rpa_db.logger = self.mock_logger
+        self.mock_rpa_db.database_name = "rpa_db"
+
+        self.processor = DistributedProcessor(rpa_db_manager=self.mock_rpa_db)
+
+    def test_reports_inserted_and_skipped(self):
+        """Test that conflicting keys are counted as skipped."""
+        self.mock_rpa_db.execute_query.return_value = [(1,)]
+        records = [
+            {"payload": {"survey_id": "SURV-1"}},
+            {"payload": {"survey_id": "SURV-2"}, "priority": PRIORITY_HIGH},
+        ]
+
+        counts = self.processor.add_records_to_queue_idempotent(
+            "flow", records, dedup_key="survey_id"
+        )
+
+        assert counts == {"inserted": 1, "skipped": 1}
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert (
+            "ON CONFLICT (flow_name, dedup_key) WHERE dedup_key IS NOT NULL DO NOTHING"
+            in query
+        )
+        assert "RETURNING id" in query
+        assert params["dedup_keys"] == ["SURV-1", "SURV-2"]
+        assert params["priorities"] == [DEFAULT_PRIORITY, PRIORITY_HIGH]
+        assert json.loads(params["payloads"][0]) == {"survey_id": "SURV-1"}
+
+    def test_explicit_key_and_repeats_within_call(self):
+        """Test per-record keys override the payload field and repeats are dropped."""
+        self.mock_rpa_db.execute_query.return_value = [(1,), (2,)]
+        records = [
+            {"payload": {"survey_id": 1}, "dedup_key": "custom"},
+            {"payload": {"survey_id": 2}},
+            {"payload": {"survey_id": 2}},
+        ]
+
+        counts = self.processor.add_records_to_queue_idempotent(
+            "flow", records, dedup_key="survey_id"
+        )
+
+        assert counts == {"inserted": 2, "skipped": 1}
+        params = self.mock_rpa_db.execute_query.call_args[0][1]
+        assert params["dedup_keys"] == ["custom", "2"]
+
+    def test_chunks_by_enqueue_chunk_size(self):
+        """Test that large inputs are written in several statements."""
+        self.processor.config["enqueue_chunk_size"] = 2
+        self.mock_rpa_db.execute_query.side_effect = [[(1,), (2,)], [(3,)]]
+        records = [{"payload": {"survey_id": i}} for i in range(3)]
+
+        counts = self.processor.add_records_to_queue_idempotent(
+            "flow", records, dedup_key="survey_id"
+        )
+
+        assert counts == {"inserted": 3, "skipped": 0}
+        assert self.mock_rpa_db.execute_query.call_count == 2
+
+    def test_missing_key_raises(self):
+        """Test that every record must have a deduplication key."""
+        with pytest.raises(ValueError, match="Record at index 1 has no deduplication"):
+            self.processor.add_records_to_queue_idempotent(
+                "flow",
+                [{"payload": {"survey_id": 1}}, {"payload": {}}],
+                dedup_key="survey_id",
+            )
+
+        self.mock_rpa_db.execute_query.assert_not_called()
+
+    def test_database_error(self):
+        """Test that database errors are wrapped in RuntimeError."""
+        self.mock_rpa_db.execute_query.side_effect = Exception("connection lost")
+
+        with pytest.raises(RuntimeError, match="Failed to add 1 records to queue"):
+            self.processor.add_records_to_queue_idempotent(
+                "flow", [{"payload": {}, "dedup_key": "a"}]
+            )
+
+    def test_dedup_migration(self):
+        """Test the V012 deduplication key migration."""
+        with open(
+            "core/migrations/rpa_db/V012__Add_processing_queue_dedup_key.sql"
+        ) as f:
+            content = f.read()
+
+        assert "ADD COLUMN IF NOT EXISTS dedup_key" in content
+        assert "CREATE UNIQUE INDEX IF NOT EXISTS" in content
+        assert "ON processing_queue(flow_name, dedup_key)" in content
+        assert "WHERE dedup_key IS NOT NULL;" in content
+
+
 class TestAddRecordsToQueue:
     """Test add_records_to_queue method functionality."""
 
@@ -1035,9 +1831,9 @@ class TestAddRecordsToQueue:
 
         # Verify SQL query structure for single record
         assert "INSERT INTO processing_queue" in query
-        assert "(flow_name, payload, status, created_at, updated_at)" in query
+        assert "(flow_name, payload, status, created_at, updated_at, priority)" in query
         assert (
-            "VALUES (:flow_name, :payload, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            "VALUES (:flow_name, :payload, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, :priority)"  # noqa: E501
             in query
         )
 
@@ -1079,18 +1875,18 @@ class TestAddRecordsToQueue:
 
         # Verify SQL query structure for batch insertion
         assert "INSERT INTO processing_queue" in query
-        assert "(flow_name, payload, status, created_at, updated_at)" in query
+        assert "(flow_name, payload, status, created_at, updated_at, priority)" in query
         assert "VALUES" in query
         assert (
-            "(:flow_name, :payload_0, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            "(:flow_name, :payload_0, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, :priority_0)"  # noqa: E501
             in query
         )
         assert (
-            "(:flow_name, :payload_1, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            "(:flow_name, :payload_1, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, :priority_1)"  # noqa: E501
             in query
         )
         assert (
-            "(:flow_name, :payload_2, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            "(:flow_name, :payload_2, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, :priority_2)"  # noqa: E501
             in query
         )
 
@@ -1336,9 +2132,9 @@ class TestGetQueueStatus:
         query = call_args[0][0]
         params = call_args[0][1]
 
-        # Verify SQL query structure
-        assert "SELECT status, COUNT(*) as count" in query
-        assert "FROM processing_queue" in query
+        # Verify SQL query structure (reads the trigger-maintained counters)
+        assert "SELECT status, CAST(SUM(record_count) AS BIGINT) as count" in query
+        assert "FROM processing_queue_stats" in query
         assert "WHERE flow_name = :flow_name" in query
         assert "GROUP BY status" in query
 
@@ -1408,7 +2204,8 @@ class TestGetQueueStatus:
         first_call = self.mock_rpa_db.execute_query.call_args_list[0]
         first_query = first_call[0][0]
         first_params = first_call[0][1]
-        assert "SELECT status, COUNT(*) as count" in first_query
+        assert "CAST(SUM(record_count) AS BIGINT) as count" in first_query
+        assert "FROM processing_queue_stats" in first_query
         assert "WHERE flow_name" not in first_query  # No WHERE clause for overall
         assert first_params == {}
 
@@ -1416,8 +2213,10 @@ class TestGetQueueStatus:
         second_call = self.mock_rpa_db.execute_query.call_args_list[1]
         second_query = second_call[0][0]
         second_params = second_call[0][1]
-        assert "SELECT flow_name, status, COUNT(*) as count" in second_query
+        assert "SELECT flow_name, status, CAST(SUM(record_count)" in second_query
+        assert "FROM processing_queue_stats" in second_query
         assert "GROUP BY flow_name, status" in second_query
+        assert "HAVING CAST(SUM(record_count) AS BIGINT) > 0" in second_query
         assert "ORDER BY flow_name, status" in second_query
         assert second_params == {}
 
@@ -1580,6 +2379,177 @@ class TestGetQueueStatus:
         }
         assert result == expected_result
 
+    def test_get_queue_status_exact_counts_queue_table(self):
+        """Test that exact=True counts processing_queue directly."""
+        self.mock_rpa_db.execute_query.side_effect = [
+            [("pending", 4)],
+            [("survey_processor", "pending", 4)],
+        ]
+
+        result = self.processor.get_queue_status(exact=True)
+
+        assert result["pending_records"] == 4
+        assert result["by_flow"]["survey_processor"]["total"] == 4
+        for call in self.mock_rpa_db.execute_query.call_args_list:
+            query = call[0][0]
+            assert "COUNT(*) as count" in query
+            assert "FROM processing_queue\n" in query
+            assert "processing_queue_stats" not in query
+
+
+class TestQueueStats:
+    """Test the trigger-maintained processing_queue_stats counters."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_rpa_db = Mock(spec=DatabaseManager)
+        self.mock_logger = Mock()
+        self.mock_rpa_db.logger = self.mock_logger
+        self.mock_rpa_db.database_name = "rpa_db"
+
+        self.processor = DistributedProcessor(rpa_db_manager=self.mock_rpa_db)
+
+    def test_refresh_queue_stats(self):
+        """Test that refresh returns the number of corrected counters."""
+        self.mock_rpa_db.execute_query.return_value = [(3,)]
+
+        assert self.processor.refresh_queue_stats() == 3
+        self.mock_rpa_db.execute_query.assert_called_once_with(
+            "SELECT refresh_processing_queue_stats()", {}
+        )
+
+    def test_refresh_queue_stats_database_error(self):
+        """Test that refresh failures are wrapped in RuntimeError."""
+        self.mock_rpa_db.execute_query.side_effect = Exception("lock timeout")
+
+        with pytest.raises(RuntimeError, match="Failed to refresh processing queue"):
+            self.processor.refresh_queue_stats()
+
+    def test_stats_migration(self):
+        """Test the V013 counters migration."""
+        with open(
+            "core/migrations/rpa_db/V013__Create_processing_queue_stats.sql"
+        ) as f:
+            content = f.read()
+
+        assert "CREATE TABLE IF NOT EXISTS processing_queue_stats" in content
+        assert "PRIMARY KEY (flow_name, status)" in content
+        for event in ("INSERT", "UPDATE", "DELETE", "TRUNCATE"):
+            assert f"AFTER {event} ON processing_queue" in content
+        assert content.count("FOR EACH STATEMENT") == 4
+        assert "SELECT refresh_processing_queue_stats();" in content
+
+
+class TestBatchSizeState:
+    """Test adaptive batch sizers and their persisted state."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_rpa_db = Mock(spec=DatabaseManager)
+        self.mock_logger = Mock()
+        self.mock_rpa_db.logger = self.mock_logger
+        self.mock_rpa_db.database_name = "rpa_db"
+
+        self.processor = DistributedProcessor(rpa_db_manager=self.mock_rpa_db)
+        self.processor.config.update(
+            {
+                "default_batch_size": 100,
+                "adaptive_batch_min_size": 10,
+                "adaptive_batch_max_size": 500,
+                "adaptive_batch_target_seconds": 60,
+                "instance_class": "worker-large",
+            }
+        )
+
+    def test_get_batch_sizer_uses_config(self):
+        """Test that the sizer is configured from the distributed config."""
+        self.mock_rpa_db.execute_query.return_value = []
+
+        sizer = self.processor.get_batch_sizer("survey_processor")
+
+        assert sizer.batch_size == 100
+        assert sizer.min_batch_size == 10
+        assert sizer.max_batch_size == 500
+        assert sizer.target_batch_seconds == 60.0
+        assert sizer.instance_class == "worker-large"
+
+    def test_get_batch_sizer_restores_once_per_flow(self):
+        """Test that one sizer per flow is shared and restored once."""
+        self.mock_rpa_db.execute_query.return_value = []
+
+        sizer = self.processor.get_batch_sizer("survey_processor")
+
+        assert self.processor.get_batch_sizer("survey_processor") is sizer
+        assert self.processor.get_batch_sizer("order_processor") is not sizer
+        assert self.mock_rpa_db.execute_query.call_count == 2
+
+    def test_load_batch_size_state(self):
+        """Test that a stored row is returned as a state dictionary."""
+        self.mock_rpa_db.execute_query.return_value = [(250, 0.12, 0.05, 0.0, 40)]
+
+        state = self.processor.load_batch_size_state("survey_processor", "4cpu")
+
+        assert state == {
+            "batch_size": 250,
+            "per_record_seconds": 0.12,
+            "claim_seconds": 0.05,
+            "failure_rate": 0.0,
+            "batches_observed": 40,
+        }
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert "FROM processing_batch_sizes" in query
+        assert params == {"flow_name": "survey_processor", "instance_class": "4cpu"}
+
+    def test_load_batch_size_state_missing(self):
+        """Test that a flow without learned state returns None."""
+        self.mock_rpa_db.execute_query.return_value = []
+
+        assert self.processor.load_batch_size_state("survey_processor", "4cpu") is None
+
+    def test_save_batch_size_state_upserts(self):
+        """Test that the learned state is upserted per flow and instance class."""
+        state = {
+            "batch_size": 200,
+            "per_record_seconds": 0.1,
+            "claim_seconds": 0.02,
+            "failure_rate": 0.0,
+            "batches_observed": 3,
+        }
+
+        self.processor.save_batch_size_state("survey_processor", "4cpu", state)
+
+        query, params = self.mock_rpa_db.execute_query.call_args[0]
+        assert "INSERT INTO processing_batch_sizes" in query
+        assert "ON CONFLICT (flow_name, instance_class) DO UPDATE" in query
+        assert params == {
+            "flow_name": "survey_processor",
+            "instance_class": "4cpu",
+            **state,
+        }
+
+    def test_batch_size_state_database_error(self):
+        """Test that state failures are wrapped in RuntimeError."""
+        self.mock_rpa_db.execute_query.side_effect = Exception("relation missing")
+
+        with pytest.raises(RuntimeError, match="Failed to load batch size state"):
+            self.processor.load_batch_size_state("survey_processor", "4cpu")
+
+        with pytest.raises(RuntimeError, match="Failed to save batch size state"):
+            self.processor.save_batch_size_state(
+                "survey_processor", "4cpu", {"batch_size": 1}
+            )
+
+    def test_batch_sizes_migration(self):
+        """Test the V014 batch size state migration."""
+        with open(
+            "core/migrations/rpa_db/V014__Create_processing_batch_sizes.sql"
+        ) as f:
+            content = f.read()
+
+        assert "CREATE TABLE IF NOT EXISTS processing_batch_sizes" in content
+        assert "PRIMARY KEY (flow_name, instance_class)" in content
+        assert "CHECK (batch_size > 0)" in content
+
 
 class TestCleanupOrphanedRecords:
     """Test cleanup_orphaned_records method functionality."""
@@ -1620,6 +2590,11 @@ class TestCleanupOrphanedRecords:
         assert "updated_at = CURRENT_TIMESTAMP" in query
         assert "WHERE status = 'processing'" in query
         assert "claimed_at < CURRENT_TIMESTAMP - INTERVAL '1 hours'" in query
+        # Records with a live lease still belong to their (healthy) owner
+        assert (
+            "(lease_expires_at IS NULL OR lease_expires_at < CURRENT_TIMESTAMP)"
+            in query
+        )
 
         # Verify return_count=True was passed
         assert kwargs.get("return_count") is True
@@ -3144,6 +4119,169 @@ class TestMultiDatabaseProcessing:
         # Verify database was called
         self.mock_rpa_db.execute_query.assert_called_once()
 
+    @staticmethod
+    def _source_row(survey_id, rating=8.0):
+        return (
+            survey_id,
+            f"CUST-{survey_id}",
+            {"overall_satisfaction": rating},
+            "2024-01-15 10:30:00",
+            "Customer Satisfaction",
+        )
+
+    def test_process_survey_batch_success(self):
+        """Test one source query and one bulk insert for a whole batch."""
+        self.mock_source_db.execute_query.return_value = [
+            self._source_row("SURV-002", 6.0),
+            self._source_row("SURV-001"),
+        ]
+        self.mock_rpa_db.bulk_insert.return_value = 2
+
+        outcomes = self.processor.process_survey_batch(
+            [
+                {"survey_id": "SURV-001", "customer_name": "Alice Johnson"},
+                {"survey_id": "SURV-404"},
+                {"survey_id": "SURV-002"},
+            ]
+        )
+
+        assert [outcome["status"] for outcome in outcomes] == [
+            "completed",
+            "failed",
+            "completed",
+        ]
+        assert outcomes[0]["result"]["satisfaction_score"] == 8.0
+        assert outcomes[0]["result"]["customer_name"] == "Alice Johnson"
+        assert outcomes[2]["result"]["satisfaction_score"] == 6.0
+        assert "Survey SURV-404 not found" in outcomes[1]["error"]
+
+        self.mock_source_db.execute_query.assert_called_once()
+        query, params = self.mock_source_db.execute_query.call_args[0]
+        assert "WHERE survey_id IN (:survey_id_0, :survey_id_1, :survey_id_2)" in query
+        assert params == {
+            "survey_id_0": "SURV-001",
+            "survey_id_1": "SURV-404",
+            "survey_id_2": "SURV-002",
+        }
+
+        self.mock_rpa_db.bulk_insert.assert_called_once()
+        table, columns, rows = self.mock_rpa_db.bulk_insert.call_args[0]
+        assert table == "processed_surveys"
+        assert columns[0] == "survey_id"
+        assert [row[0] for row in rows] == ["SURV-001", "SURV-002"]
+        self.mock_rpa_db.execute_query.assert_not_called()
+
+    def test_process_survey_batch_isolates_failed_source_chunk(self):
+        """Test that source lookups are chunked and a failed chunk is isolated."""
+        self.mock_source_db.execute_query.side_effect = [
+            Exception("deadlock victim"),
+            [self._source_row("SURV-003")],
+        ]
+
+        with patch("core.distributed.SOURCE_LOOKUP_CHUNK_SIZE", 2):
+            outcomes = self.processor.process_survey_batch(
+                [
+                    {"survey_id": "SURV-001"},
+                    {"survey_id": "SURV-002"},
+                    {"survey_id": "SURV-003"},
+                ]
+            )
+
+        assert self.mock_source_db.execute_query.call_count == 2
+        assert [outcome["status"] for outcome in outcomes] == [
+            "failed",
+            "failed",
+            "completed",
+        ]
+        assert "deadlock victim" in outcomes[0]["error"]
+
+    def test_process_survey_batch_falls_back_to_row_inserts(self):
+        """Test that a failed bulk insert only fails the rows that cannot be stored."""
+        self.mock_source_db.execute_query.return_value = [
+            self._source_row("SURV-001"),
+            self._source_row("SURV-002"),
+        ]
+        self.mock_rpa_db.bulk_insert.side_effect = RuntimeError("value too long")
+        self.mock_rpa_db.execute_query.side_effect = [None, Exception("value too long")]
+
+        outcomes = self.processor.process_survey_batch(
+            [{"survey_id": "SURV-001"}, {"survey_id": "SURV-002"}]
+        )
+
+        assert outcomes[0]["status"] == "completed"
+        assert outcomes[1]["status"] == "failed"
+        assert "Failed to store survey results for SURV-002" in outcomes[1]["error"]
+        assert self.mock_rpa_db.execute_query.call_count == 2
+
+    def test_process_survey_batch_invalid_payloads(self):
+        """Test that invalid payloads fail individually without a source lookup."""
+        outcomes = self.processor.process_survey_batch(
+            [{"customer_id": "CUST-001"}, {"survey_id": ""}]
+        )
+
+        assert [outcome["status"] for outcome in outcomes] == ["failed", "failed"]
+        assert "must contain 'survey_id'" in outcomes[0]["error"]
+        self.mock_source_db.execute_query.assert_not_called()
+        self.mock_rpa_db.bulk_insert.assert_not_called()
+
+        processor = DistributedProcessor(rpa_db_manager=self.mock_rpa_db)
+        with pytest.raises(TypeError, match="source_db_manager is required"):
+            processor.process_survey_batch([{"survey_id": "SURV-001"}])
+
+    def _cached_processor(self):
+        config_manager = Mock()
+        config_manager.get_distributed_config.return_value = {
+            "source_cache_enabled": True,
+            "source_cache_max_entries": 100,
+            "source_cache_ttl_seconds": 60,
+        }
+        return DistributedProcessor(
+            rpa_db_manager=self.mock_rpa_db,
+            source_db_manager=self.mock_source_db,
+            config_manager=config_manager,
+        )
+
+    def test_source_cache_disabled_by_default(self):
+        """Test that source lookups are not cached unless enabled."""
+        assert self.processor.source_cache is None
+        assert self.processor.get_source_cache_stats() is None
+        assert self.processor.invalidate_source_survey("SURV-001") is False
+
+    def test_source_cache_serves_repeated_lookups(self):
+        """Test that a cached survey is not read from the source database again."""
+        processor = self._cached_processor()
+        self.mock_source_db.execute_query.return_value = [self._source_row("SURV-001")]
+
+        first = processor._retrieve_source_survey_data("SURV-001")
+        second = processor._retrieve_source_survey_data("SURV-001")
+
+        assert first == second
+        self.mock_source_db.execute_query.assert_called_once()
+        stats = processor.get_source_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+        assert processor.invalidate_source_survey("SURV-001") is True
+        processor._retrieve_source_survey_data("SURV-001")
+        assert self.mock_source_db.execute_query.call_count == 2
+
+    def test_source_cache_batch_queries_only_misses(self):
+        """Test that batch lookups skip cached surveys."""
+        processor = self._cached_processor()
+        self.mock_source_db.execute_query.return_value = [self._source_row("SURV-001")]
+        processor._retrieve_source_survey_data("SURV-001")
+        self.mock_source_db.execute_query.return_value = [self._source_row("SURV-002")]
+
+        source_data, source_errors = processor._retrieve_source_survey_batch(
+            ["SURV-001", "SURV-002"]
+        )
+
+        assert set(source_data) == {"SURV-001", "SURV-002"}
+        assert source_errors == {}
+        _query, params = self.mock_source_db.execute_query.call_args[0]
+        assert params == {"survey_id_0": "SURV-002"}
+        assert processor.source_cache.get("SURV-002") is not None
+
 
 class TestMultiDatabaseIntegration:
     """Integration tests for multi-database processing with test databases."""
@@ -14,6 +14,7 @@ Test Categories:
 """
 
 import concurrent.futures
+import json
 import random
 import time
 from datetime import datetime, timedelta
@@ -93,7 +94,7 @@ class TestDistributedProcessorComprehensive:
         call_args = self.mock_rpa_db.execute_query.call_args
         query = call_args[0][0]
         assert "FOR UPDATE SKIP LOCKED" in query
-        assert "ORDER BY created_at ASC" in query
+        assert "ORDER BY priority ASC, created_at ASC" in query
 
     def test_mark_record_completed_comprehensive(self):
         """Test comprehensive record completion scenarios."""
@@ -110,7 +111,7 @@ class TestDistributedProcessorComprehensive:
 
         assert "SET status = 'completed'" in query
         assert params["record_id"] == 123
-        assert params["result"] == result
+        assert json.loads(params["result"]) == result
 
     def test_mark_record_failed_comprehensive(self):
         """Test comprehensive record failure scenarios."""
@@ -412,7 +413,7 @@ class TestConcurrentProcessing:
                 "UPDATE processing_queue" in query and "FOR UPDATE SKIP LOCKED" in query
             ):
                 return [(1, {"data": "test"}, 0, datetime.now())]  # Claim operation
-            elif "SELECT status, COUNT(*)" in query:
+            elif "SELECT status," in query:
                 return [("pending", 10), ("processing", 5)]  # Status operation
             else:
                 return 1  # Other operations
@@ -401,7 +401,7 @@ class TestConcurrentQueueOperations:
 
         # Mock status responses
         def mock_status_query(query, params, **kwargs):
-            if "SELECT status, COUNT(*)" in query:
+            if "SELECT status," in query:
                 return [
                     ("pending", random.randint(10, 50)),
                     ("processing", random.randint(1, 10)),
@@ -444,7 +444,7 @@ class TestConcurrentQueueOperations:
                 elif "FOR UPDATE SKIP LOCKED" in query:
                     operations.append("claim")
                     return [(1, {"data": "test"}, 0, datetime.now())]
-                elif "SELECT status, COUNT(*)" in query:
+                elif "SELECT status," in query:
                     operations.append("status")
                     return [("pending", 10), ("processing", 2)]
                 elif "SET status = 'completed'" in query:
@@ -226,6 +226,36 @@ class TestDistributedProcessingConfigSimple:
             ):
                 config_manager._validate_distributed_config(config)
 
+    @pytest.mark.slow
+    def test_validate_distributed_config_adaptive_batch(self):
+        """Test adaptive batch size bounds and target validation."""
+        config_manager = ConfigManager()
+        base_config = {
+            "default_batch_size": 100,
+            "cleanup_timeout_hours": 1,
+            "max_retries": 3,
+            "health_check_interval": 300,
+            "required_databases": ["rpa_db"],
+            "adaptive_batch_min_size": 1,
+            "adaptive_batch_max_size": 1000,
+            "adaptive_batch_target_seconds": 30,
+        }
+
+        for bounds in [(1, 1001), (200, 100)]:
+            config = dict(base_config)
+            config["adaptive_batch_min_size"], config["adaptive_batch_max_size"] = (
+                bounds
+            )
+            with pytest.raises(ValueError, match="adaptive batch size bounds"):
+                config_manager._validate_distributed_config(config)
+
+        config = dict(base_config, adaptive_batch_target_seconds=3601)
+        with pytest.raises(
+            ValueError,
+            match="adaptive_batch_target_seconds must be between 1 and 3600",
+        ):
+            config_manager._validate_distributed_config(config)
+
     @pytest.mark.slow
     def test_configuration_type_conversion_edge_cases(self):
         """Test edge cases in configuration type conversion."""
@@ -261,3 +291,99 @@ class TestDistributedProcessingConfigSimple:
 
             assert result["valid"] is False
             assert len(result["errors"]) > 0
+
+    def test_get_optional_int_config(self):
+        """Test optional integer configuration values."""
+        config_manager = ConfigManager()
+
+        # Unset and empty values mean "not configured"
+        with patch.object(config_manager, "get_config", return_value=None):
+            assert config_manager._get_optional_int_config("TEST_KEY") is None
+
+        with patch.object(config_manager, "get_config", return_value="  "):
+            assert config_manager._get_optional_int_config("TEST_KEY") is None
+
+        with patch.object(config_manager, "get_config", return_value="4096"):
+            assert config_manager._get_optional_int_config("TEST_KEY") == 4096
+
+        with patch.object(config_manager, "get_config", return_value="-1"):
+            with pytest.raises(ValueError, match="must be positive"):
+                config_manager._get_optional_int_config("TEST_KEY")
+
+    def test_validate_distributed_config_result_max_bytes(self):
+        """Test result size cap validation."""
+        config_manager = ConfigManager()
+        config = {
+            "default_batch_size": 100,
+            "cleanup_timeout_hours": 1,
+            "max_retries": 3,
+            "health_check_interval": 300,
+            "required_databases": [],
+            "result_max_bytes": 512,
+        }
+
+        with pytest.raises(ValueError, match="result_max_bytes must be at least 1024"):
+            config_manager._validate_distributed_config(config)
+
+        # No cap configured is valid
+        config["result_max_bytes"] = None
+        config_manager._validate_distributed_config(config)
+
+    def test_validate_distributed_config_source_cache(self):
+        """Test source cache bound validation."""
+        config_manager = ConfigManager()
+        config = {
+            "default_batch_size": 100,
+            "cleanup_timeout_hours": 1,
+            "max_retries": 3,
+            "health_check_interval": 300,
+            "required_databases": [],
+            "source_cache_max_entries": 10000,
+            "source_cache_ttl_seconds": 300,
+        }
+        config_manager._validate_distributed_config(config)
+
+        config["source_cache_max_entries"] = 2000000
+        with pytest.raises(ValueError, match="source_cache_max_entries must be"):
+            config_manager._validate_distributed_config(config)
+
+        config["source_cache_max_entries"] = 10000
+        config["source_cache_ttl_seconds"] = 90000
+        with pytest.raises(ValueError, match="source_cache_ttl_seconds must be"):
+            config_manager._validate_distributed_config(config)
+
+    def test_validate_distributed_config_process_pool_workers(self):
+        """Test process pool size validation."""
+        config_manager = ConfigManager()
+        config = {
+            "default_batch_size": 100,
+            "cleanup_timeout_hours": 1,
+            "max_retries": 3,
+            "health_check_interval": 300,
+            "required_databases": [],
+            "process_pool_workers": 512,
+        }
+
+        with pytest.raises(ValueError, match="process_pool_workers must be between"):
+            config_manager._validate_distributed_config(config)
+
+        # Sized from the CPU quota when not configured
+        config["process_pool_workers"] = None
+        config_manager._validate_distributed_config(config)
+
+    def test_validate_distributed_config_task_chunk_size(self):
+        """Test records per task validation."""
+        config_manager = ConfigManager()
+        config = {
+            "default_batch_size": 100,
+            "cleanup_timeout_hours": 1,
+            "max_retries": 3,
+            "health_check_interval": 300,
+            "required_databases": [],
+            "task_chunk_size": 50,
+        }
+        config_manager._validate_distributed_config(config)
+
+        config["task_chunk_size"] = 5000
+        with pytest.raises(ValueError, match="task_chunk_size must be between"):
+            config_manager._validate_distributed_config(config)
@@ -0,0 +1,375 @@
+"""
+Unit tests for the LISTEN/NOTIFY driven distributed worker.
+
+Tests the notification listener and worker loop with mocked database
+connections and DistributedProcessor instances.
+"""
+
+from collections import namedtuple
+from unittest.mock import MagicMock, Mock, PropertyMock, patch
+
+import pytest
+
+from core.distributed_worker import (
+    QUEUE_NOTIFY_CHANNEL,
+    DistributedWorker,
+    QueueNotificationListener,
+)
+
+Notify = namedtuple("Notify", ["pid", "channel", "payload"])
+
+
+def _make_listener():
+    """Create a listener with a mocked driver connection."""
+    mock_db = Mock()
+    mock_db.logger = Mock()
+
+    driver_connection = MagicMock()
+    driver_connection.notifies = []
+    mock_db.db_engine.raw_connection.return_value.driver_connection = driver_connection
+
+    return QueueNotificationListener(mock_db), mock_db, driver_connection
+
+
+class TestQueueNotificationListener:
+    """Test QueueNotificationListener behavior."""
+
+    def test_start_listens_on_detached_connection(self):
+        """Test that start detaches the pooled connection and issues LISTEN."""
+        listener, mock_db, driver_connection = _make_listener()
+
+        listener.start()
+
+        raw_connection = mock_db.db_engine.raw_connection.return_value
+        raw_connection.detach.assert_called_once()
+        assert driver_connection.autocommit is True
+        cursor = driver_connection.cursor.return_value.__enter__.return_value
+        cursor.execute.assert_called_once_with(f'LISTEN "{QUEUE_NOTIFY_CHANNEL}"')
+        assert listener.is_listening
+
+    def test_wait_returns_true_for_matching_notification(self):
+        """Test that a notification for the flow wakes the listener."""
+        listener, _mock_db, driver_connection = _make_listener()
+
+        def deliver():
+            driver_connection.notifies.append(
+                Notify(1, QUEUE_NOTIFY_CHANNEL, "survey_processor")
+            )
+
+        driver_connection.poll.side_effect = deliver
+
+        with patch(
+            "core.distributed_worker.select.select",
+            return_value=([driver_connection], [], []),
+        ):
+            assert listener.wait("survey_processor", timeout=5) is True
+
+        assert driver_connection.notifies == []
+
+    def test_wait_ignores_other_flows_until_timeout(self):
+        """Test that notifications for other flows do not wake the listener."""
+        listener, _mock_db, driver_connection = _make_listener()
+        driver_connection.notifies.append(
+            Notify(1, QUEUE_NOTIFY_CHANNEL, "order_processor")
+        )
+
+        with patch("core.distributed_worker.select.select", return_value=([], [], [])):
+            assert listener.wait("survey_processor", timeout=0) is False
+
+        assert driver_connection.notifies == []
+
+    def test_wait_without_flow_accepts_any_notification(self):
+        """Test that flow_name=None matches any notification."""
+        listener, _mock_db, driver_connection = _make_listener()
+        driver_connection.notifies.append(
+            Notify(1, QUEUE_NOTIFY_CHANNEL, "order_processor")
+        )
+
+        assert listener.wait(None, timeout=0) is True
+
+    def test_wait_falls_back_on_connection_error(self):
+        """Test that connection failures degrade to polling instead of raising."""
+        listener, mock_db, _driver_connection = _make_listener()
+        mock_db.db_engine.raw_connection.side_effect = Exception("refused")
+
+        assert listener.wait("survey_processor", timeout=1) is False
+        assert not listener.is_listening
+        mock_db.logger.warning.assert_called_once()
+
+    def test_reconnect_backs_off_after_failure(self):
+        """Test that a failed connection is not reopened until the retry delay."""
+        listener, mock_db, _driver_connection = _make_listener()
+        mock_db.db_engine.raw_connection.side_effect = Exception("refused")
+
+        with patch("core.distributed_worker.time.monotonic", return_value=100.0):
+            assert listener.wait("survey_processor", timeout=1) is False
+            assert listener.wait("survey_processor", timeout=1) is False
+        assert mock_db.db_engine.raw_connection.call_count == 1
+
+        # Retry after the initial delay, then wait twice as long
+        with patch("core.distributed_worker.time.monotonic", return_value=101.0):
+            assert listener.wait("survey_processor", timeout=0) is False
+        assert mock_db.db_engine.raw_connection.call_count == 2
+        with patch("core.distributed_worker.time.monotonic", return_value=102.5):
+            assert listener.wait("survey_processor", timeout=0) is False
+        assert mock_db.db_engine.raw_connection.call_count == 2
+
+        mock_db.db_engine.raw_connection.side_effect = None
+        with patch("core.distributed_worker.time.monotonic", return_value=103.0):
+            listener.start()
+        assert listener.is_listening
+
+    def test_close(self):
+        """Test that close releases the dedicated connection."""
+        listener, _mock_db, driver_connection = _make_listener()
+
+        with listener:
+            assert listener.is_listening
+
+        driver_connection.close.assert_called_once()
+        assert not listener.is_listening
+
+
+class TestDistributedWorker:
+    """Test the DistributedWorker loop."""
+
+    def setup_method(self):
+        """Set up a mocked processor."""
+        self.processor = Mock()
+        self.processor.config = {"default_batch_size": 2, "worker_poll_interval": 30}
+        self.processor.logger = Mock()
+        self.processor.mark_records_completed_batch_with_retry.return_value = []
+        self.processor.mark_records_failed_batch_with_retry.return_value = []
+        self.processor.reclaim_expired_leases.return_value = 0
+
+    def test_init_validation(self):
+        """Test worker parameter validation."""
+        with pytest.raises(ValueError, match="flow_name must be a non-empty string"):
+            DistributedWorker(self.processor, "", lambda payload: {})
+
+        with pytest.raises(ValueError, match="business_logic_func must be callable"):
+            DistributedWorker(self.processor, "flow", None)
+
+        with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+            DistributedWorker(self.processor, "flow", lambda payload: {}, batch_size=0)
+
+        with pytest.raises(ValueError, match="poll_interval must be a positive"):
+            DistributedWorker(
+                self.processor, "flow", lambda payload: {}, poll_interval=0
+            )
+
+    def test_uses_config_defaults(self):
+        """Test batch size and poll interval default to configuration."""
+        worker = DistributedWorker(self.processor, "flow", lambda payload: {})
+
+        assert worker.batch_size == 2
+        assert worker.poll_interval == 30.0
+
+    def test_process_batch_acknowledges_in_bulk(self):
+        """Test that a batch is acknowledged with one call per outcome."""
+
+        def logic(payload):
+            if payload["fail"]:
+                raise ValueError("bad record")
+            return {"ok": True}
+
+        worker = DistributedWorker(
+            self.processor, "flow", logic, use_notifications=False
+        )
+        self.processor.mark_records_completed_batch_with_retry.return_value = [2]
+
+        totals = worker.process_batch(
+            [
+                {"id": 1, "payload": {"fail": False}},
+                {"id": 2, "payload": {"fail": False}},
+                {"id": 3, "payload": {"fail": True}},
+            ]
+        )
+
+        self.processor.mark_records_completed_batch_with_retry.assert_called_once_with(
+            [(1, {"ok": True}), (2, {"ok": True})]
+        )
+        self.processor.mark_records_failed_batch_with_retry.assert_called_once_with(
+            [(3, "bad record")]
+        )
+        assert totals == {"completed": 1, "failed": 2}
+
+        # Leases are renewed until the acknowledgement has been written
+        self.processor.start_lease_heartbeat.assert_called_once_with([1, 2, 3])
+        self.processor.start_lease_heartbeat.return_value.stop.assert_called_once()
+
+    def test_process_batch_stops_heartbeat_on_ack_failure(self):
+        """Test that the heartbeat is stopped even if acknowledgement fails."""
+        worker = DistributedWorker(
+            self.processor, "flow", lambda payload: {}, use_notifications=False
+        )
+        self.processor.mark_records_completed_batch_with_retry.side_effect = (
+            RuntimeError("database unavailable")
+        )
+
+        with pytest.raises(RuntimeError, match="database unavailable"):
+            worker.process_batch([{"id": 1, "payload": {}}])
+
+        self.processor.start_lease_heartbeat.return_value.stop.assert_called_once()
+
+    def test_idle_worker_claims_reclaimed_records_without_waiting(self):
+        """Test that records freed by the lease sweeper are claimed immediately."""
+        self.processor.claim_records_batch_with_retry.side_effect = [
+            [],
+            [{"id": 7, "payload": {}}],
+        ]
+        self.processor.reclaim_expired_leases.return_value = 1
+        worker = DistributedWorker(self.processor, "flow", lambda payload: {})
+        worker.listener = Mock()
+
+        totals = worker.run(max_records=1)
+
+        self.processor.reclaim_expired_leases.assert_called_once_with("flow")
+        worker.listener.wait.assert_not_called()
+        assert totals["records_completed"] == 1
+
+    def test_run_drains_queue_until_record_budget(self):
+        """Test that the worker keeps claiming while work is available."""
+        self.processor.claim_records_batch_with_retry.side_effect = [
+            [{"id": 1, "payload": {}}, {"id": 2, "payload": {}}],
+            [{"id": 3, "payload": {}}],
+        ]
+        worker = DistributedWorker(
+            self.processor, "flow", lambda payload: {}, use_notifications=False
+        )
+
+        totals = worker.run(max_records=3)
+
+        assert totals["batches"] == 2
+        assert totals["records_claimed"] == 3
+        assert totals["records_completed"] == 3
+        # Second claim is capped to the remaining record budget
+        assert self.processor.claim_records_batch_with_retry.call_args_list[1][0] == (
+            "flow",
+            1,
+        )
+
+    def test_run_waits_on_notifications_when_idle(self):
+        """Test that an idle worker blocks on LISTEN and claims after a wakeup."""
+        self.processor.claim_records_batch_with_retry.side_effect = [
+            [],
+            [{"id": 1, "payload": {}}],
+        ]
+        worker = DistributedWorker(self.processor, "flow", lambda payload: {})
+        worker.listener = Mock()
+        worker.listener.wait.return_value = True
+
+        totals = worker.run(max_records=1)
+
+        worker.listener.wait.assert_called_once()
+        assert worker.listener.wait.call_args[0][0] == "flow"
+        assert totals["wakeups_notified"] == 1
+        assert totals["records_completed"] == 1
+        worker.listener.close.assert_called_once()
+
+    def test_wait_sleeps_while_listener_is_disconnected(self):
+        """Test that a failed listener does not turn waiting into a busy loop."""
+        worker = DistributedWorker(self.processor, "flow", lambda payload: {})
+        worker.listener = Mock()
+        worker.listener.wait.return_value = False
+        worker.listener.is_listening = False
+
+        with patch.object(worker._stop_event, "wait") as stop_wait:
+            stop_wait.side_effect = lambda timeout: worker.stop()
+            assert worker._wait_for_work(5) is False
+
+        worker.listener.wait.assert_called_once()
+        stop_wait.assert_called_once()
+        assert stop_wait.call_args[0][0] == pytest.approx(1.0)
+
+    def test_run_stops_at_runtime_budget(self):
+        """Test that an idle worker exits once the runtime budget is spent."""
+        self.processor.claim_records_batch_with_retry.return_value = []
+        worker = DistributedWorker(
+            self.processor,
+            "flow",
+            lambda payload: {},
+            poll_interval=0.01,
+            use_notifications=False,
+        )
+
+        totals = worker.run(max_runtime_seconds=0.05)
+
+        assert totals["records_claimed"] == 0
+        assert totals["wakeups_polled"] >= 1
+
+    def test_stop_interrupts_run(self):
+        """Test that stop() ends the loop."""
+        worker = DistributedWorker(
+            self.processor, "flow", lambda payload: {}, use_notifications=False
+        )
+        worker.stop()
+
+        totals = worker.run()
+
+        assert totals["batches"] == 0
+        self.processor.claim_records_batch_with_retry.assert_not_called()
+
+    def test_adaptive_batch_size(self):
+        """Test that an adaptive worker claims the learned size and reports back."""
+        self.processor.config["adaptive_batch_enabled"] = True
+        sizer = self.processor.get_batch_sizer.return_value
+        type(sizer).batch_size = PropertyMock(side_effect=[2, 2, 4])
+        self.processor.claim_records_batch_with_retry.side_effect = [
+            [{"id": 1, "payload": {}}, {"id": 2, "payload": {"fail": True}}],
+            [{"id": 3, "payload": {}}],
+        ]
+
+        def logic(payload):
+            if payload.get("fail"):
+                raise ValueError("bad record")
+            return {}
+
+        worker = DistributedWorker(
+            self.processor, "flow", logic, use_notifications=False
+        )
+        totals = worker.run(max_records=3)
+
+        self.processor.get_batch_sizer.assert_called_once_with("flow")
+        assert totals["batches"] == 2
+        # Second claim uses the learned size, capped to the record budget
+        claim_sizes = [
+            call[0][1]
+            for call in self.processor.claim_records_batch_with_retry.call_args_list
+        ]
+        assert claim_sizes == [2, 1]
+        assert sizer.record_batch.call_count == 2
+        records_claimed, _claim, _processing, records_failed = (
+            sizer.record_batch.call_args_list[0][0]
+        )
+        assert (records_claimed, records_failed) == (2, 1)
+
+    def test_explicit_batch_size_disables_adaptive_sizing(self):
+        """Test that an explicit batch size is never adapted."""
+        self.processor.config["adaptive_batch_enabled"] = True
+
+        worker = DistributedWorker(
+            self.processor, "flow", lambda payload: {}, batch_size=5
+        )
+
+        assert worker.batch_sizer is None
+        self.processor.get_batch_sizer.assert_not_called()
+
+
+class TestQueueNotificationMigration:
+    """Test the V008 notification trigger migration."""
+
+    migration_path = (
+        "core/migrations/rpa_db/V008__Add_processing_queue_notifications.sql"
+    )
+
+    def test_migration_defines_statement_level_triggers(self):
+        """Test that notifications are sent once per statement and flow."""
+        with open(self.migration_path) as f:
+            content = f.read()
+
+        assert f"pg_notify('{QUEUE_NOTIFY_CHANNEL}'" in content
+        assert "AFTER INSERT ON processing_queue" in content
+        assert "AFTER UPDATE ON processing_queue" in content
+        assert content.count("FOR EACH STATEMENT") == 2
+        assert "SELECT DISTINCT flow_name FROM new_rows" in content
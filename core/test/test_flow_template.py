@@ -5,6 +5,7 @@ Tests the flow template functionality with mocked DatabaseManager and
 DistributedProcessor instances to verify proper integration and error handling.
 """
 
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -12,14 +13,17 @@ import pytest
 # Import the module under test
 import core.flow_template as flow_template
 from core.flow_template import (
+    acknowledge_records_batch,
     create_custom_distributed_flow,
     distributed_processing_flow,
+    execute_record_business_logic,
     generate_processing_summary,
     get_processor_health,
     get_queue_status,
     process_default_business_logic,
     process_record_with_status,
     process_record_with_status_custom,
+    process_records_chunk,
 )
 
 
@@ -33,29 +37,25 @@ class TestFlowTemplate:
         self.mock_source_db = Mock()
         self.mock_processor = Mock()
 
-        # Patch the module-level instances
-        self.rpa_db_patcher = patch.object(
-            flow_template, "rpa_db_manager", self.mock_rpa_db
-        )
-        self.source_db_patcher = patch.object(
-            flow_template, "source_db_manager", self.mock_source_db
-        )
-        self.processor_patcher = patch.object(
-            flow_template, "processor", self.mock_processor
+        # Seed the instance cache so the real managers and processor are never built
+        self.instances_patcher = patch.dict(
+            flow_template._instances,
+            {
+                "config_manager": Mock(),
+                "rpa_db_manager": self.mock_rpa_db,
+                "source_db_manager": self.mock_source_db,
+                "processor": self.mock_processor,
+            },
         )
-
-        self.rpa_db_patcher.start()
-        self.source_db_patcher.start()
-        self.processor_patcher.start()
+        self.instances_patcher.start()
 
         # Configure mock processor
         self.mock_processor.instance_id = "test-instance-123"
+        self.mock_processor.config = {}
 
     def teardown_method(self):
         """Clean up after each test method."""
-        self.rpa_db_patcher.stop()
-        self.source_db_patcher.stop()
-        self.processor_patcher.stop()
+        self.instances_patcher.stop()
 
 
 class TestDistributedProcessingFlow(TestFlowTemplate):
@@ -115,6 +115,35 @@ class TestDistributedProcessingFlow(TestFlowTemplate):
             flow_name, batch_size
         )
 
+    def test_flow_sweeps_leases_and_renews_claims(self):
+        """Test that the flow reclaims expired leases and heartbeats its own claims."""
+        self.mock_processor.health_check.return_value = {"status": "healthy"}
+        self.mock_processor.reclaim_expired_leases.return_value = 2
+        self.mock_processor.claim_records_batch_with_retry.return_value = [
+            {"id": 5, "payload": {}, "retry_count": 0, "created_at": "2024-01-01"},
+        ]
+
+        with patch("core.flow_template.process_record_with_status") as mock_task:
+            mock_task.map.return_value = [
+                {"record_id": 5, "status": "completed", "result": {}},
+            ]
+            distributed_processing_flow("test_flow", 10)
+
+        self.mock_processor.reclaim_expired_leases.assert_called_once_with("test_flow")
+        self.mock_processor.start_lease_heartbeat.assert_called_once_with([5])
+        self.mock_processor.start_lease_heartbeat.return_value.stop.assert_called_once()
+
+    def test_flow_continues_when_lease_sweep_fails(self):
+        """Test that a failing lease sweep does not block claiming."""
+        self.mock_processor.health_check.return_value = {"status": "healthy"}
+        self.mock_processor.reclaim_expired_leases.side_effect = Exception("timeout")
+        self.mock_processor.claim_records_batch_with_retry.return_value = []
+
+        result = distributed_processing_flow("test_flow", 10)
+
+        assert result["records_claimed"] == 0
+        self.mock_processor.claim_records_batch_with_retry.assert_called_once()
+
     def test_flow_fails_on_unhealthy_database(self):
         """Test that flow fails fast when database health check fails."""
         # Arrange
@@ -247,6 +276,248 @@ class TestDistributedProcessingFlow(TestFlowTemplate):
             distributed_processing_flow("test_flow", -5)
 
 
+class TestContinuousDrain(TestFlowTemplate):
+    """Test cases for continuous queue draining with claim prefetching."""
+
+    def setup_method(self):
+        """Set up a healthy processor with an empty lease sweep."""
+        super().setup_method()
+        self.mock_processor.config = {
+            "default_batch_size": 2,
+            "health_check_interval": 300,
+        }
+        self.mock_processor.health_check.return_value = {"status": "healthy"}
+        self.mock_processor.reclaim_expired_leases.return_value = 0
+
+    @staticmethod
+    def _records(*record_ids):
+        return [{"id": record_id, "payload": {}} for record_id in record_ids]
+
+    @staticmethod
+    def _completed(records):
+        return [
+            {"record_id": record["id"], "status": "completed", "result": {}}
+            for record in records
+        ]
+
+    def test_prefetches_next_batch_until_queue_empty(self):
+        """Test that the next claim happens before the current batch is summarized."""
+        events = []
+        batches = [self._records(1, 2), self._records(3), []]
+
+        def claim(flow_name, claim_size):
+            events.append("claim")
+            return batches.pop(0)
+
+        def submit(records):
+            events.append("submit")
+            return self._completed(records)
+
+        def summarize(results, flow_name, batch_size, records_claimed):
+            events.append("summary")
+            return {
+                "records_processed": len(results),
+                "records_completed": len(results),
+                "records_failed": 0,
+                "errors": [],
+                "error_count": 0,
+            }
+
+        self.mock_processor.claim_records_batch_with_retry.side_effect = claim
+
+        with (
+            patch("core.flow_template.process_record_with_status") as mock_task,
+            patch(
+                "core.flow_template.generate_processing_summary",
+                side_effect=summarize,
+            ),
+        ):
+            mock_task.map.side_effect = submit
+            result = distributed_processing_flow("test_flow", continuous=True)
+
+        assert events == [
+            "claim",
+            "submit",
+            "claim",
+            "summary",
+            "submit",
+            "claim",
+            "summary",
+        ]
+        assert result["batches"] == 2
+        assert result["records_claimed"] == 3
+        assert result["records_completed"] == 3
+        assert result["success_rate_percent"] == 100.0
+        assert result["stop_reason"] == "queue_empty"
+        assert result["health_checks"] == 1
+        self.mock_processor.health_check.assert_called_once()
+
+        # Prefetched records are leased from the moment they are claimed
+        heartbeat_calls = self.mock_processor.start_lease_heartbeat.call_args_list
+        assert [call.args[0] for call in heartbeat_calls] == [[1, 2], [3]]
+
+    def test_stops_at_record_budget(self):
+        """Test that claims are capped to the remaining record budget."""
+        self.mock_processor.claim_records_batch_with_retry.side_effect = (
+            lambda flow_name, claim_size: self._records(*range(claim_size))
+        )
+
+        with patch("core.flow_template.process_record_with_status") as mock_task:
+            mock_task.map.side_effect = self._completed
+            result = distributed_processing_flow(
+                "test_flow", batch_size=2, continuous=True, max_records=3
+            )
+
+        claim_sizes = [
+            call.args[1]
+            for call in self.mock_processor.claim_records_batch_with_retry.call_args_list
+        ]
+        assert claim_sizes == [2, 1]
+        assert result["records_claimed"] == 3
+        assert result["stop_reason"] == "max_records"
+
+    def test_repeats_health_check_per_interval(self):
+        """Test that the health check is repeated once the interval has passed."""
+        self.mock_processor.config["health_check_interval"] = 0
+        self.mock_processor.claim_records_batch_with_retry.side_effect = [
+            self._records(1),
+            self._records(2),
+            [],
+        ]
+
+        with patch("core.flow_template.process_record_with_status") as mock_task:
+            mock_task.map.side_effect = self._completed
+            result = distributed_processing_flow("test_flow", continuous=True)
+
+        assert result["batches"] == 2
+        assert result["health_checks"] == 3
+        assert self.mock_processor.health_check.call_count == 3
+
+    def test_budget_validation(self):
+        """Test validation of the continuous mode budgets."""
+        with pytest.raises(ValueError, match="max_runtime_seconds must be a positive"):
+            distributed_processing_flow(
+                "test_flow", continuous=True, max_runtime_seconds=0
+            )
+
+        with pytest.raises(ValueError, match="max_records must be a positive integer"):
+            distributed_processing_flow("test_flow", continuous=True, max_records=0)
+
+
+class TestAdaptiveBatchSizing(TestFlowTemplate):
+    """Test cases for adaptive batch sizing in the flow."""
+
+    def setup_method(self):
+        """Set up a healthy processor with adaptive batch sizing enabled."""
+        super().setup_method()
+        self.mock_processor.config = {
+            "default_batch_size": 2,
+            "health_check_interval": 300,
+            "adaptive_batch_enabled": True,
+        }
+        self.mock_processor.health_check.return_value = {"status": "healthy"}
+        self.mock_processor.reclaim_expired_leases.return_value = 0
+        self.sizer = self.mock_processor.get_batch_sizer.return_value
+        self.sizer.batch_size = 7
+
+    @staticmethod
+    def _results(records, failed_ids=()):
+        return [
+            {"record_id": record["id"], "status": "failed", "error": "bad record"}
+            if record["id"] in failed_ids
+            else {"record_id": record["id"], "status": "completed", "result": {}}
+            for record in records
+        ]
+
+    def test_single_batch_uses_and_updates_sizer(self):
+        """Test that a flow without batch_size claims the learned size."""
+        records = [{"id": 1, "payload": {}}, {"id": 2, "payload": {}}]
+        self.mock_processor.claim_records_batch_with_retry.return_value = records
+
+        with patch("core.flow_template.process_record_with_status") as mock_task:
+            mock_task.map.return_value = self._results(records, failed_ids={2})
+            result = distributed_processing_flow("test_flow")
+
+        self.mock_processor.get_batch_sizer.assert_called_once_with("test_flow")
+        self.mock_processor.claim_records_batch_with_retry.assert_called_once_with(
+            "test_flow", 7
+        )
+        assert result["batch_size"] == 7
+        records_claimed, _claim, _processing, records_failed = (
+            self.sizer.record_batch.call_args[0]
+        )
+        assert (records_claimed, records_failed) == (2, 1)
+
+    def test_continuous_mode_claims_learned_size_per_batch(self):
+        """Test that every claim in continuous mode uses the current size."""
+        batches = [[{"id": 1, "payload": {}}], [{"id": 2, "payload": {}}], []]
+        self.mock_processor.claim_records_batch_with_retry.side_effect = (
+            lambda flow_name, claim_size: batches.pop(0)
+        )
+
+        def record_batch(*args):
+            self.sizer.batch_size += 1
+
+        self.sizer.record_batch.side_effect = record_batch
+
+        with patch("core.flow_template.process_record_with_status") as mock_task:
+            mock_task.map.side_effect = self._results
+            result = distributed_processing_flow("test_flow", continuous=True)
+
+        claim_sizes = [
+            call.args[1]
+            for call in self.mock_processor.claim_records_batch_with_retry.call_args_list
+        ]
+        # The next batch is prefetched before the current batch is recorded
+        assert claim_sizes == [7, 7, 8]
+        assert self.sizer.record_batch.call_count == 2
+        assert result["batches"] == 2
+
+    def test_continuous_mode_excludes_prefetch_from_processing_time(self):
+        """Test that a slow prefetch claim is not counted as processing time."""
+        batches = [[{"id": 1, "payload": {}}], [{"id": 2, "payload": {}}], []]
+
+        def claim(flow_name, claim_size):
+            if len(batches) == 2:
+                time.sleep(0.3)
+            return batches.pop(0)
+
+        self.mock_processor.claim_records_batch_with_retry.side_effect = claim
+
+        with patch("core.flow_template.process_record_with_status") as mock_task:
+            mock_task.map.side_effect = self._results
+            distributed_processing_flow("test_flow", continuous=True)
+
+        first_batch, second_batch = self.sizer.record_batch.call_args_list
+        _records, _claim, processing_seconds, _failed = first_batch[0]
+        assert processing_seconds < 0.3
+        # The slow prefetch is the claim time of the batch it claimed
+        assert second_batch[0][1] >= 0.3
+
+    def test_explicit_batch_size_is_not_adapted(self):
+        """Test that an explicit batch_size bypasses the sizer."""
+        self.mock_processor.claim_records_batch_with_retry.return_value = []
+
+        distributed_processing_flow("test_flow", batch_size=5)
+
+        self.mock_processor.get_batch_sizer.assert_not_called()
+        self.mock_processor.claim_records_batch_with_retry.assert_called_once_with(
+            "test_flow", 5
+        )
+
+    def test_disabled_by_default(self):
+        """Test that the configured default batch size is used when disabled."""
+        self.mock_processor.config["adaptive_batch_enabled"] = False
+        self.mock_processor.claim_records_batch_with_retry.return_value = []
+
+        distributed_processing_flow("test_flow")
+
+        self.mock_processor.get_batch_sizer.assert_not_called()
+        self.mock_processor.claim_records_batch_with_retry.assert_called_once_with(
+            "test_flow", 2
+        )
+
+
 class TestProcessRecordWithStatus(TestFlowTemplate):
     """Test cases for individual record processing tasks."""
 
@@ -368,6 +639,276 @@ class TestProcessRecordWithStatus(TestFlowTemplate):
         )
 
 
+class TestBatchedAcknowledgement(TestFlowTemplate):
+    """Test cases for batched record status acknowledgement."""
+
+    def test_execute_record_business_logic_does_not_write_status(self):
+        """Test that business logic execution leaves status updates to the batch."""
+        record = {"id": 1, "payload": {"rating": 4}}
+
+        result = execute_record_business_logic(
+            record, lambda payload: {"score": payload["rating"] * 2}
+        )
+
+        assert result == {"record_id": 1, "status": "completed", "result": {"score": 8}}
+        self.mock_processor.mark_record_completed_with_retry.assert_not_called()
+        self.mock_processor.mark_record_failed_with_retry.assert_not_called()
+
+    def test_execute_record_business_logic_failure(self):
+        """Test that business logic errors are captured as failed outcomes."""
+
+        def failing_logic(payload):
+            raise ValueError()
+
+        result = execute_record_business_logic({"id": 2, "payload": {}}, failing_logic)
+
+        assert result == {"record_id": 2, "status": "failed", "error": "ValueError"}
+
+    def test_acknowledge_records_batch(self):
+        """Test that completions and failures are written in two batched calls."""
+        self.mock_processor.mark_records_completed_batch_with_retry.return_value = [3]
+        self.mock_processor.mark_records_failed_batch_with_retry.return_value = []
+
+        outcomes = [
+            {"record_id": 1, "status": "completed", "result": {"ok": True}},
+            {"record_id": 2, "status": "failed", "error": "boom"},
+            {"record_id": 3, "status": "completed", "result": {"ok": True}},
+        ]
+
+        results = acknowledge_records_batch(outcomes)
+
+        self.mock_processor.mark_records_completed_batch_with_retry.assert_called_once_with(
+            [(1, {"ok": True}), (3, {"ok": True})]
+        )
+        self.mock_processor.mark_records_failed_batch_with_retry.assert_called_once_with(
+            [(2, "boom")]
+        )
+        assert results[0] == outcomes[0]
+        assert results[1] == outcomes[1]
+        assert results[2]["status"] == "failed"
+        assert "Status not recorded" in results[2]["error"]
+
+    def test_flow_with_batch_acknowledge(self):
+        """Test that the flow routes through the batched acknowledgement path."""
+        self.mock_processor.health_check.return_value = {"status": "healthy"}
+        self.mock_processor.claim_records_batch_with_retry.return_value = [
+            {"id": 1, "payload": {"data": "a"}},
+            {"id": 2, "payload": {"data": "b"}},
+        ]
+        self.mock_processor.mark_records_completed_batch_with_retry.return_value = []
+
+        result = distributed_processing_flow(
+            "test_flow",
+            2,
+            lambda payload: {"value": payload["data"]},
+            batch_acknowledge=True,
+        )
+
+        assert result["records_completed"] == 2
+        self.mock_processor.mark_records_completed_batch_with_retry.assert_called_once()
+        self.mock_processor.mark_records_failed_batch_with_retry.assert_not_called()
+        self.mock_processor.mark_record_completed_with_retry.assert_not_called()
+
+
+class TestProcessPoolMode(TestFlowTemplate):
+    """Test cases for running business logic in the process pool."""
+
+    @staticmethod
+    def _logic(payload):
+        return {"score": payload["rating"] * 2}
+
+    def test_custom_task_runs_logic_in_process_pool(self):
+        """Test that logic runs in the pool while the status is written here."""
+        self.mock_processor.config = {"process_pool_workers": 4}
+        record = {"id": 5, "payload": {"rating": 4}}
+
+        with patch(
+            "core.flow_template.run_in_process_pool", return_value={"score": 8}
+        ) as mock_run:
+            result = process_record_with_status_custom(
+                record, self._logic, use_process_pool=True
+            )
+
+        mock_run.assert_called_once_with(self._logic, {"rating": 4}, max_workers=4)
+        assert result == {"record_id": 5, "status": "completed", "result": {"score": 8}}
+        self.mock_processor.mark_record_completed_with_retry.assert_called_once_with(
+            5, {"score": 8}
+        )
+
+    def test_pool_errors_fail_the_record(self):
+        """Test that errors raised in a worker process fail only that record."""
+        self.mock_processor.config = {"process_pool_workers": None}
+
+        with patch(
+            "core.flow_template.run_in_process_pool",
+            side_effect=RuntimeError("Business logic worker process died"),
+        ):
+            result = execute_record_business_logic(
+                {"id": 6, "payload": {}}, self._logic, use_process_pool=True
+            )
+
+        assert result["status"] == "failed"
+        assert "worker process died" in result["error"]
+
+    def test_flow_submits_tasks_in_process_pool_mode(self):
+        """Test that the flow passes process pool mode to the mapped tasks."""
+        self.mock_processor.health_check.return_value = {"status": "healthy"}
+        self.mock_processor.claim_records_batch_with_retry.return_value = [
+            {"id": 1, "payload": {"rating": 1}}
+        ]
+
+        with patch("core.flow_template.process_record_with_status_custom") as mock_task:
+            mock_task.map.return_value = [
+                {"record_id": 1, "status": "completed", "result": {"score": 2}}
+            ]
+            result = distributed_processing_flow(
+                "test_flow", 10, self._logic, use_process_pool=True
+            )
+
+        mock_task.map.assert_called_once_with(
+            [{"id": 1, "payload": {"rating": 1}}],
+            business_logic_func=self._logic,
+            use_process_pool=True,
+        )
+        assert result["records_completed"] == 1
+
+    def test_process_pool_requires_business_logic(self):
+        """Test that the default placeholder logic is not sent to the pool."""
+        with pytest.raises(ValueError, match="use_process_pool requires"):
+            distributed_processing_flow("test_flow", 10, use_process_pool=True)
+
+
+class TestChunkedProcessing(TestFlowTemplate):
+    """Test cases for processing several records per task."""
+
+    @staticmethod
+    def _logic(payload):
+        if payload["rating"] < 0:
+            raise ValueError("negative rating")
+        return {"score": payload["rating"] * 2}
+
+    @staticmethod
+    def _records(count):
+        return [{"id": i, "payload": {"rating": i}} for i in range(1, count + 1)]
+
+    def _healthy(self, records):
+        self.mock_processor.health_check.return_value = {"status": "healthy"}
+        self.mock_processor.claim_records_batch_with_retry.return_value = records
+        self.mock_processor.mark_records_completed_batch_with_retry.return_value = []
+        self.mock_processor.mark_records_failed_batch_with_retry.return_value = []
+
+    def test_chunk_reports_each_record(self):
+        """Test that failures are isolated per record and written in batches."""
+        self._healthy([])
+        records = [
+            {"id": 1, "payload": {"rating": 4}},
+            {"id": 2, "payload": {"rating": -1}},
+        ]
+
+        results = process_records_chunk(records, self._logic)
+
+        assert results == [
+            {"record_id": 1, "status": "completed", "result": {"score": 8}},
+            {"record_id": 2, "status": "failed", "error": "negative rating"},
+        ]
+        self.mock_processor.mark_records_completed_batch_with_retry.assert_called_once_with(
+            [(1, {"score": 8})]
+        )
+        self.mock_processor.mark_records_failed_batch_with_retry.assert_called_once_with(
+            [(2, "negative rating")]
+        )
+        self.mock_processor.mark_record_completed_with_retry.assert_not_called()
+
+    def test_chunk_without_acknowledge_does_not_write_status(self):
+        """Test that statuses are left to the caller when acknowledge is False."""
+        results = process_records_chunk(
+            self._records(2), self._logic, acknowledge=False
+        )
+
+        assert [result["status"] for result in results] == ["completed", "completed"]
+        self.mock_processor.mark_records_completed_batch_with_retry.assert_not_called()
+
+    def test_batch_business_logic(self):
+        """Test that the batch hook gets all payloads and may fail single records."""
+        self._healthy([])
+        batch_logic = Mock(return_value=[{"score": 2}, ValueError("bad payload")])
+
+        results = process_records_chunk(
+            self._records(2), batch_business_logic_func=batch_logic
+        )
+
+        batch_logic.assert_called_once_with([{"rating": 1}, {"rating": 2}])
+        assert results == [
+            {"record_id": 1, "status": "completed", "result": {"score": 2}},
+            {"record_id": 2, "status": "failed", "error": "bad payload"},
+        ]
+
+    def test_batch_business_logic_result_count_mismatch(self):
+        """Test that a batch hook returning too few results fails the chunk."""
+        self._healthy([])
+
+        results = process_records_chunk(
+            self._records(2), batch_business_logic_func=lambda payloads: [{}]
+        )
+
+        assert [result["status"] for result in results] == ["failed", "failed"]
+        assert "returned 1 results for 2 records" in results[0]["error"]
+
+    def test_flow_processes_records_in_chunks(self):
+        """Test that the flow maps one task per chunk and reports every record."""
+        self._healthy(self._records(5))
+
+        result = distributed_processing_flow("test_flow", 5, self._logic, chunk_size=2)
+
+        assert result["records_processed"] == 5
+        assert result["records_completed"] == 5
+        # One batched status update per chunk of 2, 2 and 1 records
+        assert (
+            self.mock_processor.mark_records_completed_batch_with_retry.call_count == 3
+        )
+        self.mock_processor.mark_record_completed_with_retry.assert_not_called()
+
+    def test_flow_chunks_with_batch_acknowledge(self):
+        """Test that chunks share one status update with batch_acknowledge."""
+        self._healthy(self._records(5))
+
+        result = distributed_processing_flow(
+            "test_flow", 5, self._logic, batch_acknowledge=True, chunk_size=2
+        )
+
+        assert result["records_completed"] == 5
+        self.mock_processor.mark_records_completed_batch_with_retry.assert_called_once()
+
+    def test_chunk_size_from_config(self):
+        """Test that task_chunk_size is used when chunk_size is not given."""
+        records = self._records(3)
+        self._healthy(records)
+        self.mock_processor.config = {"task_chunk_size": 2}
+
+        with patch("core.flow_template.process_records_chunk") as mock_task:
+            mock_task.map.return_value = [
+                [{"record_id": 1, "status": "completed", "result": {}}] * 2,
+                [{"record_id": 3, "status": "completed", "result": {}}],
+            ]
+            result = distributed_processing_flow("test_flow", 3)
+
+        assert mock_task.map.call_args.args[0] == [records[:2], records[2:]]
+        assert result["records_completed"] == 3
+
+    def test_chunk_parameter_validation(self):
+        """Test chunk_size and business logic argument validation."""
+        with pytest.raises(ValueError, match="chunk_size must be a positive integer"):
+            distributed_processing_flow("test_flow", 10, chunk_size=0)
+
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            distributed_processing_flow(
+                "test_flow",
+                10,
+                self._logic,
+                batch_business_logic_func=lambda payloads: payloads,
+            )
+
+
 class TestDefaultBusinessLogic(TestFlowTemplate):
     """Test cases for the default business logic function."""
 
@@ -381,7 +922,7 @@ class TestDefaultBusinessLogic(TestFlowTemplate):
 
         # Assert
         assert result["processed"] is True
-        assert result["original_payload"] == payload
+        assert "original_payload" not in result
         assert result["processor_instance"] == "test-instance-123"
         assert "processed_at" in result
 
@@ -609,5 +1150,74 @@ class TestModuleLevelInstances(TestFlowTemplate):
         mock_processor_class.assert_called_once_with(rpa_db_manager, source_db_manager)
 
 
+class TestLazyModuleInstances:
+    """Test cases for deferred creation of the module-level instances."""
+
+    @pytest.fixture
+    def fresh_instances(self):
+        """Empty instance cache with ConfigManager, managers and processor mocked."""
+        with (
+            patch.dict(flow_template._instances, clear=True),
+            patch("core.flow_template.ConfigManager") as mock_config_class,
+            patch("core.flow_template.DatabaseManager") as mock_db_class,
+            patch("core.flow_template.DistributedProcessor") as mock_processor_class,
+        ):
+            yield mock_config_class, mock_db_class, mock_processor_class
+
+    def test_import_does_not_create_instances(self):
+        """Test that importing the module creates no managers or processor."""
+        import importlib
+
+        try:
+            with (
+                patch("core.config.ConfigManager") as mock_config_class,
+                patch("core.database.DatabaseManager") as mock_db_class,
+                patch("core.distributed.DistributedProcessor") as mock_processor_class,
+            ):
+                module = importlib.reload(flow_template)
+
+                assert module._instances == {}
+                mock_config_class.assert_not_called()
+                mock_db_class.assert_not_called()
+                mock_processor_class.assert_not_called()
+        finally:
+            importlib.reload(flow_template)
+
+    def test_first_access_creates_instances_once(self, fresh_instances):
+        """Test that the instances are created on first access and then cached."""
+        mock_config_class, mock_db_class, mock_processor_class = fresh_instances
+        mock_rpa_db = Mock()
+        mock_source_db = Mock()
+        mock_db_class.side_effect = [mock_rpa_db, mock_source_db]
+
+        processor = flow_template.get_processor()
+
+        assert processor is mock_processor_class.return_value
+        assert flow_template.processor is processor
+        assert flow_template.rpa_db_manager is mock_rpa_db
+        assert flow_template.source_db_manager is mock_source_db
+        assert flow_template.config_manager is mock_config_class.return_value
+        assert flow_template.get_processor() is processor
+        mock_db_class.assert_any_call("rpa_db")
+        mock_db_class.assert_any_call("SurveyHub")
+        mock_processor_class.assert_called_once_with(
+            mock_rpa_db, mock_source_db, mock_config_class.return_value
+        )
+        mock_config_class.assert_called_once_with()
+
+    def test_get_processor_uses_assigned_attribute(self, fresh_instances):
+        """Test that a processor patched onto the module replaces the shared one."""
+        mock_config_class, mock_db_class, mock_processor_class = fresh_instances
+        mock_processor = Mock()
+
+        with patch.object(flow_template, "processor", mock_processor):
+            assert flow_template.get_processor() is mock_processor
+
+    def test_unknown_attribute_raises(self):
+        """Test that other missing module attributes still raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'missing_name'"):
+            flow_template.missing_name  # noqa: B018
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
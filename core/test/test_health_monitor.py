@@ -531,6 +531,30 @@ class TestHealthMonitor(unittest.TestCase):
             # Should contain some metric type definitions
             self.assertTrue(len(prometheus_output) > 0)
 
+    def test_export_prometheus_metrics_includes_query_timeouts(self):
+        """Test that database query timeout counters are exported."""
+        with (
+            patch.object(self.health_monitor, "get_resource_status"),
+            patch.object(self.health_monitor, "comprehensive_health_check"),
+            patch(
+                "core.health_monitor.get_query_timeout_counts",
+                return_value=[
+                    {
+                        "database_name": "rpa_db",
+                        "query_class": "monitoring",
+                        "timeouts": 3,
+                    }
+                ],
+            ),
+        ):
+            prometheus_output = self.health_monitor.export_prometheus_metrics()
+
+        self.assertIn("# TYPE database_query_timeouts_total counter", prometheus_output)
+        self.assertIn(
+            'database_query_timeouts_total{database="rpa_db",query_class="monitoring"} 3',
+            prometheus_output,
+        )
+
     def test_get_metrics_dict(self):
         """Test getting metrics as dictionary."""
         with patch.object(self.health_monitor, "get_resource_status"):
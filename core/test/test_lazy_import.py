@@ -0,0 +1,129 @@
+"""
+Tests for lazy imports of heavy optional dependencies.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from core.lazy_import import is_loaded, lazy_import
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+@pytest.fixture
+def temp_module(tmp_path, monkeypatch):
+    """Importable module that records how often it was executed."""
+    module_name = "lazy_import_target"
+    (tmp_path / f"{module_name}.py").write_text(
+        "import builtins\n"
+        "builtins.lazy_import_target_loads = "
+        "getattr(builtins, 'lazy_import_target_loads', 0) + 1\n"
+        "VALUE = 42\n"
+        "def double(x):\n"
+        "    return 2 * x\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    import builtins
+
+    monkeypatch.setattr(builtins, "lazy_import_target_loads", 0, raising=False)
+    yield module_name
+    sys.modules.pop(module_name, None)
+
+
+class TestLazyImport:
+    """Test cases for lazy_import() stand-ins."""
+
+    def test_module_imported_on_first_attribute_access(self, temp_module):
+        """Test that a lazy module is imported on first use and only once."""
+        import builtins
+
+        module = lazy_import(temp_module)
+
+        assert not is_loaded(module)
+        assert temp_module not in sys.modules
+        assert module.VALUE == 42
+        assert module.double(2) == 4
+        assert is_loaded(module)
+        assert builtins.lazy_import_target_loads == 1
+
+    def test_attribute_imported_on_first_call(self, temp_module):
+        """Test that a lazy attribute imports its module when called."""
+        double = lazy_import(temp_module, "double")
+
+        assert not is_loaded(double)
+        assert double(21) == 42
+        assert is_loaded(double)
+
+    def test_attribute_forwards_attribute_access(self, temp_module):
+        """Test that attribute access on a lazy attribute reaches the target."""
+        double = lazy_import(temp_module, "double")
+
+        assert double.__name__ == "double"
+
+    def test_missing_module_fails_on_first_use(self):
+        """Test that import errors surface on use, not when binding the name."""
+        module = lazy_import("module_that_does_not_exist")
+
+        with pytest.raises(ModuleNotFoundError):
+            module.anything  # noqa: B018
+
+    def test_missing_attribute_fails_on_first_use(self, temp_module):
+        """Test that a missing attribute raises AttributeError on use."""
+        missing = lazy_import(temp_module, "missing")
+
+        with pytest.raises(AttributeError):
+            missing()
+
+    def test_module_attribute_can_be_patched(self, temp_module):
+        """Test that attributes reached through a lazy module can be patched."""
+        module = lazy_import(temp_module)
+
+        with patch.object(module, "double", return_value=0):
+            assert module.double(5) == 0
+        assert module.double(5) == 10
+
+    def test_repr_shows_load_state(self, temp_module):
+        """Test that the stand-in repr names the module and its load state."""
+        module = lazy_import(temp_module)
+
+        assert repr(module) == f"<lazy module '{temp_module}' (not loaded)>"
+        module.VALUE  # noqa: B018
+        assert repr(module) == f"<lazy module '{temp_module}' (loaded)>"
+
+    def test_is_loaded_for_regular_objects(self):
+        """Test that regular modules and objects count as loaded."""
+        assert is_loaded(sys)
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "core.config",
+        "core.database",
+        "core.health_monitor",
+        "core.performance_monitor",
+        "core.operational_manager",
+    ],
+)
+def test_core_modules_defer_heavy_dependencies(module_name):
+    """Test that importing core modules does not import optional dependencies."""
+    heavy_modules = ["prefect", "pyway", "psutil", "docker"]
+    code = (
+        f"import sys, {module_name}\n"
+        f"print(','.join(m for m in {heavy_modules!r} if m in sys.modules))"
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == ""
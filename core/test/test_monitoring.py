@@ -309,7 +309,7 @@ class TestDistributedProcessingDiagnostics:
     def test_analyze_orphaned_records(self):
         """Test orphaned records analysis."""
         mock_processor = Mock()
-        mock_processor.rpa_db.execute_query.return_value = [
+        mock_processor.rpa_db.execute_query_with_timeout.return_value = [
             {
                 "flow_name": "test_flow",
                 "orphaned_count": 5,
@@ -321,6 +321,8 @@ class TestDistributedProcessingDiagnostics:
 
         result = _analyze_orphaned_records(mock_processor, "test_flow")
 
+        query = mock_processor.rpa_db.execute_query_with_timeout.call_args[0][0]
+        assert "lease_expires_at IS NULL OR lease_expires_at < NOW()" in query
         assert result["total_orphaned_records"] == 5
         assert len(result["orphaned_by_flow"]) == 1
         assert result["oldest_orphaned_hours"] == 2.5
@@ -328,7 +330,9 @@ class TestDistributedProcessingDiagnostics:
     def test_analyze_orphaned_records_error(self):
         """Test orphaned records analysis with database error."""
         mock_processor = Mock()
-        mock_processor.rpa_db.execute_query.side_effect = Exception("Database error")
+        mock_processor.rpa_db.execute_query_with_timeout.side_effect = Exception(
+            "Database error"
+        )
 
         result = _analyze_orphaned_records(mock_processor, None)
 
@@ -339,7 +343,7 @@ class TestDistributedProcessingDiagnostics:
     def test_analyze_processing_performance(self):
         """Test processing performance analysis."""
         mock_processor = Mock()
-        mock_processor.rpa_db.execute_query.return_value = [
+        mock_processor.rpa_db.execute_query_with_timeout.return_value = [
             {
                 "flow_name": "test_flow",
                 "total_processed": 100,
@@ -421,7 +425,7 @@ class TestProcessingPerformanceMonitoring:
     def test_calculate_performance_metrics(self):
         """Test performance metrics calculation."""
         mock_processor = Mock()
-        mock_processor.rpa_db.execute_query.return_value = [
+        mock_processor.rpa_db.execute_query_with_timeout.return_value = [
             {
                 "total_processed": 100,
                 "completed_count": 85,
@@ -450,7 +454,7 @@ class TestProcessingPerformanceMonitoring:
     def test_calculate_performance_metrics_no_data(self):
         """Test performance metrics calculation with no data."""
         mock_processor = Mock()
-        mock_processor.rpa_db.execute_query.return_value = []
+        mock_processor.rpa_db.execute_query_with_timeout.return_value = []
 
         start_time = datetime.now() - timedelta(hours=6)
         end_time = datetime.now()
@@ -545,6 +549,50 @@ class TestDistributedSystemMaintenance:
         # Verify processor method was called
         mock_processor.cleanup_orphaned_records.assert_called_once_with(2)
 
+    @patch("core.monitoring.DatabaseManager")
+    @patch("core.monitoring.DistributedProcessor")
+    def test_maintenance_reclaims_expired_leases(
+        self, mock_processor_class, mock_db_manager_class
+    ):
+        """Test that maintenance sweeps expired leases."""
+        mock_processor = Mock()
+        mock_processor.instance_id = "test-instance-123"
+        mock_processor.get_queue_status.return_value = {"total_records": 10}
+        mock_processor.reclaim_expired_leases.return_value = 3
+        mock_processor_class.return_value = mock_processor
+
+        result = distributed_system_maintenance.fn(
+            cleanup_orphaned_records=False, dry_run=False
+        )
+
+        assert "reclaim_expired_leases" in result["operations_performed"]
+        assert result["lease_results"]["records_reclaimed"] == 3
+        mock_processor.reclaim_expired_leases.assert_called_once_with()
+        mock_processor.cleanup_orphaned_records.assert_not_called()
+
+    @patch("core.monitoring.DatabaseManager")
+    @patch("core.monitoring.DistributedProcessor")
+    def test_maintenance_refreshes_queue_stats(
+        self, mock_processor_class, mock_db_manager_class
+    ):
+        """Test that maintenance can recompute the queue status counters."""
+        mock_processor = Mock()
+        mock_processor.instance_id = "test-instance-123"
+        mock_processor.get_queue_status.return_value = {"total_records": 10}
+        mock_processor.refresh_queue_stats.return_value = 2
+        mock_processor_class.return_value = mock_processor
+
+        result = distributed_system_maintenance.fn(
+            cleanup_orphaned_records=False,
+            reclaim_expired_leases=False,
+            refresh_queue_stats=True,
+            dry_run=False,
+        )
+
+        assert result["operations_performed"] == ["refresh_queue_stats"]
+        assert result["stats_results"]["counters_corrected"] == 2
+        mock_processor.refresh_queue_stats.assert_called_once_with()
+
     @patch("core.monitoring.DatabaseManager")
     @patch("core.monitoring.DistributedProcessor")
     def test_maintenance_failed_reset(
@@ -585,17 +633,23 @@ class TestDistributedSystemMaintenance:
     def test_count_orphaned_records(self):
         """Test counting orphaned records."""
         mock_processor = Mock()
-        mock_processor.rpa_db.execute_query.return_value = [{"count": 12}]
+        mock_processor.rpa_db.execute_query_with_timeout.return_value = [{"count": 12}]
 
         count = _count_orphaned_records(mock_processor, 2)
 
         assert count == 12
-        mock_processor.rpa_db.execute_query.assert_called_once()
+        mock_processor.rpa_db.execute_query_with_timeout.assert_called_once()
+        query, params = mock_processor.rpa_db.execute_query_with_timeout.call_args[0]
+        assert "make_interval(hours => :timeout_hours)" in query
+        assert "lease_expires_at IS NULL OR lease_expires_at < NOW()" in query
+        assert params == {"timeout_hours": 2}
 
     def test_count_orphaned_records_error(self):
         """Test counting orphaned records with database error."""
         mock_processor = Mock()
-        mock_processor.rpa_db.execute_query.side_effect = Exception("Database error")
+        mock_processor.rpa_db.execute_query_with_timeout.side_effect = Exception(
+            "Database error"
+        )
 
         count = _count_orphaned_records(mock_processor, 2)
 
@@ -604,17 +658,19 @@ class TestDistributedSystemMaintenance:
     def test_count_resettable_failed_records(self):
         """Test counting resettable failed records."""
         mock_processor = Mock()
-        mock_processor.rpa_db.execute_query.return_value = [{"count": 5}]
+        mock_processor.rpa_db.execute_query_with_timeout.return_value = [{"count": 5}]
 
         count = _count_resettable_failed_records(mock_processor, "test_flow", 3)
 
         assert count == 5
-        mock_processor.rpa_db.execute_query.assert_called_once()
+        mock_processor.rpa_db.execute_query_with_timeout.assert_called_once()
 
     def test_count_resettable_failed_records_error(self):
         """Test counting resettable failed records with database error."""
         mock_processor = Mock()
-        mock_processor.rpa_db.execute_query.side_effect = Exception("Database error")
+        mock_processor.rpa_db.execute_query_with_timeout.side_effect = Exception(
+            "Database error"
+        )
 
         count = _count_resettable_failed_records(mock_processor, "test_flow", 3)
 
@@ -0,0 +1,131 @@
+"""
+Unit tests for the business logic process pool.
+
+Tests CPU quota detection from cgroup files, payload serialization and running
+business logic in worker processes.
+"""
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core import process_pool
+from core.process_pool import (
+    get_cpu_limit,
+    get_process_pool,
+    run_in_process_pool,
+    serialize,
+    shutdown_process_pool,
+)
+
+
+class TestCpuLimit:
+    """Test CPU quota detection."""
+
+    def _patch_cgroup(self, tmp_path, v2=None, v1_quota=None, v1_period=None):
+        """Point the cgroup paths at temporary files."""
+        paths = {}
+        for name, content in (
+            ("CGROUP_V2_CPU_MAX", v2),
+            ("CGROUP_V1_CPU_QUOTA", v1_quota),
+            ("CGROUP_V1_CPU_PERIOD", v1_period),
+        ):
+            path = tmp_path / name
+            if content is not None:
+                path.write_text(content)
+            paths[name] = str(path)
+        return patch.multiple(process_pool, **paths)
+
+    def test_cgroup_v2_quota(self, tmp_path):
+        """Test that a cgroup v2 quota is rounded up to whole CPUs."""
+        with (
+            self._patch_cgroup(tmp_path, v2="250000 100000\n"),
+            patch("os.sched_getaffinity", return_value=set(range(8)), create=True),
+        ):
+            assert get_cpu_limit() == 3
+
+    def test_cgroup_v2_unlimited_uses_available_cpus(self, tmp_path):
+        """Test that an unlimited quota falls back to the CPU affinity."""
+        with (
+            self._patch_cgroup(tmp_path, v2="max 100000\n"),
+            patch("os.sched_getaffinity", return_value=set(range(8)), create=True),
+        ):
+            assert get_cpu_limit() == 8
+
+    def test_cgroup_v1_quota(self, tmp_path):
+        """Test that a cgroup v1 quota is used when there is no v2 file."""
+        with (
+            self._patch_cgroup(tmp_path, v1_quota="200000\n", v1_period="100000\n"),
+            patch("os.sched_getaffinity", return_value=set(range(8)), create=True),
+        ):
+            assert get_cpu_limit() == 2
+
+    def test_quota_capped_at_available_cpus(self, tmp_path):
+        """Test that the limit never exceeds the CPUs the process may use."""
+        with (
+            self._patch_cgroup(tmp_path, v2="1600000 100000\n"),
+            patch("os.sched_getaffinity", return_value={0, 1}, create=True),
+        ):
+            assert get_cpu_limit() == 2
+
+    def test_unreadable_quota_uses_available_cpus(self, tmp_path):
+        """Test that a malformed cgroup file is ignored."""
+        with (
+            self._patch_cgroup(tmp_path, v2="garbage"),
+            patch("os.sched_getaffinity", return_value=set(range(4)), create=True),
+        ):
+            assert get_cpu_limit() == 4
+
+
+class TestRunInProcessPool:
+    """Test running business logic in worker processes."""
+
+    def teardown_method(self):
+        """Shut down the shared pool between tests."""
+        shutdown_process_pool()
+
+    def test_serialize_is_compact_json(self):
+        """Test that payloads are serialized without whitespace."""
+        assert serialize({"survey_id": "SURV-001", "scores": [1, 2]}) == (
+            b'{"survey_id":"SURV-001","scores":[1,2]}'
+        )
+
+    def test_runs_business_logic_in_worker_process(self):
+        """Test a round trip through a worker process."""
+        assert run_in_process_pool(sorted, {"b": 1, "a": 2}, max_workers=1) == [
+            "a",
+            "b",
+        ]
+
+    def test_business_logic_errors_are_raised(self):
+        """Test that exceptions from the business logic reach the caller."""
+        with pytest.raises(TypeError):
+            run_in_process_pool(int, {"survey_id": "SURV-001"}, max_workers=1)
+
+    def test_pool_is_shared(self):
+        """Test that the pool is created once and reused."""
+        pool = get_process_pool(max_workers=1)
+
+        assert get_process_pool() is pool
+
+    def test_max_workers_validation(self):
+        """Test pool size validation."""
+        with pytest.raises(ValueError, match="max_workers must be a positive integer"):
+            get_process_pool(max_workers=0)
+
+    def test_broken_pool_is_replaced(self):
+        """Test that a crashed worker fails the record and discards the pool."""
+        broken = Future()
+        broken.set_exception(BrokenProcessPool("worker died"))
+        mock_pool = Mock()
+        mock_pool.submit.return_value = broken
+
+        with patch.object(process_pool, "_process_pool", mock_pool):
+            with pytest.raises(RuntimeError, match="worker process died"):
+                run_in_process_pool(sorted, {})
+
+            assert process_pool._process_pool is None
+
+        mock_pool.shutdown.assert_called_once_with(wait=False)
@@ -0,0 +1,219 @@
+"""
+Unit tests for per-statement latency statistics of DatabaseManager engines.
+
+Tests cover query fingerprinting, the event hooks recording latency, rows,
+errors and connection checkout waits, the slow-query log and the Prometheus
+export.
+"""
+
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+
+from core.database import DatabaseManager
+from core.health_monitor import HealthMonitor
+from core.query_stats import (
+    OTHER_FINGERPRINT,
+    QueryStats,
+    fingerprint_query,
+    instrument_engine,
+    query_stats,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """SQLite engine with a pooled connection, instrumented as test_db."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}", poolclass=QueuePool)
+    instrument_engine(engine, "test_db")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER, name TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+class TestFingerprintQuery:
+    """Test normalization of statements to fingerprints."""
+
+    def test_literals_and_parameters_are_replaced(self):
+        """Test that statements differing only in values share a fingerprint."""
+        first = fingerprint_query(
+            "SELECT * FROM q WHERE id = 42 AND name = 'a''b' AND flow = %(flow)s"
+        )
+        second = fingerprint_query(
+            "SELECT *\n  FROM q WHERE id = 7 AND name = 'x' AND flow = :flow"
+        )
+
+        assert (
+            first
+            == second
+            == ("SELECT * FROM q WHERE id = ? AND name = ? AND flow = ?")
+        )
+
+    def test_value_lists_collapse(self):
+        """Test that IN lists and multi-row VALUES do not depend on their length."""
+        assert fingerprint_query("SELECT 1 FROM t WHERE id IN (1, 2, 3)") == (
+            "SELECT ? FROM t WHERE id IN (...)"
+        )
+        assert fingerprint_query(
+            "INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s)"
+        ) == fingerprint_query("INSERT INTO t (a, b) VALUES (:a, :b)")
+
+    def test_identifiers_and_casts_are_kept(self):
+        """Test that digits in names and PostgreSQL casts survive."""
+        assert fingerprint_query("SELECT payload::text FROM rpa1_queue") == (
+            "SELECT payload::text FROM rpa1_queue"
+        )
+
+
+class TestQueryStats:
+    """Test the statistics store."""
+
+    def test_histogram_buckets_and_totals(self):
+        """Test that observations land in cumulative buckets."""
+        stats = QueryStats()
+        stats.record_statement("db", "SELECT 1", 0.002, rows=1)
+        stats.record_statement("db", "SELECT 2", 0.3, rows=1)
+
+        [entry] = stats.get_statement_stats()
+
+        assert entry["count"] == 2
+        assert entry["rows"] == 2
+        assert entry["buckets"][0.001] == 0
+        assert entry["buckets"][0.005] == 1
+        assert entry["buckets"][0.5] == 2
+        assert entry["max_seconds"] == 0.3
+
+    def test_fingerprints_are_bounded(self):
+        """Test that statements beyond the limit are grouped as other."""
+        stats = QueryStats(max_fingerprints=2)
+        for table in ("a", "b", "c", "d"):
+            stats.record_statement("db", f"SELECT * FROM {table}", 0.001)
+
+        fingerprints = {entry["fingerprint"] for entry in stats.get_statement_stats()}
+
+        assert fingerprints == {"SELECT * FROM a", "SELECT * FROM b", OTHER_FINGERPRINT}
+
+
+class TestEngineInstrumentation:
+    """Test the event hooks attached to engines."""
+
+    def test_statements_and_checkout_waits_are_recorded(self, engine):
+        """Test that executed statements and checkouts are recorded."""
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text("SELECT * FROM t WHERE id = :id"), {"id": i})
+
+        statements = query_stats.get_statement_stats("test_db")
+        select_stats = [s for s in statements if s["fingerprint"].startswith("SELECT")]
+
+        assert select_stats[0]["fingerprint"] == "SELECT * FROM t WHERE id = ?"
+        assert select_stats[0]["count"] == 3
+        assert query_stats.get_checkout_wait_stats()[0]["count"] >= 1
+
+    def test_errors_are_recorded(self, engine):
+        """Test that failing statements are counted as errors."""
+        with pytest.raises(OperationalError):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT * FROM missing_table"))
+
+        [entry] = [
+            s
+            for s in query_stats.get_statement_stats("test_db")
+            if "missing_table" in s["fingerprint"]
+        ]
+        assert entry["errors"] == 1
+
+    def test_slow_queries_are_logged(self, engine, caplog):
+        """Test the slow-query log above the configured threshold."""
+        query_stats.set_slow_query_threshold("test_db", 0)
+
+        with caplog.at_level(logging.WARNING, logger="core.database.slow_queries"):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT name FROM t WHERE name = 'secret'"))
+
+        query_stats.set_slow_query_threshold("test_db", 1000)
+        assert "Slow query on 'test_db'" in caplog.text
+        assert "SELECT name FROM t WHERE name = ?" in caplog.text
+        assert "secret" not in caplog.text
+
+    def test_checkout_timing_survives_dispose(self, engine):
+        """Test that the pool created by dispose() is timed too."""
+        engine.dispose()
+        query_stats.reset()
+
+        with engine.connect():
+            pass
+
+        assert query_stats.get_checkout_wait_stats()[0]["count"] == 1
+
+    def test_non_engines_are_ignored(self):
+        """Test that test doubles are not instrumented."""
+        mock_engine = Mock()
+
+        instrument_engine(mock_engine, "test_db")
+
+        assert not mock_engine.method_calls
+
+
+class TestQueryStatsExport:
+    """Test the Prometheus export and DatabaseManager reporting."""
+
+    def test_prometheus_export(self, engine):
+        """Test histogram, row and checkout series in the HealthMonitor export."""
+        with engine.connect() as conn:
+            conn.execute(text("SELECT * FROM t"))
+
+        monitor = HealthMonitor(enable_structured_logging=False)
+        with (
+            patch.object(monitor, "get_resource_status"),
+            patch.object(monitor, "comprehensive_health_check"),
+        ):
+            output = monitor.export_prometheus_metrics()
+
+        assert "# TYPE database_query_duration_seconds histogram" in output
+        assert 'query="SELECT * FROM t",le="+Inf"} 1' in output
+        assert "database_query_rows_total{" in output
+        assert (
+            'database_connection_checkout_wait_seconds_count{database="test_db"}'
+            in (output)
+        )
+
+    def test_database_manager_reports_its_statistics(self):
+        """Test DatabaseManager.get_query_stats on a shared engine."""
+        with patch("core.database.ConfigManager") as mock_config_class:
+            mock_config = mock_config_class.return_value
+            mock_config.get_variable.side_effect = lambda key, default=None: {
+                "stats_db_type": "postgresql",
+                "stats_db_slow_query_threshold_ms": "250",
+            }.get(key, default)
+            mock_config.get_secret.return_value = "sqlite://"
+
+            db_manager = DatabaseManager("stats_db")
+            db_manager.execute_query("SELECT 1 AS one")
+            stats = db_manager.get_query_stats()
+
+        assert stats["slow_query_threshold_ms"] == 250
+        assert stats["statements"][0]["fingerprint"] == "SELECT ? AS one"
+        assert stats["checkout_wait"]["count"] == 1
+
+    def test_invalid_slow_query_threshold_uses_default(self):
+        """Test that a malformed threshold is ignored instead of failing the engine."""
+        with patch("core.database.ConfigManager") as mock_config_class:
+            mock_config = mock_config_class.return_value
+            mock_config.get_variable.side_effect = lambda key, default=None: {
+                "stats_db_type": "postgresql",
+                "stats_db_slow_query_threshold_ms": "fast",
+            }.get(key, default)
+            mock_config.get_secret.return_value = "sqlite://"
+
+            db_manager = DatabaseManager("stats_db")
+            db_manager._logger = Mock()
+            db_manager.execute_query("SELECT 1 AS one")
+
+        assert db_manager.get_query_stats()["slow_query_threshold_ms"] == 1000
+        db_manager.logger.warning.assert_called_once()
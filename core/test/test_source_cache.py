@@ -0,0 +1,153 @@
+"""
+Unit tests for the source row cache.
+
+Tests LRU eviction, TTL expiry, the shared SQLite tier, invalidation and the
+hit/miss statistics of SourceRowCache.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core.source_cache import SourceRowCache
+
+
+class TestSourceRowCache:
+    """Test the in-memory tier."""
+
+    def test_init_validation(self):
+        """Test cache parameter validation."""
+        with pytest.raises(ValueError, match="max_entries must be a positive integer"):
+            SourceRowCache(max_entries=0)
+
+        with pytest.raises(ValueError, match="ttl_seconds must be a positive number"):
+            SourceRowCache(ttl_seconds=0)
+
+    def test_get_and_set(self):
+        """Test that stored values are returned and misses return None."""
+        cache = SourceRowCache()
+        cache.set("SURVEY-001", {"survey_id": "SURVEY-001"})
+
+        assert cache.get("SURVEY-001") == {"survey_id": "SURVEY-001"}
+        assert cache.get("SURVEY-002") is None
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate_percent"] == 50.0
+        assert stats["disk_tier"] is False
+
+    def test_none_values_are_not_cached(self):
+        """Test that None is treated as a miss rather than a cached value."""
+        cache = SourceRowCache()
+        cache.set("SURVEY-001", None)
+
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = SourceRowCache(max_entries=2)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")
+        cache.set("c", {"v": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("c") == {"v": 3}
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Test that entries are not served after their TTL."""
+        cache = SourceRowCache(ttl_seconds=10)
+
+        with patch("core.source_cache.time.time", return_value=1000.0):
+            cache.set("a", {"v": 1})
+
+        with patch("core.source_cache.time.time", return_value=1009.0):
+            assert cache.get("a") == {"v": 1}
+
+        with patch("core.source_cache.time.time", return_value=1010.0):
+            assert cache.get("a") is None
+
+        assert cache.stats()["entries"] == 0
+
+    def test_get_many_returns_hits_only(self):
+        """Test that get_many omits missing keys."""
+        cache = SourceRowCache()
+        cache.set("a", {"v": 1})
+
+        assert cache.get_many(["a", "b"]) == {"a": {"v": 1}}
+
+    def test_invalidate(self):
+        """Test explicit invalidation."""
+        cache = SourceRowCache()
+        cache.set("a", {"v": 1})
+
+        assert cache.invalidate("a") is True
+        assert cache.invalidate("a") is False
+        assert cache.get("a") is None
+        assert cache.stats()["invalidations"] == 1
+
+
+class TestSourceRowCacheDiskTier:
+    """Test the shared SQLite tier."""
+
+    def test_disk_tier_is_shared_between_instances(self, tmp_path):
+        """Test that a second cache on the same file sees entries of the first."""
+        path = str(tmp_path / "cache" / "source_cache.db")
+        writer = SourceRowCache(disk_path=path)
+        reader = SourceRowCache(disk_path=path)
+
+        writer.set("SURVEY-001", {"survey_id": "SURVEY-001", "score": 5})
+
+        assert reader.get("SURVEY-001") == {"survey_id": "SURVEY-001", "score": 5}
+        stats = reader.stats()
+        assert stats["disk_hits"] == 1
+        assert stats["entries"] == 1
+        assert stats["disk_tier"] is True
+
+        writer.close()
+        reader.close()
+
+    def test_invalidate_removes_disk_entry(self, tmp_path):
+        """Test that invalidation is visible to other instances."""
+        path = str(tmp_path / "source_cache.db")
+        first = SourceRowCache(disk_path=path)
+        second = SourceRowCache(disk_path=path)
+        first.set("a", {"v": 1})
+
+        assert second.invalidate("a") is True
+        first._entries.clear()
+        assert first.get("a") is None
+
+        first.close()
+        second.close()
+
+    def test_expired_disk_entries_are_not_served(self, tmp_path):
+        """Test that the disk tier honours the TTL."""
+        path = str(tmp_path / "source_cache.db")
+        writer = SourceRowCache(ttl_seconds=10, disk_path=path)
+        reader = SourceRowCache(ttl_seconds=10, disk_path=path)
+
+        with patch("core.source_cache.time.time", return_value=1000.0):
+            writer.set("a", {"v": 1})
+
+        with patch("core.source_cache.time.time", return_value=1011.0):
+            assert reader.get("a") is None
+
+        writer.close()
+        reader.close()
+
+    def test_unusable_disk_path_degrades_to_memory(self, tmp_path):
+        """Test that a disk tier failure is logged and the cache keeps working."""
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("")
+        logger = Mock()
+
+        cache = SourceRowCache(disk_path=str(blocker / "cache.db"), logger=logger)
+        cache.set("a", {"v": 1})
+
+        assert cache.get("a") == {"v": 1}
+        assert cache.stats()["disk_tier"] is False
+        logger.warning.assert_called_once()
@@ -0,0 +1,186 @@
+"""
+Unit tests and benchmark for satisfaction scoring.
+
+Tests that the batch scoring engine returns exactly the scores of the per-record
+function, with and without NumPy, and measures its throughput.
+"""
+
+import random
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from core import survey_scoring
+from core.survey_scoring import (
+    VECTORIZE_MIN_BATCH_SIZE,
+    calculate_satisfaction_score,
+    calculate_satisfaction_scores,
+)
+
+# NumPy is the optional "performance" extra
+requires_numpy = pytest.mark.skipif(
+    not survey_scoring.NUMPY_AVAILABLE, reason="NumPy not available"
+)
+
+SURVEY_TYPES = [
+    "Customer Satisfaction",
+    "Product Feedback",
+    "Market Research",
+    "Employee Engagement",
+    None,
+]
+
+
+def _random_response(rng, text_answers=True):
+    """Create a response with a mix of valid, out-of-range and invalid values."""
+    if text_answers and rng.random() < 0.02:
+        return "not a dict"
+
+    response = {}
+    for i in range(rng.randint(0, 12)):
+        kind = rng.random()
+        if kind < 0.6:
+            response[f"q{i}"] = rng.uniform(-1, 11)
+        elif kind < 0.8:
+            response[f"q{i}"] = rng.randint(0, 12)
+        elif kind < 0.85:
+            response[f"q{i}"] = True
+        elif text_answers:
+            response[f"q{i}"] = "free text"
+
+    if not text_answers:
+        return response
+
+    if rng.random() < 0.3:
+        response["overall_satisfaction"] = rng.choice([rng.uniform(0, 10), "7", None])
+    if rng.random() < 0.5:
+        response["product_rating"] = rng.choice([rng.uniform(0, 10), 3])
+    if rng.random() < 0.5:
+        response["interest_level"] = rng.choice([rng.uniform(0, 10), 9])
+    return response
+
+
+def _random_responses(count, seed=42, text_answers=True):
+    rng = random.Random(seed)
+    return [
+        (_random_response(rng, text_answers), rng.choice(SURVEY_TYPES))
+        for _ in range(count)
+    ]
+
+
+def _score_each(responses):
+    return [calculate_satisfaction_score(*response) for response in responses]
+
+
+class TestCalculateSatisfactionScores:
+    """Test that batch scores match the per-record function."""
+
+    def test_matches_per_record_scores(self):
+        """Test exact parity on a large randomized batch."""
+        responses = _random_responses(5000)
+
+        assert calculate_satisfaction_scores(responses) == _score_each(responses)
+
+    @requires_numpy
+    def test_matches_per_record_scores_vectorized(self):
+        """Test exact parity when ratings are averaged with NumPy."""
+        numeric_responses = _random_responses(5000, text_answers=False)
+        mixed_responses = numeric_responses + _random_responses(500)
+
+        with patch.object(
+            survey_scoring, "_mean_ratings", wraps=survey_scoring._mean_ratings
+        ) as mean_ratings:
+            assert calculate_satisfaction_scores(numeric_responses) == _score_each(
+                numeric_responses
+            )
+            # Text answers after the numeric sample are filtered out in NumPy
+            assert calculate_satisfaction_scores(mixed_responses) == _score_each(
+                mixed_responses
+            )
+
+        assert mean_ratings.call_count == 2
+
+    def test_matches_per_record_scores_without_numpy(self):
+        """Test exact parity when NumPy is not installed."""
+        responses = _random_responses(500)
+
+        with patch.object(survey_scoring, "NUMPY_AVAILABLE", False):
+            assert calculate_satisfaction_scores(responses) == _score_each(responses)
+
+    @requires_numpy
+    def test_mean_uses_same_summation_as_python(self):
+        """Test that averages are bit-identical, not just approximately equal."""
+        response = {f"q{i}": 0.1 for i in range(10)}
+        responses = [(response, "Employee Engagement")] * VECTORIZE_MIN_BATCH_SIZE
+
+        scores = calculate_satisfaction_scores(responses)
+
+        assert scores == [sum([0.1] * 10) / 10] * VECTORIZE_MIN_BATCH_SIZE
+
+    def test_scoring_rules(self):
+        """Test the score of each survey type."""
+        scores = calculate_satisfaction_scores(
+            [
+                ({"overall_satisfaction": 9.2}, "Customer Satisfaction"),
+                ({"a": 8.0, "b": 7.0, "c": "text"}, "Customer Satisfaction"),
+                (
+                    {"product_rating": 8.0, "recommendation_likelihood": 6.0},
+                    "Product Feedback",
+                ),
+                ({"interest_level": 7.5}, "Market Research"),
+                ({"comments": "none"}, "Other"),
+            ]
+        )
+
+        assert scores == [9.2, 7.5, (8.0 * 0.7) + (6.0 * 0.3), 7.5, 5.0]
+
+    def test_invalid_responses(self):
+        """Test default scores for non-dict responses and None for bad ratings."""
+        logger = Mock()
+        responses = [
+            ("invalid", "Customer Satisfaction"),
+            ({"overall_satisfaction": "high"}, "Customer Satisfaction"),
+            ({"product_rating": None}, "Product Feedback"),
+        ] * VECTORIZE_MIN_BATCH_SIZE
+
+        scores = calculate_satisfaction_scores(responses, logger)
+
+        assert scores == [5.0, None, None] * VECTORIZE_MIN_BATCH_SIZE
+        assert logger.warning.call_count == len(responses)
+
+    def test_empty_batch(self):
+        """Test that an empty batch returns no scores."""
+        assert calculate_satisfaction_scores([]) == []
+
+
+@pytest.mark.performance
+@requires_numpy
+class TestSatisfactionScoringBenchmark:
+    """Benchmark the batch engine against per-record scoring."""
+
+    @pytest.mark.slow
+    def test_batch_scoring_throughput(self):
+        """Measure per-record and batch scoring throughput on 200,000 responses."""
+        responses = _random_responses(200000, seed=7, text_answers=False)
+
+        start_time = time.perf_counter()
+        expected = _score_each(responses)
+        per_record_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        scores = calculate_satisfaction_scores(responses)
+        batch_time = time.perf_counter() - start_time
+
+        print("\nSatisfaction Scoring Benchmark:")
+        print(
+            f"  Per-record: {per_record_time:.3f}s "
+            f"({len(responses) / per_record_time:.0f} responses/sec)"
+        )
+        print(
+            f"  Batch:      {batch_time:.3f}s "
+            f"({len(responses) / batch_time:.0f} responses/sec)"
+        )
+        print(f"  Speedup:    {per_record_time / batch_time:.2f}x")
+
+        assert scores == expected
@@ -0,0 +1,60 @@
+"""
+Unit tests for chunked task mapping.
+
+Tests splitting records into chunks and mapping per-record tasks over chunks in
+a Prefect flow.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from prefect import flow, task
+
+from core.task_chunking import chunk_records, map_in_chunks
+
+
+@task
+def double_record(record, factor=2):
+    """Per-record task used by the tests."""
+    return {"record_id": record["id"], "value": record["value"] * factor}
+
+
+class TestChunkRecords:
+    """Test splitting records into chunks."""
+
+    def test_chunks_keep_order(self):
+        """Test that the last chunk holds the remainder."""
+        assert chunk_records([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+    def test_empty_records(self):
+        """Test that no records give no chunks."""
+        assert chunk_records([], 10) == []
+
+    def test_chunk_size_validation(self):
+        """Test chunk size validation."""
+        with pytest.raises(ValueError, match="chunk_size must be a positive integer"):
+            chunk_records([1], 0)
+
+
+class TestMapInChunks:
+    """Test mapping a per-record task over chunks."""
+
+    def test_results_are_returned_per_record(self):
+        """Test that chunked mapping returns one result per record in order."""
+        records = [{"id": i, "value": i} for i in range(7)]
+
+        @flow
+        def chunked_flow():
+            return map_in_chunks(double_record, records, 3, factor=10)
+
+        assert chunked_flow() == [{"record_id": i, "value": i * 10} for i in range(7)]
+
+    def test_chunk_size_one_maps_the_task(self):
+        """Test that chunk size 1 keeps one task run per record."""
+        record_task = Mock()
+        record_task.map.return_value = [{"record_id": 1}]
+
+        results = map_in_chunks(record_task, [{"id": 1}], 1, cleanup=True)
+
+        record_task.map.assert_called_once_with([{"id": 1}], cleanup=True)
+        assert results == [{"record_id": 1}]
@@ -8,8 +8,11 @@ import asyncio
 import logging
 from typing import Any, Optional
 
-from prefect import get_client
-from prefect.exceptions import ObjectNotFound
+from core.lazy_import import lazy_import
+
+# Prefect is imported on the first API call, not when the CLI starts
+get_client = lazy_import("prefect", "get_client")
+prefect_exceptions = lazy_import("prefect.exceptions")
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +48,7 @@ class PrefectClient:
             try:
                 flow = await client.read_flow_by_name(flow_name)
                 logger.info(f"Found existing flow: {flow_name}")
-            except ObjectNotFound:
+            except prefect_exceptions.ObjectNotFound:
                 logger.warning(
                     f"Flow {flow_name} not found. It may need to be registered first."
                 )
@@ -143,7 +146,7 @@ class PrefectClient:
                     deployments = await client.read_deployments(
                         flow_filter={"id": {"any_": [flow.id]}}
                     )
-                except ObjectNotFound:
+                except prefect_exceptions.ObjectNotFound:
                     logger.warning(f"Flow {flow_name} not found")
                     return []
             else:
@@ -194,7 +197,7 @@ class PrefectClient:
                 "updated": deployment.updated,
             }
 
-        except ObjectNotFound:
+        except prefect_exceptions.ObjectNotFound:
             logger.info(f"Deployment {flow_name}/{deployment_name} not found")
             return None
         except Exception as e:
@@ -212,7 +215,7 @@ class PrefectClient:
             client = await self.get_client()
             work_pool = await client.read_work_pool(work_pool_name)
             return work_pool is not None
-        except ObjectNotFound:
+        except prefect_exceptions.ObjectNotFound:
             return False
         except Exception as e:
             logger.error(f"Failed to validate work pool {work_pool_name}: {e}")
@@ -6,6 +6,7 @@ Provides CLI commands for error reporting, recovery, and rollback operations.
 
 import click
 import json
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Optional
 
@@ -248,3 +249,13 @@ def register_error_commands(cli_group):
     """Register error handling commands with the main CLI."""
     cli_group.add_command(error)
     cli_group.add_command(recovery)
+
+
+def run_error_command(group_name: str, args: Sequence[str]) -> int:
+    """Run the 'error' or 'recovery' command group with arguments from the main CLI."""
+    group = {"error": error, "recovery": recovery}[group_name]
+    try:
+        group.main(args=args, prog_name=f"deployment-cli {group_name}")
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 0 if e.code is None else 1
+    return 0
@@ -0,0 +1,165 @@
+"""
+CLI Import Profiling
+
+Runs a CLI command in a fresh interpreter with ``-X importtime`` and reports the
+per-module import-time tree, so slow cold starts can be traced to the imports
+that cause them.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+# Modules below this cumulative import time are left out of the report
+DEFAULT_MIN_IMPORT_MS = 5.0
+
+# Module that is imported to measure the cold start of the CLI
+CLI_MODULE = "deployment_system.cli.main"
+
+# "import time:   self |  cumulative | <2 spaces per nesting level>module"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    """Import time of one module and the modules it imported first."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list["ImportRecord"] = field(default_factory=list)
+
+    @property
+    def cumulative_ms(self) -> float:
+        return self.cumulative_us / 1000
+
+
+def parse_importtime(lines: list[str]) -> list[ImportRecord]:
+    """
+    Build the import tree from ``-X importtime`` output.
+
+    The interpreter writes a module after the modules it imported, indented one
+    level deeper, so children are collected until their parent line appears.
+    Lines that are not import timings are ignored.
+
+    Returns:
+        Top-level imports in the order they finished
+    """
+    pending: dict[int, list[ImportRecord]] = {}
+    for line in lines:
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = len(indent) // 2
+        record = ImportRecord(
+            name=name,
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            children=pending.pop(depth + 1, []),
+        )
+        pending.setdefault(depth, []).append(record)
+    return pending.get(0, [])
+
+
+def total_import_ms(records: list[ImportRecord]) -> float:
+    """Total import time of a tree of top-level imports in milliseconds."""
+    return sum(record.cumulative_us for record in records) / 1000
+
+
+def format_import_tree(
+    records: list[ImportRecord], min_ms: float = DEFAULT_MIN_IMPORT_MS
+) -> list[str]:
+    """
+    Format an import tree, slowest imports first.
+
+    Args:
+        records: Imports to format
+        min_ms: Leave out modules with a lower cumulative import time
+
+    Returns:
+        Report lines with cumulative and self time per module
+    """
+    lines = []
+
+    def add(record: ImportRecord, depth: int) -> None:
+        lines.append(
+            f"{record.cumulative_ms:9.1f} ms {record.self_us / 1000:9.1f} ms  "
+            f"{'  ' * depth}{record.name}"
+        )
+        for child in sorted(record.children, key=lambda r: -r.cumulative_us):
+            if child.cumulative_ms >= min_ms:
+                add(child, depth + 1)
+
+    for record in sorted(records, key=lambda r: -r.cumulative_us):
+        if record.cumulative_ms >= min_ms:
+            add(record, 0)
+    return lines
+
+
+def measure_imports(argv: list[str]) -> tuple[int, list[ImportRecord], list[str]]:
+    """
+    Run the CLI in a fresh interpreter with import timing enabled.
+
+    Args:
+        argv: CLI arguments; when empty only the CLI module is imported
+
+    Returns:
+        Tuple of (exit code, import tree, stderr lines that are not timings)
+    """
+    if argv:
+        command = [sys.executable, "-X", "importtime", "-m", CLI_MODULE, *argv]
+    else:
+        command = [sys.executable, "-X", "importtime", "-c", f"import {CLI_MODULE}"]
+
+    # Make the package importable from any working directory
+    project_root = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (project_root, env.get("PYTHONPATH")) if path
+    )
+
+    completed = subprocess.run(command, stderr=subprocess.PIPE, text=True, env=env)
+    stderr_lines = completed.stderr.splitlines()
+    other_lines = [line for line in stderr_lines if not line.startswith("import time:")]
+    return completed.returncode, parse_importtime(stderr_lines), other_lines
+
+
+def profile_imports(
+    argv: list[str],
+    min_ms: float = DEFAULT_MIN_IMPORT_MS,
+    budget_ms: Optional[float] = None,
+) -> int:
+    """
+    Run a CLI command and print its per-module import-time tree.
+
+    Args:
+        argv: CLI arguments of the command to profile
+        min_ms: Leave out modules with a lower cumulative import time
+        budget_ms: Optional import-time budget; exceeding it fails the run
+
+    Returns:
+        Exit code of the command, or 1 if the import budget is exceeded
+    """
+    returncode, records, other_lines = measure_imports(argv)
+    for line in other_lines:
+        print(line, file=sys.stderr)
+
+    total_ms = total_import_ms(records)
+    print(f"\nImport time profile ({' '.join(argv) or CLI_MODULE})")
+    print(f"{'cumulative':>12} {'self':>12}  module")
+    for line in format_import_tree(records, min_ms):
+        print(line)
+    print(f"\nTotal import time: {total_ms:.1f} ms")
+
+    if budget_ms is not None and total_ms > budget_ms:
+        print(
+            f"✗ Import time {total_ms:.1f} ms exceeds the budget of {budget_ms:.1f} ms",
+            file=sys.stderr,
+        )
+        return 1
+    return returncode
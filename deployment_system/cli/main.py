@@ -7,18 +7,73 @@ Main command-line interface for the deployment system with error handling.
 
 import argparse
 import sys
+from typing import Optional
 
 from .commands import DeploymentCLI
 from .utils import CLIUtils
-from .error_commands import register_error_commands
 
+# Error handling command groups, implemented with click in error_commands
+ERROR_COMMAND_GROUPS = {
+    "error": "Error reporting commands",
+    "recovery": "Rollback and recovery commands",
+}
 
-def main():
+
+def _add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the import profiling options to a parser."""
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help="Run the command in a fresh interpreter and report its import-time tree",
+    )
+    parser.add_argument(
+        "--profile-min-ms",
+        type=float,
+        default=None,
+        help="Hide modules importing faster than this in the profile (default: 5)",
+    )
+    parser.add_argument(
+        "--import-budget-ms",
+        type=float,
+        default=None,
+        help="Fail the profiled run if the total import time exceeds this budget",
+    )
+
+
+def main(argv: Optional[list[str]] = None):
     """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Profiling runs the remaining arguments in a child interpreter, so handle it
+    # before anything else is imported or parsed
+    profile_parser = argparse.ArgumentParser(add_help=False)
+    _add_profile_arguments(profile_parser)
+    profile_args, command_argv = profile_parser.parse_known_args(argv)
+    if profile_args.profile_imports:
+        from .import_profile import DEFAULT_MIN_IMPORT_MS, profile_imports
+
+        return profile_imports(
+            command_argv,
+            min_ms=(
+                DEFAULT_MIN_IMPORT_MS
+                if profile_args.profile_min_ms is None
+                else profile_args.profile_min_ms
+            ),
+            budget_ms=profile_args.import_budget_ms,
+        )
+
+    # Error handling commands are click groups, imported only when one of them runs
+    if command_argv and command_argv[0] in ERROR_COMMAND_GROUPS:
+        from .error_commands import run_error_command
+
+        return run_error_command(command_argv[0], command_argv[1:])
+
     parser = argparse.ArgumentParser(
         description="Prefect Deployment System CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
+    _add_profile_arguments(parser)
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
@@ -200,10 +255,11 @@ def main():
         "--flow-name", required=True, help="Flow name for the deployment"
     )
 
-    # Register error handling commands
-    register_error_commands(subparsers)
+    # Error handling commands, listed for help; main() runs them before parsing
+    for group_name, group_help in ERROR_COMMAND_GROUPS.items():
+        subparsers.add_parser(group_name, help=group_help)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
@@ -263,14 +319,10 @@ def execute_command(cli: DeploymentCLI, args) -> int:
         return cmd_list_deployments_ui(cli, args)
     elif args.command == "get-deployment-url":
         return cmd_get_deployment_url(cli, args)
-    elif args.command in ["error", "recovery"]:
-        # Error handling commands are handled by click, so this shouldn't be reached
-        # But we include it for completeness
-        print(
-            f"Error handling command {args.command} should be handled by click",
-            file=sys.stderr,
-        )
-        return 1
+    elif args.command in ERROR_COMMAND_GROUPS:
+        from .error_commands import run_error_command
+
+        return run_error_command(args.command, [])
     else:
         print(f"Unknown command: {args.command}", file=sys.stderr)
         return 1
@@ -0,0 +1,119 @@
+"""
+Tests for CLI import profiling and the cold-start import budget.
+
+The deploy pipeline runs the CLI many times per release, so the time to import
+it is checked against a budget. Override the budget with CLI_IMPORT_BUDGET_MS on
+slow build machines.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from deployment_system.cli.import_profile import (
+    format_import_tree,
+    measure_imports,
+    parse_importtime,
+    total_import_ms,
+)
+from deployment_system.cli.main import main
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Cold-start budget for importing the CLI (about 0.35 s on a developer machine)
+CLI_IMPORT_BUDGET_MS = float(os.getenv("CLI_IMPORT_BUDGET_MS", "1500"))
+
+# Dependencies only needed by commands that talk to Prefect, Docker or databases
+HEAVY_MODULES = ["prefect", "sqlalchemy", "psutil", "docker", "pyway", "httpx", "click"]
+
+IMPORTTIME_OUTPUT = [
+    "import time: self [us] | cumulative | imported package",
+    "import time:       100 |        100 |     leaf",
+    "import time:       200 |        300 |   child_a",
+    "import time:       400 |        400 |   child_b",
+    "import time:       500 |       1200 | parent",
+    "some other stderr output",
+    "import time:        50 |         50 | other",
+]
+
+
+class TestImportTimeParsing:
+    """Test cases for parsing -X importtime output."""
+
+    def test_parse_builds_tree(self):
+        """Test that nested imports become children of their parent."""
+        records = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert [record.name for record in records] == ["parent", "other"]
+        parent = records[0]
+        assert parent.self_us == 500
+        assert parent.cumulative_us == 1200
+        assert [child.name for child in parent.children] == ["child_a", "child_b"]
+        assert [leaf.name for leaf in parent.children[0].children] == ["leaf"]
+
+    def test_total_import_ms(self):
+        """Test that the total sums the top-level cumulative times."""
+        records = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert total_import_ms(records) == pytest.approx(1.25)
+
+    def test_format_orders_and_filters(self):
+        """Test that the report lists slowest imports first and hides fast ones."""
+        records = parse_importtime(IMPORTTIME_OUTPUT)
+
+        lines = format_import_tree(records, min_ms=0.2)
+
+        names = [line.split()[-1] for line in lines]
+        assert names == ["parent", "child_b", "child_a"]
+        assert lines[1].endswith("    child_b")
+
+
+class TestCLIColdStart:
+    """Regression checks for the cold start of the deployment CLI."""
+
+    def test_cli_import_skips_heavy_dependencies(self):
+        """Test that importing the CLI does not import optional dependencies."""
+        code = (
+            "import sys, deployment_system.cli.main\n"
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+            check=True,
+        )
+
+        assert completed.stdout.strip() == ""
+
+    def test_cli_import_within_budget(self):
+        """Test that the cold import of the CLI stays within the budget."""
+        returncode, records, _ = measure_imports([])
+
+        assert returncode == 0
+        total_ms = total_import_ms(records)
+        assert total_ms <= CLI_IMPORT_BUDGET_MS, "\n".join(
+            [f"CLI import took {total_ms:.1f} ms (budget {CLI_IMPORT_BUDGET_MS} ms)"]
+            + format_import_tree(records)
+        )
+
+    def test_profile_imports_option(self, capsys):
+        """Test that --profile-imports prints the import tree of the CLI."""
+        returncode = main(["--profile-imports", "--profile-min-ms", "0"])
+
+        output = capsys.readouterr().out
+        assert returncode == 0
+        assert "deployment_system.cli.main" in output
+        assert "Total import time:" in output
+
+    def test_profile_imports_budget_exceeded(self, capsys):
+        """Test that a profiled run over the import budget fails."""
+        returncode = main(["--profile-imports", "--import-budget-ms", "0.001"])
+
+        assert returncode == 1
+        assert "exceeds the budget" in capsys.readouterr().err
@@ -10,10 +10,12 @@ import time
 from typing import Any, Optional
 from urllib.parse import urljoin, urlparse
 
-import httpx
+from core.lazy_import import lazy_import
 
 from ..api.prefect_client import PrefectClient
 
+httpx = lazy_import("httpx")
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,7 +43,7 @@ class UIClient:
             logger.warning(f"Could not derive UI URL from API URL {api_url}: {e}")
             return None
 
-    async def get_http_client(self) -> httpx.AsyncClient:
+    async def get_http_client(self) -> "httpx.AsyncClient":
         """Get or create HTTP client."""
         if self._http_client is None:
             self._http_client = httpx.AsyncClient(timeout=30.0)
@@ -139,17 +139,23 @@ def prepare_survey_records_for_queue(
 
 @task(name="add-surveys-to-queue")
 def add_surveys_to_processing_queue(
-    records: list[dict[str, Any]], flow_name: str = "survey_processor"
+    records: list[dict[str, Any]],
+    flow_name: str = "survey_processor",
+    dedup_key: Optional[str] = "survey_id",
 ) -> dict[str, Any]:
     """
     Add prepared survey records to the distributed processing queue.
 
     This task demonstrates the pattern for bulk insertion of records into
-    the processing queue, with proper error handling and logging.
+    the processing queue, with proper error handling and logging. Surveys are
+    deduplicated by survey_id, so re-running the task does not enqueue (and
+    process) the same surveys twice.
 
     Args:
         records: List of survey records to add to queue
         flow_name: Name of the flow that will process these records
+        dedup_key: Payload field used to skip surveys already in the queue,
+            or None to enqueue every record (default: "survey_id")
 
     Returns:
         Dictionary containing insertion results and statistics
@@ -166,20 +172,30 @@ def add_surveys_to_processing_queue(
         )
 
         # Add records to queue using DistributedProcessor
-        inserted_count = processor.add_records_to_queue(flow_name, records)
+        if dedup_key is not None:
+            counts = processor.add_records_to_queue_idempotent(
+                flow_name, records, dedup_key=dedup_key
+            )
+            inserted_count = counts["inserted"]
+            skipped_count = counts["skipped"]
+        else:
+            inserted_count = processor.add_records_to_queue(flow_name, records)
+            skipped_count = 0
 
         # Get updated queue status
         queue_status = processor.get_queue_status(flow_name)
 
         result = {
             "records_added": inserted_count,
+            "records_skipped": skipped_count,
             "flow_name": flow_name,
             "queue_status": queue_status,
             "insertion_timestamp": datetime.now().isoformat(),
         }
 
         logger.info(
-            f"Successfully added {inserted_count} records to queue. "
+            f"Successfully added {inserted_count} records to queue "
+            f"({skipped_count} already enqueued were skipped). "
             f"Queue now has {queue_status['pending_records']} pending records."
         )
 
@@ -155,6 +155,7 @@ class TestDistributedSurveyProcessing:
         )
 
         assert result["records_added"] == 2
+        assert result["records_skipped"] == 0
         assert result["flow_name"] == "survey_processor"
         assert "queue_status" in result
         assert "insertion_timestamp" in result
@@ -483,6 +483,39 @@ class TestSurveyRecordPreparation:
             assert len(unique_survey_types) > 1, "Should have multiple survey types"
 
 
+class TestSurveyQueueInsertion:
+    """Unit tests for adding survey records to the processing queue."""
+
+    def test_add_surveys_skips_already_enqueued(self):
+        """Test that surveys are deduplicated by survey_id on enqueue."""
+        from flows.examples.distributed_survey_processing import (
+            add_surveys_to_processing_queue,
+        )
+
+        records = [{"payload": {"survey_id": "SURV-1000"}}]
+
+        with (
+            patch("flows.examples.distributed_survey_processing.get_run_logger"),
+            patch(
+                "flows.examples.distributed_survey_processing.processor"
+            ) as mock_processor,
+        ):
+            mock_processor.add_records_to_queue_idempotent.return_value = {
+                "inserted": 0,
+                "skipped": 1,
+            }
+            mock_processor.get_queue_status.return_value = {"pending_records": 1}
+
+            result = add_surveys_to_processing_queue.fn(records)
+
+        mock_processor.add_records_to_queue_idempotent.assert_called_once_with(
+            "survey_processor", records, dedup_key="survey_id"
+        )
+        mock_processor.add_records_to_queue.assert_not_called()
+        assert result["records_added"] == 0
+        assert result["records_skipped"] == 1
+
+
 if __name__ == "__main__":
     """
     Run the unit tests.
@@ -21,6 +21,7 @@ from core.tasks import (
 try:
     from core.database import DatabaseManager
     from core.distributed import DistributedProcessor
+    from core.task_chunking import map_in_chunks
 
     DISTRIBUTED_AVAILABLE = True
 except ImportError:
@@ -157,8 +158,13 @@ def _run_distributed_rpa1_workflow(
             "message": "No records to process",
         }
 
-    # Process records using .map()
-    results = process_rpa1_record.map(records, cleanup=cleanup)
+    # Process records using .map(), task_chunk_size records per task
+    results = map_in_chunks(
+        process_rpa1_record,
+        records,
+        processor.config.get("task_chunk_size", 1),
+        cleanup=cleanup,
+    )
 
     # Generate summary
     completed_count = sum(1 for r in results if r["status"] == "completed")
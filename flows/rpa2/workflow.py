@@ -17,6 +17,7 @@ from core.config import rpa2_config
 try:
     from core.database import DatabaseManager
     from core.distributed import DistributedProcessor
+    from core.task_chunking import map_in_chunks
 
     DISTRIBUTED_AVAILABLE = True
 except ImportError:
@@ -254,8 +255,13 @@ def _run_distributed_rpa2_workflow(
             "message": "No records to process",
         }
 
-    # Process records using .map()
-    results = process_rpa2_record.map(records, validation_strict=validation_strict)
+    # Process records using .map(), task_chunk_size records per task
+    results = map_in_chunks(
+        process_rpa2_record,
+        records,
+        processor.config.get("task_chunk_size", 1),
+        validation_strict=validation_strict,
+    )
 
     # Generate summary
     completed_count = sum(1 for r in results if r["status"] == "completed")
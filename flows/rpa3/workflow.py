@@ -24,6 +24,7 @@ from core.config import ConfigManager
 try:
     from core.database import DatabaseManager
     from core.distributed import DistributedProcessor
+    from core.task_chunking import map_in_chunks
 
     DISTRIBUTED_AVAILABLE = True
 except ImportError:
@@ -577,8 +578,10 @@ def _run_distributed_rpa3_workflow(batch_size: int, logger) -> dict[str, Any]:
             "message": "No records to process",
         }
 
-    # Process records using .map()
-    results = process_rpa3_record.map(records)
+    # Process records using .map(), task_chunk_size records per task
+    results = map_in_chunks(
+        process_rpa3_record, records, processor.config.get("task_chunk_size", 1)
+    )
 
     # Generate summary
     completed_count = sum(1 for r in results if r["status"] == "completed")
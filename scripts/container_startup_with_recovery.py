@@ -132,6 +132,21 @@ class ContainerStartupManager:
             self.logger.error(f"Environment validation failed: {e}")
             return False
 
+    def preload_configuration(self) -> bool:
+        """
+        Fetch Prefect variables and secrets in bulk before they are looked up.
+
+        A failed preload is not fatal; configuration is then fetched per key.
+
+        Returns:
+            Always True
+        """
+        loaded = self.config_manager.preload()
+        self.logger.info(
+            f"Preloaded {loaded['variables']} variables and {loaded['secrets']} secrets"
+        )
+        return True
+
     def initialize_database_managers(self) -> bool:
         """
         Initialize database managers with error recovery.
@@ -267,6 +282,7 @@ class ContainerStartupManager:
 
         checks = [
             ("Environment Validation", self.validate_environment),
+            ("Configuration Preload", self.preload_configuration),
             ("Database Initialization", self.initialize_database_managers),
             ("Health Monitoring", self.initialize_health_monitoring),
             ("Error Recovery", self.initialize_error_recovery),